@@ -1,105 +1,71 @@
 """
-Quick script to check teacher status on the blockchain
+Check teacher and student status on the blockchain
+
+Audits any number of wallets in any number of attendance apps concurrently
+and writes a CSV or JSON report (opted_in, is_teacher, creator and per-session
+check-ins). Without arguments it checks the default wallet in the default app.
+
+    python check_teacher_status.py --app-id 755366519 --addresses-file students.txt --output audit.csv
+    python check_teacher_status.py --app-id 1 --app-id 2 --address <ADDR> --format json
 """
 
-from algosdk.v2client import algod
+import argparse
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "smart_contracts" / "attendance"))
+
+from algod_pool import get_algod_client
+from status_auditor import DEFAULT_CONCURRENCY, audit_status, write_report
+
+DEFAULT_APP_ID = 755366519
+DEFAULT_WALLET = "ILUHQ3QQXFHDP3N7FQAREPGHQVVVPQN2BMN3H3722LT5BSMRVPWP6T4GF4"
+
+
+def read_addresses(path):
+    """One address per line (or the first CSV column); blank lines and a header are skipped"""
+    addresses = []
+    with open(path) as f:
+        for line in f:
+            value = line.split(",")[0].strip()
+            if len(value) == 58:
+                addresses.append(value)
+    return addresses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Audit teacher/student status across attendance apps")
+    parser.add_argument("--app-id", type=int, action="append", help="App ID to audit (repeatable)")
+    parser.add_argument("--address", action="append", default=[], help="Wallet address (repeatable)")
+    parser.add_argument("--addresses-file", help="File with one address per line")
+    parser.add_argument("--network", default="testnet", help="localnet or testnet")
+    parser.add_argument("--format", choices=["csv", "json"], help="Report format (default: from --output, else csv)")
+    parser.add_argument("--output", help="Report path (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Requests in flight")
+    args = parser.parse_args(argv)
+
+    app_ids = args.app_id or [DEFAULT_APP_ID]
+    addresses = list(args.address)
+    if args.addresses_file:
+        addresses += read_addresses(args.addresses_file)
+    if not addresses:
+        addresses = [DEFAULT_WALLET]
+
+    algod_client = get_algod_client(args.network, pool_size=args.concurrency)
+    print(f"⏳ Auditing {len(addresses)} wallets in {len(app_ids)} apps...", file=sys.stderr)
+    rows = audit_status(algod_client, app_ids, addresses, args.concurrency)
+
+    write_report(args.output or sys.stdout, rows, args.format)
 
-def main():
-    print("=" * 60)
-    print("Teacher Status Checker")
-    print("=" * 60)
-    
-    # Connect to TestNet
-    algod_address = "https://testnet-api.algonode.cloud"
-    algod_token = ""
-    algod_client = algod.AlgodClient(algod_token, algod_address)
-    
-    # Your details
-    app_id = 755366519
-    wallet_address = "ILUHQ3QQXFHDP3N7FQAREPGHQVVVPQN2BMN3H3722LT5BSMRVPWP6T4GF4"
-    
-    print(f"\nChecking status for:")
-    print(f"App ID: {app_id}")
-    print(f"Wallet: {wallet_address}")
-    print()
-    
-    try:
-        # Get app info to check creator
-        app_info = algod_client.application_info(app_id)
-        creator = app_info['params']['creator']
-        
-        print(f"Contract Creator: {creator}")
-        print(f"Your Wallet:      {wallet_address}")
-        print(f"Are you creator?  {creator == wallet_address}")
-        print()
-        
-        # Check if user has opted in
-        try:
-            account_info = algod_client.account_application_info(wallet_address, app_id)
-            
-            if not account_info.get('app-local-state'):
-                print("❌ STATUS: NOT OPTED IN")
-                print()
-                print("You need to opt-in to the app first!")
-                print("Visit the teacher dashboard and click 'Opt-In to App'")
-                return
-            
-            # User has opted in, check local state
-            local_state = account_info['app-local-state']['key-value']
-            
-            print("✅ STATUS: OPTED IN")
-            print()
-            print("Local State:")
-            
-            is_teacher = False
-            for item in local_state:
-                import base64
-                key = base64.b64decode(item['key']).decode('utf-8')
-                
-                if item['value']['type'] == 1:  # bytes
-                    value = base64.b64decode(item['value']['bytes']).decode('utf-8')
-                else:  # uint
-                    value = item['value']['uint']
-                
-                print(f"  {key}: {value}")
-                
-                if key == 'is_teacher':
-                    is_teacher = (value == 1)
-            
-            print()
-            if is_teacher:
-                print("✅ TEACHER STATUS: AUTHORIZED")
-                print("You should have access to the teacher dashboard!")
-            else:
-                print("❌ TEACHER STATUS: NOT AUTHORIZED")
-                print()
-                if creator == wallet_address:
-                    print("⚠️  PROBLEM: You are the creator but not marked as teacher!")
-                    print("This means the opt-in happened before the contract was updated.")
-                    print()
-                    print("SOLUTION: You need to opt-in again to the NEW contract.")
-                    print("The frontend should show 'Opt-In Required' button.")
-                else:
-                    print("You need the admin to authorize you:")
-                    print("  python manage_teachers.py")
-        
-        except Exception as e:
-            if "application does not exist" in str(e).lower():
-                print("❌ STATUS: NOT OPTED IN")
-                print()
-                print("You need to opt-in to the app first!")
-                print("Visit the teacher dashboard and click 'Opt-In to App'")
-            else:
-                print(f"Error checking opt-in status: {e}")
-    
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        print()
-        print("Make sure:")
-        print("1. App ID is correct: 755366519")
-        print("2. You have internet connection")
-        print("3. The app exists on TestNet")
+    opted_in = sum(1 for row in rows if row["opted_in"])
+    teachers = sum(1 for row in rows if row["is_teacher"])
+    errors = sum(1 for row in rows if row["error"])
+    print(f"✅ {len(rows)} wallet/app pairs: {opted_in} opted in, {teachers} teachers, {errors} errors", file=sys.stderr)
+    for row in rows:
+        if row["is_creator"] and row["opted_in"] and not row["is_teacher"]:
+            print(f"⚠️  Creator {row['address'][:8]}... opted in to app {row['app_id']} before the teacher flag existed; opt in again", file=sys.stderr)
+    if args.output:
+        print(f"📄 Report written to {args.output}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -1,31 +1,45 @@
 import dataclasses
+import hashlib
 import importlib
+import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from shutil import rmtree
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
-
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
 
+
+def configure_logging() -> None:
+    """Sets up logging; called from the command line entry point, not at import."""
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+
+
+def configure_deploy() -> None:
+    """Loads environment variables and AlgoKit debug tracing, only needed to deploy."""
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+    logger.info("Loading .env")
+    load_dotenv()
+
+
 # ----------------------- Contract Configuration ----------------------- #
 
 
@@ -33,7 +47,10 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    def load_deploy(self) -> Callable[[], None] | None:
+        """Imports this contract's deploy function, if it has one."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -47,6 +64,8 @@ def import_contract(folder: Path) -> Path:
 
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
     """Imports the deploy function from a folder if it exists."""
+    if not (folder / "deploy_config.py").exists():
+        return None
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
         deploy_module = importlib.import_module(module_name)
@@ -60,22 +79,44 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+def is_algopy_contract(directory: Path) -> bool:
+    """Checks whether the directory's contract.py is an Algorand Python (puya) contract.
+
+    PyTeal contracts (e.g. attendance) are compiled by their own deploy scripts, so
+    they are skipped by the build pipeline; attendance_arc4 is the algopy port.
+    """
+    return "algopy" in (directory / "contract.py").read_text(encoding="utf-8")
+
+
+def discover_contracts(contract_name: str | None = None) -> list[SmartContract]:
+    """
+    Finds the contracts to build or deploy. With a contract name only that folder
+    is inspected. Deploy modules are not imported here, see SmartContract.load_deploy.
+    """
+    # Use the current directory (root_path) as the base for contract folders and exclude
+    # folders that start with '_' (internal helpers).
+    if contract_name is not None:
+        folders = [root_path / contract_name]
+    else:
+        folders = sorted(root_path.iterdir())
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+        if folder.is_dir()
+        and has_contract_file(folder)
+        and is_algopy_contract(folder)
+        and not folder.name.startswith("_")
+    ]
+
 
 # -------------------------- Build Logic -------------------------- #
 
 deployment_extension = "py"
 
+# Written next to the artifacts after each successful build; a contract whose
+# sources and compiler versions still match it is skipped.
+MANIFEST_NAME = ".build_manifest.json"
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,95 +127,339 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
+def _sha256_files(paths: list[Path], base: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.relative_to(base).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def source_hash(contract_path: Path) -> str:
+    """Hashes every Python source in the contract's folder (the contract and its helpers)."""
+    folder = contract_path.parent
+    return _sha256_files(
+        [path for path in folder.rglob("*.py") if "__pycache__" not in path.parts],
+        folder,
+    )
+
+
+# Resolved once per process
+_compile_command: list[str] = []
+_compiler_version: list[str] = []
+
+
+def _tool_version(command: list[str]) -> str:
+    """First line the tool prints for --version, or 'unknown' if it does not run."""
+    try:
+        result = subprocess.run(
+            [*command, "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=120,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    lines = result.stdout.strip().splitlines()
+    return lines[0].strip() if result.returncode == 0 and lines else "unknown"
+
+
+def compiler_version() -> str:
+    """
+    Versions of the compiler and client generator that produced the artifacts,
+    asked from the tools the build runs (puyapy, or the one 'algokit compile'
+    uses, and the AlgoKit CLI that generates clients) rather than read from
+    this environment's packages.
+    """
+    if not _compiler_version:
+        _compiler_version.append(
+            f"compiler={_tool_version(compile_command())},"
+            f"client-generator={_tool_version(['algokit', '--no-color'])}"
+        )
+    return _compiler_version[0]
+
+
+def compile_command() -> list[str]:
+    """
+    Calls puyapy directly when it is on PATH, which saves starting the AlgoKit CLI
+    for every contract; otherwise goes through 'algokit compile python'.
+    """
+    if not _compile_command:
+        puyapy = shutil.which("puyapy")
+        _compile_command.extend(
+            [puyapy] if puyapy else ["algokit", "--no-color", "compile", "python"]
+        )
+    return _compile_command
+
+
+def read_manifest(output_dir: Path) -> dict[str, str]:
+    """Returns the last build manifest, or an empty dict if there is none."""
+    try:
+        manifest: dict[str, str] = json.loads((output_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest
+
+
+def is_up_to_date(output_dir: Path, contract_path: Path) -> bool:
+    """Checks whether the last build used the current sources and compiler."""
+    manifest = read_manifest(output_dir)
+    return (
+        manifest.get("source_hash") == source_hash(contract_path)
+        and manifest.get("compiler_version") == compiler_version()
+    )
+
+
 def build(output_dir: Path, contract_path: Path) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    The output directory is replaced once the build succeeds. The client is only
+    regenerated when the '.arc56.json' app spec changed.
     """
     output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
-
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+    output_dir.parent.mkdir(exist_ok=True, parents=True)
+    previous = read_manifest(output_dir)
+    sources = source_hash(contract_path)
+    staging_dir = Path(
+        tempfile.mkdtemp(prefix=f".{output_dir.name}-", dir=output_dir.parent)
     )
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    # Look for arc56.json files and generate the client based on them.
-    app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
-    ]
+    try:
+        build_result = subprocess.run(
+            [
+                *compile_command(),
+                str(contract_path.resolve()),
+                f"--out-dir={staging_dir}",
+                "--no-output-arc32",
+                "--output-arc56",
+                "--output-source-map",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        if build_result.returncode:
+            raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
-    client_file: str | None = None
-    if not app_spec_file_names:
-        logger.warning(
-            "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
+        # Look for arc56.json files and generate the client based on them.
+        app_spec_files = sorted(staging_dir.glob("*.arc56.json"))
+        app_spec_hash = _sha256_files(app_spec_files, staging_dir)
+        client_pattern = _get_output_path(output_dir, deployment_extension).name
+        previous_clients = (
+            sorted(output_dir.glob(client_pattern.format(contract_name="*")))
+            if output_dir.exists()
+            else []
         )
-    else:
-        for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+        client_file: str | None = None
+        if not app_spec_files:
+            logger.warning(
+                "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
             )
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
+        elif previous.get("app_spec_hash") == app_spec_hash and previous_clients:
+            for client_path in previous_clients:
+                logger.info(f"App spec unchanged, keeping {client_path.name}")
+                shutil.copy2(client_path, staging_dir / client_path.name)
+            client_file = app_spec_files[-1].name
+        else:
+            for app_spec_file in app_spec_files:
+                client_file = app_spec_file.name
+                print(client_file)
+                generate_result = subprocess.run(
+                    [
+                        "algokit",
+                        "generate",
+                        "client",
+                        str(staging_dir),
+                        "--output",
+                        str(_get_output_path(staging_dir, deployment_extension)),
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
+                if generate_result.returncode:
+                    if "No such command" in generate_result.stdout:
+                        raise Exception(
+                            "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+                        )
+                    else:
+                        raise Exception(
+                            f"Could not generate typed client:\n{generate_result.stdout}"
+                        )
+
+        manifest: dict[str, str] = {
+            "source_hash": sources,
+            "compiler_version": compiler_version(),
+            "app_spec_hash": app_spec_hash,
+        }
+        (staging_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+        if output_dir.exists():
+            rmtree(output_dir)
+        staging_dir.rename(output_dir)
+    finally:
+        if staging_dir.exists():
+            rmtree(staging_dir)
+
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+def build_all(
+    contracts_to_build: list[SmartContract], artifact_path: Path, *, force: bool = False
+) -> None:
+    """
+    Builds the contracts whose sources or compiler changed since their last build,
+    in parallel worker processes. With force, every contract is rebuilt.
+    """
+    stale = [
+        contract
+        for contract in contracts_to_build
+        if force or not is_up_to_date(artifact_path / contract.name, contract.path)
+    ]
+    for contract in contracts_to_build:
+        if contract not in stale:
+            logger.info(f"{contract.name} is up to date, skipping build")
+    if not stale:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as pool:
+        futures = {
+            pool.submit(build, artifact_path / contract.name, contract.path): contract
+            for contract in stale
+        }
+        for contract in stale:
+            logger.info(f"Building app at {contract.path}")
+        errors = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+                logger.info(f"Built {futures[future].name}")
+            except Exception as e:
+                errors.append(f"{futures[future].name}: {e}")
+    if errors:
+        raise Exception("Could not build contracts:\n" + "\n".join(errors))
+
+
+# -------------------------- Watch Logic -------------------------- #
+
+WATCH_INTERVAL_SECONDS = 0.2
+# Changes closer together than this (e.g. an editor saving several files) are
+# built once.
+DEBOUNCE_SECONDS = 0.3
+
+
+def _snapshot(contracts_to_watch: list[SmartContract]) -> dict[Path, tuple[int, int]]:
+    """Modification time and size of every Python source in the watched folders."""
+    snapshot = {}
+    for contract in contracts_to_watch:
+        for path in contract.path.parent.rglob("*.py"):
+            if "__pycache__" in path.parts:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _timed_build(output_dir: Path, contract_path: Path) -> float:
+    start = time.perf_counter()
+    build(output_dir, contract_path)
+    return time.perf_counter() - start
+
+
+def watch(contracts_to_watch: list[SmartContract], artifact_path: Path) -> None:
+    """
+    Rebuilds a contract whenever one of its sources changes, until interrupted.
+    The worker processes stay up between rebuilds, so a rebuild only pays for
+    the compiler itself.
+    """
+    try:
+        build_all(contracts_to_watch, artifact_path)
+    except Exception as e:
+        # Keep watching, the next save may fix it
+        logger.error(str(e))
+    folders = {contract.path.parent: contract for contract in contracts_to_watch}
+    snapshot = _snapshot(contracts_to_watch)
+    pending: set[str] = set()
+    last_change = 0.0
+    workers = min(len(contracts_to_watch), os.cpu_count() or 1) or 1
+    logger.info(
+        f"Watching {', '.join(contract.name for contract in contracts_to_watch)} (Ctrl+C to stop)"
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                time.sleep(WATCH_INTERVAL_SECONDS)
+                current = _snapshot(contracts_to_watch)
+                changed = {
+                    path
+                    for path in current.keys() | snapshot.keys()
+                    if current.get(path) != snapshot.get(path)
+                }
+                snapshot = current
+                if changed:
+                    for path in changed:
+                        pending.update(
+                            contract.name
+                            for folder, contract in folders.items()
+                            if folder in path.parents
+                        )
+                    last_change = time.monotonic()
+                    continue
+                if not pending or time.monotonic() - last_change < DEBOUNCE_SECONDS:
+                    continue
+
+                futures = {}
+                for contract in contracts_to_watch:
+                    if contract.name not in pending:
+                        continue
+                    output_dir = artifact_path / contract.name
+                    if is_up_to_date(output_dir, contract.path):
+                        logger.info(f"{contract.name} unchanged, skipping build")
+                        continue
+                    logger.info(f"Rebuilding {contract.name}")
+                    future = pool.submit(_timed_build, output_dir, contract.path)
+                    futures[future] = contract.name
+                pending.clear()
+                for future in as_completed(futures):
+                    try:
+                        logger.info(
+                            f"Rebuilt {futures[future]} in {future.result():.2f}s"
+                        )
+                    except Exception as e:
+                        logger.error(f"Could not rebuild {futures[future]}: {e}")
+        except KeyboardInterrupt:
+            logger.info("Stopped watching")
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
 def main(action: str, contract_name: str | None = None) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
-    # Filter contracts based on an optional specific contract name.
-    filtered_contracts = [
-        contract
-        for contract in contracts
-        if contract_name is None or contract.name == contract_name
-    ]
+    # Only the selected contract (or every contract) is discovered.
+    filtered_contracts = discover_contracts(contract_name)
+    if contract_name is not None and not filtered_contracts:
+        logger.error(f"No Algorand Python contract named {contract_name}")
+    if action in ("deploy", "all"):
+        configure_deploy()
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(filtered_contracts, artifact_path)
+        case "rebuild":
+            build_all(filtered_contracts, artifact_path, force=True)
+        case "watch":
+            watch(filtered_contracts, artifact_path)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -188,21 +473,23 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
+                deploy = contract.load_deploy()
+                if deploy:
                     logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+                    deploy()
         case "all":
+            build_all(filtered_contracts, artifact_path)
             for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
+                deploy = contract.load_deploy()
+                if deploy:
                     logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+                    deploy()
         case _:
             logger.error(f"Unknown action: {action}")
 
 
 if __name__ == "__main__":
+    configure_logging()
     if len(sys.argv) > 2:
         main(sys.argv[1], sys.argv[2])
     elif len(sys.argv) > 1:
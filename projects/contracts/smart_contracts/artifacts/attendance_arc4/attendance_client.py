@@ -0,0 +1,2570 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["CloseOut"], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "byte[]", "name": "session_name"}, {"type": "uint64", "name": "duration_seconds"}, {"type": "uint64", "name": "attendance_window_seconds"}], "name": "create", "returns": {"type": "void"}, "desc": "Creates the app with its first session (attendance_window_seconds=0 means the whole session)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "desc": "Opts in the sender; the creator is granted teacher privileges", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "teacher"}], "name": "add_teacher", "returns": {"type": "void"}, "desc": "Grants teacher privileges (admin only, teacher must be opted in)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "teacher"}], "name": "remove_teacher", "returns": {"type": "void"}, "desc": "Revokes teacher privileges (admin only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "byte[]", "name": "session_name"}, {"type": "uint64", "name": "duration_seconds"}, {"type": "uint64", "name": "attendance_window_seconds"}], "name": "create_session", "returns": {"type": "void"}, "desc": "Replaces the session held in global state", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "close_session", "returns": {"type": "void"}, "desc": "Closes the session held in global state", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "byte[]", "name": "session_name"}, {"type": "uint64", "name": "duration_seconds"}, {"type": "uint64", "name": "attendance_window_seconds"}], "name": "open_session", "returns": {"type": "void"}, "desc": "Registers a concurrent session in its own \"s\" + session_id box", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}], "name": "close_registered_session", "returns": {"type": "void"}, "desc": "Closes a registered session (opening teacher or admin)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "byte[]", "name": "merkle_root"}, {"type": "uint64", "name": "count"}], "name": "commit_attendance", "returns": {"type": "void"}, "desc": "Closes either kind of session and stores the Merkle root of its off-chain attendance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "address", "name": "student"}, {"type": "uint64", "name": "qr_round"}, {"type": "uint64", "name": "leaf_index"}, {"type": "byte[]", "name": "proof"}], "name": "verify_attendance", "returns": {"type": "void"}, "desc": "Proves a student is in a committed session's Merkle tree (proof: sibling hashes, leaf to root)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "pool_budget", "returns": {"type": "void"}, "desc": "Adds 700 opcodes to the group's pooled budget (anyone can call)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "uint64", "name": "qr_round"}, {"type": "byte[]", "name": "qr_hash"}], "name": "mark_attendance", "returns": {"type": "void"}, "desc": "Records attendance in the student's local state (requires opt-in)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "uint64", "name": "qr_round"}, {"type": "byte[]", "name": "qr_hash"}], "name": "mark_attendance_box", "returns": {"type": "void"}, "desc": "Records attendance in an \"a\" + session_id + student box (no opt-in required)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "uint64", "name": "capacity"}, {"type": "bool", "name": "track_rounds"}], "name": "create_roster", "returns": {"type": "void"}, "desc": "Creates a session roster record, its bitmap (1 bit per slot) and optionally a 2-byte round delta per slot", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "address", "name": "student"}], "name": "enroll", "returns": {"type": "uint64"}, "desc": "Assigns a student the roster's next slot and returns it (teacher only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "uint64", "name": "qr_round"}, {"type": "byte[]", "name": "qr_hash"}], "name": "mark_attendance_bitmap", "returns": {"type": "void"}, "desc": "Records attendance as one bit in the session bitmap at the student's enrollment slot", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}], "name": "get_session_summary", "returns": {"type": "byte[]"}, "desc": "Returns the session in the registered record layout for both kinds of session:\nstart_round | end_round | attendance_end_round | is_active | total_attendance | teacher | session_name (teacher is the creator for the session held in global state)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "session_id"}, {"type": "byte[]", "name": "addresses"}], "name": "get_attendance_bitmap", "returns": {"type": "byte[]"}, "desc": "Returns one bit per address (32 bytes each; bit 0 is the high bit of byte 0, as getbit),\nset when the student checked in with any attendance mode. Simulate with allow_unnamed_resources so the accounts and boxes need no references.", "events": [], "readonly": true, "recommendations": {}}], "name": "Attendance", "state": {"keys": {"box": {}, "global": {"session_id": {"key": "c2Vzc2lvbl9pZA==", "keyType": "AVMString", "valueType": "AVMBytes"}, "session_name": {"key": "c2Vzc2lvbl9uYW1l", "keyType": "AVMString", "valueType": "AVMBytes"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "start_round": {"key": "c3RhcnRfcm91bmQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "end_round": {"key": "ZW5kX3JvdW5k", "keyType": "AVMString", "valueType": "AVMUint64"}, "attendance_end_round": {"key": "YXR0ZW5kYW5jZV9lbmRfcm91bmQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_active": {"key": "aXNfYWN0aXZl", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_attendance": {"key": "dG90YWxfYXR0ZW5kYW5jZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"is_teacher": {"key": "aXNfdGVhY2hlcg==", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 3, "ints": 5}, "local": {"bytes": 0, "ints": 16}}}, "structs": {}, "byteCode": {"approval": "CyAEAAEIAiYQB2NyZWF0b3IBcwlpc19hY3RpdmUKc2Vzc2lvbl9pZAFlCmlzX3RlYWNoZXIBYRB0b3RhbF9hdHRlbmRhbmNlCmNoZWNrZWRfaW4BbgFiBBUffHULc3RhcnRfcm91bmQUYXR0ZW5kYW5jZV9lbmRfcm91bmQJZW5kX3JvdW5kDHNlc3Npb25fbmFtZTEbQQCpgAQwxtWKNhoAjgEAkTEZFEQxGEEAeoIQBDsPfOwEYKsYswRskUlXBJaF6uIE+G05qgQftaS3BE6BV0sECU7+sASeV9YsBGDaCKUEcXqWJQTGEboEBDPOywAEVxHpdgSSAMPQBIGjWD02GgCOEABvAIYAnQDxAPoBgAGVAfQAAQKeAzEDmQQCBFcFCAVlACNDgATkDGECNhoAjgEAFAAxGSMSMRgQREIAQzEZJRIxGBBDNhoBSSJZJQhLARUSRFcCADYaAkkiWSUISwEVEkRXAgA2GgNJFSQSRBc2GgRJFSQSRBcoMQBniAZVI0MxACIoZUQSMQAnBU8CZiNDNhoBSRWBIBJEMQAiKGVEEkQnBSNmI0M2GgFJFYEgEkQxACIoZUQSRCcFImYjQzYaAUkiWSUISwEVEkRXAgBJNhoCSSJZJQhLARUSRFcCAE4CNhoDSRUkEkQXTgI2GgRJFSQSRBdMiAWCRBWBHw5BAAkpSwJQvUUBFERMTgOIBcMjQ4gFZkQqImcjQzYaAUkiWSUISwEVEkRXAgA2GgJJIlklCEsBFRJEVwIANhoDSRUkEkQXNhoESRUkEkQXiAUrREsDFYEfDkQiK2VESwQTRDIGSwKBAwoITwJLAk8DTTIGTIEDCggpTwRQSwMVgUgISwFMuUQyBhZPAxZQTwIWUCMWUCIWUDEAUE8CUCJMuyNDNhoBSSJZJQhLARUSRFcCAIgE9SNDNhoBSSJZJQhLARUSRFcCAEk2GgJJIlklCEsBFRJEVwIATDYaA0kVJBJEF04CIitlRBJBACKIBI1EKiJnSRWBIBJEgAFtTwNQSYEouURPAhZPAkxQvyNDSwKIBJdC/902GgFJIlklCEsBFRJEVwIANhoCSRWBIBJENhoDSRUkEkQXNhoESRUkEkQXNhoFSSJZJQhLARUSRFcCAElOBRVJTgWBIBgURIABbU8EUElOBIEgJLoXSwENRIABAE8DUE8CFlABTCJJSwUMQQAxSwVLAYEgWEsCJRhAABWAAQFPBFBMUAFOAkwlCkyBIAhC/9aAAQFMUE8DUAFOAkL/6EgUREwigSC6EkQjQzYaAUkiWSUISwEVEkRXAgBJNhoCSRUkEkQXTgI2GgNJIlklCEsBFRJEVwIATgJJiAQYSE4EJwhLAVBJTgIxAExiFEQVgR8OQQAcJwZLAklOAlAxAFC9RQEURCcETFAxAFC9RQEURExJTwRPBIgEHzEATwIjZjEAgA5jaGVja19pbl9yb3VuZEsCUDIGZkyIBBkjQzYaAUkiWSUISwEVEkRXAgA2GgJJFSQSRBc2GgNJIlklCEsBFRJEVwIASwKIA4lITgNLAhWBHw5ESwJOAogDvEmIAwMURCcESwFQMQBQvUUBFEQnBksBUDEAUEkkuUQyBha/TIgDsSNDNhoBSSJZJQhLARUSRFcCAEk2GgJJFSQSRBdJTgI2GgNJFSMSRCJTiAKXREsCFYEfDkRLAUQnCUsDUEmBGLlESwIWIhZQSwIWUL8nCk8DUE8CgQcIJAq5REEADIABcksCUEsBJQu5RCNDNhoBSSJZJQhLARUSRFcCADYaAkkVgSASRIgCPEQnCUsCUEkkSboXSwEiJLoXSwENRCcETwRQTwNQSSS5REsBFkxLAb9MIwgWTwIkTwK7JwtMULAjQzYaAUkiWSUISwEVEkRXAgBJNhoCSRUkEkQXNhoDSSJZJQhLARUSRFcCAEsCiAJiTgVOA0sCFYEfDkRLAk4CiAKUSYgB2xREJwZLAVAxAFC9RQEURCcESwFQMQBQvkQXSU4EJwlLAlBJIiS6F0sCDUQnCk8DUEsCJApKI7pPBCQYSlMURCNUu4EQJLoXQQAdMgZLBAlJgf//Aw5EgAFySwNQSwQlC08CFlcGAruIAkIjQzYaAUkiWSUISwEVEkRXAgBJIitlRBJBADxIIicMZUQWIicOZUQWUCInDWVEFlAiKmVEFlAiJwdlRBZQIihlRFAiJw9lRFBJFRZXBgJMUCcLTFCwI0MpTFC+REL/6SJJgABHAjYaAUkiWSUISwEVEkRXAgBJNhoCSSJZJQhLARUSRFcCAElOAxVJTgNJgSAYFESBIAqBBwgkCq9MSRWBHw5JTgQnCk8CUEwiTgRBAAVJvUhFBCJJSwcMQQCFSwdLAYEgWElFDkkVgSASRDIIJwhLBlBjSElFDEAAFksFQQARJwZLBFBLDVC9RQFBAAMjRQtLCkAANksEQQAxJwRLBFBLDVC+TEUNQQAiSwsXSUULJApJRQpLBQxBABFLAUsJI7pLCiQYU0EAAyNFC0mBIApLCyITTwROAlROAoEgCEL/dEYCSRUWVwYCTFAnC0xQsCNDMQAiKGVEEkAADzEAIicFYyJOAk0jEkEAAiOJIomKAQExADIIJwiL/1BjSCITiYoBACmL/1BJgwIoILoxABJAAAoxACIoZUQSQQAJI0QiFoEYTLuJIkL/9IoEACuL/GcnD4v9ZycMMgZnMgaL/oEDCggnDkxni/6L/0lNMgZMgQMKCCcNTGcqI2cnByJniYoBAiIrZUSL/xJBABgiKmVEIxJEMgYiJw1lRA5EIicMZUQjTIkpi/9QSYEYJLoXIxJEMgZLAYEQJLoXDkQiJLoXIkyJigMAMgaL/gmBFA5Ei/4Wi/1MUDEAUAGL/xJEiYoCAIv/QQAMIicHZUQjCCcHTGeJKYv+UEmBICS6FyMIFoEgTLuJ", "clear": "C4EBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyCiAgICBieXRlY2Jsb2NrICJjcmVhdG9yIiAweDczICJpc19hY3RpdmUiICJzZXNzaW9uX2lkIiAweDY1ICJpc190ZWFjaGVyIiAweDYxICJ0b3RhbF9hdHRlbmRhbmNlIiAweDYzNjg2NTYzNmI2NTY0NWY2OTZlIDB4NmUgMHg2MiAweDE1MWY3Yzc1ICJzdGFydF9yb3VuZCIgImF0dGVuZGFuY2VfZW5kX3JvdW5kIiAiZW5kX3JvdW5kIiAic2Vzc2lvbl9uYW1lIgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNi0zMQogICAgLy8gY2xhc3MgQXR0ZW5kYW5jZSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgIyBjaGVja2VkX2luPHNlc3Npb25faWQ+L2NoZWNrX2luX3JvdW5kPHNlc3Npb25faWQ+IGxvY2FsIGtleXMgYXJlIGR5bmFtaWMsIHJlc2VydmUgdGhlbSBleHBsaWNpdGx5CiAgICAvLyAgICAgIyAoMTYgaXMgdGhlIEFWTSdzIGxvY2FsIHNjaGVtYSBsaW1pdDogaXNfdGVhY2hlciArIDcgc2Vzc2lvbnMgKyAxIHNwYXJlKQogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NSwgZ2xvYmFsX2J5dGVzPTMsIGxvY2FsX3VpbnRzPTE2LCBsb2NhbF9ieXRlcz0wKSwKICAgIC8vICk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9jbG9zZV9vdXRAMjkKICAgIHB1c2hieXRlcyAweDMwYzZkNThhIC8vIG1ldGhvZCAib3B0X2luKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9vcHRfaW5fcm91dGVANQoKbWFpbl9zd2l0Y2hfY2FzZV9uZXh0QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI2LTMxCiAgICAvLyBjbGFzcyBBdHRlbmRhbmNlKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICAjIGNoZWNrZWRfaW48c2Vzc2lvbl9pZD4vY2hlY2tfaW5fcm91bmQ8c2Vzc2lvbl9pZD4gbG9jYWwga2V5cyBhcmUgZHluYW1pYywgcmVzZXJ2ZSB0aGVtIGV4cGxpY2l0bHkKICAgIC8vICAgICAjICgxNiBpcyB0aGUgQVZNJ3MgbG9jYWwgc2NoZW1hIGxpbWl0OiBpc190ZWFjaGVyICsgNyBzZXNzaW9ucyArIDEgc3BhcmUpCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz01LCBnbG9iYWxfYnl0ZXM9MywgbG9jYWxfdWludHM9MTYsIGxvY2FsX2J5dGVzPTApLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMjUKICAgIHB1c2hieXRlc3MgMHgzYjBmN2NlYyAweDYwYWIxOGIzIDB4NmM5MTQ5NTcgMHg5Njg1ZWFlMiAweGY4NmQzOWFhIDB4MWZiNWE0YjcgMHg0ZTgxNTc0YiAweDA5NGVmZWIwIDB4OWU1N2Q2MmMgMHg2MGRhMDhhNSAweDcxN2E5NjI1IDB4YzYxMWJhMDQgMHgzM2NlY2IwMCAweDU3MTFlOTc2IDB4OTIwMGMzZDAgMHg4MWEzNTgzZCAvLyBtZXRob2QgImFkZF90ZWFjaGVyKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAicmVtb3ZlX3RlYWNoZXIoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJjcmVhdGVfc2Vzc2lvbihieXRlW10sYnl0ZVtdLHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xvc2Vfc2Vzc2lvbigpdm9pZCIsIG1ldGhvZCAib3Blbl9zZXNzaW9uKGJ5dGVbXSxieXRlW10sdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb24oYnl0ZVtdKXZvaWQiLCBtZXRob2QgImNvbW1pdF9hdHRlbmRhbmNlKGJ5dGVbXSxieXRlW10sdWludDY0KXZvaWQiLCBtZXRob2QgInZlcmlmeV9hdHRlbmRhbmNlKGJ5dGVbXSxhZGRyZXNzLHVpbnQ2NCx1aW50NjQsYnl0ZVtdKXZvaWQiLCBtZXRob2QgInBvb2xfYnVkZ2V0KCl2b2lkIiwgbWV0aG9kICJtYXJrX2F0dGVuZGFuY2UoYnl0ZVtdLHVpbnQ2NCxieXRlW10pdm9pZCIsIG1ldGhvZCAibWFya19hdHRlbmRhbmNlX2JveChieXRlW10sdWludDY0LGJ5dGVbXSl2b2lkIiwgbWV0aG9kICJjcmVhdGVfcm9zdGVyKGJ5dGVbXSx1aW50NjQsYm9vbCl2b2lkIiwgbWV0aG9kICJlbnJvbGwoYnl0ZVtdLGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJtYXJrX2F0dGVuZGFuY2VfYml0bWFwKGJ5dGVbXSx1aW50NjQsYnl0ZVtdKXZvaWQiLCBtZXRob2QgImdldF9zZXNzaW9uX3N1bW1hcnkoYnl0ZVtdKWJ5dGVbXSIsIG1ldGhvZCAiZ2V0X2F0dGVuZGFuY2VfYml0bWFwKGJ5dGVbXSxieXRlW10pYnl0ZVtdIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggYWRkX3RlYWNoZXIgcmVtb3ZlX3RlYWNoZXIgY3JlYXRlX3Nlc3Npb24gY2xvc2Vfc2Vzc2lvbiBvcGVuX3Nlc3Npb24gY2xvc2VfcmVnaXN0ZXJlZF9zZXNzaW9uIGNvbW1pdF9hdHRlbmRhbmNlIHZlcmlmeV9hdHRlbmRhbmNlIG1haW5fcG9vbF9idWRnZXRfcm91dGVAMTYgbWFya19hdHRlbmRhbmNlIG1hcmtfYXR0ZW5kYW5jZV9ib3ggY3JlYXRlX3Jvc3RlciBlbnJvbGwgbWFya19hdHRlbmRhbmNlX2JpdG1hcCBnZXRfc2Vzc2lvbl9zdW1tYXJ5IGdldF9hdHRlbmRhbmNlX2JpdG1hcAogICAgZXJyCgptYWluX3Bvb2xfYnVkZ2V0X3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfTm9PcEAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjYtMzEKICAgIC8vIGNsYXNzIEF0dGVuZGFuY2UoCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgICMgY2hlY2tlZF9pbjxzZXNzaW9uX2lkPi9jaGVja19pbl9yb3VuZDxzZXNzaW9uX2lkPiBsb2NhbCBrZXlzIGFyZSBkeW5hbWljLCByZXNlcnZlIHRoZW0gZXhwbGljaXRseQogICAgLy8gICAgICMgKDE2IGlzIHRoZSBBVk0ncyBsb2NhbCBzY2hlbWEgbGltaXQ6IGlzX3RlYWNoZXIgKyA3IHNlc3Npb25zICsgMSBzcGFyZSkKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTUsIGdsb2JhbF9ieXRlcz0zLCBsb2NhbF91aW50cz0xNiwgbG9jYWxfYnl0ZXM9MCksCiAgICAvLyApOgogICAgcHVzaGJ5dGVzIDB4ZTQwYzYxMDIgLy8gbWV0aG9kICJjcmVhdGUoYnl0ZVtdLGJ5dGVbXSx1aW50NjQsdWludDY0KXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKbWFpbl9vcHRfaW5fcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NTUKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzEgLy8gT3B0SW4KICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIGFzc2VydAogICAgYiBvcHRfaW4KCm1haW5fY2xvc2Vfb3V0QDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo2MAogICAgLy8gQGJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz1bIkNsb3NlT3V0Il0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnRjXzMgLy8gQ2xvc2VPdXQKICAgID09CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgJiYKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NTIKICAgIC8vIHNlbGYuY3JlYXRvciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzAgLy8gImNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5fc3RhcnRfZ2xvYmFsX3Nlc3Npb24oc2Vzc2lvbl9pZCwgc2Vzc2lvbl9uYW1lLCBkdXJhdGlvbl9zZWNvbmRzLCBhdHRlbmRhbmNlX3dpbmRvd19zZWNvbmRzKQogICAgY2FsbHN1YiBfc3RhcnRfZ2xvYmFsX3Nlc3Npb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NDcKICAgIC8vIEBhYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2Uub3B0X2luW3JvdXRpbmddKCkgLT4gdm9pZDoKb3B0X2luOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo1OAogICAgLy8gc2VsZi5pc190ZWFjaGVyW1R4bi5zZW5kZXJdID0gVUludDY0KDEpIGlmIFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yIGVsc2UgVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDUgLy8gImlzX3RlYWNoZXIiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NTUKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk9wdEluIl0pCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmFkZF90ZWFjaGVyW3JvdXRpbmddKCkgLT4gdm9pZDoKYWRkX3RlYWNoZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjY2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NjkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgdGhlIGNyZWF0b3IgY2FuIG1hbmFnZSB0ZWFjaGVycyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGNyZWF0b3IgY2FuIG1hbmFnZSB0ZWFjaGVycwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5pc190ZWFjaGVyW3RlYWNoZXJdID0gVUludDY0KDEpCiAgICBieXRlYyA1IC8vICJpc190ZWFjaGVyIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5yZW1vdmVfdGVhY2hlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlbW92ZV90ZWFjaGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IsICJPbmx5IHRoZSBjcmVhdG9yIGNhbiBtYW5hZ2UgdGVhY2hlcnMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBjcmVhdG9yIGNhbiBtYW5hZ2UgdGVhY2hlcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6NzYKICAgIC8vIHNlbGYuaXNfdGVhY2hlclt0ZWFjaGVyXSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNSAvLyAiaXNfdGVhY2hlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2UuY3JlYXRlX3Nlc3Npb25bcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfc2Vzc2lvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6ODAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGNvdmVyIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGNvdmVyIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6ODUKICAgIC8vIGFzc2VydCBzZWxmLl9pc19hdXRob3JpemVkX3RlYWNoZXIoKSwgIkNhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyIgogICAgY2FsbHN1YiBfaXNfYXV0aG9yaXplZF90ZWFjaGVyCiAgICBhc3NlcnQgLy8gQ2FsbGVyIGlzIG5vdCBhbiBhdXRob3JpemVkIHRlYWNoZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6ODYKICAgIC8vIGlmIHNlc3Npb25faWQubGVuZ3RoIDw9IE1BWF9CT1hfU0VTU0lPTl9JRF9MRU5HVEg6CiAgICBsZW4KICAgIHB1c2hpbnQgMzEKICAgIDw9CiAgICBieiBjcmVhdGVfc2Vzc2lvbl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6ODcKICAgIC8vIF9sZW5ndGgsIHJlZ2lzdGVyZWQgPSBvcC5Cb3gubGVuZ3RoKEJ5dGVzKGIicyIpICsgc2Vzc2lvbl9pZCkKICAgIGJ5dGVjXzEgLy8gMHg3MwogICAgZGlnIDIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBhc3NlcnQgbm90IHJlZ2lzdGVyZWQsICJTZXNzaW9uIElEIGlzIHJlZ2lzdGVyZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gU2Vzc2lvbiBJRCBpcyByZWdpc3RlcmVkCgpjcmVhdGVfc2Vzc2lvbl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLl9zdGFydF9nbG9iYWxfc2Vzc2lvbihzZXNzaW9uX2lkLCBzZXNzaW9uX25hbWUsIGR1cmF0aW9uX3NlY29uZHMsIGF0dGVuZGFuY2Vfd2luZG93X3NlY29uZHMpCiAgICBzd2FwCiAgICBjb3ZlciAzCiAgICBjYWxsc3ViIF9zdGFydF9nbG9iYWxfc2Vzc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo4MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmNsb3NlX3Nlc3Npb25bcm91dGluZ10oKSAtPiB2b2lkOgpjbG9zZV9zZXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMzgKICAgIC8vIGFzc2VydCBzZWxmLl9pc19hdXRob3JpemVkX3RlYWNoZXIoKSwgIkNhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyIgogICAgY2FsbHN1YiBfaXNfYXV0aG9yaXplZF90ZWFjaGVyCiAgICBhc3NlcnQgLy8gQ2FsbGVyIGlzIG5vdCBhbiBhdXRob3JpemVkIHRlYWNoZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzM5CiAgICAvLyBzZWxmLmlzX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAiaXNfYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2Uub3Blbl9zZXNzaW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKb3Blbl9zZXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTo5NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTAxCiAgICAvLyBhc3NlcnQgc2VsZi5faXNfYXV0aG9yaXplZF90ZWFjaGVyKCksICJDYWxsZXIgaXMgbm90IGFuIGF1dGhvcml6ZWQgdGVhY2hlciIKICAgIGNhbGxzdWIgX2lzX2F1dGhvcml6ZWRfdGVhY2hlcgogICAgYXNzZXJ0IC8vIENhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gYXNzZXJ0IHNlc3Npb25faWQubGVuZ3RoIDw9IE1BWF9CT1hfU0VTU0lPTl9JRF9MRU5HVEgsICJTZXNzaW9uIElEIHRvbyBsb25nIgogICAgZGlnIDMKICAgIGxlbgogICAgcHVzaGludCAzMQogICAgPD0KICAgIGFzc2VydCAvLyBTZXNzaW9uIElEIHRvbyBsb25nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEwMwogICAgLy8gYXNzZXJ0IHNlc3Npb25faWQgIT0gc2VsZi5zZXNzaW9uX2lkLCAiU2Vzc2lvbiBJRCBpcyBoZWxkIGluIGdsb2JhbCBzdGF0ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJzZXNzaW9uX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNlc3Npb25faWQgZXhpc3RzCiAgICBkaWcgNAogICAgIT0KICAgIGFzc2VydCAvLyBTZXNzaW9uIElEIGlzIGhlbGQgaW4gZ2xvYmFsIHN0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEwNQogICAgLy8gZW5kX3JvdW5kID0gR2xvYmFsLnJvdW5kICsgZHVyYXRpb25fc2Vjb25kcyAvLyBTRUNPTkRTX1BFUl9ST1VORAogICAgZ2xvYmFsIFJvdW5kCiAgICBkaWcgMgogICAgcHVzaGludCAzCiAgICAvCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM1MAogICAgLy8gd2luZG93ID0gYXR0ZW5kYW5jZV93aW5kb3dfc2Vjb25kcyBpZiBhdHRlbmRhbmNlX3dpbmRvd19zZWNvbmRzIGVsc2UgZHVyYXRpb25fc2Vjb25kcwogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAzCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzUxCiAgICAvLyByZXR1cm4gR2xvYmFsLnJvdW5kICsgd2luZG93IC8vIFNFQ09ORFNfUEVSX1JPVU5ECiAgICBnbG9iYWwgUm91bmQKICAgIHN3YXAKICAgIHB1c2hpbnQgMwogICAgLwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxMDgKICAgIC8vIG5hbWUgPSBCeXRlcyhiInMiKSArIHNlc3Npb25faWQKICAgIGJ5dGVjXzEgLy8gMHg3MwogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTA5CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShuYW1lLCBTRVNTSU9OX0hFQURFUl9TSVpFICsgc2Vzc2lvbl9uYW1lLmxlbmd0aCksICJTZXNzaW9uIGFscmVhZHkgcmVnaXN0ZXJlZCIKICAgIGRpZyAzCiAgICBsZW4KICAgIHB1c2hpbnQgNzIKICAgICsKICAgIGRpZyAxCiAgICBzd2FwCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gU2Vzc2lvbiBhbHJlYWR5IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEzCiAgICAvLyBvcC5pdG9iKEdsb2JhbC5yb3VuZCkKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxMTQKICAgIC8vICsgb3AuaXRvYihlbmRfcm91bmQpCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gb3AuaXRvYihHbG9iYWwucm91bmQpCiAgICAvLyArIG9wLml0b2IoZW5kX3JvdW5kKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjExNQogICAgLy8gKyBvcC5pdG9iKGF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjExMy0xMTUKICAgIC8vIG9wLml0b2IoR2xvYmFsLnJvdW5kKQogICAgLy8gKyBvcC5pdG9iKGVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihhdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxMTYKICAgIC8vICsgb3AuaXRvYigxKQogICAgaW50Y18xIC8vIDEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEzLTExNgogICAgLy8gb3AuaXRvYihHbG9iYWwucm91bmQpCiAgICAvLyArIG9wLml0b2IoZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKGF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKDEpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTE3CiAgICAvLyArIG9wLml0b2IoMCkKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjExMy0xMTcKICAgIC8vIG9wLml0b2IoR2xvYmFsLnJvdW5kKQogICAgLy8gKyBvcC5pdG9iKGVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihhdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYigxKQogICAgLy8gKyBvcC5pdG9iKDApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTE4CiAgICAvLyArIFR4bi5zZW5kZXIuYnl0ZXMKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEzLTExOAogICAgLy8gb3AuaXRvYihHbG9iYWwucm91bmQpCiAgICAvLyArIG9wLml0b2IoZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKGF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKDEpCiAgICAvLyArIG9wLml0b2IoMCkKICAgIC8vICsgVHhuLnNlbmRlci5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjExMy0xMTkKICAgIC8vIG9wLml0b2IoR2xvYmFsLnJvdW5kKQogICAgLy8gKyBvcC5pdG9iKGVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihhdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYigxKQogICAgLy8gKyBvcC5pdG9iKDApCiAgICAvLyArIFR4bi5zZW5kZXIuYnl0ZXMKICAgIC8vICsgc2Vzc2lvbl9uYW1lLAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEyCiAgICAvLyBTRVNTSU9OX1NUQVJUX1JPVU5ELAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTEwLTEyMAogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgbmFtZSwKICAgIC8vICAgICBTRVNTSU9OX1NUQVJUX1JPVU5ELAogICAgLy8gICAgIG9wLml0b2IoR2xvYmFsLnJvdW5kKQogICAgLy8gICAgICsgb3AuaXRvYihlbmRfcm91bmQpCiAgICAvLyAgICAgKyBvcC5pdG9iKGF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgLy8gICAgICsgb3AuaXRvYigxKQogICAgLy8gICAgICsgb3AuaXRvYigwKQogICAgLy8gICAgICsgVHhuLnNlbmRlci5ieXRlcwogICAgLy8gICAgICsgc2Vzc2lvbl9uYW1lLAogICAgLy8gKQogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6OTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb25bcm91dGluZ10oKSAtPiB2b2lkOgpjbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxMjUKICAgIC8vIHNlbGYuX2Nsb3NlX3JlZ2lzdGVyZWRfc2Vzc2lvbihzZXNzaW9uX2lkKQogICAgY2FsbHN1YiBfY2xvc2VfcmVnaXN0ZXJlZF9zZXNzaW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmNvbW1pdF9hdHRlbmRhbmNlW3JvdXRpbmddKCkgLT4gdm9pZDoKY29tbWl0X2F0dGVuZGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgc3dhcAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxMzAKICAgIC8vIGlmIHNlc3Npb25faWQgPT0gc2VsZi5zZXNzaW9uX2lkOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInNlc3Npb25faWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Vzc2lvbl9pZCBleGlzdHMKICAgID09CiAgICBieiBjb21taXRfYXR0ZW5kYW5jZV9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMzgKICAgIC8vIGFzc2VydCBzZWxmLl9pc19hdXRob3JpemVkX3RlYWNoZXIoKSwgIkNhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyIgogICAgY2FsbHN1YiBfaXNfYXV0aG9yaXplZF90ZWFjaGVyCiAgICBhc3NlcnQgLy8gQ2FsbGVyIGlzIG5vdCBhbiBhdXRob3JpemVkIHRlYWNoZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzM5CiAgICAvLyBzZWxmLmlzX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAiaXNfYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0Cgpjb21taXRfYXR0ZW5kYW5jZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEzNQogICAgLy8gYXNzZXJ0IG1lcmtsZV9yb290Lmxlbmd0aCA9PSAzMiwgIk1lcmtsZSByb290IG11c3QgYmUgMzIgYnl0ZXMiCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBNZXJrbGUgcm9vdCBtdXN0IGJlIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gbmFtZSA9IEJ5dGVzKGIibSIpICsgc2Vzc2lvbl9pZAogICAgcHVzaGJ5dGVzIDB4NmQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEzNwogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUobmFtZSwgNDApLCAiQXR0ZW5kYW5jZSBhbHJlYWR5IGNvbW1pdHRlZCIKICAgIGR1cAogICAgcHVzaGludCA0MAogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIEF0dGVuZGFuY2UgYWxyZWFkeSBjb21taXR0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTM4CiAgICAvLyBvcC5Cb3gucHV0KG5hbWUsIG1lcmtsZV9yb290ICsgb3AuaXRvYihjb3VudCkpCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjEyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpjb21taXRfYXR0ZW5kYW5jZV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLl9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb24oc2Vzc2lvbl9pZCkKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb24KICAgIGIgY29tbWl0X2F0dGVuZGFuY2VfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLnZlcmlmeV9hdHRlbmRhbmNlW3JvdXRpbmddKCkgLT4gdm9pZDoKdmVyaWZ5X2F0dGVuZGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE0MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgY292ZXIgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNDUKICAgIC8vIGFzc2VydCBwcm9vZi5sZW5ndGggJSAzMiA9PSAwLCAiUHJvb2YgbXVzdCBiZSAzMi1ieXRlIGhhc2hlcyIKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciA1CiAgICBwdXNoaW50IDMyCiAgICAlCiAgICAhCiAgICBhc3NlcnQgLy8gUHJvb2YgbXVzdCBiZSAzMi1ieXRlIGhhc2hlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNDYKICAgIC8vIGNvbW1pdG1lbnQgPSBCeXRlcyhiIm0iKSArIHNlc3Npb25faWQKICAgIHB1c2hieXRlcyAweDZkCiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE0NwogICAgLy8gYXNzZXJ0IGxlYWZfaW5kZXggPCBvcC5idG9pKG9wLkJveC5leHRyYWN0KGNvbW1pdG1lbnQsIDMyLCA4KSksICJMZWFmIG91dHNpZGUgdGhlIGNvbW1pdG1lbnQiCiAgICBwdXNoaW50IDMyCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gTGVhZiBvdXRzaWRlIHRoZSBjb21taXRtZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE0OQogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihCeXRlcyhiIlx4MDAiKSArIHN0dWRlbnQuYnl0ZXMgKyBvcC5pdG9iKHFyX3JvdW5kKSkKICAgIHB1c2hieXRlcyAweDAwCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNTEKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKDAsIHByb29mLmxlbmd0aCwgMzIpOgogICAgaW50Y18wIC8vIDAKCnZlcmlmeV9hdHRlbmRhbmNlX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTUxCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgwLCBwcm9vZi5sZW5ndGgsIDMyKToKICAgIGR1cAogICAgZGlnIDUKICAgIDwKICAgIGJ6IHZlcmlmeV9hdHRlbmRhbmNlX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE1MgogICAgLy8gc2libGluZyA9IG9wLmV4dHJhY3QocHJvb2YsIG9mZnNldCwgMzIpCiAgICBkaWcgNQogICAgZGlnIDEKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE1My0xNTQKICAgIC8vICMgRXZlbiBpbmRleDogdGhlIG5vZGUgaXMgdGhlIGxlZnQgY2hpbGQKICAgIC8vIGlmIGluZGV4ICUgMiA9PSAwOgogICAgZGlnIDIKICAgIGludGNfMyAvLyAyCiAgICAlCiAgICBibnogdmVyaWZ5X2F0dGVuZGFuY2VfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTU1CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KEJ5dGVzKGIiXHgwMSIpICsgbm9kZSArIHNpYmxpbmcpCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBjb3ZlciAyCgp2ZXJpZnlfYXR0ZW5kYW5jZV9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gaW5kZXggLy89IDIKICAgIHN3YXAKICAgIGludGNfMyAvLyAyCiAgICAvCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE1MQogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMCwgcHJvb2YubGVuZ3RoLCAzMik6CiAgICBwdXNoaW50IDMyCiAgICArCiAgICBiIHZlcmlmeV9hdHRlbmRhbmNlX2Zvcl9oZWFkZXJAMgoKdmVyaWZ5X2F0dGVuZGFuY2VfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE1NwogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihCeXRlcyhiIlx4MDEiKSArIHNpYmxpbmcgKyBub2RlKQogICAgcHVzaGJ5dGVzIDB4MDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgY292ZXIgMgogICAgYiB2ZXJpZnlfYXR0ZW5kYW5jZV9hZnRlcl9pZl9lbHNlQDYKCnZlcmlmeV9hdHRlbmRhbmNlX2FmdGVyX2ZvckA4OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE2MC0xNjEKICAgIC8vICMgQSBwcm9vZiBzaG9ydGVyIHRoYW4gdGhlIHRyZWUgd291bGQgbGVhdmUgaW5kZXggYml0cyB1bnVzZWQKICAgIC8vIGFzc2VydCBpbmRleCA9PSAwLCAiUHJvb2YgZG9lcyBub3QgcmVhY2ggdGhlIHJvb3QiCiAgICAhCiAgICBhc3NlcnQgLy8gUHJvb2YgZG9lcyBub3QgcmVhY2ggdGhlIHJvb3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTYyCiAgICAvLyBhc3NlcnQgbm9kZSA9PSBvcC5Cb3guZXh0cmFjdChjb21taXRtZW50LCAwLCAzMiksICJTdHVkZW50IG5vdCBpbiB0aGUgY29tbWl0dGVkIGF0dGVuZGFuY2UiCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGludCAzMgogICAgYm94X2V4dHJhY3QKICAgID09CiAgICBhc3NlcnQgLy8gU3R1ZGVudCBub3QgaW4gdGhlIGNvbW1pdHRlZCBhdHRlbmRhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE0MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLm1hcmtfYXR0ZW5kYW5jZVtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1hcmtfYXR0ZW5kYW5jZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTcwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGNvdmVyIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE3MwogICAgLy8gaXNfZ2xvYmFsLCBfc3RhcnRfcm91bmQgPSBzZWxmLl9jaGVja19zZXNzaW9uX29wZW4oc2Vzc2lvbl9pZCkKICAgIGR1cAogICAgY2FsbHN1YiBfY2hlY2tfc2Vzc2lvbl9vcGVuCiAgICBwb3AKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTc1CiAgICAvLyBjaGVja2VkX2luX2tleSA9IEJ5dGVzKGIiY2hlY2tlZF9pbiIpICsgc2Vzc2lvbl9pZAogICAgYnl0ZWMgOCAvLyAweDYzNjg2NTYzNmI2NTY0NWY2OTZlCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTc2CiAgICAvLyBhc3NlcnQgb3AuQXBwTG9jYWwuZ2V0X3VpbnQ2NChUeG4uc2VuZGVyLCBjaGVja2VkX2luX2tleSkgPT0gMCwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBhcHBfbG9jYWxfZ2V0CiAgICAhCiAgICBhc3NlcnQgLy8gQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNzctMTc5CiAgICAvLyAjIE5vciBpbiBib3ggbW9kZSwgYW5kIGlzbid0IG9uIHRoZSBzZXNzaW9uJ3Mgcm9zdGVyIChib3ggbW9kZXMgbmVlZCBhIHNlc3Npb25faWQKICAgIC8vICMgdGhhdCBmaXRzIGluIGEgYm94IG5hbWUpCiAgICAvLyBpZiBzZXNzaW9uX2lkLmxlbmd0aCA8PSBNQVhfQk9YX1NFU1NJT05fSURfTEVOR1RIOgogICAgbGVuCiAgICBwdXNoaW50IDMxCiAgICA8PQogICAgYnogbWFya19hdHRlbmRhbmNlX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxODAKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5faGFzX2JveChCeXRlcyhiImEiKSArIHNlc3Npb25faWQgKyBUeG4uc2VuZGVyLmJ5dGVzKSwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICBieXRlYyA2IC8vIDB4NjEKICAgIGRpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMyNQogICAgLy8gX2xlbmd0aCwgZXhpc3RzID0gb3AuQm94Lmxlbmd0aChuYW1lKQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4MAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLl9oYXNfYm94KEJ5dGVzKGIiYSIpICsgc2Vzc2lvbl9pZCArIFR4bi5zZW5kZXIuYnl0ZXMpLCAiQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZCIKICAgICEKICAgIGFzc2VydCAvLyBBdHRlbmRhbmNlIGFscmVhZHkgbWFya2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4MQogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLl9oYXNfYm94KEJ5dGVzKGIiZSIpICsgc2Vzc2lvbl9pZCArIFR4bi5zZW5kZXIuYnl0ZXMpLCAiU3R1ZGVudCBpcyBlbnJvbGxlZCIKICAgIGJ5dGVjIDQgLy8gMHg2NQogICAgc3dhcAogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzI1CiAgICAvLyBfbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKG5hbWUpCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTgxCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuX2hhc19ib3goQnl0ZXMoYiJlIikgKyBzZXNzaW9uX2lkICsgVHhuLnNlbmRlci5ieXRlcyksICJTdHVkZW50IGlzIGVucm9sbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIFN0dWRlbnQgaXMgZW5yb2xsZWQKCm1hcmtfYXR0ZW5kYW5jZV9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4MgogICAgLy8gc2VsZi5fdmVyaWZ5X3FyX3Byb29mKHNlc3Npb25faWQsIHFyX3JvdW5kLCBxcl9oYXNoKQogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgY2FsbHN1YiBfdmVyaWZ5X3FyX3Byb29mCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4NAogICAgLy8gb3AuQXBwTG9jYWwucHV0KFR4bi5zZW5kZXIsIGNoZWNrZWRfaW5fa2V5LCBVSW50NjQoMSkpCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4NQogICAgLy8gb3AuQXBwTG9jYWwucHV0KFR4bi5zZW5kZXIsIEJ5dGVzKGIiY2hlY2tfaW5fcm91bmQiKSArIHNlc3Npb25faWQsIEdsb2JhbC5yb3VuZCkKICAgIHR4biBTZW5kZXIKICAgIHB1c2hieXRlcyAweDYzNjg2NTYzNmI1ZjY5NmU1ZjcyNmY3NTZlNjQKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGdsb2JhbCBSb3VuZAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxODYKICAgIC8vIHNlbGYuX2NvdW50X2F0dGVuZGFuY2Uoc2Vzc2lvbl9pZCwgaXNfZ2xvYmFsKQogICAgc3dhcAogICAgY2FsbHN1YiBfY291bnRfYXR0ZW5kYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxNzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5tYXJrX2F0dGVuZGFuY2VfYm94W3JvdXRpbmddKCkgLT4gdm9pZDoKbWFya19hdHRlbmRhbmNlX2JveDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTg4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxOTEKICAgIC8vIGlzX2dsb2JhbCwgX3N0YXJ0X3JvdW5kID0gc2VsZi5fY2hlY2tfc2Vzc2lvbl9vcGVuKHNlc3Npb25faWQpCiAgICBkaWcgMgogICAgY2FsbHN1YiBfY2hlY2tfc2Vzc2lvbl9vcGVuCiAgICBwb3AKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTkyCiAgICAvLyBhc3NlcnQgc2Vzc2lvbl9pZC5sZW5ndGggPD0gTUFYX0JPWF9TRVNTSU9OX0lEX0xFTkdUSCwgIlNlc3Npb24gSUQgdG9vIGxvbmciCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDMxCiAgICA8PQogICAgYXNzZXJ0IC8vIFNlc3Npb24gSUQgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTkzCiAgICAvLyBzZWxmLl92ZXJpZnlfcXJfcHJvb2Yoc2Vzc2lvbl9pZCwgcXJfcm91bmQsIHFyX2hhc2gpCiAgICBkaWcgMgogICAgY292ZXIgMgogICAgY2FsbHN1YiBfdmVyaWZ5X3FyX3Byb29mCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLl9jaGVja2VkX2luX2xvY2FsKHNlc3Npb25faWQpLCAiQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZCIKICAgIGR1cAogICAgY2FsbHN1YiBfY2hlY2tlZF9pbl9sb2NhbAogICAgIQogICAgYXNzZXJ0IC8vIEF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuX2hhc19ib3goQnl0ZXMoYiJlIikgKyBzZXNzaW9uX2lkICsgVHhuLnNlbmRlci5ieXRlcyksICJTdHVkZW50IGlzIGVucm9sbGVkIgogICAgYnl0ZWMgNCAvLyAweDY1CiAgICBkaWcgMQogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzI1CiAgICAvLyBfbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKG5hbWUpCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuX2hhc19ib3goQnl0ZXMoYiJlIikgKyBzZXNzaW9uX2lkICsgVHhuLnNlbmRlci5ieXRlcyksICJTdHVkZW50IGlzIGVucm9sbGVkIgogICAgIQogICAgYXNzZXJ0IC8vIFN0dWRlbnQgaXMgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTk3CiAgICAvLyBuYW1lID0gQnl0ZXMoYiJhIikgKyBzZXNzaW9uX2lkICsgVHhuLnNlbmRlci5ieXRlcwogICAgYnl0ZWMgNiAvLyAweDYxCiAgICBkaWcgMQogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MTk4CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShuYW1lLCA4KSwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToxOTkKICAgIC8vIG9wLkJveC5wdXQobmFtZSwgb3AuaXRvYihHbG9iYWwucm91bmQpKQogICAgZ2xvYmFsIFJvdW5kCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIwMAogICAgLy8gc2VsZi5fY291bnRfYXR0ZW5kYW5jZShzZXNzaW9uX2lkLCBpc19nbG9iYWwpCiAgICBzd2FwCiAgICBjYWxsc3ViIF9jb3VudF9hdHRlbmRhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjE4OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmNyZWF0ZV9yb3N0ZXJbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfcm9zdGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMDIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMDUKICAgIC8vIGFzc2VydCBzZWxmLl9pc19hdXRob3JpemVkX3RlYWNoZXIoKSwgIkNhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyIgogICAgY2FsbHN1YiBfaXNfYXV0aG9yaXplZF90ZWFjaGVyCiAgICBhc3NlcnQgLy8gQ2FsbGVyIGlzIG5vdCBhbiBhdXRob3JpemVkIHRlYWNoZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjA2CiAgICAvLyBhc3NlcnQgc2Vzc2lvbl9pZC5sZW5ndGggPD0gTUFYX0JPWF9TRVNTSU9OX0lEX0xFTkdUSCwgIlNlc3Npb24gSUQgdG9vIGxvbmciCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDMxCiAgICA8PQogICAgYXNzZXJ0IC8vIFNlc3Npb24gSUQgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjA3CiAgICAvLyBhc3NlcnQgY2FwYWNpdHkgPiAwLCAiQ2FwYWNpdHkgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGRpZyAxCiAgICBhc3NlcnQgLy8gQ2FwYWNpdHkgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMDkKICAgIC8vIHJvc3RlciA9IEJ5dGVzKGIibiIpICsgc2Vzc2lvbl9pZAogICAgYnl0ZWMgOSAvLyAweDZlCiAgICBkaWcgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIxMAogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUocm9zdGVyLCBST1NURVJfUkVDT1JEX1NJWkUpLCAiUm9zdGVyIGFscmVhZHkgZXhpc3RzIgogICAgZHVwCiAgICBwdXNoaW50IDI0CiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gUm9zdGVyIGFscmVhZHkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIxMQogICAgLy8gb3AuQm94LnB1dChyb3N0ZXIsIG9wLml0b2IoY2FwYWNpdHkpICsgb3AuaXRvYigwKSArIG9wLml0b2IoVUludDY0KDEpIGlmIHRyYWNrX3JvdW5kcyBlbHNlIFVJbnQ2NCgwKSkpCiAgICBkaWcgMgogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGl0b2IKICAgIGNvbmNhdAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMTIKICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKEJ5dGVzKGIiYiIpICsgc2Vzc2lvbl9pZCwgKGNhcGFjaXR5ICsgNykgLy8gOCksICJSb3N0ZXIgYWxyZWFkeSBleGlzdHMiCiAgICBieXRlYyAxMCAvLyAweDYyCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBwdXNoaW50IDcKICAgICsKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gUm9zdGVyIGFscmVhZHkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIxMwogICAgLy8gaWYgdHJhY2tfcm91bmRzOgogICAgYnogY3JlYXRlX3Jvc3Rlcl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjE0CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZShCeXRlcyhiInIiKSArIHNlc3Npb25faWQsIGNhcGFjaXR5ICogMiksICJSb3N0ZXIgYWxyZWFkeSBleGlzdHMiCiAgICBwdXNoYnl0ZXMgMHg3MgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gUm9zdGVyIGFscmVhZHkgZXhpc3RzCgpjcmVhdGVfcm9zdGVyX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjAyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2UuZW5yb2xsW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5yb2xsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjE5CiAgICAvLyBhc3NlcnQgc2VsZi5faXNfYXV0aG9yaXplZF90ZWFjaGVyKCksICJDYWxsZXIgaXMgbm90IGFuIGF1dGhvcml6ZWQgdGVhY2hlciIKICAgIGNhbGxzdWIgX2lzX2F1dGhvcml6ZWRfdGVhY2hlcgogICAgYXNzZXJ0IC8vIENhbGxlciBpcyBub3QgYW4gYXV0aG9yaXplZCB0ZWFjaGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIyMQogICAgLy8gcm9zdGVyID0gQnl0ZXMoYiJuIikgKyBzZXNzaW9uX2lkCiAgICBieXRlYyA5IC8vIDB4NmUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjIyCiAgICAvLyBzbG90ID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChyb3N0ZXIsIFJPU1RFUl9FTlJPTExFRF9DT1VOVCwgOCkpCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICBkdXAKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIyMwogICAgLy8gYXNzZXJ0IHNsb3QgPCBvcC5idG9pKG9wLkJveC5leHRyYWN0KHJvc3RlciwgUk9TVEVSX0NBUEFDSVRZLCA4KSksICJSb3N0ZXIgaXMgZnVsbCIKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkaWcgMQogICAgPgogICAgYXNzZXJ0IC8vIFJvc3RlciBpcyBmdWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIyNQogICAgLy8gbmFtZSA9IEJ5dGVzKGIiZSIpICsgc2Vzc2lvbl9pZCArIHN0dWRlbnQuYnl0ZXMKICAgIGJ5dGVjIDQgLy8gMHg2NQogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIyNgogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUobmFtZSwgOCksICJBbHJlYWR5IGVucm9sbGVkIgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIEFscmVhZHkgZW5yb2xsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjI3CiAgICAvLyBvcC5Cb3gucHV0KG5hbWUsIG9wLml0b2Ioc2xvdCkpCiAgICBkaWcgMQogICAgaXRvYgogICAgc3dhcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjI4CiAgICAvLyBvcC5Cb3gucmVwbGFjZShyb3N0ZXIsIFJPU1RFUl9FTlJPTExFRF9DT1VOVCwgb3AuaXRvYihzbG90ICsgMSkpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWMgMTEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2UubWFya19hdHRlbmRhbmNlX2JpdG1hcFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1hcmtfYXR0ZW5kYW5jZV9iaXRtYXA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIzMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMzQKICAgIC8vIGlzX2dsb2JhbCwgc3RhcnRfcm91bmQgPSBzZWxmLl9jaGVja19zZXNzaW9uX29wZW4oc2Vzc2lvbl9pZCkKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9jaGVja19zZXNzaW9uX29wZW4KICAgIGNvdmVyIDUKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjM1CiAgICAvLyBhc3NlcnQgc2Vzc2lvbl9pZC5sZW5ndGggPD0gTUFYX0JPWF9TRVNTSU9OX0lEX0xFTkdUSCwgIlNlc3Npb24gSUQgdG9vIGxvbmciCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDMxCiAgICA8PQogICAgYXNzZXJ0IC8vIFNlc3Npb24gSUQgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjM2CiAgICAvLyBzZWxmLl92ZXJpZnlfcXJfcHJvb2Yoc2Vzc2lvbl9pZCwgcXJfcm91bmQsIHFyX2hhc2gpCiAgICBkaWcgMgogICAgY292ZXIgMgogICAgY2FsbHN1YiBfdmVyaWZ5X3FyX3Byb29mCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIzNy0yMzgKICAgIC8vICMgTm90IGNoZWNrZWQgaW4gd2l0aCBsb2NhbCBzdGF0ZSBvciBpbiBib3ggbW9kZSBiZWZvcmUgZW5yb2xsaW5nCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuX2NoZWNrZWRfaW5fbG9jYWwoc2Vzc2lvbl9pZCksICJBdHRlbmRhbmNlIGFscmVhZHkgbWFya2VkIgogICAgZHVwCiAgICBjYWxsc3ViIF9jaGVja2VkX2luX2xvY2FsCiAgICAhCiAgICBhc3NlcnQgLy8gQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMzkKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5faGFzX2JveChCeXRlcyhiImEiKSArIHNlc3Npb25faWQgKyBUeG4uc2VuZGVyLmJ5dGVzKSwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICBieXRlYyA2IC8vIDB4NjEKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMjUKICAgIC8vIF9sZW5ndGgsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgobmFtZSkKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyMzkKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5faGFzX2JveChCeXRlcyhiImEiKSArIHNlc3Npb25faWQgKyBUeG4uc2VuZGVyLmJ5dGVzKSwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICAhCiAgICBhc3NlcnQgLy8gQXR0ZW5kYW5jZSBhbHJlYWR5IG1hcmtlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNDEKICAgIC8vIGVucm9sbG1lbnQsIGVucm9sbGVkID0gb3AuQm94LmdldChCeXRlcyhiImUiKSArIHNlc3Npb25faWQgKyBUeG4uc2VuZGVyLmJ5dGVzKQogICAgYnl0ZWMgNCAvLyAweDY1CiAgICBkaWcgMQogICAgY29uY2F0CiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjQyCiAgICAvLyBhc3NlcnQgZW5yb2xsZWQsICJTdHVkZW50IGlzIG5vdCBlbnJvbGxlZCIKICAgIGFzc2VydCAvLyBTdHVkZW50IGlzIG5vdCBlbnJvbGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNDMKICAgIC8vIHNsb3QgPSBvcC5idG9pKGVucm9sbG1lbnQpCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjQ0CiAgICAvLyByb3N0ZXIgPSBCeXRlcyhiIm4iKSArIHNlc3Npb25faWQKICAgIGJ5dGVjIDkgLy8gMHg2ZQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNDUKICAgIC8vIGFzc2VydCBzbG90IDwgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChyb3N0ZXIsIFJPU1RFUl9DQVBBQ0lUWSwgOCkpLCAiU2xvdCBvdXRzaWRlIHRoZSByb3N0ZXIiCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGRpZyAyCiAgICA+CiAgICBhc3NlcnQgLy8gU2xvdCBvdXRzaWRlIHRoZSByb3N0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjQ3CiAgICAvLyBiaXRtYXAgPSBCeXRlcyhiImIiKSArIHNlc3Npb25faWQKICAgIGJ5dGVjIDEwIC8vIDB4NjIKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI0OAogICAgLy8gc2xvdF9ieXRlID0gb3AuQm94LmV4dHJhY3QoYml0bWFwLCBzbG90IC8vIDgsIDEpCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGR1cDIKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNDkKICAgIC8vIGFzc2VydCBvcC5nZXRiaXQoc2xvdF9ieXRlLCBzbG90ICUgOCkgPT0gMCwgIkF0dGVuZGFuY2UgYWxyZWFkeSBtYXJrZWQiCiAgICB1bmNvdmVyIDQKICAgIGludGNfMiAvLyA4CiAgICAlCiAgICBkdXAyCiAgICBnZXRiaXQKICAgICEKICAgIGFzc2VydCAvLyBBdHRlbmRhbmNlIGFscmVhZHkgbWFya2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI1MAogICAgLy8gb3AuQm94LnJlcGxhY2UoYml0bWFwLCBzbG90IC8vIDgsIG9wLnNldGJpdF9ieXRlcyhzbG90X2J5dGUsIHNsb3QgJSA4LCBUcnVlKSkKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI1MgogICAgLy8gaWYgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChyb3N0ZXIsIFJPU1RFUl9UUkFDS19ST1VORFMsIDgpKToKICAgIHB1c2hpbnQgMTYKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgYnogbWFya19hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjUzCiAgICAvLyBkZWx0YSA9IEdsb2JhbC5yb3VuZCAtIHN0YXJ0X3JvdW5kCiAgICBnbG9iYWwgUm91bmQKICAgIGRpZyA0CiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI1NAogICAgLy8gYXNzZXJ0IGRlbHRhIDw9IE1BWF9ST1VORF9ERUxUQSwgIlJvdW5kIGRlbHRhIGRvZXMgbm90IGZpdCBpbiAyIGJ5dGVzIgogICAgZHVwCiAgICBwdXNoaW50IDY1NTM1CiAgICA8PQogICAgYXNzZXJ0IC8vIFJvdW5kIGRlbHRhIGRvZXMgbm90IGZpdCBpbiAyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI1NQogICAgLy8gb3AuQm94LnJlcGxhY2UoQnl0ZXMoYiJyIikgKyBzZXNzaW9uX2lkLCBzbG90ICogMiwgb3AuZXh0cmFjdChvcC5pdG9iKGRlbHRhKSwgNiwgMikpCiAgICBwdXNoYnl0ZXMgMHg3MgogICAgZGlnIDMKICAgIGNvbmNhdAogICAgZGlnIDQKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBib3hfcmVwbGFjZQoKbWFya19hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI1NwogICAgLy8gc2VsZi5fY291bnRfYXR0ZW5kYW5jZShzZXNzaW9uX2lkLCBpc19nbG9iYWwpCiAgICBjYWxsc3ViIF9jb3VudF9hdHRlbmRhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjIzMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmdldF9zZXNzaW9uX3N1bW1hcnlbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc2Vzc2lvbl9zdW1tYXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjY4CiAgICAvLyBpZiBzZXNzaW9uX2lkID09IHNlbGYuc2Vzc2lvbl9pZDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJzZXNzaW9uX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNlc3Npb25faWQgZXhpc3RzCiAgICA9PQogICAgYnogZ2V0X3Nlc3Npb25fc3VtbWFyeV9hZnRlcl9pZl9lbHNlQDMKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzAKICAgIC8vIG9wLml0b2Ioc2VsZi5zdGFydF9yb3VuZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAic3RhcnRfcm91bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhcnRfcm91bmQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3MQogICAgLy8gKyBvcC5pdG9iKHNlbGYuZW5kX3JvdW5kKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJlbmRfcm91bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZW5kX3JvdW5kIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzAtMjcxCiAgICAvLyBvcC5pdG9iKHNlbGYuc3RhcnRfcm91bmQpCiAgICAvLyArIG9wLml0b2Ioc2VsZi5lbmRfcm91bmQpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjcyCiAgICAvLyArIG9wLml0b2Ioc2VsZi5hdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAiYXR0ZW5kYW5jZV9lbmRfcm91bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXR0ZW5kYW5jZV9lbmRfcm91bmQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3MC0yNzIKICAgIC8vIG9wLml0b2Ioc2VsZi5zdGFydF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3MwogICAgLy8gKyBvcC5pdG9iKHNlbGYuaXNfYWN0aXZlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19hY3RpdmUgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3MC0yNzMKICAgIC8vIG9wLml0b2Ioc2VsZi5zdGFydF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKHNlbGYuaXNfYWN0aXZlKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3NAogICAgLy8gKyBvcC5pdG9iKHNlbGYudG90YWxfYXR0ZW5kYW5jZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9hdHRlbmRhbmNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2F0dGVuZGFuY2UgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3MC0yNzQKICAgIC8vIG9wLml0b2Ioc2VsZi5zdGFydF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmVuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmF0dGVuZGFuY2VfZW5kX3JvdW5kKQogICAgLy8gKyBvcC5pdG9iKHNlbGYuaXNfYWN0aXZlKQogICAgLy8gKyBvcC5pdG9iKHNlbGYudG90YWxfYXR0ZW5kYW5jZSkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzUKICAgIC8vICsgc2VsZi5jcmVhdG9yLmJ5dGVzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzAtMjc1CiAgICAvLyBvcC5pdG9iKHNlbGYuc3RhcnRfcm91bmQpCiAgICAvLyArIG9wLml0b2Ioc2VsZi5lbmRfcm91bmQpCiAgICAvLyArIG9wLml0b2Ioc2VsZi5hdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmlzX2FjdGl2ZSkKICAgIC8vICsgb3AuaXRvYihzZWxmLnRvdGFsX2F0dGVuZGFuY2UpCiAgICAvLyArIHNlbGYuY3JlYXRvci5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI3NgogICAgLy8gKyBzZWxmLnNlc3Npb25fbmFtZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vICJzZXNzaW9uX25hbWUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Vzc2lvbl9uYW1lIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzAtMjc2CiAgICAvLyBvcC5pdG9iKHNlbGYuc3RhcnRfcm91bmQpCiAgICAvLyArIG9wLml0b2Ioc2VsZi5lbmRfcm91bmQpCiAgICAvLyArIG9wLml0b2Ioc2VsZi5hdHRlbmRhbmNlX2VuZF9yb3VuZCkKICAgIC8vICsgb3AuaXRvYihzZWxmLmlzX2FjdGl2ZSkKICAgIC8vICsgb3AuaXRvYihzZWxmLnRvdGFsX2F0dGVuZGFuY2UpCiAgICAvLyArIHNlbGYuY3JlYXRvci5ieXRlcwogICAgLy8gKyBzZWxmLnNlc3Npb25fbmFtZQogICAgY29uY2F0CgpnZXRfc2Vzc2lvbl9zdW1tYXJ5X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmdldF9zZXNzaW9uX3N1bW1hcnlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjYxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWMgMTEgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9zZXNzaW9uX3N1bW1hcnlfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyNzgKICAgIC8vIHJlY29yZCwgcmVnaXN0ZXJlZCA9IG9wLkJveC5nZXQoQnl0ZXMoYiJzIikgKyBzZXNzaW9uX2lkKQogICAgYnl0ZWNfMSAvLyAweDczCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mjc5CiAgICAvLyBhc3NlcnQgcmVnaXN0ZXJlZCwgIlNlc3Npb24gbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIFNlc3Npb24gbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI2MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfc2Vzc2lvbl9zdW1tYXJ5X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLmdldF9zZXNzaW9uX3N1bW1hcnlANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5nZXRfYXR0ZW5kYW5jZV9iaXRtYXBbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYXR0ZW5kYW5jZV9iaXRtYXA6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mjg5CiAgICAvLyBhc3NlcnQgYWRkcmVzc2VzLmxlbmd0aCAlIDMyID09IDAsICJBZGRyZXNzZXMgbXVzdCBiZSAzMiBieXRlcyBlYWNoIgogICAgbGVuCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgcHVzaGludCAzMgogICAgJQogICAgIQogICAgYXNzZXJ0IC8vIEFkZHJlc3NlcyBtdXN0IGJlIDMyIGJ5dGVzIGVhY2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjkwCiAgICAvLyBiaXRzID0gb3AuYnplcm8oKGFkZHJlc3Nlcy5sZW5ndGggLy8gMzIgKyA3KSAvLyA4KQogICAgcHVzaGludCAzMgogICAgLwogICAgcHVzaGludCA3CiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgYnplcm8KICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MjkxLTI5MgogICAgLy8gIyBCb3ggbmFtZXMgb25seSBmaXQgc2Vzc2lvbl9pZHMgb2YgdXAgdG8gMzEgYnl0ZXMKICAgIC8vIGZpdHNfYm94X25hbWUgPSBzZXNzaW9uX2lkLmxlbmd0aCA8PSBNQVhfQk9YX1NFU1NJT05fSURfTEVOR1RICiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMQogICAgPD0KICAgIGR1cAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyOTMKICAgIC8vIGJpdG1hcCA9IEJ5dGVzKGIiYiIpICsgc2Vzc2lvbl9pZAogICAgYnl0ZWMgMTAgLy8gMHg2MgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mjk0CiAgICAvLyBiaXRtYXBfbGVuZ3RoID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyOTUKICAgIC8vIGlmIGZpdHNfYm94X25hbWU6CiAgICBieiBnZXRfYXR0ZW5kYW5jZV9iaXRtYXBfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI5NgogICAgLy8gYml0bWFwX2xlbmd0aCwgX2V4aXN0cyA9IG9wLkJveC5sZW5ndGgoYml0bWFwKQogICAgZHVwCiAgICBib3hfbGVuCiAgICBwb3AKICAgIGJ1cnkgNAoKZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mjk4CiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgwLCBhZGRyZXNzZXMubGVuZ3RoLCAzMik6CiAgICBpbnRjXzAgLy8gMAoKZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mjk4CiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgwLCBhZGRyZXNzZXMubGVuZ3RoLCAzMik6CiAgICBkdXAKICAgIGRpZyA3CiAgICA8CiAgICBieiBnZXRfYXR0ZW5kYW5jZV9iaXRtYXBfYWZ0ZXJfZm9yQDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjI5OQogICAgLy8gYWRkcmVzcyA9IG9wLmV4dHJhY3QoYWRkcmVzc2VzLCBvZmZzZXQsIDMyKQogICAgZGlnIDcKICAgIGRpZyAxCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBidXJ5IDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMwMgogICAgLy8gQWNjb3VudChhZGRyZXNzKSwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIEJ5dGVzKGIiY2hlY2tlZF9pbiIpICsgc2Vzc2lvbl9pZAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25JRAogICAgYnl0ZWMgOCAvLyAweDYzNjg2NTYzNmI2NTY0NWY2OTZlCiAgICBkaWcgNgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMwMC0zMDMKICAgIC8vICMgTG9jYWwgc3RhdGUgbW9kZSAoYWNjb3VudCBkb2VzIG5vdCBuZWVkIHRvIGJlIG9wdGVkIGluKQogICAgLy8gcHJlc2VudCwgX2V4aXN0cyA9IG9wLkFwcExvY2FsLmdldF9leF91aW50NjQoCiAgICAvLyAgICAgQWNjb3VudChhZGRyZXNzKSwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIEJ5dGVzKGIiY2hlY2tlZF9pbiIpICsgc2Vzc2lvbl9pZAogICAgLy8gKQogICAgYXBwX2xvY2FsX2dldF9leAogICAgcG9wCiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzA0LTMwNQogICAgLy8gIyBCb3ggbW9kZQogICAgLy8gaWYgbm90IHByZXNlbnQgYW5kIGZpdHNfYm94X25hbWUgYW5kIHNlbGYuX2hhc19ib3goQnl0ZXMoYiJhIikgKyBzZXNzaW9uX2lkICsgYWRkcmVzcyk6CiAgICBibnogZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2lmX2Vsc2VAOQogICAgZGlnIDUKICAgIGJ6IGdldF9hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDkKICAgIGJ5dGVjIDYgLy8gMHg2MQogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDEzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzI1CiAgICAvLyBfbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKG5hbWUpCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzA0LTMwNQogICAgLy8gIyBCb3ggbW9kZQogICAgLy8gaWYgbm90IHByZXNlbnQgYW5kIGZpdHNfYm94X25hbWUgYW5kIHNlbGYuX2hhc19ib3goQnl0ZXMoYiJhIikgKyBzZXNzaW9uX2lkICsgYWRkcmVzcyk6CiAgICBieiBnZXRfYXR0ZW5kYW5jZV9iaXRtYXBfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMwNgogICAgLy8gcHJlc2VudCA9IFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIGJ1cnkgMTEKCmdldF9hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMwNy0zMDgKICAgIC8vICMgQml0bWFwIHJvc3RlciBtb2RlOiB0aGUgc3R1ZGVudCdzIHNsb3QgYml0CiAgICAvLyBpZiBub3QgcHJlc2VudCBhbmQgYml0bWFwX2xlbmd0aDoKICAgIGRpZyAxMAogICAgYm56IGdldF9hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDE3CiAgICBkaWcgNAogICAgYnogZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzA5CiAgICAvLyBlbnJvbGxtZW50LCBlbnJvbGxlZCA9IG9wLkJveC5nZXQoQnl0ZXMoYiJlIikgKyBzZXNzaW9uX2lkICsgYWRkcmVzcykKICAgIGJ5dGVjIDQgLy8gMHg2NQogICAgZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDEzCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ1cnkgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzEwCiAgICAvLyBpZiBlbnJvbGxlZCBhbmQgb3AuYnRvaShlbnJvbGxtZW50KSAvLyA4IDwgYml0bWFwX2xlbmd0aDoKICAgIGJ6IGdldF9hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDE3CiAgICBkaWcgMTEKICAgIGJ0b2kKICAgIGR1cAogICAgYnVyeSAxMQogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGR1cAogICAgYnVyeSAxMAogICAgZGlnIDUKICAgIDwKICAgIGJ6IGdldF9hdHRlbmRhbmNlX2JpdG1hcF9hZnRlcl9pZl9lbHNlQDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMxMgogICAgLy8gaWYgb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGJpdG1hcCwgc2xvdCAvLyA4LCAxKSwgc2xvdCAlIDgpOgogICAgZGlnIDEKICAgIGRpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGRpZyAxMAogICAgaW50Y18yIC8vIDgKICAgICUKICAgIGdldGJpdAogICAgYnogZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzEzCiAgICAvLyBwcmVzZW50ID0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgYnVyeSAxMQoKZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2lmX2Vsc2VAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMxNAogICAgLy8gYml0cyA9IG9wLnNldGJpdF9ieXRlcyhiaXRzLCBvZmZzZXQgLy8gMzIsIGJvb2wocHJlc2VudCkpCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIC8KICAgIGRpZyAxMQogICAgaW50Y18wIC8vIDAKICAgICE9CiAgICB1bmNvdmVyIDQKICAgIGNvdmVyIDIKICAgIHNldGJpdAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyOTgKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKDAsIGFkZHJlc3Nlcy5sZW5ndGgsIDMyKToKICAgIHB1c2hpbnQgMzIKICAgICsKICAgIGIgZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2Zvcl9oZWFkZXJANAoKZ2V0X2F0dGVuZGFuY2VfYml0bWFwX2FmdGVyX2ZvckAxOToKICAgIHBvcG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weToyODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5faXNfYXV0aG9yaXplZF90ZWFjaGVyKCkgLT4gdWludDY0OgpfaXNfYXV0aG9yaXplZF90ZWFjaGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciBvciBzZWxmLmlzX3RlYWNoZXIuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKSA9PSAxCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGJueiBfaXNfYXV0aG9yaXplZF90ZWFjaGVyX2Jvb2xfdHJ1ZUAyCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiaXNfdGVhY2hlciIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogX2lzX2F1dGhvcml6ZWRfdGVhY2hlcl9ib29sX2ZhbHNlQDMKCl9pc19hdXRob3JpemVkX3RlYWNoZXJfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMjEKICAgIC8vIHJldHVybiBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciBvciBzZWxmLmlzX3RlYWNoZXIuZ2V0KFR4bi5zZW5kZXIsIGRlZmF1bHQ9VUludDY0KDApKSA9PSAxCiAgICByZXRzdWIKCl9pc19hdXRob3JpemVkX3RlYWNoZXJfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzIxCiAgICAvLyByZXR1cm4gVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3Igb3Igc2VsZi5pc190ZWFjaGVyLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkgPT0gMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLl9jaGVja2VkX2luX2xvY2FsKHNlc3Npb25faWQ6IGJ5dGVzKSAtPiB1aW50NjQ6Cl9jaGVja2VkX2luX2xvY2FsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMjgtMzI5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jaGVja2VkX2luX2xvY2FsKHNlbGYsIHNlc3Npb25faWQ6IEJ5dGVzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMzMgogICAgLy8gVHhuLnNlbmRlciwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIEJ5dGVzKGIiY2hlY2tlZF9pbiIpICsgc2Vzc2lvbl9pZAogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBieXRlYyA4IC8vIDB4NjM2ODY1NjM2YjY1NjQ1ZjY5NmUKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjMzMC0zMzMKICAgIC8vICMgYXBwX2xvY2FsX2dldF9leCByZWFkcyAwIGZvciBzdHVkZW50cyB3aG8gbmV2ZXIgb3B0ZWQgaW4KICAgIC8vIGNoZWNrZWRfaW4sIF9leGlzdHMgPSBvcC5BcHBMb2NhbC5nZXRfZXhfdWludDY0KAogICAgLy8gICAgIFR4bi5zZW5kZXIsIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCBCeXRlcyhiImNoZWNrZWRfaW4iKSArIHNlc3Npb25faWQKICAgIC8vICkKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozMzQKICAgIC8vIHJldHVybiBjaGVja2VkX2luICE9IDAKICAgIGludGNfMCAvLyAwCiAgICAhPQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLl9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb24oc2Vzc2lvbl9pZDogYnl0ZXMpIC0+IHZvaWQ6Cl9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM0MS0zNDIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2Nsb3NlX3JlZ2lzdGVyZWRfc2Vzc2lvbihzZWxmLCBzZXNzaW9uX2lkOiBCeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNDMKICAgIC8vIG5hbWUgPSBCeXRlcyhiInMiKSArIHNlc3Npb25faWQKICAgIGJ5dGVjXzEgLy8gMHg3MwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNDQKICAgIC8vIHRlYWNoZXIgPSBvcC5Cb3guZXh0cmFjdChuYW1lLCBTRVNTSU9OX1RFQUNIRVIsIDMyKQogICAgcHVzaGludHMgNDAgMzIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM0NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gdGVhY2hlciBvciBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgdGhlIHNlc3Npb24gdGVhY2hlciBjYW4gY2xvc2UgaXQiCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYm56IF9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb25fYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYnogX2Nsb3NlX3JlZ2lzdGVyZWRfc2Vzc2lvbl9ib29sX2ZhbHNlQDMKCl9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb25fYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQoKX2Nsb3NlX3JlZ2lzdGVyZWRfc2Vzc2lvbl9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM0NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuYnl0ZXMgPT0gdGVhY2hlciBvciBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciwgIk9ubHkgdGhlIHNlc3Npb24gdGVhY2hlciBjYW4gY2xvc2UgaXQiCiAgICBhc3NlcnQgLy8gT25seSB0aGUgc2Vzc2lvbiB0ZWFjaGVyIGNhbiBjbG9zZSBpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNDYKICAgIC8vIG9wLkJveC5yZXBsYWNlKG5hbWUsIFNFU1NJT05fSVNfQUNUSVZFLCBvcC5pdG9iKDApKQogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIHB1c2hpbnQgMjQKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCl9jbG9zZV9yZWdpc3RlcmVkX3Nlc3Npb25fYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgX2Nsb3NlX3JlZ2lzdGVyZWRfc2Vzc2lvbl9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2UuX3N0YXJ0X2dsb2JhbF9zZXNzaW9uKHNlc3Npb25faWQ6IGJ5dGVzLCBzZXNzaW9uX25hbWU6IGJ5dGVzLCBkdXJhdGlvbl9zZWNvbmRzOiB1aW50NjQsIGF0dGVuZGFuY2Vfd2luZG93X3NlY29uZHM6IHVpbnQ2NCkgLT4gdm9pZDoKX3N0YXJ0X2dsb2JhbF9zZXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNTMtMzU2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zdGFydF9nbG9iYWxfc2Vzc2lvbigKICAgIC8vICAgICBzZWxmLCBzZXNzaW9uX2lkOiBCeXRlcywgc2Vzc2lvbl9uYW1lOiBCeXRlcywgZHVyYXRpb25fc2Vjb25kczogVUludDY0LCBhdHRlbmRhbmNlX3dpbmRvd19zZWNvbmRzOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNTcKICAgIC8vIHNlbGYuc2Vzc2lvbl9pZCA9IHNlc3Npb25faWQKICAgIGJ5dGVjXzMgLy8gInNlc3Npb25faWQiCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM1OAogICAgLy8gc2VsZi5zZXNzaW9uX25hbWUgPSBzZXNzaW9uX25hbWUKICAgIGJ5dGVjIDE1IC8vICJzZXNzaW9uX25hbWUiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM1OQogICAgLy8gc2VsZi5zdGFydF9yb3VuZCA9IEdsb2JhbC5yb3VuZAogICAgYnl0ZWMgMTIgLy8gInN0YXJ0X3JvdW5kIgogICAgZ2xvYmFsIFJvdW5kCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNjAKICAgIC8vIHNlbGYuZW5kX3JvdW5kID0gR2xvYmFsLnJvdW5kICsgZHVyYXRpb25fc2Vjb25kcyAvLyBTRUNPTkRTX1BFUl9ST1VORAogICAgZ2xvYmFsIFJvdW5kCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgMwogICAgLwogICAgKwogICAgYnl0ZWMgMTQgLy8gImVuZF9yb3VuZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM1MAogICAgLy8gd2luZG93ID0gYXR0ZW5kYW5jZV93aW5kb3dfc2Vjb25kcyBpZiBhdHRlbmRhbmNlX3dpbmRvd19zZWNvbmRzIGVsc2UgZHVyYXRpb25fc2Vjb25kcwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGR1cAogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM1MQogICAgLy8gcmV0dXJuIEdsb2JhbC5yb3VuZCArIHdpbmRvdyAvLyBTRUNPTkRTX1BFUl9ST1VORAogICAgZ2xvYmFsIFJvdW5kCiAgICBzd2FwCiAgICBwdXNoaW50IDMKICAgIC8KICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzYxCiAgICAvLyBzZWxmLmF0dGVuZGFuY2VfZW5kX3JvdW5kID0gc2VsZi5fYXR0ZW5kYW5jZV9lbmRfcm91bmQoZHVyYXRpb25fc2Vjb25kcywgYXR0ZW5kYW5jZV93aW5kb3dfc2Vjb25kcykKICAgIGJ5dGVjIDEzIC8vICJhdHRlbmRhbmNlX2VuZF9yb3VuZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM2MgogICAgLy8gc2VsZi5pc19hY3RpdmUgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzIgLy8gImlzX2FjdGl2ZSIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNjMKICAgIC8vIHNlbGYudG90YWxfYXR0ZW5kYW5jZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNyAvLyAidG90YWxfYXR0ZW5kYW5jZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmF0dGVuZGFuY2VfYXJjNC5jb250cmFjdC5BdHRlbmRhbmNlLl9jaGVja19zZXNzaW9uX29wZW4oc2Vzc2lvbl9pZDogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpfY2hlY2tfc2Vzc2lvbl9vcGVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNjUtMzY2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jaGVja19zZXNzaW9uX29wZW4oc2VsZiwgc2Vzc2lvbl9pZDogQnl0ZXMpIC0+IHR1cGxlW2Jvb2wsIFVJbnQ2NF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzY4CiAgICAvLyBpZiBzZXNzaW9uX2lkID09IHNlbGYuc2Vzc2lvbl9pZDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJzZXNzaW9uX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNlc3Npb25faWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBieiBfY2hlY2tfc2Vzc2lvbl9vcGVuX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNjkKICAgIC8vIGFzc2VydCBzZWxmLmlzX2FjdGl2ZSA9PSAxLCAiU2Vzc2lvbiBpcyBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19hY3RpdmUgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBTZXNzaW9uIGlzIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzcwCiAgICAvLyBhc3NlcnQgR2xvYmFsLnJvdW5kIDw9IHNlbGYuYXR0ZW5kYW5jZV9lbmRfcm91bmQsICJBdHRlbmRhbmNlIHdpbmRvdyBjbG9zZWQiCiAgICBnbG9iYWwgUm91bmQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAiYXR0ZW5kYW5jZV9lbmRfcm91bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXR0ZW5kYW5jZV9lbmRfcm91bmQgZXhpc3RzCiAgICA8PQogICAgYXNzZXJ0IC8vIEF0dGVuZGFuY2Ugd2luZG93IGNsb3NlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNzEKICAgIC8vIHJldHVybiBUcnVlLCBzZWxmLnN0YXJ0X3JvdW5kCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gInN0YXJ0X3JvdW5kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXJ0X3JvdW5kIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIHN3YXAKICAgIHJldHN1YgoKX2NoZWNrX3Nlc3Npb25fb3Blbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM3MwogICAgLy8gbmFtZSA9IEJ5dGVzKGIicyIpICsgc2Vzc2lvbl9pZAogICAgYnl0ZWNfMSAvLyAweDczCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNzQKICAgIC8vIGFzc2VydCBvcC5idG9pKG9wLkJveC5leHRyYWN0KG5hbWUsIFNFU1NJT05fSVNfQUNUSVZFLCA4KSkgPT0gMSwgIlNlc3Npb24gaXMgbm90IGFjdGl2ZSIKICAgIGR1cAogICAgcHVzaGludCAyNAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBTZXNzaW9uIGlzIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mzc1CiAgICAvLyBhc3NlcnQgR2xvYmFsLnJvdW5kIDw9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QobmFtZSwgU0VTU0lPTl9BVFRFTkRBTkNFX0VORF9ST1VORCwgOCkpLCAiQXR0ZW5kYW5jZSB3aW5kb3cgY2xvc2VkIgogICAgZ2xvYmFsIFJvdW5kCiAgICBkaWcgMQogICAgcHVzaGludCAxNgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICA8PQogICAgYXNzZXJ0IC8vIEF0dGVuZGFuY2Ugd2luZG93IGNsb3NlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozNzYKICAgIC8vIHJldHVybiBGYWxzZSwgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChuYW1lLCBTRVNTSU9OX1NUQVJUX1JPVU5ELCA4KSkKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXR0ZW5kYW5jZV9hcmM0LmNvbnRyYWN0LkF0dGVuZGFuY2UuX3ZlcmlmeV9xcl9wcm9vZihzZXNzaW9uX2lkOiBieXRlcywgcXJfcm91bmQ6IHVpbnQ2NCwgcXJfaGFzaDogYnl0ZXMpIC0+IHZvaWQ6Cl92ZXJpZnlfcXJfcHJvb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM3OC0zNzkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3ZlcmlmeV9xcl9wcm9vZihzZWxmLCBzZXNzaW9uX2lkOiBCeXRlcywgcXJfcm91bmQ6IFVJbnQ2NCwgcXJfaGFzaDogQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6MzgxCiAgICAvLyBhc3NlcnQgR2xvYmFsLnJvdW5kIC0gcXJfcm91bmQgPD0gUVJfVkFMSURJVFlfUk9VTkRTLCAiUVIgY29kZSBleHBpcmVkIgogICAgZ2xvYmFsIFJvdW5kCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIHB1c2hpbnQgMjAKICAgIDw9CiAgICBhc3NlcnQgLy8gUVIgY29kZSBleHBpcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM4MgogICAgLy8gYXNzZXJ0IHFyX2hhc2ggPT0gb3Auc2hhMjU2KHNlc3Npb25faWQgKyBvcC5pdG9iKHFyX3JvdW5kKSArIFR4bi5zZW5kZXIuYnl0ZXMpLCAiSW52YWxpZCBRUiBjb2RlIgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydCAvLyBJbnZhbGlkIFFSIGNvZGUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hdHRlbmRhbmNlX2FyYzQuY29udHJhY3QuQXR0ZW5kYW5jZS5fY291bnRfYXR0ZW5kYW5jZShzZXNzaW9uX2lkOiBieXRlcywgaXNfZ2xvYmFsOiB1aW50NjQpIC0+IHZvaWQ6Cl9jb3VudF9hdHRlbmRhbmNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozODQtMzg1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jb3VudF9hdHRlbmRhbmNlKHNlbGYsIHNlc3Npb25faWQ6IEJ5dGVzLCBpc19nbG9iYWw6IGJvb2wpIC0+IE5vbmU6ICAjIG5vcWE6IEZCVDAwMQogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM4NgogICAgLy8gaWYgaXNfZ2xvYmFsOgogICAgZnJhbWVfZGlnIC0xCiAgICBieiBfY291bnRfYXR0ZW5kYW5jZV9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozODcKICAgIC8vIHNlbGYudG90YWxfYXR0ZW5kYW5jZSArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfYXR0ZW5kYW5jZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9hdHRlbmRhbmNlIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2F0dGVuZGFuY2UiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgpfY291bnRfYXR0ZW5kYW5jZV9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hdHRlbmRhbmNlX2FyYzQvY29udHJhY3QucHk6Mzg5CiAgICAvLyBuYW1lID0gQnl0ZXMoYiJzIikgKyBzZXNzaW9uX2lkCiAgICBieXRlY18xIC8vIDB4NzMKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXR0ZW5kYW5jZV9hcmM0L2NvbnRyYWN0LnB5OjM5MAogICAgLy8gdG90YWwgPSBvcC5idG9pKG9wLkJveC5leHRyYWN0KG5hbWUsIFNFU1NJT05fVE9UQUxfQVRURU5EQU5DRSwgOCkpCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2F0dGVuZGFuY2VfYXJjNC9jb250cmFjdC5weTozOTEKICAgIC8vIG9wLkJveC5yZXBsYWNlKG5hbWUsIFNFU1NJT05fVE9UQUxfQVRURU5EQU5DRSwgb3AuaXRvYih0b3RhbCArIDEpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHB1c2hpbnQgMzIKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1785], "errorMessage": "Address length is 32 bytes"}, {"pc": [1726], "errorMessage": "Addresses must be 32 bytes each"}, {"pc": [1380], "errorMessage": "Already enrolled"}, {"pc": [775], "errorMessage": "Attendance already committed"}, {"pc": [1030, 1053, 1179, 1204, 1475, 1488, 1536], "errorMessage": "Attendance already marked"}, {"pc": [2090, 2122], "errorMessage": "Attendance window closed"}, {"pc": [510, 538, 597, 755, 1257, 1348], "errorMessage": "Caller is not an authorized teacher"}, {"pc": [1267], "errorMessage": "Capacity must be greater than zero"}, {"pc": [2156], "errorMessage": "Invalid QR code"}, {"pc": [882], "errorMessage": "Leaf outside the commitment"}, {"pc": [764], "errorMessage": "Merkle root must be 32 bytes"}, {"pc": [421, 444], "errorMessage": "Only the creator can manage teachers"}, {"pc": [1996], "errorMessage": "Only the session teacher can close it"}, {"pc": [954], "errorMessage": "Proof does not reach the root"}, {"pc": [864], "errorMessage": "Proof must be 32-byte hashes"}, {"pc": [2141], "errorMessage": "QR code expired"}, {"pc": [1277, 1302, 1317], "errorMessage": "Roster already exists"}, {"pc": [1368], "errorMessage": "Roster is full"}, {"pc": [1559], "errorMessage": "Round delta does not fit in 2 bytes"}, {"pc": [612], "errorMessage": "Session ID is held in global state"}, {"pc": [526], "errorMessage": "Session ID is registered"}, {"pc": [604, 1166, 1264, 1462], "errorMessage": "Session ID too long"}, {"pc": [649], "errorMessage": "Session already registered"}, {"pc": [2081, 2111], "errorMessage": "Session is not active"}, {"pc": [1671], "errorMessage": "Session not found"}, {"pc": [1516], "errorMessage": "Slot outside the roster"}, {"pc": [1065, 1192], "errorMessage": "Student is enrolled"}, {"pc": [1498], "errorMessage": "Student is not enrolled"}, {"pc": [961], "errorMessage": "Student not in the committed attendance"}, {"pc": [1625, 2088], "errorMessage": "check self.attendance_end_round exists"}, {"pc": [394, 419, 442, 1644, 1925, 1990], "errorMessage": "check self.creator exists"}, {"pc": [1618], "errorMessage": "check self.end_round exists"}, {"pc": [1631, 2078], "errorMessage": "check self.is_active exists"}, {"pc": [608, 747, 1602, 2068], "errorMessage": "check self.session_id exists"}, {"pc": [1650], "errorMessage": "check self.session_name exists"}, {"pc": [1612, 2095], "errorMessage": "check self.start_round exists"}, {"pc": [1638, 2170], "errorMessage": "check self.total_attendance exists"}, {"pc": [335, 351, 456, 473, 549, 565, 683, 704, 721, 799, 842, 969, 997, 1116, 1141, 1220, 1325, 1410, 1436, 1587, 1686, 1703], "errorMessage": "invalid array length header"}, {"pc": [1251], "errorMessage": "invalid number of bytes for arc4.bool"}, {"pc": [342, 358, 463, 480, 556, 572, 690, 711, 728, 806, 849, 976, 1004, 1123, 1148, 1227, 1332, 1417, 1443, 1594, 1693, 1710], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [413, 436, 818, 1344], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [369, 378, 493, 504, 583, 592, 740, 826, 835, 988, 1134, 1239, 1429], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AddTeacherArgs:
+    """Dataclass for add_teacher arguments"""
+    teacher: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "add_teacher(address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RemoveTeacherArgs:
+    """Dataclass for remove_teacher arguments"""
+    teacher: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "remove_teacher(address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateSessionArgs:
+    """Dataclass for create_session arguments"""
+    session_id: bytes | str
+    session_name: bytes | str
+    duration_seconds: int
+    attendance_window_seconds: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_session(byte[],byte[],uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class OpenSessionArgs:
+    """Dataclass for open_session arguments"""
+    session_id: bytes | str
+    session_name: bytes | str
+    duration_seconds: int
+    attendance_window_seconds: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "open_session(byte[],byte[],uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CloseRegisteredSessionArgs:
+    """Dataclass for close_registered_session arguments"""
+    session_id: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_registered_session(byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CommitAttendanceArgs:
+    """Dataclass for commit_attendance arguments"""
+    session_id: bytes | str
+    merkle_root: bytes | str
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "commit_attendance(byte[],byte[],uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VerifyAttendanceArgs:
+    """Dataclass for verify_attendance arguments"""
+    session_id: bytes | str
+    student: str
+    qr_round: int
+    leaf_index: int
+    proof: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "verify_attendance(byte[],address,uint64,uint64,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MarkAttendanceArgs:
+    """Dataclass for mark_attendance arguments"""
+    session_id: bytes | str
+    qr_round: int
+    qr_hash: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mark_attendance(byte[],uint64,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MarkAttendanceBoxArgs:
+    """Dataclass for mark_attendance_box arguments"""
+    session_id: bytes | str
+    qr_round: int
+    qr_hash: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mark_attendance_box(byte[],uint64,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateRosterArgs:
+    """Dataclass for create_roster arguments"""
+    session_id: bytes | str
+    capacity: int
+    track_rounds: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_roster(byte[],uint64,bool)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class EnrollArgs:
+    """Dataclass for enroll arguments"""
+    session_id: bytes | str
+    student: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "enroll(byte[],address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MarkAttendanceBitmapArgs:
+    """Dataclass for mark_attendance_bitmap arguments"""
+    session_id: bytes | str
+    qr_round: int
+    qr_hash: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mark_attendance_bitmap(byte[],uint64,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSessionSummaryArgs:
+    """Dataclass for get_session_summary arguments"""
+    session_id: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_session_summary(byte[])byte[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetAttendanceBitmapArgs:
+    """Dataclass for get_attendance_bitmap arguments"""
+    session_id: bytes | str
+    addresses: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_attendance_bitmap(byte[],byte[])byte[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateArgs:
+    """Dataclass for create arguments"""
+    session_id: bytes | str
+    session_name: bytes | str
+    duration_seconds: int
+    attendance_window_seconds: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create(byte[],byte[],uint64,uint64)void"
+
+
+class _AttendanceOptIn:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class _AttendanceCloseOut:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self, params: algokit_utils.AppClientBareCallParams | None = None
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.close_out(params)
+
+
+class AttendanceParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AttendanceOptIn":
+        return _AttendanceOptIn(self.app_client)
+
+    @property
+    def close_out(self) -> "_AttendanceCloseOut":
+        return _AttendanceCloseOut(self.app_client)
+
+    def add_teacher(
+        self,
+        args: tuple[str] | AddTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_teacher(address)void",
+            "args": method_args,
+        }))
+
+    def remove_teacher(
+        self,
+        args: tuple[str] | RemoveTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_teacher(address)void",
+            "args": method_args,
+        }))
+
+    def create_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def close_session(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_session()void",
+        }))
+
+    def open_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | OpenSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def close_registered_session(
+        self,
+        args: tuple[bytes | str] | CloseRegisteredSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_registered_session(byte[])void",
+            "args": method_args,
+        }))
+
+    def commit_attendance(
+        self,
+        args: tuple[bytes | str, bytes | str, int] | CommitAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_attendance(byte[],byte[],uint64)void",
+            "args": method_args,
+        }))
+
+    def verify_attendance(
+        self,
+        args: tuple[bytes | str, str, int, int, bytes | str] | VerifyAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_attendance(byte[],address,uint64,uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def pool_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "pool_budget()void",
+        }))
+
+    def mark_attendance(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def mark_attendance_box(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBoxArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_box(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def create_roster(
+        self,
+        args: tuple[bytes | str, int, bool] | CreateRosterArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_roster(byte[],uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def enroll(
+        self,
+        args: tuple[bytes | str, str] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "enroll(byte[],address)uint64",
+            "args": method_args,
+        }))
+
+    def mark_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_bitmap(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def get_session_summary(
+        self,
+        args: tuple[bytes | str] | GetSessionSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session_summary(byte[])byte[]",
+            "args": method_args,
+        }))
+
+    def get_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, bytes | str] | GetAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_attendance_bitmap(byte[],byte[])byte[]",
+            "args": method_args,
+        }))
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AttendanceOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class _AttendanceCloseOutTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        return self.app_client.create_transaction.bare.close_out(params)
+
+
+class AttendanceCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AttendanceOptInTransaction":
+        return _AttendanceOptInTransaction(self.app_client)
+
+    @property
+    def close_out(self) -> "_AttendanceCloseOutTransaction":
+        return _AttendanceCloseOutTransaction(self.app_client)
+
+    def add_teacher(
+        self,
+        args: tuple[str] | AddTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_teacher(address)void",
+            "args": method_args,
+        }))
+
+    def remove_teacher(
+        self,
+        args: tuple[str] | RemoveTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_teacher(address)void",
+            "args": method_args,
+        }))
+
+    def create_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def close_session(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_session()void",
+        }))
+
+    def open_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | OpenSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def close_registered_session(
+        self,
+        args: tuple[bytes | str] | CloseRegisteredSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_registered_session(byte[])void",
+            "args": method_args,
+        }))
+
+    def commit_attendance(
+        self,
+        args: tuple[bytes | str, bytes | str, int] | CommitAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_attendance(byte[],byte[],uint64)void",
+            "args": method_args,
+        }))
+
+    def verify_attendance(
+        self,
+        args: tuple[bytes | str, str, int, int, bytes | str] | VerifyAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_attendance(byte[],address,uint64,uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def pool_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "pool_budget()void",
+        }))
+
+    def mark_attendance(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def mark_attendance_box(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBoxArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_box(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def create_roster(
+        self,
+        args: tuple[bytes | str, int, bool] | CreateRosterArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_roster(byte[],uint64,bool)void",
+            "args": method_args,
+        }))
+
+    def enroll(
+        self,
+        args: tuple[bytes | str, str] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "enroll(byte[],address)uint64",
+            "args": method_args,
+        }))
+
+    def mark_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_bitmap(byte[],uint64,byte[])void",
+            "args": method_args,
+        }))
+
+    def get_session_summary(
+        self,
+        args: tuple[bytes | str] | GetSessionSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session_summary(byte[])byte[]",
+            "args": method_args,
+        }))
+
+    def get_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, bytes | str] | GetAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_attendance_bitmap(byte[],byte[])byte[]",
+            "args": method_args,
+        }))
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AttendanceOptInSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class _AttendanceCloseOutSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def bare(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        
+    ) -> algokit_utils.SendAppTransactionResult:
+        return self.app_client.send.bare.close_out(
+            params=params,
+            send_params=send_params,
+            
+        )
+
+
+class AttendanceSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AttendanceOptInSend":
+        return _AttendanceOptInSend(self.app_client)
+
+    @property
+    def close_out(self) -> "_AttendanceCloseOutSend":
+        return _AttendanceCloseOutSend(self.app_client)
+
+    def add_teacher(
+        self,
+        args: tuple[str] | AddTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_teacher(address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def remove_teacher(
+        self,
+        args: tuple[str] | RemoveTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_teacher(address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def close_session(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_session()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def open_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | OpenSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "open_session(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def close_registered_session(
+        self,
+        args: tuple[bytes | str] | CloseRegisteredSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_registered_session(byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def commit_attendance(
+        self,
+        args: tuple[bytes | str, bytes | str, int] | CommitAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "commit_attendance(byte[],byte[],uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def verify_attendance(
+        self,
+        args: tuple[bytes | str, str, int, int, bytes | str] | VerifyAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_attendance(byte[],address,uint64,uint64,byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def pool_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "pool_budget()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def mark_attendance(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance(byte[],uint64,byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def mark_attendance_box(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBoxArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_box(byte[],uint64,byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_roster(
+        self,
+        args: tuple[bytes | str, int, bool] | CreateRosterArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_roster(byte[],uint64,bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def enroll(
+        self,
+        args: tuple[bytes | str, str] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "enroll(byte[],address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def mark_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mark_attendance_bitmap(byte[],uint64,byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_session_summary(
+        self,
+        args: tuple[bytes | str] | GetSessionSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bytes]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_session_summary(byte[])byte[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+
+    def get_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, bytes | str] | GetAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bytes]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_attendance_bitmap(byte[],byte[])byte[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create(byte[],byte[],uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    session_id: bytes
+    session_name: bytes
+    creator: str
+    start_round: int
+    end_round: int
+    attendance_end_round: int
+    is_active: int
+    total_attendance: int
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    is_teacher: int
+
+class AttendanceState:
+    """Methods to access state for the current Attendance app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    def local_state(
+        self, address: str
+    ) -> "_LocalState":
+            """Methods to access local_state for the current app"""
+            return _LocalState(self.app_client, address)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def session_id(self) -> bytes:
+        """Get the current value of the session_id key in global_state state"""
+        value = self.app_client.state.global_state.get_value("session_id")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def session_name(self) -> bytes:
+        """Get the current value of the session_name key in global_state state"""
+        value = self.app_client.state.global_state.get_value("session_name")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def creator(self) -> str:
+        """Get the current value of the creator key in global_state state"""
+        value = self.app_client.state.global_state.get_value("creator")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def start_round(self) -> int:
+        """Get the current value of the start_round key in global_state state"""
+        value = self.app_client.state.global_state.get_value("start_round")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def end_round(self) -> int:
+        """Get the current value of the end_round key in global_state state"""
+        value = self.app_client.state.global_state.get_value("end_round")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def attendance_end_round(self) -> int:
+        """Get the current value of the attendance_end_round key in global_state state"""
+        value = self.app_client.state.global_state.get_value("attendance_end_round")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def is_active(self) -> int:
+        """Get the current value of the is_active key in global_state state"""
+        value = self.app_client.state.global_state.get_value("is_active")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_attendance(self) -> int:
+        """Get the current value of the total_attendance key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_attendance")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _LocalState:
+    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+        self.app_client = app_client
+        self.address = address
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self.app_client.state.local_state(self.address).get_all()
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(LocalStateValue, converted)
+
+    @property
+    def is_teacher(self) -> int:
+        """Get the current value of the is_teacher key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("is_teacher")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class AttendanceClient:
+    """Client for interacting with Attendance smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AttendanceParams(self.app_client)
+        self.create_transaction = AttendanceCreateTransactionParams(self.app_client)
+        self.send = AttendanceSend(self.app_client)
+        self.state = AttendanceState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AttendanceClient":
+        return AttendanceClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AttendanceComposer":
+        return AttendanceComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["add_teacher(address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["remove_teacher(address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_session(byte[],byte[],uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_session()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["open_session(byte[],byte[],uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_registered_session(byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["commit_attendance(byte[],byte[],uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["verify_attendance(byte[],address,uint64,uint64,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["pool_budget()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mark_attendance(byte[],uint64,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mark_attendance_box(byte[],uint64,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_roster(byte[],uint64,bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["enroll(byte[],address)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mark_attendance_bitmap(byte[],uint64,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_session_summary(byte[])byte[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bytes | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_attendance_bitmap(byte[],byte[])byte[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bytes | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create(byte[],byte[],uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opt_in()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bytes | int:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AttendanceMethodCallCreateParams(
+    algokit_utils.AppClientCreateSchema, algokit_utils.BaseAppClientMethodCallParams[
+        CreateArgs,
+        str | None,
+    ]
+):
+    """Parameters for creating Attendance contract using ABI"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallCreateParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallCreateParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class AttendanceFactory(algokit_utils.TypedAppFactoryProtocol[AttendanceMethodCallCreateParams, None, None]):
+    """Factory for deploying and managing AttendanceClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AttendanceFactoryParams(self.app_factory)
+        self.create_transaction = AttendanceFactoryCreateTransaction(self.app_factory)
+        self.send = AttendanceFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AttendanceMethodCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AttendanceClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AttendanceClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AttendanceClient:
+        """Get an app client by creator address and name"""
+        return AttendanceClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AttendanceClient:
+        """Get an app client by app ID"""
+        return AttendanceClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AttendanceFactoryParams:
+    """Parameters for creating transactions for Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactoryCreateParams(app_factory)
+        self.update = AttendanceFactoryUpdateParams(app_factory)
+        self.delete = AttendanceFactoryDeleteParams(app_factory)
+
+class AttendanceFactoryCreateParams:
+    """Parameters for 'create' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def add_teacher(
+        self,
+        args: tuple[str] | AddTeacherArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_teacher(address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_teacher(address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def remove_teacher(
+        self,
+        args: tuple[str] | RemoveTeacherArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the remove_teacher(address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "remove_teacher(address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_session(byte[],byte[],uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_session(byte[],byte[],uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_session(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_session()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_session()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def open_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | OpenSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the open_session(byte[],byte[],uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "open_session(byte[],byte[],uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_registered_session(
+        self,
+        args: tuple[bytes | str] | CloseRegisteredSessionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_registered_session(byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_registered_session(byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def commit_attendance(
+        self,
+        args: tuple[bytes | str, bytes | str, int] | CommitAttendanceArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the commit_attendance(byte[],byte[],uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "commit_attendance(byte[],byte[],uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_attendance(
+        self,
+        args: tuple[bytes | str, str, int, int, bytes | str] | VerifyAttendanceArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_attendance(byte[],address,uint64,uint64,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "verify_attendance(byte[],address,uint64,uint64,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def pool_budget(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the pool_budget()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "pool_budget()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def mark_attendance(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the mark_attendance(byte[],uint64,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "mark_attendance(byte[],uint64,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def mark_attendance_box(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBoxArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the mark_attendance_box(byte[],uint64,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "mark_attendance_box(byte[],uint64,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_roster(
+        self,
+        args: tuple[bytes | str, int, bool] | CreateRosterArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_roster(byte[],uint64,bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_roster(byte[],uint64,bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def enroll(
+        self,
+        args: tuple[bytes | str, str] | EnrollArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the enroll(byte[],address)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "enroll(byte[],address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def mark_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBitmapArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the mark_attendance_bitmap(byte[],uint64,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "mark_attendance_bitmap(byte[],uint64,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_session_summary(
+        self,
+        args: tuple[bytes | str] | GetSessionSummaryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_session_summary(byte[])byte[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_session_summary(byte[])byte[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, bytes | str] | GetAttendanceBitmapArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_attendance_bitmap(byte[],byte[])byte[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_attendance_bitmap(byte[],byte[])byte[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create(byte[],byte[],uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create(byte[],byte[],uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def opt_in(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opt_in()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "opt_in()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AttendanceFactoryUpdateParams:
+    """Parameters for 'update' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AttendanceFactoryDeleteParams:
+    """Parameters for 'delete' operations of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AttendanceFactoryCreateTransaction:
+    """Create transactions for Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactoryCreateTransactionCreate(app_factory)
+
+
+class AttendanceFactoryCreateTransactionCreate:
+    """Create new instances of Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AttendanceFactorySend:
+    """Send calls to Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AttendanceFactorySendCreate(app_factory)
+
+
+class AttendanceFactorySendCreate:
+    """Send create calls to Attendance contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AttendanceClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AttendanceClient(result[0]), result[1]
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> tuple[AttendanceClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
+            """Creates and sends a transaction using the create(byte[],byte[],uint64,uint64)void ABI method"""
+            params = params or algokit_utils.CommonAppCallCreateParams()
+            client, result = self.app_factory.send.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    **{
+                    **dataclasses.asdict(params),
+                    "method": "create(byte[],byte[],uint64,uint64)void",
+                    "args": _parse_abi_args(args),
+                    }
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params
+            )
+            return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
+    
+            return AttendanceClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+                **{
+                    **result.__dict__,
+                    "app_id": result.app_id,
+                    "abi_return": return_value,
+                    "transaction": result.transaction,
+                    "confirmation": result.confirmation,
+                    "group_id": result.group_id,
+                    "tx_ids": result.tx_ids,
+                    "transactions": result.transactions,
+                    "confirmations": result.confirmations,
+                    "app_address": result.app_address,
+                }
+            )
+
+
+class _AttendanceOptInComposer:
+    def __init__(self, composer: "AttendanceComposer"):
+        self.composer = composer
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.opt_in.opt_in(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "opt_in()void", v
+            )
+        )
+        return self.composer
+
+
+class _AttendanceCloseOutComposer:
+    def __init__(self, composer: "AttendanceComposer"):
+        self.composer = composer
+
+
+class AttendanceComposer:
+    """Composer for creating transaction groups for Attendance contract calls"""
+
+    def __init__(self, client: "AttendanceClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def opt_in(self) -> "_AttendanceOptInComposer":
+        return _AttendanceOptInComposer(self)
+
+    @property
+    def close_out(self) -> "_AttendanceCloseOutComposer":
+        return _AttendanceCloseOutComposer(self)
+
+    def add_teacher(
+        self,
+        args: tuple[str] | AddTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.add_teacher(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "add_teacher(address)void", v
+            )
+        )
+        return self
+
+    def remove_teacher(
+        self,
+        args: tuple[str] | RemoveTeacherArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.remove_teacher(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "remove_teacher(address)void", v
+            )
+        )
+        return self
+
+    def create_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_session(byte[],byte[],uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def close_session(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_session(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_session()void", v
+            )
+        )
+        return self
+
+    def open_session(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | OpenSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.open_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "open_session(byte[],byte[],uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def close_registered_session(
+        self,
+        args: tuple[bytes | str] | CloseRegisteredSessionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_registered_session(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_registered_session(byte[])void", v
+            )
+        )
+        return self
+
+    def commit_attendance(
+        self,
+        args: tuple[bytes | str, bytes | str, int] | CommitAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.commit_attendance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "commit_attendance(byte[],byte[],uint64)void", v
+            )
+        )
+        return self
+
+    def verify_attendance(
+        self,
+        args: tuple[bytes | str, str, int, int, bytes | str] | VerifyAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.verify_attendance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "verify_attendance(byte[],address,uint64,uint64,byte[])void", v
+            )
+        )
+        return self
+
+    def pool_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.pool_budget(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "pool_budget()void", v
+            )
+        )
+        return self
+
+    def mark_attendance(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mark_attendance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mark_attendance(byte[],uint64,byte[])void", v
+            )
+        )
+        return self
+
+    def mark_attendance_box(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBoxArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mark_attendance_box(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mark_attendance_box(byte[],uint64,byte[])void", v
+            )
+        )
+        return self
+
+    def create_roster(
+        self,
+        args: tuple[bytes | str, int, bool] | CreateRosterArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_roster(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_roster(byte[],uint64,bool)void", v
+            )
+        )
+        return self
+
+    def enroll(
+        self,
+        args: tuple[bytes | str, str] | EnrollArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.enroll(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "enroll(byte[],address)uint64", v
+            )
+        )
+        return self
+
+    def mark_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, int, bytes | str] | MarkAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mark_attendance_bitmap(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mark_attendance_bitmap(byte[],uint64,byte[])void", v
+            )
+        )
+        return self
+
+    def get_session_summary(
+        self,
+        args: tuple[bytes | str] | GetSessionSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_session_summary(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_session_summary(byte[])byte[]", v
+            )
+        )
+        return self
+
+    def get_attendance_bitmap(
+        self,
+        args: tuple[bytes | str, bytes | str] | GetAttendanceBitmapArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_attendance_bitmap(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_attendance_bitmap(byte[],byte[])byte[]", v
+            )
+        )
+        return self
+
+    def create(
+        self,
+        args: tuple[bytes | str, bytes | str, int, int] | CreateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create(byte[],byte[],uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AttendanceComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AttendanceComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,309 @@
+"""
+CampusChain AI - Pooled Keep-Alive Algod Client
+
+algosdk's AlgodClient opens a new connection (and a TLS handshake against
+algonode) for every request. PooledAlgodClient is a drop-in subclass that
+keeps HTTP/1.1 connections alive and reuses them:
+
+- at most pool_size connections per client, shared safely between threads
+- 429 and 5xx responses are retried with exponential backoff, honouring
+  Retry-After; transaction submission is only retried when it was rate
+  limited, so a signed transaction is never sent twice after a server error
+- timeouts are set per endpoint (wait-for-block-after waits up to a minute,
+  simulate and compile get longer than plain reads)
+
+Usage:
+    from algod_pool import get_algod_client
+
+    algod_client = get_algod_client("testnet")  # shared by every caller in the process
+"""
+
+import http.client
+import json
+import random
+import socket
+import ssl
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib import parse
+
+from algosdk import constants, error
+from algosdk.v2client import algod
+
+NETWORKS = {
+    "localnet": ("http://localhost:4001", "a" * 64),
+    "testnet": ("https://testnet-api.algonode.cloud", ""),
+}
+
+DEFAULT_POOL_SIZE = 8
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8
+MAX_RETRY_AFTER_SECONDS = 60
+
+# Rate limited or the node/proxy is unavailable
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Seconds per endpoint, longest matching path prefix wins
+ENDPOINT_TIMEOUTS = {
+    "/v2/status/wait-for-block-after/": 70,
+    "/v2/status": 10,
+    "/v2/transactions/params": 10,
+    "/v2/transactions/pending/": 10,
+    "/v2/transactions": 15,
+    "/v2/transactions/simulate": 60,
+    "/v2/teal/compile": 30,
+    "/v2/accounts/": 10,
+    "/v2/applications/": 10,
+    "/v2/blocks/": 30,
+}
+
+# POST endpoints that change nothing and can be repeated after a server error
+IDEMPOTENT_POSTS = ("/v2/transactions/simulate", "/v2/teal/compile", "/v2/teal/disassemble", "/v2/teal/dryrun")
+
+# A kept-alive connection the server already closed fails with one of these
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, at most size at a time"""
+
+    def __init__(self, address, size=DEFAULT_POOL_SIZE):
+        url = parse.urlsplit(address)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported algod address: {address}")
+        self.scheme = url.scheme
+        self.host = url.hostname
+        self.port = url.port
+        self.base_path = url.path.rstrip("/")
+        self.size = size
+        self.created = 0
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._ssl_context = ssl.create_default_context() if self.scheme == "https" else None
+
+    def acquire(self, timeout):
+        """
+        Take an idle connection or open a new one
+
+        Returns:
+            (connection, reused) - reused is False for a fresh connection
+        """
+        self._slots.acquire()
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+        try:
+            if self._ssl_context is not None:
+                connection = http.client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self._ssl_context)
+            else:
+                connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.created += 1
+        return connection, False
+
+    def release(self, connection, reusable):
+        """Return a connection; closed instead if the response did not leave it reusable"""
+        if reusable:
+            with self._lock:
+                self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """AlgodClient over a keep-alive connection pool with retries and per-endpoint timeouts"""
+
+    def __init__(
+        self,
+        algod_token,
+        algod_address,
+        headers=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        max_retries=MAX_RETRIES,
+        backoff_seconds=BACKOFF_SECONDS,
+        timeouts=None
+    ):
+        """
+        Args:
+            algod_token: Algod API token
+            algod_address: Algod URL, e.g. https://testnet-api.algonode.cloud
+            headers: Extra headers sent with every request
+            pool_size: Maximum open connections (and concurrent requests)
+            max_retries: Retries after a rate limit, server error or dropped connection
+            backoff_seconds: First retry delay, doubled per retry
+            timeouts: Endpoint path prefix -> seconds, merged over ENDPOINT_TIMEOUTS
+        """
+        super().__init__(algod_token, algod_address, headers)
+        self.pool = ConnectionPool(algod_address, pool_size)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeouts = dict(ENDPOINT_TIMEOUTS, **(timeouts or {}))
+
+    def timeout_for(self, path, default):
+        """Timeout of the longest configured prefix of path, else default"""
+        matches = [prefix for prefix in self.timeouts if path.startswith(prefix)]
+        if not matches:
+            return default
+        return self.timeouts[max(matches, key=len)]
+
+    def algod_request(
+        self,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        response_format="json",
+        timeout=30
+    ):
+        """Same contract as AlgodClient.algod_request, sent over a pooled connection"""
+        header = {"User-Agent": "py-algorand-sdk", "Connection": "keep-alive"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+
+        if requrl not in constants.unversioned_paths:
+            requrl = algod.api_version_path_prefix + requrl
+        timeout = self.timeout_for(requrl, timeout)
+        retry_server_errors = method in ("GET", "HEAD") or requrl in IDEMPOTENT_POSTS
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        status, reason, body = self._send(method, self.pool.base_path + requrl, data, header, timeout, retry_server_errors)
+
+        if status >= 400:
+            message, payload = reason or f"HTTP {status}", {}
+            try:
+                payload = json.loads(body.decode("utf-8"))
+                message = payload["message"]
+            except (ValueError, KeyError, TypeError):
+                pass
+            raise error.AlgodHTTPError(message, status, payload.get("data") if isinstance(payload, dict) else None)
+
+        if response_format != "json":
+            return body
+        if status == 200 and not body:
+            # Some algod responses are 200 OK with an empty body
+            return {}
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+
+    def _send(self, method, path, data, header, timeout, retry_server_errors):
+        """
+        Send one request, retrying as configured
+
+        Returns:
+            (status, reason, body) of the final response
+
+        Raises:
+            OSError, http.client.HTTPException: If the connection keeps failing
+        """
+        attempt = 0
+        while True:
+            connection, reused = self.pool.acquire(timeout)
+            try:
+                connection.request(method, path, body=data, headers=header)
+                response = connection.getresponse()
+                body = response.read()
+            except STALE_CONNECTION_ERRORS:
+                self.pool.release(connection, False)
+                # The server closed an idle connection before reading the request, resend at once
+                if reused:
+                    continue
+                if not retry_server_errors or attempt >= self.max_retries:
+                    raise
+            except (OSError, http.client.HTTPException, socket.timeout):
+                self.pool.release(connection, False)
+                if not retry_server_errors or attempt >= self.max_retries:
+                    raise
+            else:
+                self.pool.release(connection, not response.will_close)
+                retryable = response.status == 429 or (retry_server_errors and response.status in RETRY_STATUSES)
+                if not retryable or attempt >= self.max_retries:
+                    return response.status, response.reason, body
+                retry_after = _retry_after_seconds(response.getheader("Retry-After"))
+                if retry_after is not None:
+                    time.sleep(retry_after)
+                    attempt += 1
+                    continue
+
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _backoff(self, attempt):
+        delay = min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2 ** attempt)
+        # Jitter keeps many clients rate limited together from retrying in step
+        return delay * random.uniform(0.5, 1)
+
+    def close(self):
+        """Close the pooled connections (the client still works, it reconnects on demand)"""
+        self.pool.close()
+
+
+def _retry_after_seconds(value):
+    """Retry-After header (seconds or HTTP date) as seconds, None if absent or unreadable"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(MAX_RETRY_AFTER_SECONDS, max(0, seconds))
+
+
+def get_algod_client(network="localnet", pool_size=DEFAULT_POOL_SIZE, **options):
+    """
+    Shared pooled client for a network
+
+    Every call with the same arguments returns the same client, so scripts and
+    helpers in one process reuse its open connections.
+
+    Args:
+        network: "localnet" or "testnet"
+        pool_size: Maximum open connections
+        **options: max_retries, backoff_seconds, timeouts or headers for PooledAlgodClient
+
+    Returns:
+        PooledAlgodClient
+
+    Raises:
+        ValueError: If the network is not supported
+    """
+    if network not in NETWORKS:
+        raise ValueError(f"Unsupported network: {network}")
+    key = (network, pool_size, repr(sorted(options.items())))
+    with _clients_lock:
+        if key not in _clients:
+            algod_address, algod_token = NETWORKS[network]
+            _clients[key] = PooledAlgodClient(algod_token, algod_address, pool_size=pool_size, **options)
+        return _clients[key]
@@ -0,0 +1,239 @@
+"""
+CampusChain AI - Asyncio Algod/Indexer Layer for Bulk Operations
+
+The attendance scripts call algod one request at a time, so checking the
+local state of 2,000 students takes minutes. AsyncAlgodClient exposes the
+calls those scripts use as coroutines, running the (thread-safe, pooled)
+algosdk client on a bounded worker pool:
+
+- at most `concurrency` requests are in flight, over as many keep-alive
+  connections (see algod_pool)
+- map_bounded runs a coroutine over any number of items with a fixed number
+  of workers, keeping results in input order
+- account_app_states fetches and decodes many accounts' local state at once
+
+Usage:
+    import asyncio
+    from async_algod import AsyncAlgodClient, account_app_states
+
+    async def main():
+        async with AsyncAlgodClient(network="testnet", concurrency=32) as client:
+            return await account_app_states(client, app_id, addresses)
+
+    states = asyncio.run(main())  # address -> decoded local state, None if not opted in
+"""
+
+import asyncio
+import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from algosdk import error
+from algosdk.v2client import indexer
+
+from algod_pool import get_algod_client
+
+DEFAULT_CONCURRENCY = 16
+
+INDEXER_NETWORKS = {
+    "localnet": ("http://localhost:8980", "a" * 64),
+    "testnet": ("https://testnet-idx.algonode.cloud", ""),
+}
+INDEXER_PAGE_SIZE = 1000
+
+
+class _AsyncWrapper:
+    """Runs a synchronous algosdk client's methods on a bounded thread pool"""
+
+    def __init__(self, client, concurrency):
+        self.client = client
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=type(self).__name__)
+
+    async def _call(self, method, *args, **kwargs):
+        # The executor's worker count is the concurrency bound
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(getattr(self.client, method), *args, **kwargs)
+        )
+
+    def close(self):
+        """Stop the worker threads (the wrapped client stays usable)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+class AsyncAlgodClient(_AsyncWrapper):
+    """Coroutine versions of the algod calls the attendance tooling uses"""
+
+    def __init__(self, algod_client=None, network="testnet", concurrency=DEFAULT_CONCURRENCY):
+        """
+        Args:
+            algod_client: Algod client to wrap; by default the shared pooled client for network
+            network: "localnet" or "testnet", used when algod_client is not given
+            concurrency: Maximum requests in flight
+        """
+        super().__init__(algod_client or get_algod_client(network, pool_size=concurrency), concurrency)
+
+    async def status(self):
+        return await self._call("status")
+
+    async def status_after_block(self, round_num):
+        return await self._call("status_after_block", round_num)
+
+    async def suggested_params(self):
+        return await self._call("suggested_params")
+
+    async def account_info(self, address):
+        return await self._call("account_info", address)
+
+    async def account_application_info(self, address, app_id):
+        return await self._call("account_application_info", address, app_id)
+
+    async def application_info(self, app_id):
+        return await self._call("application_info", app_id)
+
+    async def send_transaction(self, signed_txn):
+        return await self._call("send_transaction", signed_txn)
+
+    async def send_transactions(self, signed_txns):
+        return await self._call("send_transactions", signed_txns)
+
+    async def pending_transaction_info(self, tx_id):
+        return await self._call("pending_transaction_info", tx_id)
+
+    async def compile(self, source):
+        return await self._call("compile", source)
+
+
+class AsyncIndexerClient(_AsyncWrapper):
+    """Coroutine versions of the indexer searches used to list an app's accounts"""
+
+    def __init__(self, indexer_client=None, network="testnet", concurrency=DEFAULT_CONCURRENCY):
+        """
+        Args:
+            indexer_client: IndexerClient to wrap; by default one for network
+            network: "localnet" or "testnet", used when indexer_client is not given
+            concurrency: Maximum requests in flight
+        """
+        if indexer_client is None:
+            if network not in INDEXER_NETWORKS:
+                raise ValueError(f"Unsupported network: {network}")
+            indexer_address, indexer_token = INDEXER_NETWORKS[network]
+            indexer_client = indexer.IndexerClient(indexer_token, indexer_address)
+        super().__init__(indexer_client, concurrency)
+
+    async def accounts(self, application_id, limit=INDEXER_PAGE_SIZE, next_page=None):
+        return await self._call("accounts", application_id=application_id, limit=limit, next_page=next_page)
+
+    async def opted_in_accounts(self, application_id):
+        """
+        Every account opted into an app, following next-token page by page
+
+        Yields:
+            Indexer account dicts
+        """
+        next_page = None
+        while True:
+            page = await self.accounts(application_id, next_page=next_page)
+            for account_info in page.get("accounts", []):
+                yield account_info
+            next_page = page.get("next-token")
+            if not next_page:
+                return
+
+
+async def map_bounded(fn, items, concurrency=DEFAULT_CONCURRENCY, return_exceptions=False):
+    """
+    Await fn(item) for every item with at most `concurrency` running at once
+
+    Only `concurrency` worker coroutines exist however many items there are.
+
+    Args:
+        fn: Coroutine function taking one item
+        items: Iterable of items
+        concurrency: Number of workers
+        return_exceptions: Put a failed item's exception in its result slot
+            instead of raising it
+
+    Returns:
+        List of results in the order of items
+    """
+    items = list(items)
+    results = [None] * len(items)
+    positions = iter(range(len(items)))
+
+    async def worker():
+        for index in positions:
+            try:
+                results[index] = await fn(items[index])
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(items)))))
+    return results
+
+
+def batched(items, size):
+    """Split items into lists of at most size, e.g. 16 transactions per atomic group"""
+    items = list(items)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def decode_state(key_values):
+    """
+    Decode an algod/indexer key-value list
+
+    Returns:
+        Dict of key (str) -> int for uints, str for UTF-8 bytes, else bytes
+    """
+    state = {}
+    for item in key_values:
+        key = base64.b64decode(item["key"]).decode("utf-8", "backslashreplace")
+        value = item["value"]
+        if value["type"] == 1:
+            raw = base64.b64decode(value.get("bytes", ""))
+            try:
+                state[key] = raw.decode("utf-8")
+            except UnicodeDecodeError:
+                state[key] = raw
+        else:
+            state[key] = value.get("uint", 0)
+    return state
+
+
+async def account_app_states(client, app_id, addresses):
+    """
+    Decoded local state of many accounts in one app, fetched concurrently
+
+    Args:
+        client: AsyncAlgodClient
+        app_id: Application ID
+        addresses: Account addresses
+
+    Returns:
+        Dict of address -> decoded local state, or None if the account is not opted in
+
+    Raises:
+        AlgodHTTPError: For failures other than "not opted in"
+    """
+    async def fetch(address):
+        try:
+            info = await client.account_application_info(address, app_id)
+        except error.AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        local_state = info.get("app-local-state")
+        return None if local_state is None else decode_state(local_state.get("key-value", []))
+
+    addresses = list(addresses)
+    states = await map_bounded(fetch, addresses, client.concurrency)
+    return dict(zip(addresses, states))
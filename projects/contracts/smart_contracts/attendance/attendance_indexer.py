@@ -0,0 +1,417 @@
+"""
+CampusChain AI - Attendance Indexer
+
+Follows algod block by block and keeps a SQLite read model of the attendance
+apps it is configured for, so dashboards page through rosters locally instead
+of asking the public indexer on every refresh (which also caps an
+/v2/accounts?application-id=... listing at one page).
+
+Decoded calls (only confirmed transactions are in blocks):
+- app creation, create_session, open_session -> sessions
+- mark_attendance, mark_attendance_box, mark_attendance_bitmap -> roster
+- close_session (global, registered or with a Merkle commitment) -> sessions
+- add_teacher, remove_teacher (and the creator as admin) -> teachers
+
+The last processed round is checkpointed in the same SQLite transaction as
+the block's rows, so a restarted indexer resumes exactly where it stopped.
+
+Usage:
+    python attendance_indexer.py --app-id 123 --db attendance.db --start-round 4000000
+    python attendance_indexer.py --app-id 123 --db attendance.db --serve 8980
+
+    GET /apps/<app_id>/sessions?limit=50&after=<session_id>
+    GET /apps/<app_id>/sessions/<session_id>/roster?limit=100&after=<address>
+    GET /apps/<app_id>/students/<address>?limit=50&after=<session_id>
+    GET /apps/<app_id>/teachers
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+import msgpack
+from algosdk import encoding
+
+sys.path.insert(0, str(Path(__file__).parent))
+from confirmation_tracker import transaction_id
+from deploy_config import AttendanceDeployConfig
+
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = 100
+ROUND_SECONDS = 3  # Same approximation as contract.py
+
+MARK_ATTENDANCE_MODES = {
+    b"mark_attendance": "local",
+    b"mark_attendance_box": "box",
+    b"mark_attendance_bitmap": "bitmap",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_round INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS apps (
+    app_id INTEGER PRIMARY KEY,
+    creator TEXT,
+    global_session_id TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    app_id INTEGER NOT NULL,
+    session_id TEXT NOT NULL,
+    session_name TEXT,
+    teacher TEXT,
+    registered INTEGER NOT NULL,
+    start_round INTEGER,
+    end_round INTEGER,
+    attendance_end_round INTEGER,
+    is_active INTEGER NOT NULL,
+    total_attendance INTEGER NOT NULL DEFAULT 0,
+    closed_round INTEGER,
+    merkle_root TEXT,
+    committed_count INTEGER,
+    PRIMARY KEY (app_id, session_id)
+);
+CREATE TABLE IF NOT EXISTS roster (
+    app_id INTEGER NOT NULL,
+    session_id TEXT NOT NULL,
+    student TEXT NOT NULL,
+    check_in_round INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    tx_id TEXT,
+    PRIMARY KEY (app_id, session_id, student)
+);
+CREATE INDEX IF NOT EXISTS roster_by_student ON roster (app_id, student, session_id);
+CREATE TABLE IF NOT EXISTS teachers (
+    app_id INTEGER NOT NULL,
+    teacher TEXT NOT NULL,
+    is_admin INTEGER NOT NULL DEFAULT 0,
+    is_active INTEGER NOT NULL,
+    added_round INTEGER,
+    removed_round INTEGER,
+    PRIMARY KEY (app_id, teacher)
+);
+"""
+
+
+def connect(db_path):
+    """Open the read model (WAL so other processes can read while the follower writes)"""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _text(value):
+    return value.decode("utf-8", errors="replace")
+
+
+def _uint(value):
+    return int.from_bytes(value, "big")
+
+
+class AttendanceIndexer:
+    """
+    Block follower and SQLite read model for a set of attendance apps
+
+    Args:
+        algod_client: Algod client to follow
+        db_path: SQLite file (":memory:" for tests)
+        app_ids: Attendance application IDs to index
+        start_round: First round to read when there is no checkpoint yet
+                     (the round the oldest app was created in)
+    """
+
+    def __init__(self, algod_client, db_path, app_ids, start_round=None):
+        self.algod_client = algod_client
+        self.app_ids = set(app_ids)
+        self.conn = connect(db_path)
+        self._lock = threading.RLock()
+
+        if self.last_round is None:
+            if start_round is None:
+                start_round = algod_client.status()["last-round"]
+            with self.conn:
+                self.conn.execute("INSERT INTO checkpoint (id, last_round) VALUES (1, ?)", (start_round - 1,))
+
+    @property
+    def last_round(self):
+        with self._lock:
+            row = self.conn.execute("SELECT last_round FROM checkpoint WHERE id = 1").fetchone()
+        return row["last_round"] if row else None
+
+    # Block following
+
+    def sync(self, until_round=None):
+        """
+        Process every block up to until_round (default: the latest round)
+
+        Returns:
+            Number of blocks processed
+        """
+        if until_round is None:
+            until_round = self.algod_client.status()["last-round"]
+        processed = 0
+        while self.last_round < until_round:
+            self.process_block(self.last_round + 1)
+            processed += 1
+        return processed
+
+    def follow(self, stop_event=None):
+        """Process new blocks as algod produces them until stop_event is set"""
+        while stop_event is None or not stop_event.is_set():
+            self.sync()
+            # Blocks until the next round instead of polling
+            self.algod_client.status_after_block(self.last_round)
+
+    def process_block(self, round_number):
+        """Decode one block and checkpoint it in a single SQLite transaction"""
+        raw = self.algod_client.block_info(round_number, response_format="msgpack")
+        block = msgpack.unpackb(raw, raw=False, strict_map_key=False)["block"]
+
+        with self._lock, self.conn:
+            for txn in block.get("txns", []):
+                self._process_txn(txn, block, round_number)
+            self.conn.execute("UPDATE checkpoint SET last_round = ? WHERE id = 1", (round_number,))
+
+    def _process_txn(self, txn, block, round_number, inner=False):
+        fields = txn["txn"]
+        if fields.get("type") == "appl":
+            app_id = fields.get("apid") or txn.get("apid")
+            if app_id in self.app_ids:
+                # Inner transactions have no ID of their own in the block
+                tx_id = None if inner else transaction_id(txn, block)
+                self._apply_call(app_id, fields, tx_id, round_number)
+        # Calls made by other apps to ours
+        for inner_txn in txn.get("dt", {}).get("itx", []):
+            self._process_txn(inner_txn, block, round_number, inner=True)
+
+    def _apply_call(self, app_id, fields, tx_id, round_number):
+        args = fields.get("apaa", [])
+        sender = encoding.encode_address(fields["snd"])
+        on_complete = fields.get("apan", 0)
+
+        if not fields.get("apid"):
+            # Creation: [session_id, session_name, duration, attendance_window (optional)]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO apps (app_id, creator, global_session_id) VALUES (?, ?, ?)",
+                (app_id, sender, _text(args[0])),
+            )
+            self._add_teacher(app_id, sender, round_number, is_admin=1)
+            self._open_session(app_id, args[0], args[1], args[2:], sender, round_number, registered=0)
+            return
+        if on_complete != 0 or not args:
+            return
+
+        method = args[0]
+        if method in MARK_ATTENDANCE_MODES:
+            self._mark(app_id, args[1], sender, round_number, MARK_ATTENDANCE_MODES[method], tx_id)
+        elif method == b"create_session":
+            self.conn.execute("UPDATE apps SET global_session_id = ? WHERE app_id = ?", (_text(args[1]), app_id))
+            self._open_session(app_id, args[1], args[2], args[3:], sender, round_number, registered=0)
+        elif method == b"open_session":
+            self._open_session(app_id, args[1], args[2], args[3:], sender, round_number, registered=1)
+        elif method == b"close_session":
+            self._close_session(app_id, args, round_number)
+        elif method in (b"add_teacher", b"remove_teacher"):
+            teacher = encoding.encode_address(fields["apat"][0])
+            if method == b"add_teacher":
+                self._add_teacher(app_id, teacher, round_number)
+            else:
+                self.conn.execute(
+                    "UPDATE teachers SET is_active = 0, removed_round = ? WHERE app_id = ? AND teacher = ?",
+                    (round_number, app_id, teacher),
+                )
+
+    def _open_session(self, app_id, session_id, session_name, durations, teacher, round_number, registered):
+        end_round = round_number + _uint(durations[0]) // ROUND_SECONDS
+        attendance_end_round = round_number + _uint(durations[1]) // ROUND_SECONDS if len(durations) > 1 else end_round
+        # Like the contract, reusing a session_id resets the counter but not who checked in
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO sessions (
+                app_id, session_id, session_name, teacher, registered,
+                start_round, end_round, attendance_end_round, is_active, total_attendance
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1, 0)
+            """,
+            (
+                app_id, _text(session_id), _text(session_name), teacher, registered,
+                round_number, end_round, attendance_end_round,
+            ),
+        )
+
+    def _mark(self, app_id, session_id, student, round_number, mode, tx_id):
+        inserted = self.conn.execute(
+            """
+            INSERT OR IGNORE INTO roster (app_id, session_id, student, check_in_round, mode, tx_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (app_id, _text(session_id), student, round_number, mode, tx_id),
+        ).rowcount
+        if inserted:
+            self.conn.execute(
+                "UPDATE sessions SET total_attendance = total_attendance + 1 WHERE app_id = ? AND session_id = ?",
+                (app_id, _text(session_id)),
+            )
+
+    def _close_session(self, app_id, args, round_number):
+        if len(args) > 1:
+            session_id = _text(args[1])
+        else:
+            row = self.conn.execute("SELECT global_session_id FROM apps WHERE app_id = ?", (app_id,)).fetchone()
+            session_id = row["global_session_id"] if row else None
+        merkle_root, committed_count = (args[2].hex(), _uint(args[3])) if len(args) > 3 else (None, None)
+        self.conn.execute(
+            """
+            UPDATE sessions SET is_active = 0, closed_round = ?,
+                merkle_root = COALESCE(?, merkle_root), committed_count = COALESCE(?, committed_count)
+            WHERE app_id = ? AND session_id = ?
+            """,
+            (round_number, merkle_root, committed_count, app_id, session_id),
+        )
+
+    def _add_teacher(self, app_id, teacher, round_number, is_admin=0):
+        self.conn.execute(
+            """
+            INSERT INTO teachers (app_id, teacher, is_admin, is_active, added_round) VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT (app_id, teacher) DO UPDATE SET is_active = 1, added_round = ?, removed_round = NULL
+            """,
+            (app_id, teacher, is_admin, round_number, round_number),
+        )
+
+    # Queries (keyset pagination: pass the returned next cursor as after)
+
+    def _page(self, query, params, key, limit):
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        with self._lock:
+            rows = [dict(row) for row in self.conn.execute(query + " LIMIT ?", (*params, limit + 1))]
+        next_cursor = rows[limit - 1][key] if len(rows) > limit else None
+        return {"items": rows[:limit], "next": next_cursor}
+
+    def list_sessions(self, app_id, limit=DEFAULT_PAGE_SIZE, after=""):
+        """Sessions of an app ordered by session_id"""
+        return self._page(
+            "SELECT * FROM sessions WHERE app_id = ? AND session_id > ? ORDER BY session_id",
+            (app_id, after or ""),
+            "session_id",
+            limit,
+        )
+
+    def list_roster(self, app_id, session_id, limit=DEFAULT_PAGE_SIZE, after=""):
+        """Students present in a session ordered by address"""
+        return self._page(
+            """
+            SELECT student, check_in_round, mode, tx_id FROM roster
+            WHERE app_id = ? AND session_id = ? AND student > ? ORDER BY student
+            """,
+            (app_id, session_id, after or ""),
+            "student",
+            limit,
+        )
+
+    def student_history(self, app_id, student, limit=DEFAULT_PAGE_SIZE, after=""):
+        """Sessions a student attended ordered by session_id"""
+        return self._page(
+            """
+            SELECT session_id, check_in_round, mode, tx_id FROM roster
+            WHERE app_id = ? AND student = ? AND session_id > ? ORDER BY session_id
+            """,
+            (app_id, student, after or ""),
+            "session_id",
+            limit,
+        )
+
+    def list_teachers(self, app_id, include_removed=False):
+        """Teachers of an app (the creator is listed with is_admin = 1)"""
+        query = "SELECT * FROM teachers WHERE app_id = ?" + ("" if include_removed else " AND is_active = 1")
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(query + " ORDER BY teacher", (app_id,))]
+
+
+def make_handler(indexer):
+    """HTTP handler serving the indexer's paginated queries as JSON"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            parts = [unquote(part) for part in url.path.strip("/").split("/")]
+            try:
+                if len(parts) < 3 or parts[0] != "apps":
+                    return self._send(404, {"error": "not found"})
+                app_id = int(parts[1])
+                limit, after = query.get("limit"), query.get("after", "")
+                if parts[2:] == ["sessions"]:
+                    body = indexer.list_sessions(app_id, limit, after)
+                elif len(parts) == 5 and parts[2] == "sessions" and parts[4] == "roster":
+                    body = indexer.list_roster(app_id, parts[3], limit, after)
+                elif len(parts) == 4 and parts[2] == "students":
+                    body = indexer.student_history(app_id, parts[3], limit, after)
+                elif parts[2:] == ["teachers"]:
+                    body = {"items": indexer.list_teachers(app_id)}
+                else:
+                    return self._send(404, {"error": "not found"})
+            except ValueError as e:
+                return self._send(400, {"error": str(e)})
+            body["last_round"] = indexer.last_round
+            self._send(200, body)
+
+        def _send(self, status, body):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index attendance apps into a local SQLite read model")
+    parser.add_argument("--network", default="localnet", help="Network to follow (localnet or testnet)")
+    parser.add_argument("--app-id", type=int, action="append", required=True, help="App ID to index (repeatable)")
+    parser.add_argument("--db", default="attendance_index.db", help="SQLite database path")
+    parser.add_argument("--start-round", type=int, help="First round to read when there is no checkpoint")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="Serve paginated queries over HTTP")
+    args = parser.parse_args()
+
+    algod_client = AttendanceDeployConfig.get_algod_client(args.network)
+    indexer = AttendanceIndexer(algod_client, args.db, args.app_id, args.start_round)
+    print(f"⏳ Catching up from round {indexer.last_round + 1}...")
+    started = time.time()
+    processed = indexer.sync()
+    print(f"✅ {processed} blocks in {time.time() - started:.1f}s, at round {indexer.last_round}")
+
+    stop = threading.Event()
+    follower = threading.Thread(target=indexer.follow, args=(stop,), daemon=True)
+    follower.start()
+
+    if args.serve:
+        server = ThreadingHTTPServer(("0.0.0.0", args.serve), make_handler(indexer))
+        print(f"📄 Serving on http://localhost:{args.serve}/apps/{args.app_id[0]}/sessions")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            stop.set()
+    else:
+        try:
+            follower.join()
+        except KeyboardInterrupt:
+            stop.set()
+
+
+if __name__ == "__main__":
+    main()
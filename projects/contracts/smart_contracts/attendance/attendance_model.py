@@ -0,0 +1,541 @@
+"""
+CampusChain AI - Attendance Reference Model
+
+Pure-Python copy of contract.py's session state machine, so a backend can
+predict whether a mark_attendance call will be accepted before spending a
+fee and a round on it. The model checks the same rules in the same order as
+the contract:
+
+1. the session_id is the session in global state or a registered session
+2. the session is active
+3. the attendance window (attendance_end_round) hasn't closed
+4. the student is opted in and hasn't checked in to this session yet (the
+   fuzzed calls only use local state mode, so the box records and rosters the
+   contract also checks never exist here)
+5. qr_round is 8 bytes and at most QR_VALIDITY_ROUNDS old
+6. qr_hash == SHA256(session_id + qr_round + student_address)
+7. the two new local state keys fit the local schema
+
+fuzz() runs random calls against the compiled TEAL and the model side by side
+and reports every call they disagree on, so the two can't drift apart.
+
+Usage:
+    model = AttendanceModel.from_chain(algod_client, app_id, [student_address], [b"CS102-LAB"])
+    reason = model.check_mark_attendance(student_address, session_id, qr_round, qr_hash, round)
+    # None when the call would be accepted, otherwise one of the REJECT_* reasons
+
+    python attendance_model.py --iterations 2000              # fuzz on the in-process AVM
+    python attendance_model.py --network localnet --optimized  # fuzz the optimized build on LocalNet
+"""
+
+import argparse
+import base64
+import hashlib
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from algosdk.transaction import (
+    ApplicationCloseOutTxn,
+    ApplicationCreateTxn,
+    ApplicationNoOpTxn,
+    ApplicationOptInTxn,
+    OnComplete,
+    PaymentTxn,
+)
+
+sys.path.insert(0, str(Path(__file__).parent))
+from box_storage import (
+    check_in_box_refs,
+    close_session_txn,
+    create_session_txn,
+    list_registered_sessions,
+    open_session_txn,
+    session_box_min_balance,
+)
+from deploy_config import AttendanceDeployConfig
+
+# Must match contract.py
+QR_VALIDITY_ROUNDS = 20
+SECONDS_PER_ROUND = 3
+CHECKED_IN_KEY = b"checked_in"
+CHECK_IN_ROUND_KEY = b"check_in_round"
+IS_TEACHER_KEY = b"is_teacher"
+MAX_KEY_LENGTH = 64
+# Local schema of the apps deploy_config creates; from_chain reads the app's own
+LOCAL_UINTS = AttendanceDeployConfig.LOCAL_SCHEMA.num_uints
+
+# Why the model expects a call to be rejected
+REJECT_UNKNOWN_SESSION = "unknown session"
+REJECT_SESSION_CLOSED = "session closed"
+REJECT_WINDOW_CLOSED = "attendance window closed"
+REJECT_NOT_OPTED_IN = "not opted in"
+REJECT_DUPLICATE = "already checked in"
+REJECT_BAD_QR_ROUND = "qr_round is not 8 bytes"
+REJECT_QR_FROM_FUTURE = "qr_round is in the future"
+REJECT_QR_EXPIRED = "QR expired"
+REJECT_WRONG_WALLET = "QR hash does not match"
+REJECT_SESSION_ID_TOO_LONG = "session_id too long for a local state key"
+REJECT_LOCAL_STATE_FULL = "local state schema full"
+
+_sha256 = hashlib.sha256
+
+
+class Session:
+    """Attendance fields of one session, global or registered"""
+
+    __slots__ = ("start_round", "end_round", "attendance_end_round", "is_active", "total_attendance")
+
+    def __init__(self, start_round, end_round, attendance_end_round, is_active=1, total_attendance=0):
+        self.start_round = start_round
+        self.end_round = end_round
+        self.attendance_end_round = attendance_end_round
+        self.is_active = is_active
+        self.total_attendance = total_attendance
+
+    @classmethod
+    def starting(cls, round, duration_seconds, attendance_window_seconds=None):
+        """Session created in round, as create_session/open_session compute it"""
+        end_round = round + duration_seconds // SECONDS_PER_ROUND
+        if attendance_window_seconds is None:
+            attendance_end_round = end_round
+        else:
+            attendance_end_round = round + attendance_window_seconds // SECONDS_PER_ROUND
+        return cls(round, end_round, attendance_end_round)
+
+    def fields(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class AttendanceModel:
+    """
+    Session and attendance state of one app, updated like contract.py updates it
+
+    Addresses are 32-byte public keys (encoding.decode_address), the form the
+    contract hashes; str addresses are accepted too but cost a decode per call.
+    Teacher methods (create_session, open_session, close_session) apply calls
+    the contract accepted and don't re-check authorization.
+    """
+
+    def __init__(self, session_id, session, sessions=None, local_states=None, local_uints=LOCAL_UINTS):
+        """
+        Args:
+            session_id: session_id held in global state
+            session: Session in global state
+            sessions: Dict of registered session_id -> Session
+            local_states: Dict of opted-in address -> local state dict (bytes key -> int)
+            local_uints: Local state schema of the app (uints; it has no byte slices)
+        """
+        self.session_id = session_id
+        self.session = session
+        self.sessions = sessions or {}
+        self.local_states = local_states or {}
+        self.local_uints = local_uints
+
+    @classmethod
+    def created(cls, session_id, round, duration_seconds, attendance_window_seconds=None):
+        """Model of an app created in round with the given session"""
+        return cls(session_id, Session.starting(round, duration_seconds, attendance_window_seconds))
+
+    @classmethod
+    def from_chain(cls, algod_client, app_id, addresses=(), session_ids=()):
+        """
+        Load the current state of a deployed app
+
+        Args:
+            algod_client: Algod client
+            app_id: Attendance app
+            addresses: Accounts whose local state the model needs (not opted in is fine)
+            session_ids: Registered sessions the model needs (bytes, unknown ones are skipped)
+        """
+        params = algod_client.application_info(app_id)["params"]
+        state = {}
+        for item in params.get("global-state", []):
+            key = base64.b64decode(item["key"])
+            value = item["value"]
+            state[key] = base64.b64decode(value["bytes"]) if value["type"] == 1 else value["uint"]
+        session = Session(
+            state.get(b"start_round", 0),
+            state.get(b"end_round", 0),
+            state.get(b"attendance_end_round", 0),
+            state.get(b"is_active", 0),
+            state.get(b"total_attendance", 0),
+        )
+
+        sessions = {
+            session_id.encode(): Session(
+                record["start_round"],
+                record["end_round"],
+                record["attendance_end_round"],
+                record["is_active"],
+                record["total_attendance"],
+            )
+            for session_id, record in list_registered_sessions(algod_client, app_id, session_ids).items()
+        }
+
+        local_states = {}
+        for address in addresses:
+            try:
+                info = algod_client.account_application_info(address, app_id)
+            except AlgodHTTPError as e:
+                if e.code == 404:
+                    continue
+                raise
+            if "app-local-state" not in info:
+                continue
+            local_states[encoding.decode_address(address)] = {
+                base64.b64decode(item["key"]): item["value"]["uint"]
+                for item in info["app-local-state"].get("key-value", [])
+            }
+
+        return cls(
+            state.get(b"session_id", b""),
+            session,
+            sessions,
+            local_states,
+            params.get("local-state-schema", {}).get("num-uint", 0),
+        )
+
+    def state(self):
+        """Comparable snapshot of everything the model tracks"""
+        return {
+            "session_id": self.session_id,
+            "session": self.session.fields(),
+            "sessions": {session_id: session.fields() for session_id, session in self.sessions.items()},
+            "local_states": {address: dict(state) for address, state in self.local_states.items()},
+        }
+
+    # ------------------------- student calls -------------------------- #
+
+    def check_mark_attendance(self, sender, session_id, qr_round, qr_hash, round):
+        """
+        Predict a mark_attendance call
+
+        Args:
+            sender: Student address (32-byte public key or str)
+            session_id: session_id argument (bytes)
+            qr_round: qr_round argument (bytes, 8 for a valid call)
+            qr_hash: qr_hash argument (bytes)
+            round: Round the call is evaluated in (last round + 1 on a live network)
+
+        Returns:
+            None if the contract would accept the call, otherwise a REJECT_* reason
+        """
+        if isinstance(sender, str):
+            sender = encoding.decode_address(sender)
+
+        session = self.session if session_id == self.session_id else self.sessions.get(session_id)
+        if session is None:
+            return REJECT_UNKNOWN_SESSION
+        if session.is_active != 1:
+            return REJECT_SESSION_CLOSED
+        if round > session.attendance_end_round:
+            return REJECT_WINDOW_CLOSED
+
+        local_state = self.local_states.get(sender)
+        if local_state is None:
+            return REJECT_NOT_OPTED_IN
+        checked_in_key = CHECKED_IN_KEY + session_id
+        if local_state.get(checked_in_key, 0) != 0:
+            return REJECT_DUPLICATE
+
+        if len(qr_round) != 8:
+            return REJECT_BAD_QR_ROUND
+        age = round - int.from_bytes(qr_round, "big")
+        if age < 0:
+            return REJECT_QR_FROM_FUTURE
+        if age > QR_VALIDITY_ROUNDS:
+            return REJECT_QR_EXPIRED
+        if qr_hash != _sha256(session_id + qr_round + sender).digest():
+            return REJECT_WRONG_WALLET
+
+        if len(CHECK_IN_ROUND_KEY) + len(session_id) > MAX_KEY_LENGTH:
+            return REJECT_SESSION_ID_TOO_LONG
+        # Both keys are new: the contract only ever writes them together
+        if checked_in_key not in local_state and len(local_state) + 2 > self.local_uints:
+            return REJECT_LOCAL_STATE_FULL
+        return None
+
+    def check_many(self, calls, round):
+        """
+        Predict many mark_attendance calls against the current state
+
+        Args:
+            calls: Iterable of (sender, session_id, qr_round, qr_hash)
+            round: Round the calls are evaluated in
+
+        Returns:
+            List of None / REJECT_* reasons, one per call
+        """
+        check = self.check_mark_attendance
+        return [check(sender, session_id, qr_round, qr_hash, round) for sender, session_id, qr_round, qr_hash in calls]
+
+    def mark_attendance(self, sender, session_id, qr_round, qr_hash, round):
+        """Apply a mark_attendance call if it would be accepted; same return value as check_mark_attendance"""
+        if isinstance(sender, str):
+            sender = encoding.decode_address(sender)
+        reason = self.check_mark_attendance(sender, session_id, qr_round, qr_hash, round)
+        if reason is None:
+            local_state = self.local_states[sender]
+            local_state[CHECKED_IN_KEY + session_id] = 1
+            local_state[CHECK_IN_ROUND_KEY + session_id] = round
+            session = self.session if session_id == self.session_id else self.sessions[session_id]
+            session.total_attendance += 1
+        return reason
+
+    def opt_in(self, sender, is_teacher=False):
+        if isinstance(sender, str):
+            sender = encoding.decode_address(sender)
+        self.local_states[sender] = {IS_TEACHER_KEY: int(is_teacher)}
+
+    def close_out(self, sender):
+        if isinstance(sender, str):
+            sender = encoding.decode_address(sender)
+        self.local_states.pop(sender, None)
+
+    # ------------------------- teacher calls -------------------------- #
+
+    def create_session(self, session_id, round, duration_seconds, attendance_window_seconds=None):
+        """Replace the session in global state"""
+        self.session_id = session_id
+        self.session = Session.starting(round, duration_seconds, attendance_window_seconds)
+
+    def open_session(self, session_id, round, duration_seconds, attendance_window_seconds=None):
+        """Register a concurrent session"""
+        self.sessions[session_id] = Session.starting(round, duration_seconds, attendance_window_seconds)
+
+    def close_session(self, session_id=None):
+        """Close the session in global state (session_id None or its id) or a registered one"""
+        if session_id is None or session_id == self.session_id:
+            self.session.is_active = 0
+        else:
+            self.sessions[session_id].is_active = 0
+
+
+# ---------------------------- differential fuzzing ---------------------------- #
+
+FUZZ_GLOBAL_SESSION = b"FUZZ-LECTURE"
+FUZZ_DURATION_SECONDS = 120
+FUZZ_WINDOW_SECONDS = 60
+QR_AGES = (0, 0, 0, 1, 5, QR_VALIDITY_ROUNDS - 1, QR_VALIDITY_ROUNDS, QR_VALIDITY_ROUNDS + 1, 60, -1, -3)
+
+
+def _encode(value):
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def fuzz(algod_client, iterations=1000, seed=0, students=6, optimized=False):
+    """
+    Send random calls to a fresh contract.py app and check the model predicted each outcome
+
+    Most calls are mark_attendance candidates mixing valid proofs with every way
+    one can fail (wrong session, closed session, old/future/short qr_round, hash
+    for another wallet, duplicates, local state full); the rest advance rounds,
+    create/open/close sessions and opt students in and out.
+
+    Args:
+        algod_client: LocalNet client or local_avm.LocalAlgodClient
+        iterations: Number of calls
+        seed: Random seed, the same seed replays the same calls
+        students: Number of student accounts
+        optimized: Fuzz the optimized build profile
+
+    Returns:
+        dict with app_id, call counts, the reason counts of expected rejections and
+        the mismatches (call, model prediction, contract outcome)
+    """
+    import contract
+    from compile_cache import get_compiled_programs
+    from profile_opcodes import new_funded_account, send
+
+    rng = random.Random(seed)
+    programs = get_compiled_programs(algod_client, contract, optimized)
+
+    teacher_key, teacher = new_funded_account(algod_client, 100_000_000)
+    accounts = [new_funded_account(algod_client) for _ in range(students)]
+    sp = algod_client.suggested_params()
+    create = ApplicationCreateTxn(
+        sender=teacher,
+        sp=sp,
+        on_complete=OnComplete.NoOpOC,
+        approval_program=programs["approval"]["bytecode"],
+        clear_program=programs["clear"]["bytecode"],
+        global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
+        local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
+        app_args=[
+            FUZZ_GLOBAL_SESSION,
+            b"Fuzz Lecture",
+            FUZZ_DURATION_SECONDS.to_bytes(8, "big"),
+            FUZZ_WINDOW_SECONDS.to_bytes(8, "big"),
+        ],
+        extra_pages=AttendanceDeployConfig.extra_program_pages(programs["approval"]["bytecode"], programs["clear"]["bytecode"]),
+    )
+    app_id = send(algod_client, create, teacher_key)["application-index"]
+    send(algod_client, PaymentTxn(teacher, sp, get_application_address(app_id), 10_000_000), teacher_key)
+    send(algod_client, ApplicationOptInTxn(teacher, sp, app_id), teacher_key)
+    # Everyone but the last student starts opted in
+    for private_key, address in accounts[:-1]:
+        send(algod_client, ApplicationOptInTxn(address, sp, app_id), private_key)
+
+    addresses = [teacher] + [address for _key, address in accounts]
+    model = AttendanceModel.from_chain(algod_client, app_id, addresses)
+    session_ids = [FUZZ_GLOBAL_SESSION, b"NEVER-OPENED"]
+    counts = Counter()
+    reasons = Counter()
+    mismatches = []
+
+    def teacher_call(txn):
+        return send(algod_client, txn, teacher_key)["confirmed-round"]
+
+    for iteration in range(iterations):
+        sp = algod_client.suggested_params()
+        action = rng.random()
+
+        if action < 0.08:
+            # Empty-ish block: rounds pass, windows close and QRs expire
+            send(algod_client, PaymentTxn(teacher, sp, teacher, 0, note=rng.randbytes(8)), teacher_key)
+            counts["rounds"] += 1
+            continue
+        if action < 0.11:
+            session_id = f"FUZZ-G{iteration}".encode()
+            window = rng.choice((None, 15, FUZZ_WINDOW_SECONDS))
+            confirmed_round = teacher_call(
+                create_session_txn(teacher, sp, app_id, session_id, "Fuzz", FUZZ_DURATION_SECONDS, window)
+            )
+            model.create_session(session_id, confirmed_round, FUZZ_DURATION_SECONDS, window)
+            session_ids.append(session_id)
+            counts["create_session"] += 1
+            continue
+        if action < 0.14:
+            session_id = f"FUZZ-R{iteration}".encode()
+            send(
+                algod_client,
+                PaymentTxn(teacher, sp, get_application_address(app_id), session_box_min_balance(session_id, "Fuzz")),
+                teacher_key,
+            )
+            confirmed_round = teacher_call(
+                open_session_txn(teacher, sp, app_id, session_id, "Fuzz", FUZZ_DURATION_SECONDS, FUZZ_WINDOW_SECONDS)
+            )
+            model.open_session(session_id, confirmed_round, FUZZ_DURATION_SECONDS, FUZZ_WINDOW_SECONDS)
+            session_ids.append(session_id)
+            counts["open_session"] += 1
+            continue
+        if action < 0.16:
+            open_ids = [session_id for session_id, session in model.sessions.items() if session.is_active]
+            session_id = rng.choice(open_ids + [None])
+            if session_id is None:
+                teacher_call(ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"close_session"]))
+            else:
+                teacher_call(close_session_txn(teacher, sp, app_id, session_id))
+            model.close_session(session_id)
+            counts["close_session"] += 1
+            continue
+        if action < 0.19:
+            # Opt students back in more often than out, so most stay opted in
+            opted_out = [(key, address) for key, address in accounts if encoding.decode_address(address) not in model.local_states]
+            if opted_out and rng.random() < 0.7:
+                private_key, address = rng.choice(opted_out)
+                send(algod_client, ApplicationOptInTxn(address, sp, app_id), private_key)
+                model.opt_in(address)
+            else:
+                private_key, address = rng.choice(accounts)
+                if encoding.decode_address(address) in model.local_states:
+                    send(algod_client, ApplicationCloseOutTxn(address, sp, app_id), private_key)
+                    model.close_out(address)
+            counts["opt_in/close_out"] += 1
+            continue
+
+        # mark_attendance candidate
+        private_key, address = rng.choice(accounts)
+        round = algod_client.status()["last-round"] + 1
+        # Mostly sessions that still take attendance, so calls get past the session checks
+        sessions = [(model.session_id, model.session), *model.sessions.items()]
+        open_ids = [session_id for session_id, session in sessions if session.is_active and round <= session.attendance_end_round]
+        open_ids = open_ids or session_ids
+        session_id = rng.choice(open_ids) if rng.random() < 0.8 else rng.choice(session_ids)
+        qr_round = max(round - rng.choice(QR_AGES), 0).to_bytes(8, "big")
+        if rng.random() < 0.05:
+            qr_round = qr_round[1:] if rng.random() < 0.5 else qr_round + b"\x00"
+        proof_for = address
+        if rng.random() < 0.1:
+            proof_for = rng.choice(accounts)[1]
+        qr_hash = hashlib.sha256(session_id + qr_round + encoding.decode_address(proof_for)).digest()
+        if rng.random() < 0.05:
+            qr_hash = rng.randbytes(rng.choice((31, 32)))
+
+        args = [b"mark_attendance", session_id, qr_round, qr_hash]
+        boxes = check_in_box_refs(session_id, address)
+        txn = ApplicationNoOpTxn(address, sp, app_id, app_args=args, boxes=boxes, note=rng.randbytes(8))
+
+        predicted = model.check_mark_attendance(address, session_id, qr_round, qr_hash, round)
+        try:
+            confirmed_round = send(algod_client, txn, private_key)["confirmed-round"]
+            outcome = None
+        except AlgodHTTPError as e:
+            confirmed_round = None
+            outcome = str(e)
+
+        counts["mark_attendance"] += 1
+        if (predicted is None) != (outcome is None) or (confirmed_round is not None and confirmed_round != round):
+            mismatches.append({
+                "iteration": iteration,
+                "call": {
+                    "sender": address,
+                    "session_id": _encode(session_id),
+                    "qr_round": _encode(qr_round),
+                    "qr_hash": _encode(qr_hash),
+                    "round": round,
+                },
+                "model": predicted or "accepted",
+                "contract": outcome or f"accepted in round {confirmed_round}",
+            })
+        if predicted is None:
+            model.mark_attendance(address, session_id, qr_round, qr_hash, round)
+            counts["accepted"] += 1
+        else:
+            reasons[predicted] += 1
+
+    if model.state() != AttendanceModel.from_chain(algod_client, app_id, addresses, list(model.sessions)).state():
+        mismatches.append({"iteration": iterations, "call": "final state", "model": "-", "contract": "differs"})
+
+    return {"app_id": app_id, "counts": counts, "reasons": reasons, "mismatches": mismatches}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential fuzzing of the attendance model against contract.py")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--optimized", action="store_true", help="Fuzz the optimized build profile")
+    parser.add_argument("--network", choices=("local", "localnet"), default="local",
+                        help="local: in-process AVM (default), localnet: AlgoKit LocalNet")
+    args = parser.parse_args()
+
+    if args.network == "localnet":
+        algod_client = AttendanceDeployConfig.get_algod_client("localnet")
+    else:
+        from local_avm import LocalAlgodClient
+        algod_client = LocalAlgodClient()
+
+    result = fuzz(algod_client, args.iterations, args.seed, optimized=args.optimized)
+    print(f"\n🎲 {args.iterations} calls (seed {args.seed}) against app {result['app_id']}")
+    for name, count in sorted(result["counts"].items()):
+        print(f"   {name:<24} {count:>6}")
+    print("\n   Expected rejections:")
+    for reason, count in result["reasons"].most_common():
+        print(f"   {reason:<42} {count:>6}")
+
+    for mismatch in result["mismatches"]:
+        print(f"\n❌ #{mismatch['iteration']} {mismatch['call']}")
+        print(f"   model:    {mismatch['model']}")
+        print(f"   contract: {mismatch['contract']}")
+    if result["mismatches"]:
+        sys.exit(1)
+    print("\n✅ Model and contract agree on every call")
+
+
+if __name__ == "__main__":
+    main()
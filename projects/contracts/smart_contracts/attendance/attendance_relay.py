@@ -0,0 +1,475 @@
+"""
+CampusChain AI - Attendance Relay
+
+At the start of a lecture hundreds of phones submit mark_attendance at once
+over campus Wi-Fi and many miss the QR_VALIDITY_ROUNDS window. The relay
+runs on a machine with a good link to algod and takes that load off the
+phones: it packs check-ins into atomic groups of up to 16 and pipelines the
+groups to algod, so it never waits for one group to confirm before sending
+the next.
+
+A group ID is part of what each student signs, so check-ins go through a
+two-step exchange and the relay never signs anything for a student:
+
+1. reserve(): the phone sends its unsigned mark_attendance call. The relay
+   batches calls for up to linger_seconds, drops calls that simulate says
+   would fail (one failing call rejects its whole atomic group) and assigns
+   the group ID.
+2. submit_signed(): the phone signs the grouped transaction it got back.
+   Once every member of a group has signed, the group is sent.
+
+Members that do not sign within sign_timeout_seconds are dropped and the
+rest of their group is regrouped and signed again. An error inside a relay
+thread rejects the check-ins it was handling; algod lookups that fail are
+retried on the next pass, and the threads keep running.
+
+Usage:
+    with AttendanceRelay(algod_client, app_id) as relay:
+        check_in = relay.reserve(txn)                     # phone -> relay
+        grouped = check_in.next_group_txn(timeout=10)     # relay -> phone
+        relay.submit_signed(check_in, grouped.sign(key))  # phone -> relay
+        check_in.wait(timeout=30)
+        print(relay.results())
+"""
+
+import queue
+import threading
+import time
+
+from algosdk.transaction import OnComplete, SignedTransaction, assign_group_id
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+MAX_GROUP_SIZE = 16
+# How long stop() waits for each thread when no timeout is given
+STOP_JOIN_SECONDS = 5
+# Pause after a failed algod status call before retrying
+RETRY_SECONDS = 0.5
+MARK_ATTENDANCE_METHODS = (b"mark_attendance", b"mark_attendance_box", b"mark_attendance_bitmap")
+
+# Check-in status
+QUEUED = "queued"
+GROUPED = "grouped"
+SUBMITTED = "submitted"
+CONFIRMED = "confirmed"
+REJECTED = "rejected"
+EXPIRED = "expired"
+
+
+class CheckIn:
+    """One student's mark_attendance call on its way through the relay"""
+
+    def __init__(self, txn):
+        self.txn = txn
+        self.student = txn.sender
+        self.status = QUEUED
+        self.reason = None
+        self.tx_id = None
+        self.confirmed_round = None
+        self._group_txns = queue.Queue()
+        self._done = threading.Event()
+
+    def next_group_txn(self, timeout=None):
+        """
+        Wait for the grouped transaction to sign
+
+        Returns:
+            The transaction with its group ID set, or None once the check-in
+            is finished (confirmed, rejected or expired)
+
+        Raises:
+            queue.Empty: If nothing arrives within timeout
+        """
+        return self._group_txns.get(timeout=timeout)
+
+    def wait(self, timeout=None):
+        """Wait until the check-in is finished, returns False on timeout"""
+        return self._done.wait(timeout)
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def as_dict(self):
+        return {
+            "status": self.status,
+            "tx_id": self.tx_id,
+            "confirmed_round": self.confirmed_round,
+            "reason": self.reason,
+        }
+
+    def _hand_out(self, txn):
+        self.status = GROUPED
+        self.tx_id = txn.get_txid()
+        self._group_txns.put(txn)
+
+    def _finish(self, status, reason=None, confirmed_round=None):
+        self.status = status
+        self.reason = reason
+        self.confirmed_round = confirmed_round
+        self._done.set()
+        self._group_txns.put(None)
+
+
+class _Group:
+    """Check-ins sharing one group ID"""
+
+    def __init__(self, check_ins, sign_deadline):
+        self.check_ins = check_ins
+        self.signed = {}
+        self.sign_deadline = sign_deadline
+        self.last_valid = max(check_in.txn.last_valid_round for check_in in check_ins)
+
+    @property
+    def fully_signed(self):
+        return len(self.signed) == len(self.check_ins)
+
+    def signed_txns(self):
+        return [self.signed[check_in.tx_id] for check_in in self.check_ins]
+
+
+class AttendanceRelay:
+    """
+    Packs student-signed mark_attendance calls into atomic groups and pipelines them
+
+    Args:
+        algod_client: Algod client
+        app_id: Attendance application ID
+        group_size: Maximum calls per atomic group (protocol limit is 16)
+        linger_seconds: How long to wait for more check-ins before sealing a partial group
+        sign_timeout_seconds: How long students have to sign their grouped transaction
+        max_in_flight: Groups sent but not yet confirmed before sending pauses
+    """
+
+    def __init__(
+        self,
+        algod_client,
+        app_id,
+        group_size=MAX_GROUP_SIZE,
+        linger_seconds=0.25,
+        sign_timeout_seconds=10,
+        max_in_flight=32
+    ):
+        if not 1 <= group_size <= MAX_GROUP_SIZE:
+            raise ValueError(f"group_size must be between 1 and {MAX_GROUP_SIZE}")
+        self.algod_client = algod_client
+        self.app_id = app_id
+        self.group_size = group_size
+        self.linger_seconds = linger_seconds
+        self.sign_timeout_seconds = sign_timeout_seconds
+
+        self._lock = threading.Lock()
+        self._incoming = queue.Queue()
+        self._ready = queue.Queue()
+        self._in_flight_slots = threading.BoundedSemaphore(max_in_flight)
+        self._unsigned = {}  # tx_id -> _Group waiting for signatures
+        self._in_flight = []  # sent groups waiting for confirmation
+        self._check_ins = {}  # student address -> latest CheckIn
+        self._running = False
+        self._threads = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start the grouping, sending and confirmation threads"""
+        self._running = True
+        for target in (self._group_loop, self._send_loop, self._confirm_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        """
+        Wait for pending check-ins (up to timeout) and stop the threads
+
+        Threads still busy after the timeout (STOP_JOIN_SECONDS each without one,
+        e.g. blocked in status_after_block) are left to exit on their own.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.drain(timeout)
+        self._running = False
+        for thread in self._threads:
+            thread.join(STOP_JOIN_SECONDS if deadline is None else max(0, deadline - time.monotonic()))
+        self._threads = []
+
+    def drain(self, timeout=None):
+        """Wait until every check-in is finished, returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for check_in in list(self._check_ins.values()):
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            if not check_in.wait(remaining):
+                return False
+        return True
+
+    def reserve(self, txn):
+        """
+        Queue a student's unsigned mark_attendance call for grouping
+
+        Args:
+            txn: Unsigned call built with box_storage.mark_attendance_txn (or the
+                 _box / _bitmap variants), without a group ID
+
+        Returns:
+            CheckIn to receive the grouped transaction from and track
+
+        Raises:
+            ValueError: If the call is not a mark_attendance call to this app or the
+                        student already has a check-in in progress
+        """
+        if (
+            txn.type != "appl"
+            or txn.index != self.app_id
+            or txn.on_complete != OnComplete.NoOpOC
+            or not txn.app_args
+            or txn.app_args[0] not in MARK_ATTENDANCE_METHODS
+        ):
+            raise ValueError("Only mark_attendance calls to this app can be relayed")
+        if txn.group:
+            raise ValueError("Transaction is already grouped")
+
+        check_in = CheckIn(txn)
+        with self._lock:
+            previous = self._check_ins.get(txn.sender)
+            if previous is not None and not previous.done:
+                raise ValueError(f"{txn.sender} already has a check-in in progress")
+            self._check_ins[txn.sender] = check_in
+        self._incoming.put(check_in)
+        return check_in
+
+    def submit_signed(self, check_in, signed_txn):
+        """
+        Hand back the student's signature of the grouped transaction
+
+        Raises:
+            ValueError: If the signed transaction is not the one handed out
+        """
+        tx_id = signed_txn.get_txid()
+        with self._lock:
+            group = self._unsigned.get(tx_id)
+            if group is None or tx_id != check_in.tx_id:
+                raise ValueError("Signed transaction does not match the grouped transaction handed out")
+            group.signed[tx_id] = signed_txn
+            if not group.fully_signed:
+                return
+            for member in group.check_ins:
+                del self._unsigned[member.tx_id]
+        self._ready.put(group)
+
+    def results(self):
+        """
+        Per-student outcome of every check-in seen by the relay
+
+        Returns:
+            Dict of student address -> {status, tx_id, confirmed_round, reason}
+        """
+        with self._lock:
+            return {student: check_in.as_dict() for student, check_in in self._check_ins.items()}
+
+    # Grouping
+
+    def _group_loop(self):
+        while self._running:
+            batch = self._collect()
+            try:
+                if batch:
+                    self._seal(batch)
+            except Exception as e:
+                _reject(batch, f"relay error: {e}")
+            try:
+                self._expire_unsigned()
+            except Exception:
+                # Leave the groups for the next pass
+                time.sleep(RETRY_SECONDS)
+
+    def _collect(self):
+        """Take up to group_size check-ins, waiting at most linger_seconds after the first"""
+        try:
+            batch = [self._incoming.get(timeout=0.05)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.linger_seconds
+        while len(batch) < self.group_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._incoming.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _seal(self, batch):
+        """Drop calls that would fail, assign the group ID and hand the group out"""
+        while batch:
+            for check_in in batch:
+                check_in.txn.group = None
+            txns = assign_group_id([check_in.txn for check_in in batch])
+            failed_at, message = self._simulate(txns)
+            if failed_at is None:
+                break
+            batch[failed_at]._finish(REJECTED, message)
+            del batch[failed_at]
+        if not batch:
+            return
+
+        group = _Group(batch, time.monotonic() + self.sign_timeout_seconds)
+        with self._lock:
+            for check_in in batch:
+                check_in._hand_out(check_in.txn)
+                self._unsigned[check_in.tx_id] = group
+
+    def _simulate(self, txns):
+        """
+        Simulate an unsigned group
+
+        Returns:
+            (index of the first failing call or None, failure message)
+        """
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=[SignedTransaction(txn, None) for txn in txns])],
+            allow_empty_signatures=True,
+        )
+        try:
+            result = self.algod_client.simulate_transactions(request)["txn-groups"][0]
+        except Exception:
+            # Simulate is only a pre-check; algod still rejects bad groups on send
+            return None, None
+        if "failure-message" not in result:
+            return None, None
+        return result.get("failed-at", [0])[0], result["failure-message"]
+
+    def _expire_unsigned(self):
+        """Drop members that did not sign in time and regroup the rest"""
+        now = time.monotonic()
+        with self._lock:
+            stale = {id(group): group for group in self._unsigned.values() if group.sign_deadline < now}
+            for group in stale.values():
+                for member in group.check_ins:
+                    del self._unsigned[member.tx_id]
+        for group in stale.values():
+            for member in group.check_ins:
+                if member.done:
+                    continue
+                if member.tx_id in group.signed:
+                    member.status = QUEUED
+                    self._incoming.put(member)
+                else:
+                    member._finish(EXPIRED, "not signed in time")
+
+    # Sending and confirmation
+
+    def _send_loop(self):
+        while self._running:
+            try:
+                group = self._ready.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            self._in_flight_slots.acquire()
+            try:
+                self.algod_client.send_transactions(group.signed_txns())
+            except Exception as e:
+                self._in_flight_slots.release()
+                try:
+                    self._handle_send_error(group, str(e))
+                except Exception as error:
+                    _reject(group.check_ins, f"relay error: {error}")
+                continue
+            for member in group.check_ins:
+                member.status = SUBMITTED
+            with self._lock:
+                self._in_flight.append(group)
+
+    def _handle_send_error(self, group, message):
+        """Reject the member algod blamed and regroup the others, reject all if none was named"""
+        blamed = [member for member in group.check_ins if member.tx_id in message]
+        if not blamed:
+            for member in group.check_ins:
+                member._finish(REJECTED, message)
+            return
+        for member in group.check_ins:
+            if member in blamed:
+                member._finish(REJECTED, message)
+            else:
+                member.status = QUEUED
+                self._incoming.put(member)
+
+    def _confirm_loop(self):
+        last_round = None
+        while self._running:
+            try:
+                if last_round is None:
+                    last_round = self.algod_client.status()["last-round"]
+                with self._lock:
+                    in_flight = list(self._in_flight)
+                if not in_flight:
+                    time.sleep(0.05)
+                    continue
+                for group in in_flight:
+                    try:
+                        final = self._check_group(group, last_round)
+                    except Exception as e:
+                        _reject(group.check_ins, f"relay error: {e}")
+                        final = True
+                    if final:
+                        with self._lock:
+                            self._in_flight.remove(group)
+                        self._in_flight_slots.release()
+                # Wait for the next block instead of polling every pending transaction
+                last_round = self.algod_client.status_after_block(last_round)["last-round"]
+            except Exception:
+                # algod unreachable: keep the groups in flight and retry
+                time.sleep(RETRY_SECONDS)
+
+    def _check_group(self, group, last_round):
+        """Update the members of a sent group, returns True once it is final"""
+        # Grouped transactions confirm together, one lookup covers the group
+        try:
+            info = self.algod_client.pending_transaction_info(group.check_ins[0].tx_id)
+        except Exception:
+            # Retried on the next block, until the group can no longer confirm
+            info = {}
+        if info.get("confirmed-round"):
+            for member in group.check_ins:
+                member._finish(CONFIRMED, confirmed_round=info["confirmed-round"])
+            return True
+        if info.get("pool-error"):
+            for member in group.check_ins:
+                member._finish(REJECTED, info["pool-error"])
+            return True
+        if last_round > group.last_valid:
+            for member in group.check_ins:
+                member._finish(EXPIRED, "not confirmed before last valid round")
+            return True
+        return False
+
+
+def _reject(check_ins, reason):
+    """Finish the check-ins that are still pending as rejected"""
+    for check_in in check_ins:
+        if not check_in.done:
+            check_in._finish(REJECTED, reason)
+
+
+def relay_check_in(relay, txn, private_key, timeout=60):
+    """
+    Student side of the exchange: reserve, sign each grouped transaction, wait
+
+    Args:
+        relay: AttendanceRelay (or a client forwarding to one)
+        txn: Unsigned mark_attendance call
+        private_key: Student's private key, never leaves this function
+        timeout: Seconds to wait for each step
+
+    Returns:
+        The finished CheckIn
+    """
+    check_in = relay.reserve(txn)
+    while True:
+        grouped = check_in.next_group_txn(timeout)
+        if grouped is None:
+            return check_in
+        relay.submit_signed(check_in, grouped.sign(private_key))
@@ -0,0 +1,309 @@
+"""
+CampusChain AI - Optimized Build Profile Benchmark
+
+Deploys the default and the optimized build of contract.py and
+contract_v2_secure.py side by side on LocalNet and runs the same scenario
+(valid calls plus the rejections the contracts exist for) against both.
+
+The benchmark fails unless:
+- every call is accepted/rejected the same way by both builds
+- the final global, local and box state is the same
+- the optimized build is cheaper for mark_attendance and create_session
+
+Usage:
+    python benchmark_optimized.py [--contract contract]
+"""
+
+import argparse
+import base64
+import sys
+from pathlib import Path
+
+from algosdk.logic import get_application_address
+from algosdk.transaction import (
+    ApplicationCreateTxn,
+    ApplicationNoOpTxn,
+    ApplicationOptInTxn,
+    ApplicationUpdateTxn,
+    OnComplete,
+    PaymentTxn,
+)
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+sys.path.insert(0, str(Path(__file__).parent))
+from compile_cache import get_compiled_programs, get_programs
+from deploy_config import AttendanceDeployConfig
+from box_storage import (
+    SESSION_BOX_PREFIX,
+    ATTENDANCE_BOX_PREFIX,
+    create_roster_txn,
+    create_session_txn,
+    decode_session_record,
+    enroll_txn,
+    mark_attendance_bitmap_txn,
+    mark_attendance_box_txn,
+    mark_attendance_txn,
+    open_session_txn,
+    session_box_name,
+)
+from profile_opcodes import CONTRACTS, new_funded_account, qr_hash, send
+
+# Handlers the optimized profile must make cheaper
+OPTIMIZED_HANDLERS = ("mark_attendance", "create_session")
+
+GLOBAL_SESSION = b"CS101-LECTURE"
+REGISTERED_SESSION = b"CS102-LAB"
+ROSTER_CAPACITY = 64
+
+
+def compile_build(algod_client, module, optimized):
+    """Compile one build profile of a contract module to program bytes"""
+    programs = get_compiled_programs(algod_client, module, optimized)
+    return programs["approval"]["bytecode"], programs["clear"]["bytecode"]
+
+
+def try_call(algod_client, txn, private_key):
+    """
+    Simulate a call and send it if it would be accepted
+
+    Returns:
+        (accepted, opcode cost) - cost is None for rejected calls
+    """
+    request = SimulateRequest(txn_groups=[SimulateRequestTransactionGroup(txns=[txn.sign(private_key)])])
+    group = algod_client.simulate_transactions(request)["txn-groups"][0]
+    if "failure-message" in group:
+        return False, None
+    send(algod_client, txn, private_key)
+    return True, group["txn-results"][0].get("app-budget-consumed", 0)
+
+
+def run_scenario(algod_client, module, optimized, accounts):
+    """
+    Deploy one build and run the benchmark scenario against it
+
+    Args:
+        algod_client: LocalNet Algod client
+        module: contract module (contract or contract_v2_secure)
+        optimized: Use the optimized build profile
+        accounts: dict of role -> (private_key, address), shared by both builds
+
+    Returns:
+        (list of (step, accepted, cost), app_id, creation round)
+    """
+    approval, clear = compile_build(algod_client, module, optimized)
+    has_boxes = "box_create" in get_programs(module)["approval"]
+    teacher_key, teacher = accounts["teacher"]
+    assistant_key, assistant = accounts["assistant"]
+    student_key, student = accounts["student"]
+    outsider_key, outsider = accounts["outsider"]
+    sp = algod_client.suggested_params()
+    steps = []
+
+    def step(name, txn, private_key):
+        accepted, cost = try_call(algod_client, txn, private_key)
+        steps.append((name, accepted, cost))
+
+    def mark(name, role, session_id, qr_age=0, proof_for=None, builder=None, extra=()):
+        private_key, sender = accounts[role]
+        qr_round = max(algod_client.status()["last-round"] - qr_age, 0)
+        proof = qr_hash(session_id, qr_round, proof_for or sender)
+        if builder is not None:
+            txn = builder(sender, sp, app_id, session_id, qr_round, proof, *extra)
+        elif has_boxes:
+            txn = mark_attendance_txn(sender, sp, app_id, session_id, qr_round, proof)
+        else:
+            txn = ApplicationNoOpTxn(
+                sender, sp, app_id, app_args=[b"mark_attendance", session_id, qr_round.to_bytes(8, "big"), proof]
+            )
+        step(name, txn, private_key)
+
+    create = ApplicationCreateTxn(
+        sender=teacher,
+        sp=sp,
+        on_complete=OnComplete.NoOpOC,
+        approval_program=approval,
+        clear_program=clear,
+        global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
+        local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
+        app_args=[GLOBAL_SESSION, b"Intro Lecture", (3600).to_bytes(8, "big")],
+        extra_pages=AttendanceDeployConfig.extra_program_pages(approval, clear),
+    )
+    confirmed = send(algod_client, create, teacher_key)
+    app_id = confirmed["application-index"]
+    created_round = confirmed["confirmed-round"]
+    send(algod_client, PaymentTxn(teacher, sp, get_application_address(app_id), 1_000_000), teacher_key)
+
+    for role in ("teacher", "assistant", "student", "outsider"):
+        step("opt_in", ApplicationOptInTxn(accounts[role][1], sp, app_id), accounts[role][0])
+
+    def teacher_call(*app_args, accounts_=None):
+        return ApplicationNoOpTxn(teacher, sp, app_id, app_args=list(app_args), accounts=accounts_)
+
+    step("add_teacher", teacher_call(b"add_teacher", accounts_=[assistant]), teacher_key)
+    session_args = [b"create_session", GLOBAL_SESSION, b"Lecture 2", (3600).to_bytes(8, "big")]
+    session_boxes = [(0, session_box_name(GLOBAL_SESSION))] if has_boxes else None
+
+    def session_call(sender, app_args):
+        return ApplicationNoOpTxn(sender, sp, app_id, app_args=app_args, boxes=session_boxes)
+
+    step("create_session[outsider]", session_call(outsider, session_args), outsider_key)
+    step("create_session", session_call(assistant, session_args + [(600).to_bytes(8, "big")]), assistant_key)
+    step("create_session[no window]", session_call(assistant, session_args), assistant_key)
+
+    mark("mark_attendance", "student", GLOBAL_SESSION)
+    mark("mark_attendance[duplicate]", "student", GLOBAL_SESSION)
+    mark("mark_attendance[shared QR]", "outsider", GLOBAL_SESSION, proof_for=student)
+    mark("mark_attendance[expired QR]", "outsider", GLOBAL_SESSION, qr_age=30)
+
+    if has_boxes:
+        step("open_session", open_session_txn(assistant, sp, app_id, REGISTERED_SESSION, "Lab", 3600), assistant_key)
+        step(
+            "create_session[registered]",
+            create_session_txn(assistant, sp, app_id, REGISTERED_SESSION, "Lab", 3600),
+            assistant_key,
+        )
+        step(
+            "create_roster",
+            create_roster_txn(assistant, sp, app_id, REGISTERED_SESSION, ROSTER_CAPACITY, track_rounds=True),
+            assistant_key,
+        )
+        step("enroll[student]", enroll_txn(student, sp, app_id, REGISTERED_SESSION, student), student_key)
+        step("enroll", enroll_txn(assistant, sp, app_id, REGISTERED_SESSION, student), assistant_key)
+        mark("mark_attendance_box", "outsider", REGISTERED_SESSION, builder=mark_attendance_box_txn)
+        # A student counts once per session, whatever the mode
+        mark("mark_attendance[box recorded]", "outsider", REGISTERED_SESSION)
+        mark("mark_attendance_box[enrolled]", "student", REGISTERED_SESSION, builder=mark_attendance_box_txn)
+        for name in ("mark_attendance_bitmap", "mark_attendance_bitmap[duplicate]"):
+            mark(name, "student", REGISTERED_SESSION, builder=mark_attendance_bitmap_txn, extra=(ROSTER_CAPACITY, True))
+
+    update = ApplicationUpdateTxn(teacher, sp, app_id, approval, clear)
+    step("update_application", update, teacher_key)
+    step("remove_teacher", teacher_call(b"remove_teacher", accounts_=[assistant]), teacher_key)
+    step("close_session[removed teacher]", ApplicationNoOpTxn(assistant, sp, app_id, app_args=[b"close_session"]), assistant_key)
+    step("close_session", teacher_call(b"close_session"), teacher_key)
+    mark("mark_attendance[closed]", "outsider", GLOBAL_SESSION)
+
+    return steps, app_id, created_round
+
+
+def _decode_state(key_values, created_round):
+    """Decode a state key-value list, with round values relative to app creation"""
+    state = {}
+    for item in key_values:
+        key = base64.b64decode(item["key"])
+        value = item["value"]
+        if value["type"] == 1:
+            state[key] = base64.b64decode(value["bytes"])
+        elif b"round" in key and value["uint"]:
+            # 0 means "not checked in yet", keep it as is
+            state[key] = value["uint"] - created_round
+        else:
+            state[key] = value["uint"]
+    return state
+
+
+def read_state(algod_client, app_id, created_round, addresses):
+    """
+    Snapshot global, local and box state of an app
+
+    Rounds are stored relative to the creation round so two deployments made
+    one after the other compare equal.
+    """
+    info = algod_client.application_info(app_id)["params"]
+    snapshot = {"global": _decode_state(info.get("global-state", []), created_round), "local": {}, "boxes": {}}
+
+    for address in addresses:
+        local = algod_client.account_application_info(address, app_id).get("app-local-state", {})
+        snapshot["local"][address] = _decode_state(local.get("key-value", []), created_round)
+
+    for box in algod_client.application_boxes(app_id)["boxes"]:
+        name = base64.b64decode(box["name"])
+        value = base64.b64decode(algod_client.application_box_by_name(app_id, name)["value"])
+        if name.startswith(SESSION_BOX_PREFIX):
+            record = decode_session_record(value)
+            for field in ("start_round", "end_round", "attendance_end_round"):
+                record[field] -= created_round
+            value = record
+        elif name.startswith(ATTENDANCE_BOX_PREFIX):
+            value = int.from_bytes(value, "big") - created_round
+        snapshot["boxes"][name] = value
+    return snapshot
+
+
+def benchmark_contract(algod_client, name):
+    """
+    Run the scenario on both builds of one contract
+
+    Returns:
+        dict with per-step results of both builds, whether behaviour and final
+        state match, and the handlers that did not get cheaper
+    """
+    module = CONTRACTS[name]
+    accounts = {role: new_funded_account(algod_client) for role in ("teacher", "assistant", "student", "outsider")}
+    addresses = [address for _key, address in accounts.values()]
+
+    results = {}
+    for profile, optimized in (("default", False), ("optimized", True)):
+        steps, app_id, created_round = run_scenario(algod_client, module, optimized, accounts)
+        results[profile] = {
+            "steps": steps,
+            "state": read_state(algod_client, app_id, created_round, addresses),
+        }
+
+    default_steps, optimized_steps = results["default"]["steps"], results["optimized"]["steps"]
+    same_outcomes = [
+        (step, accepted) for step, accepted, _cost in default_steps
+    ] == [
+        (step, accepted) for step, accepted, _cost in optimized_steps
+    ]
+    default_costs = {step: cost for step, accepted, cost in default_steps if accepted}
+    optimized_costs = {step: cost for step, accepted, cost in optimized_steps if accepted}
+    not_cheaper = [
+        handler for handler in OPTIMIZED_HANDLERS
+        if handler not in optimized_costs or optimized_costs[handler] >= default_costs.get(handler, 0)
+    ]
+
+    return {
+        "default": default_steps,
+        "optimized": optimized_steps,
+        "same_outcomes": same_outcomes,
+        "same_state": results["default"]["state"] == results["optimized"]["state"],
+        "not_cheaper": not_cheaper,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the optimized build profile against the default one")
+    parser.add_argument("--contract", choices=sorted(CONTRACTS), action="append", help="Contract(s) to benchmark")
+    args = parser.parse_args()
+
+    algod_client = AttendanceDeployConfig.get_algod_client("localnet")
+    failed = False
+
+    for name in args.contract or CONTRACTS:
+        result = benchmark_contract(algod_client, name)
+        print(f"\n📄 {name}.py")
+        print(f"   {'call':<36} {'default':>8} {'optimized':>10} {'delta':>6}")
+        for (step, accepted, cost), (_step, _accepted, optimized_cost) in zip(result["default"], result["optimized"]):
+            if not accepted:
+                print(f"   {step:<36} {'rejected':>8} {'rejected' if not _accepted else optimized_cost:>10}")
+                continue
+            delta = optimized_cost - cost if optimized_cost is not None else "-"
+            print(f"   {step:<36} {cost:>8} {optimized_cost if optimized_cost is not None else 'rejected':>10} {delta:>6}")
+
+        if not result["same_outcomes"]:
+            print("   ❌ Builds accepted/rejected different calls")
+        if not result["same_state"]:
+            print("   ❌ Builds ended with different state")
+        if result["not_cheaper"]:
+            print(f"   ❌ Not cheaper with the optimized profile: {', '.join(result['not_cheaper'])}")
+        if result["same_outcomes"] and result["same_state"] and not result["not_cheaper"]:
+            print("   ✅ Same behaviour, lower cost")
+        else:
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
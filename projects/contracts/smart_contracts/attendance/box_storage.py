@@ -0,0 +1,565 @@
+"""
+CampusChain AI - Box Storage Helpers
+
+Helpers for the box-backed attendance mode of the attendance contract.
+
+Box layout:
+- "a" + session_id + student_address (8 bytes): round when attendance was marked
+- "n" + session_id (24 bytes): roster record (capacity, enrolled count, track_rounds)
+- "e" + session_id + student_address (8 bytes): student's slot in that roster
+- "b" + session_id (capacity / 8 bytes): attendance bitmap, 1 bit per slot
+- "r" + session_id (2 bytes per slot, optional): check-in round minus start_round
+- "s" + session_id: registered session record (rounds, active flag, counter, teacher, name)
+- "m" + session_id (40 bytes): Merkle root + count of attendance collected off-chain
+
+Every record is named after its session and student, so a session's box
+records share the "a" + session_id prefix: algod lists them, values included,
+in one box listing request filtered by that prefix, whatever else the app
+stores. Listing a whole session without the class list is also the job of
+the attendance indexer (attendance_indexer.py). In bitmap roster mode the
+whole session is one box read (about 100 bytes per 800 students).
+
+Sessions registered with open_session live side by side in their own "s" boxes,
+so one app serves any number of concurrent classes. Every attendance call for a
+registered session references its "s" box; the builders below add it.
+"""
+
+import base64
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import ApplicationNoOpTxn
+
+
+# Box key prefixes (must match contract.py)
+ATTENDANCE_BOX_PREFIX = b"a"
+ENROLLMENT_BOX_PREFIX = b"e"
+ROSTER_BOX_PREFIX = b"n"
+BITMAP_BOX_PREFIX = b"b"
+ROUNDS_BOX_PREFIX = b"r"
+SESSION_BOX_PREFIX = b"s"
+COMMITMENT_BOX_PREFIX = b"m"
+
+# Box limits
+MAX_BOX_NAME_LENGTH = 64
+MAX_SESSION_ID_LENGTH = MAX_BOX_NAME_LENGTH - len(ATTENDANCE_BOX_PREFIX) - 32
+ATTENDANCE_BOX_SIZE = 8
+ENROLLMENT_BOX_SIZE = 8
+ROSTER_RECORD_SIZE = 24  # capacity | enrolled_count | track_rounds (uint64 each)
+ROUND_DELTA_SIZE = 2
+SESSION_HEADER_SIZE = 72  # 5 x uint64 + teacher address, session_name follows
+COMMITMENT_BOX_SIZE = 40  # merkle_root (32 bytes) + count (uint64)
+
+# Each box reference in a group grants 1024 bytes of box read/write budget
+BOX_IO_BUDGET_PER_REF = 1024
+
+# Accounts, apps, assets and boxes one transaction can reference
+MAX_TXN_REFERENCES = 8
+
+# Box minimum balance: 2500 + 400 * (name length + value length) microAlgos
+BOX_FLAT_MIN_BALANCE = 2500
+BOX_BYTE_MIN_BALANCE = 400
+
+
+def _session_id_bytes(session_id):
+    """Return session_id as bytes and check it fits in a box name"""
+    session_id = session_id.encode() if isinstance(session_id, str) else bytes(session_id)
+    if len(session_id) > MAX_SESSION_ID_LENGTH:
+        raise ValueError(
+            f"Session ID is {len(session_id)} bytes, box mode supports at most {MAX_SESSION_ID_LENGTH}"
+        )
+    return session_id
+
+
+def attendance_box_name(session_id, student_address):
+    """
+    Build the box name holding a student's attendance record
+
+    Args:
+        session_id: Session identifier (str or bytes)
+        student_address: Student's Algorand address
+
+    Returns:
+        Box name as bytes
+    """
+    return ATTENDANCE_BOX_PREFIX + _session_id_bytes(session_id) + encoding.decode_address(student_address)
+
+
+def box_min_balance(name_length, size):
+    """Minimum balance (microAlgos) the app account needs for one box"""
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (name_length + size)
+
+
+def attendance_box_min_balance(session_id):
+    """Minimum balance (microAlgos) the app account needs per attendance record"""
+    name_length = len(ATTENDANCE_BOX_PREFIX) + len(_session_id_bytes(session_id)) + 32
+    return box_min_balance(name_length, ATTENDANCE_BOX_SIZE)
+
+
+def mark_attendance_box_txn(sender, sp, app_id, session_id, qr_round, qr_hash):
+    """
+    Build a mark_attendance_box application call
+
+    Args:
+        sender: Student address (must match the wallet bound into qr_hash)
+        sp: Suggested params
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        qr_round: Round the QR code was generated at (int)
+        qr_hash: SHA256(session_id + qr_round + student_address) as bytes
+
+    Returns:
+        Unsigned ApplicationNoOpTxn with the box references attached
+    """
+    session_id = _session_id_bytes(session_id)
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"mark_attendance_box", session_id, qr_round.to_bytes(8, "big"), qr_hash],
+        boxes=check_in_box_refs(session_id, sender)
+    )
+
+
+def check_in_box_refs(session_id, student_address):
+    """
+    Box references every attendance mode needs for a student's check-in
+
+    The registry box, plus the student's box record and enrollment box the
+    contract checks so a student is counted once per session whatever the mode.
+    Empty for session_ids too long for box names (local state mode only).
+    """
+    session_id = session_id.encode() if isinstance(session_id, str) else bytes(session_id)
+    if len(session_id) > MAX_SESSION_ID_LENGTH:
+        return []
+    return [
+        (0, session_box_name(session_id)),
+        (0, attendance_box_name(session_id, student_address)),
+        (0, enrollment_box_name(session_id, student_address))
+    ]
+
+
+def _box_value(algod_client, app_id, name):
+    """Value of one box, None if the box does not exist"""
+    try:
+        response = algod_client.application_box_by_name(app_id, name)
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return base64.b64decode(response["value"])
+
+
+def list_boxes(algod_client, app_id, prefix):
+    """
+    Names and values of the app's boxes whose name starts with prefix
+
+    One box listing request (more only when algod pages the result), served
+    from algod's box index by prefix, independent of how many other boxes the
+    app holds.
+
+    Returns:
+        Dict of box name -> value (bytes)
+    """
+    params = {"prefix": "b64:" + base64.b64encode(prefix).decode(), "values": "true"}
+    boxes = {}
+    while True:
+        response = algod_client.algod_request("GET", f"/applications/{app_id}/boxes", params=params)
+        for box in response["boxes"]:
+            boxes[base64.b64decode(box["name"])] = base64.b64decode(box["value"])
+        if not response.get("next-token"):
+            return boxes
+        params["next"] = response["next-token"]
+
+
+def get_session_attendance(algod_client, app_id, session_id, student_addresses):
+    """
+    Read the box attendance records of one session for a list of students
+
+    Lists the session's box records in one request (list_boxes), however
+    many students the class list holds. Use AttendanceIndexer.list_roster to
+    list a session without a class list.
+
+    Args:
+        algod_client: Algod client instance
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        student_addresses: Students to look up (e.g. the class list)
+
+    Returns:
+        Dict of student address -> check-in round, for the students with a record
+    """
+    prefix = ATTENDANCE_BOX_PREFIX + _session_id_bytes(session_id)
+    boxes = list_boxes(algod_client, app_id, prefix)
+    records = {}
+    for student_address in student_addresses:
+        value = boxes.get(attendance_box_name(session_id, student_address))
+        if value is not None:
+            records[student_address] = int.from_bytes(value, "big")
+
+    return records
+
+
+def enrollment_box_name(session_id, student_address):
+    """Build the box name holding a student's slot in a session's roster"""
+    return ENROLLMENT_BOX_PREFIX + _session_id_bytes(session_id) + encoding.decode_address(student_address)
+
+
+def roster_box_name(session_id):
+    """Build the box name holding a session's roster record"""
+    return ROSTER_BOX_PREFIX + _session_id_bytes(session_id)
+
+
+def bitmap_box_name(session_id):
+    """Build the box name holding a session's attendance bitmap"""
+    return BITMAP_BOX_PREFIX + _session_id_bytes(session_id)
+
+
+def rounds_box_name(session_id):
+    """Build the box name holding a session's check-in round deltas"""
+    return ROUNDS_BOX_PREFIX + _session_id_bytes(session_id)
+
+
+def bitmap_size(capacity):
+    """Size in bytes of a bitmap with one bit per enrollment slot"""
+    return (capacity + 7) // 8
+
+
+def _box_refs(names, total_bytes):
+    """
+    Box references for names, padded with empty refs to cover total_bytes of I/O
+
+    Raises:
+        ValueError: The boxes need more references than one transaction can hold
+    """
+    refs = [(0, name) for name in names]
+    needed = -(-total_bytes // BOX_IO_BUDGET_PER_REF)
+    refs += [(0, b"")] * max(0, needed - len(refs))
+    if len(refs) > MAX_TXN_REFERENCES:
+        raise ValueError(
+            f"{total_bytes} bytes of box I/O need {len(refs)} references, a transaction holds at most {MAX_TXN_REFERENCES}"
+        )
+    return refs
+
+
+def enroll_txn(sender, sp, app_id, session_id, student_address):
+    """
+    Build an enroll application call (assigns the student the roster's next slot)
+
+    Args:
+        sender: Teacher address (pays the enrollment box by funding the app account)
+        sp: Suggested params
+        app_id: Attendance application ID
+        session_id: Session identifier of the roster (str or bytes)
+        student_address: Student to enroll
+
+    Returns:
+        Unsigned ApplicationNoOpTxn
+    """
+    session_id = _session_id_bytes(session_id)
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"enroll", session_id, encoding.decode_address(student_address)],
+        boxes=[(0, roster_box_name(session_id)), (0, enrollment_box_name(session_id, student_address))]
+    )
+
+
+def create_roster_txn(sender, sp, app_id, session_id, capacity, track_rounds=False):
+    """
+    Build a create_roster application call
+
+    Args:
+        sender: Teacher address
+        sp: Suggested params
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        capacity: Number of enrollment slots the bitmap covers
+        track_rounds: Also create the per-slot check-in round box
+
+    Returns:
+        Unsigned ApplicationNoOpTxn with enough box references for the boxes created
+    """
+    names = [roster_box_name(session_id), bitmap_box_name(session_id)]
+    total_bytes = ROSTER_RECORD_SIZE + bitmap_size(capacity)
+    if track_rounds:
+        names.append(rounds_box_name(session_id))
+        total_bytes += capacity * ROUND_DELTA_SIZE
+
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[
+            b"create_roster",
+            _session_id_bytes(session_id),
+            capacity.to_bytes(8, "big"),
+            int(track_rounds).to_bytes(8, "big")
+        ],
+        boxes=_box_refs(names, total_bytes)
+    )
+
+
+def mark_attendance_bitmap_txn(sender, sp, app_id, session_id, qr_round, qr_hash, capacity, track_rounds=False):
+    """
+    Build a mark_attendance_bitmap application call
+
+    Args:
+        sender: Enrolled student address
+        sp: Suggested params
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        qr_round: Round the QR code was generated at (int)
+        qr_hash: SHA256(session_id + qr_round + student_address) as bytes
+        capacity: Roster capacity passed to create_roster (sizes the box I/O budget)
+        track_rounds: The roster was created with track_rounds (adds the rounds box)
+
+    Returns:
+        Unsigned ApplicationNoOpTxn
+
+    Raises:
+        ValueError: The roster is too large for one transaction's box references
+    """
+    session_id = _session_id_bytes(session_id)
+    names = [name for _app, name in check_in_box_refs(session_id, sender)]
+    names += [roster_box_name(session_id), bitmap_box_name(session_id)]
+    total_bytes = SESSION_HEADER_SIZE + ENROLLMENT_BOX_SIZE + ROSTER_RECORD_SIZE + bitmap_size(capacity)
+    if track_rounds:
+        names.append(rounds_box_name(session_id))
+        total_bytes += capacity * ROUND_DELTA_SIZE
+
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"mark_attendance_bitmap", session_id, qr_round.to_bytes(8, "big"), qr_hash],
+        boxes=_box_refs(names, total_bytes)
+    )
+
+
+def get_roster(algod_client, app_id, session_id):
+    """
+    Read a session's roster record
+
+    Returns:
+        Dict with capacity, enrolled_count and track_rounds
+    """
+    response = algod_client.application_box_by_name(app_id, roster_box_name(session_id))
+    record = base64.b64decode(response["value"])
+    capacity, enrolled_count, track_rounds = (
+        int.from_bytes(record[offset:offset + 8], "big") for offset in range(0, ROSTER_RECORD_SIZE, 8)
+    )
+    return {"capacity": capacity, "enrolled_count": enrolled_count, "track_rounds": bool(track_rounds)}
+
+
+def get_enrollment_index(algod_client, app_id, session_id, student_addresses):
+    """
+    Read the enrollment index (slot -> student address) of a session's roster
+
+    Costs one box read per student. Slots never change once assigned, so
+    callers should cache the result.
+
+    Args:
+        algod_client: Algod client instance
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        student_addresses: Students to look up (e.g. the class list)
+
+    Returns:
+        Dict of slot number -> student address, for the students that are enrolled
+    """
+    index = {}
+    for student_address in student_addresses:
+        value = _box_value(algod_client, app_id, enrollment_box_name(session_id, student_address))
+        if value is not None:
+            index[int.from_bytes(value, "big")] = student_address
+
+    return index
+
+
+def decode_bitmap(bitmap):
+    """Return the slot numbers whose bit is set (bit 0 is the high bit of byte 0, as getbit)"""
+    return [
+        byte_index * 8 + bit
+        for byte_index, byte in enumerate(bitmap)
+        if byte
+        for bit in range(8)
+        if byte & (0x80 >> bit)
+    ]
+
+
+def decode_round_deltas(rounds, slots, start_round):
+    """Map slots to absolute check-in rounds from the 2-byte deltas box"""
+    return {
+        slot: start_round + int.from_bytes(rounds[slot * ROUND_DELTA_SIZE:(slot + 1) * ROUND_DELTA_SIZE], "big")
+        for slot in slots
+    }
+
+
+def get_bitmap_attendance(algod_client, app_id, session_id, enrollment_index=None):
+    """
+    Read a session's bitmap roster with a single box read
+
+    Args:
+        algod_client: Algod client instance
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes)
+        enrollment_index: Cached result of get_enrollment_index to translate slots to addresses
+
+    Returns:
+        Sorted list of present slot numbers, or of addresses when enrollment_index is given
+    """
+    response = algod_client.application_box_by_name(app_id, bitmap_box_name(session_id))
+    slots = decode_bitmap(base64.b64decode(response["value"]))
+
+    if enrollment_index is None:
+        return slots
+    return [enrollment_index[slot] for slot in slots]
+
+
+def session_box_name(session_id):
+    """Build the box name holding a registered session's record"""
+    return SESSION_BOX_PREFIX + _session_id_bytes(session_id)
+
+
+def commitment_box_name(session_id):
+    """Build the box name holding a session's Merkle attendance commitment"""
+    return COMMITMENT_BOX_PREFIX + _session_id_bytes(session_id)
+
+
+def session_box_min_balance(session_id, session_name):
+    """Minimum balance (microAlgos) the app account needs per registered session"""
+    session_name = session_name.encode() if isinstance(session_name, str) else session_name
+    return box_min_balance(len(session_box_name(session_id)), SESSION_HEADER_SIZE + len(session_name))
+
+
+def open_session_txn(sender, sp, app_id, session_id, session_name, duration_seconds, attendance_window_seconds=None):
+    """
+    Build an open_session application call registering a concurrent session
+
+    Args:
+        sender: Teacher address
+        sp: Suggested params
+        app_id: Attendance application ID
+        session_id: Session identifier (str or bytes, at most 31 bytes)
+        session_name: Human-readable session name
+        duration_seconds: Session duration
+        attendance_window_seconds: Attendance window (defaults to the whole session)
+
+    Returns:
+        Unsigned ApplicationNoOpTxn
+    """
+    session_name = session_name.encode() if isinstance(session_name, str) else session_name
+    app_args = [b"open_session", _session_id_bytes(session_id), session_name, duration_seconds.to_bytes(8, "big")]
+    if attendance_window_seconds is not None:
+        app_args.append(attendance_window_seconds.to_bytes(8, "big"))
+
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=app_args,
+        boxes=[(0, session_box_name(session_id))]
+    )
+
+
+def create_session_txn(sender, sp, app_id, session_id, session_name, duration_seconds, attendance_window_seconds=None):
+    """
+    Build a create_session application call replacing the session held in global state
+
+    The registry box is referenced so the contract can check session_id is not
+    a registered session (session_ids longer than 31 bytes never are).
+
+    Returns:
+        Unsigned ApplicationNoOpTxn
+    """
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    session_name = session_name.encode() if isinstance(session_name, str) else session_name
+    app_args = [b"create_session", session_id, session_name, duration_seconds.to_bytes(8, "big")]
+    if attendance_window_seconds is not None:
+        app_args.append(attendance_window_seconds.to_bytes(8, "big"))
+
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=app_args,
+        boxes=[(0, session_box_name(session_id))] if len(session_id) <= MAX_SESSION_ID_LENGTH else []
+    )
+
+
+def close_session_txn(sender, sp, app_id, session_id):
+    """Build a close_session application call for a registered session"""
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"close_session", _session_id_bytes(session_id)],
+        boxes=[(0, session_box_name(session_id))]
+    )
+
+
+def mark_attendance_txn(sender, sp, app_id, session_id, qr_round, qr_hash):
+    """
+    Build a local state mark_attendance application call
+
+    The registry box is referenced so the call works for registered sessions as
+    well as the session held in global state, along with the boxes the contract
+    checks for a check-in in another mode.
+    """
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"mark_attendance", session_id, qr_round.to_bytes(8, "big"), qr_hash],
+        boxes=check_in_box_refs(session_id, sender)
+    )
+
+
+def decode_session_record(record):
+    """
+    Decode a registered session's box value
+
+    Returns:
+        Dict with start_round, end_round, attendance_end_round, is_active,
+        total_attendance, teacher and session_name
+    """
+    fields = [int.from_bytes(record[offset:offset + 8], "big") for offset in range(0, 40, 8)]
+    return {
+        "start_round": fields[0],
+        "end_round": fields[1],
+        "attendance_end_round": fields[2],
+        "is_active": fields[3],
+        "total_attendance": fields[4],
+        "teacher": encoding.encode_address(record[40:SESSION_HEADER_SIZE]),
+        "session_name": record[SESSION_HEADER_SIZE:].decode("utf-8", errors="replace"),
+    }
+
+
+def get_registered_session(algod_client, app_id, session_id):
+    """Read one registered session's record"""
+    response = algod_client.application_box_by_name(app_id, session_box_name(session_id))
+    return decode_session_record(base64.b64decode(response["value"]))
+
+
+def list_registered_sessions(algod_client, app_id, session_ids):
+    """
+    Read the registered sessions among session_ids
+
+    One box read per session_id. Use AttendanceIndexer.list_sessions to list
+    every session of the app.
+
+    Returns:
+        Dict of session_id (str) -> decoded session record, for the registered ones
+    """
+    sessions = {}
+    for session_id in session_ids:
+        record = _box_value(algod_client, app_id, session_box_name(session_id))
+        if record is None or len(record) < SESSION_HEADER_SIZE:
+            continue
+        session_id = session_id.decode("utf-8", errors="replace") if isinstance(session_id, bytes) else session_id
+        sessions[session_id] = decode_session_record(record)
+
+    return sessions
@@ -0,0 +1,276 @@
+"""
+CampusChain AI - Check-In Load Generator
+
+How many mark_attendance calls land inside one QR validity window (20 rounds
+for contract.py, 5 for contract_v2_secure.py)? This runs the
+test_student_attendance.py flow (fund, opt in, mark attendance) for N
+students at once:
+
+1. pre-generate N student accounts, fund them and opt them in (16 per
+   group, see bulk_accounts.py)
+2. show one QR: qr_round is the last round before the first call, and every
+   student's wallet-bound QR hash and signed call are computed up front
+3. fire the calls at --rate per second from --workers threads
+4. report throughput, p50/p95/p99 confirmation latency (send to the block
+   that confirmed it) and rejection reasons
+
+Against LocalNet every group is its own block (dev mode), so the window is
+literally 20 transactions. The default stand-in is the in-process AVM adding
+a block every --block-seconds (2.8, like MainNet) with every call that
+arrived in between, which is what a lecture hall on TestNet/MainNet sees.
+
+Usage:
+    python checkin_load.py --students 2000 --rate 500
+    python checkin_load.py --contract contract_v2_secure --students 1000
+    python checkin_load.py --network localnet --students 200
+"""
+
+import argparse
+import hashlib
+import math
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from algosdk import account, encoding, mnemonic
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import ApplicationCreateTxn, ApplicationNoOpTxn, OnComplete
+
+sys.path.insert(0, str(Path(__file__).parent))
+from box_storage import check_in_box_refs
+from bulk_accounts import fund_and_opt_in
+from compile_cache import get_compiled_programs
+from confirmation_tracker import TransactionExpiredError, get_confirmation_tracker
+from deploy_config import AttendanceDeployConfig
+from local_avm import LOCALNET_DISPENSER_MNEMONIC
+from profile_opcodes import CONTRACTS, send
+
+# QR_VALIDITY_ROUNDS of each contract
+QR_VALIDITY_ROUNDS = {"contract": 20, "contract_v2_secure": 5}
+
+LOAD_SESSION = b"LOAD-LECTURE"
+SESSION_SECONDS = 3600
+# Opt-in minimum balance (16 local uints) plus fees
+STUDENT_FUNDING = 1_000_000
+# Calls still missing this many rounds after the QR expired count as dropped
+DROP_AFTER_ROUNDS = 10
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def rejection_reason(message):
+    """Error message without the transaction ID, so equal rejections count together"""
+    message = re.sub(r"^TransactionPool\.Remember: ", "", message)
+    return re.sub(r"transaction \w+: ", "", message)
+
+
+def prepare_students(algod_client, app_id, count):
+    """
+    Generate, fund and opt in count student accounts
+
+    Returns:
+        List of (private_key, address)
+    """
+    students = [account.generate_account() for _ in range(count)]
+    fund_and_opt_in(
+        algod_client, mnemonic.to_private_key(LOCALNET_DISPENSER_MNEMONIC), app_id, students, STUDENT_FUNDING
+    )
+    return students
+
+
+def deploy(algod_client, name):
+    """
+    Deploy a contract with one open session
+
+    Returns:
+        Application ID
+    """
+    programs = get_compiled_programs(algod_client, CONTRACTS[name])
+    dispenser_key = mnemonic.to_private_key(LOCALNET_DISPENSER_MNEMONIC)
+    teacher = account.address_from_private_key(dispenser_key)
+    create = ApplicationCreateTxn(
+        sender=teacher,
+        sp=algod_client.suggested_params(),
+        on_complete=OnComplete.NoOpOC,
+        approval_program=programs["approval"]["bytecode"],
+        clear_program=programs["clear"]["bytecode"],
+        global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
+        local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
+        app_args=[LOAD_SESSION, b"Load Test Lecture", SESSION_SECONDS.to_bytes(8, "big")],
+        extra_pages=AttendanceDeployConfig.extra_program_pages(programs["approval"]["bytecode"], programs["clear"]["bytecode"]),
+    )
+    return send(algod_client, create, dispenser_key)["application-index"]
+
+
+def run_load(algod_client, name="contract", students=1000, rate=None, workers=8):
+    """
+    Fire one mark_attendance per student against a fresh app
+
+    Args:
+        algod_client: LocalNet client or local_avm.LocalAlgodClient
+        name: Key of CONTRACTS ("contract" or "contract_v2_secure")
+        students: Number of students
+        rate: Submissions per second (None: as fast as the workers can send)
+        workers: Sending threads
+
+    Returns:
+        dict with counts, throughput (confirmed calls per second), latency
+        percentiles in seconds, rejection reasons and the rounds involved
+    """
+    validity_rounds = QR_VALIDITY_ROUNDS[name]
+    app_id = deploy(algod_client, name)
+    accounts = prepare_students(algod_client, app_id, students)
+
+    # The QR on screen: every student scans the same qr_round
+    sp = algod_client.suggested_params()
+    qr_round = algod_client.status()["last-round"]
+    qr_bytes = qr_round.to_bytes(8, "big")
+    sp.last = qr_round + validity_rounds + DROP_AFTER_ROUNDS
+    calls = [
+        ApplicationNoOpTxn(
+            address,
+            sp,
+            app_id,
+            app_args=[
+                b"mark_attendance",
+                LOAD_SESSION,
+                qr_bytes,
+                hashlib.sha256(LOAD_SESSION + qr_bytes + encoding.decode_address(address)).digest(),
+            ],
+            # contract.py checks the student has no box record or roster slot either
+            boxes=check_in_box_refs(LOAD_SESSION, address) if name == "contract" else None,
+        ).sign(private_key)
+        for private_key, address in accounts
+    ]
+
+    tracker = get_confirmation_tracker(algod_client)
+    lock = threading.Lock()
+    latencies = []
+    confirmed_rounds = Counter()
+    rejections = Counter()
+    finished = threading.Semaphore(0)
+
+    # Every call releases finished exactly once, whatever fails, so the run never hangs
+    def confirmed(sent_at):
+        def callback(future):
+            try:
+                with lock:
+                    try:
+                        result = future.result()
+                    except TransactionExpiredError:
+                        rejections["dropped (never confirmed)"] += 1
+                    except Exception as e:
+                        rejections[f"confirmation failed ({type(e).__name__})"] += 1
+                    else:
+                        latencies.append(time.perf_counter() - sent_at)
+                        confirmed_rounds[result["confirmed-round"]] += 1
+            finally:
+                finished.release()
+        return callback
+
+    def rejected(message):
+        reason = rejection_reason(message)
+        if "assert failed" in reason:
+            try:
+                expired = algod_client.status()["last-round"] + 1 - qr_round > validity_rounds
+            except Exception:
+                expired = False
+            if expired:
+                reason = f"QR expired (older than {validity_rounds} rounds)"
+        return reason
+
+    def submit(stxn):
+        sent_at = time.perf_counter()
+        tracked = False
+        try:
+            tx_id = algod_client.send_transaction(stxn)
+            tracker.track(tx_id, stxn.transaction.last_valid_round, callback=confirmed(sent_at))
+            tracked = True
+        except AlgodHTTPError as e:
+            reason = rejected(str(e))
+            with lock:
+                rejections[reason] += 1
+        except Exception as e:
+            # URLError, OSError...: algod never took the call
+            with lock:
+                rejections[f"not sent ({type(e).__name__})"] += 1
+        finally:
+            if not tracked:
+                finished.release()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index, stxn in enumerate(calls):
+            if rate:
+                delay = started + index / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            executor.submit(submit, stxn)
+    for _ in calls:
+        finished.acquire()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "contract": name,
+        "students": students,
+        "qr_round": qr_round,
+        "validity_rounds": validity_rounds,
+        "confirmed": len(latencies),
+        "rejected": sum(rejections.values()),
+        "rejections": rejections,
+        "rounds": dict(sorted(confirmed_rounds.items())),
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "latency": {
+            label: percentile(latencies, fraction) if latencies else None
+            for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        },
+    }
+
+
+def print_report(report):
+    print(f"\n📄 {report['contract']}.py: {report['students']} students, QR round {report['qr_round']} "
+          f"(valid {report['validity_rounds']} rounds)")
+    print(f"   ✅ confirmed   {report['confirmed']:>7}")
+    print(f"   ❌ rejected    {report['rejected']:>7}")
+    print(f"   ⏱  {report['seconds']:.2f}s, {report['throughput']:.1f} confirmed calls/s")
+    if report["confirmed"]:
+        latency = report["latency"]
+        print(f"   latency p50 {latency['p50'] * 1000:.0f}ms  p95 {latency['p95'] * 1000:.0f}ms  "
+              f"p99 {latency['p99'] * 1000:.0f}ms")
+    for round_number, count in report["rounds"].items():
+        print(f"   round {round_number} (+{round_number - report['qr_round']}): {count} confirmed")
+    for reason, count in report["rejections"].most_common():
+        print(f"   {count:>7} x {reason}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fire mark_attendance calls from many students at once")
+    parser.add_argument("--contract", choices=sorted(CONTRACTS), default="contract")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--rate", type=float, help="Submissions per second (default: as fast as possible)")
+    parser.add_argument("--workers", type=int, default=8, help="Sending threads")
+    parser.add_argument("--network", choices=("local", "localnet"), default="local",
+                        help="local: in-process AVM with real block times (default), localnet: AlgoKit LocalNet")
+    parser.add_argument("--block-seconds", type=float, default=2.8, help="Block time of the in-process AVM")
+    args = parser.parse_args()
+
+    if args.network == "localnet":
+        algod_client = AttendanceDeployConfig.get_algod_client("localnet")
+    else:
+        from local_avm import LocalAlgodClient
+        algod_client = LocalAlgodClient(block_seconds=args.block_seconds)
+
+    print_report(run_load(algod_client, args.contract, args.students, args.rate, args.workers))
+
+
+if __name__ == "__main__":
+    main()
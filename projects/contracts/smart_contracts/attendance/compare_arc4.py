@@ -0,0 +1,376 @@
+"""
+CampusChain AI - PyTeal vs ARC-4 Cost Comparison
+
+Runs the same attendance scenario against the PyTeal contract (contract.py) and
+its Algorand Python port (smart_contracts/attendance_arc4) and reports, per
+method, the opcode cost from simulate plus both program sizes.
+
+On LocalNet (the default) both programs are assembled by algod. With
+--network local the scenario runs on the in-process AVM (local_avm.py), which
+counts opcodes with its own cost table and cannot assemble TEAL, so the size
+table compares TEAL instruction counts instead (the two compilers comment
+their TEAL very differently) and lists the ARC-4 bytecode size from its
+ARC-56 spec; the PyTeal bytecode size needs algod.
+
+Build the ARC-4 artifacts first:
+    algokit project run build -- attendance_arc4
+
+Usage:
+    python compare_arc4.py [--network local] [--output report.md]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from algosdk import abi, account, encoding, mnemonic
+from algosdk.logic import get_application_address
+from algosdk.transaction import (
+    ApplicationCreateTxn,
+    ApplicationNoOpTxn,
+    ApplicationOptInTxn,
+    OnComplete,
+    PaymentTxn,
+    wait_for_confirmation,
+)
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+sys.path.insert(0, str(Path(__file__).parent))
+from contract import get_approval_program, get_clear_program
+from deploy_config import AttendanceDeployConfig
+from box_storage import (
+    create_roster_txn,
+    create_session_txn,
+    enroll_txn,
+    mark_attendance_bitmap_txn,
+    mark_attendance_box_txn,
+    mark_attendance_txn,
+    open_session_txn,
+    close_session_txn,
+)
+from merkle_attendance import MerkleTree, commit_attendance_txn, verify_attendance_txn
+from session_reader import attendance_bitmap_txn, session_summary_txn
+
+ARC4_ARTIFACTS = Path(__file__).parent.parent / "artifacts" / "attendance_arc4"
+LOCALNET_DISPENSER_MNEMONIC = "auction inquiry lava second expand liberty glass involve ginger illness length room item discover ahead table doctor term tackle cement bonus profit right above catch"
+
+GLOBAL_SESSION = b"CS101-LECTURE"
+NEXT_GLOBAL_SESSION = b"CS101-LECTURE-2"
+REGISTERED_SESSION = b"CS102-LAB"
+ROSTER_CAPACITY = 64
+
+
+def compile_program(algod_client, teal_source):
+    """Compile TEAL source with algod and return the program bytes"""
+    result = algod_client.compile(teal_source)
+    return base64.b64decode(result["result"])
+
+
+def load_arc4_spec():
+    """Load the ARC-56 spec and TEAL produced by the algopy build"""
+    spec_path = ARC4_ARTIFACTS / "Attendance.arc56.json"
+    if not spec_path.exists():
+        raise FileNotFoundError(
+            f"{spec_path} not found, run `algokit project run build -- attendance_arc4` first"
+        )
+    spec = json.loads(spec_path.read_text())
+    methods = {
+        method["name"]: abi.Method.from_json(json.dumps(method))
+        for method in spec["methods"]
+    }
+    approval = (ARC4_ARTIFACTS / "Attendance.approval.teal").read_text()
+    clear = (ARC4_ARTIFACTS / "Attendance.clear.teal").read_text()
+    return methods, approval, clear
+
+
+def teal_instructions(program):
+    """Count the instructions of TEAL source, leaving out comments, labels and the pragma"""
+    lines = (line.split("//")[0].strip() for line in program.decode().splitlines())
+    return sum(1 for line in lines if line and not line.endswith(":") and not line.startswith("#pragma"))
+
+
+def load_arc4_bytecode_sizes():
+    """Assembled sizes of the ARC-4 programs, from the byteCode puyapy stored in the ARC-56 spec"""
+    spec = json.loads((ARC4_ARTIFACTS / "Attendance.arc56.json").read_text())
+    return {name: len(base64.b64decode(program)) for name, program in spec.get("byteCode", {}).items()}
+
+
+def arc4_call(txn, method, args):
+    """
+    Turn a PyTeal-style call into the equivalent ARC-4 call
+
+    Box and account references are kept, app args are replaced by the method
+    selector and the ABI encoded arguments. Account arguments are encoded as
+    their index in the foreign accounts array.
+    """
+    app_args = [method.get_selector()]
+    accounts = list(txn.accounts or [])
+    for arg, value in zip(method.args, args):
+        if str(arg.type) == "account":
+            if value not in accounts:
+                accounts.append(value)
+            app_args.append((accounts.index(value) + 1).to_bytes(1, "big"))
+        else:
+            app_args.append(arg.type.encode(value))
+    txn.app_args = app_args
+    txn.accounts = accounts
+    return txn
+
+
+def qr_hash(session_id, qr_round, student_address):
+    """QR proof the teacher's screen encodes for a student"""
+    return hashlib.sha256(
+        session_id + qr_round.to_bytes(8, "big") + encoding.decode_address(student_address)
+    ).digest()
+
+
+def submit(algod_client, txn, private_key, simulate=True, send=True):
+    """
+    Simulate (for its opcode cost) then send a transaction
+
+    Read-only calls are only simulated (send=False), with unnamed resources
+    allowed as the frontend does.
+    """
+    signed = txn.sign(private_key)
+    cost = None
+    if simulate:
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=[signed])],
+            allow_unnamed_resources=not send,
+        )
+        group = algod_client.simulate_transactions(request)["txn-groups"][0]
+        if "failure-message" in group:
+            raise RuntimeError(group["failure-message"])
+        cost = group.get("app-budget-consumed", 0)
+    if not send:
+        return cost, None
+    tx_id = algod_client.send_transaction(signed)
+    confirmed = wait_for_confirmation(algod_client, tx_id, 4)
+    return cost, confirmed
+
+
+def new_funded_account(algod_client, amount=10_000_000):
+    """Create a LocalNet account funded by the dispenser"""
+    private_key, address = account.generate_account()
+    dispenser_key = mnemonic.to_private_key(LOCALNET_DISPENSER_MNEMONIC)
+    payment = PaymentTxn(
+        account.address_from_private_key(dispenser_key),
+        algod_client.suggested_params(),
+        address,
+        amount,
+    )
+    submit(algod_client, payment, dispenser_key, simulate=False)
+    return private_key, address
+
+
+def run_scenario(algod_client, approval, clear, methods=None):
+    """
+    Deploy one flavour of the contract and exercise every method once
+
+    Each attendance mode gets its own student, since a student counts once per
+    session whichever mode recorded the check-in.
+
+    Args:
+        algod_client: LocalNet Algod client
+        approval: Compiled approval program
+        clear: Compiled clear program
+        methods: ARC-4 methods by name, None for the PyTeal contract
+
+    Returns:
+        dict of method name -> opcode cost
+    """
+    teacher_key, teacher = new_funded_account(algod_client)
+    assistant_key, assistant = new_funded_account(algod_client)
+    student_key, student = new_funded_account(algod_client)
+    box_student_key, box_student = new_funded_account(algod_client)
+    roster_student_key, roster_student = new_funded_account(algod_client)
+    sp = algod_client.suggested_params()
+
+    def call(txn, name, *args):
+        return arc4_call(txn, methods[name], args) if methods else txn
+
+    create = ApplicationCreateTxn(
+        sender=teacher,
+        sp=sp,
+        on_complete=OnComplete.NoOpOC,
+        approval_program=approval,
+        clear_program=clear,
+        global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
+        local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
+        app_args=[GLOBAL_SESSION, b"Intro Lecture", (3600).to_bytes(8, "big"), (3600).to_bytes(8, "big")],
+        extra_pages=AttendanceDeployConfig.extra_program_pages(approval, clear),
+    )
+    create = call(create, "create", GLOBAL_SESSION, b"Intro Lecture", 3600, 3600)
+    costs = {}
+    costs["create"], confirmed = submit(algod_client, create, teacher_key)
+    app_id = confirmed["application-index"]
+
+    payment = PaymentTxn(teacher, sp, get_application_address(app_id), 1_000_000)
+    submit(algod_client, payment, teacher_key, simulate=False)
+
+    for key, address in ((teacher_key, teacher), (assistant_key, assistant), (student_key, student)):
+        opt_in = call(ApplicationOptInTxn(address, sp, app_id), "opt_in")
+        costs["opt_in"], _ = submit(algod_client, opt_in, key)
+
+    txn = ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"add_teacher"], accounts=[assistant])
+    costs["add_teacher"], _ = submit(algod_client, call(txn, "add_teacher", assistant), teacher_key)
+
+    txn = open_session_txn(assistant, sp, app_id, REGISTERED_SESSION, "Lab", 3600, 3600)
+    txn = call(txn, "open_session", REGISTERED_SESSION, b"Lab", 3600, 3600)
+    costs["open_session"], _ = submit(algod_client, txn, assistant_key)
+
+    txn = create_roster_txn(assistant, sp, app_id, REGISTERED_SESSION, ROSTER_CAPACITY, track_rounds=True)
+    txn = call(txn, "create_roster", REGISTERED_SESSION, ROSTER_CAPACITY, True)
+    costs["create_roster"], _ = submit(algod_client, txn, assistant_key)
+
+    txn = enroll_txn(assistant, sp, app_id, REGISTERED_SESSION, roster_student)
+    txn = call(txn, "enroll", REGISTERED_SESSION, roster_student)
+    costs["enroll"], _ = submit(algod_client, txn, assistant_key)
+
+    qr_round = algod_client.status()["last-round"]
+    for name, builder, key, address, session_id, extra in (
+        ("mark_attendance", mark_attendance_txn, student_key, student, GLOBAL_SESSION, ()),
+        ("mark_attendance_box", mark_attendance_box_txn, box_student_key, box_student, REGISTERED_SESSION, ()),
+        ("mark_attendance_bitmap", mark_attendance_bitmap_txn, roster_student_key, roster_student,
+         REGISTERED_SESSION, (ROSTER_CAPACITY, True)),
+    ):
+        proof = qr_hash(session_id, qr_round, address)
+        txn = builder(address, sp, app_id, session_id, qr_round, proof, *extra)
+        txn = call(txn, name, session_id, qr_round, proof)
+        costs[name], _ = submit(algod_client, txn, key)
+
+    txn = call(session_summary_txn(teacher, sp, app_id, REGISTERED_SESSION), "get_session_summary", REGISTERED_SESSION)
+    costs["get_session_summary"], _ = submit(algod_client, txn, teacher_key, send=False)
+
+    # Two addresses (an account and two boxes each) plus the session's two boxes
+    # are the 8 references one call can carry
+    addresses = [student, roster_student]
+    txn = attendance_bitmap_txn(teacher, sp, app_id, REGISTERED_SESSION, addresses)
+    txn = call(
+        txn, "get_attendance_bitmap", REGISTERED_SESSION,
+        b"".join(encoding.decode_address(address) for address in addresses)
+    )
+    costs["get_attendance_bitmap"], _ = submit(algod_client, txn, teacher_key, send=False)
+
+    txn = close_session_txn(assistant, sp, app_id, REGISTERED_SESSION)
+    txn = call(txn, "close_registered_session", REGISTERED_SESSION)
+    costs["close_registered_session"], _ = submit(algod_client, txn, assistant_key)
+
+    # Commit a (one attendee) Merkle root for the registered session and prove it
+    tree = MerkleTree({box_student: qr_round})
+    txn = commit_attendance_txn(assistant, sp, app_id, REGISTERED_SESSION, tree)
+    txn = call(txn, "commit_attendance", REGISTERED_SESSION, tree.root, tree.count)
+    costs["commit_attendance"], _ = submit(algod_client, txn, assistant_key)
+
+    inclusion = tree.proof(box_student)
+    txn = verify_attendance_txn(
+        student, sp, app_id, REGISTERED_SESSION, box_student, qr_round, inclusion["index"], inclusion["proof"]
+    )
+    txn = call(
+        txn, "verify_attendance", REGISTERED_SESSION, box_student, qr_round, inclusion["index"],
+        b"".join(inclusion["proof"])
+    )
+    costs["verify_attendance"], _ = submit(algod_client, txn, student_key)
+
+    txn = call(ApplicationNoOpTxn(student, sp, app_id, app_args=[b"pool_budget"]), "pool_budget")
+    costs["pool_budget"], _ = submit(algod_client, txn, student_key)
+
+    txn = ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"remove_teacher"], accounts=[assistant])
+    costs["remove_teacher"], _ = submit(algod_client, call(txn, "remove_teacher", assistant), teacher_key)
+
+    txn = call(ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"close_session"]), "close_session")
+    costs["close_session"], _ = submit(algod_client, txn, teacher_key)
+
+    txn = create_session_txn(teacher, sp, app_id, NEXT_GLOBAL_SESSION, "Lecture 2", 3600, 3600)
+    txn = call(txn, "create_session", NEXT_GLOBAL_SESSION, b"Lecture 2", 3600, 3600)
+    costs["create_session"], _ = submit(algod_client, txn, teacher_key)
+
+    return costs
+
+
+def format_report(pyteal_costs, arc4_costs, pyteal_sizes, arc4_sizes, assembled=True, arc4_bytecode=None):
+    """
+    Render the comparison as markdown tables: opcodes per method, then program sizes
+
+    Args:
+        pyteal_costs: Method name -> opcode cost of the PyTeal contract
+        arc4_costs: Method name -> opcode cost of the ARC-4 port
+        pyteal_sizes: Program name -> size of the PyTeal programs
+        arc4_sizes: Program name -> size of the ARC-4 programs
+        assembled: Whether the sizes are assembled bytes (else teal_instructions() counts)
+        arc4_bytecode: Program name -> assembled ARC-4 size, listed when TEAL was not assembled
+    """
+    unit = "bytes" if assembled else "TEAL instructions"
+    lines = [
+        "| Method | PyTeal opcodes | ARC-4 opcodes | Delta |",
+        "|---|---:|---:|---:|",
+    ]
+    for name, pyteal_cost in pyteal_costs.items():
+        arc4_cost = arc4_costs[name]
+        lines.append(f"| {name} | {pyteal_cost} | {arc4_cost} | {arc4_cost - pyteal_cost:+d} |")
+    lines += [
+        "",
+        f"| Program | PyTeal {unit} | ARC-4 {unit} | Delta |",
+        "|---|---:|---:|---:|",
+    ]
+    for name, pyteal_size in pyteal_sizes.items():
+        arc4_size = arc4_sizes[name]
+        lines.append(f"| {name} | {pyteal_size} | {arc4_size} | {arc4_size - pyteal_size:+d} |")
+    if not assembled:
+        lines.append("")
+        lines.append("TEAL was not assembled (in-process AVM); run on LocalNet for assembled sizes.")
+        if arc4_bytecode:
+            sizes = ", ".join(f"{name} {size} bytes" for name, size in arc4_bytecode.items())
+            lines.append(f"ARC-4 bytecode from its ARC-56 spec: {sizes}.")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PyTeal and ARC-4 attendance contract costs")
+    parser.add_argument("--output", help="Write the markdown report to this file")
+    parser.add_argument("--network", choices=("local", "localnet"), default="localnet",
+                        help="localnet: AlgoKit LocalNet (default), local: in-process AVM, TEAL instruction counts")
+    args = parser.parse_args()
+
+    if args.network == "localnet":
+        algod_client = AttendanceDeployConfig.get_algod_client("localnet")
+    else:
+        from local_avm import LocalAlgodClient
+        algod_client = LocalAlgodClient()
+    methods, arc4_approval_teal, arc4_clear_teal = load_arc4_spec()
+
+    pyteal_programs = {
+        "approval": compile_program(algod_client, get_approval_program()),
+        "clear": compile_program(algod_client, get_clear_program()),
+    }
+    arc4_programs = {
+        "approval": compile_program(algod_client, arc4_approval_teal),
+        "clear": compile_program(algod_client, arc4_clear_teal),
+    }
+    assembled = args.network == "localnet"
+
+    print("⏳ Running PyTeal scenario...")
+    pyteal_costs = run_scenario(algod_client, pyteal_programs["approval"], pyteal_programs["clear"])
+    print("⏳ Running ARC-4 scenario...")
+    arc4_costs = run_scenario(algod_client, arc4_programs["approval"], arc4_programs["clear"], methods)
+
+    report = format_report(
+        pyteal_costs,
+        arc4_costs,
+        {name: len(program) if assembled else teal_instructions(program) for name, program in pyteal_programs.items()},
+        {name: len(program) if assembled else teal_instructions(program) for name, program in arc4_programs.items()},
+        assembled,
+        None if assembled else load_arc4_bytecode_sizes(),
+    )
+    print(report)
+
+    if args.output:
+        Path(args.output).write_text(report)
+        print(f"✅ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+CampusChain AI - Content-Addressed Compile Cache
+
+Deploy scripts and tests regenerate TEAL from PyTeal on every run and then
+send it to algod's compile endpoint. Both results only depend on the
+contract source, so they are cached under the git-ignored .cache directory of
+the contracts project, apart from the committed artifacts:
+
+    .cache/attendance/<build key>/approval.teal   PyTeal output
+                                  approval.bin    algod bytecode
+                                  approval.map.json  algod source map
+                                  approval.local_avm.*  same, for the in-process AVM
+                                  clear.* and manifest.json likewise
+
+The build key is a SHA256 of the contract module's source, the PyTeal
+version, the TEAL version the module compiles with (TEAL_VERSION, or
+OPTIMIZED_VERSION for the optimized build) and the optimization options, so editing
+contract.py (or switching build profile) misses the cache and anything else
+hits it without running PyTeal or calling algod.
+
+Usage:
+    from compile_cache import get_compiled_programs
+
+    programs = get_compiled_programs(algod_client)
+    programs["approval"]["bytecode"], programs["clear"]["bytecode"]
+"""
+
+import base64
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "attendance"
+PROGRAMS = ("approval", "clear")
+
+
+def _default_module():
+    import contract
+    return contract
+
+
+def build_key(module=None, optimized=False):
+    """
+    Cache key of a contract module's programs
+
+    Args:
+        module: Module with get_approval_program/get_clear_program (default: contract.py)
+        optimized: Build profile
+
+    Returns:
+        Hex SHA256 of the source, PyTeal version, TEAL version and options
+    """
+    module = module or _default_module()
+    options = {
+        "module": module.__name__,
+        "optimized": optimized,
+        "pyteal": importlib.metadata.version("pyteal"),
+        "version": module.OPTIMIZED_VERSION if optimized else module.TEAL_VERSION,
+        "optimize": repr(vars(module.OPTIMIZE_OPTIONS)) if optimized else None,
+    }
+    digest = hashlib.sha256(Path(module.__file__).read_bytes())
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _write(path, data):
+    """Write atomically, so parallel test runs never read half a file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data if isinstance(data, bytes) else data.encode())
+    os.replace(tmp, path)
+
+
+def get_programs(module=None, optimized=False):
+    """
+    TEAL of both programs, from the cache or generated with PyTeal
+
+    Returns:
+        Dict of "approval"/"clear" -> TEAL source
+    """
+    module = module or _default_module()
+    directory = CACHE_DIR / build_key(module, optimized)
+    paths = {name: directory / f"{name}.teal" for name in PROGRAMS}
+    if all(path.exists() for path in paths.values()):
+        return {name: path.read_text() for name, path in paths.items()}
+
+    programs = {
+        "approval": module.get_approval_program(optimized),
+        "clear": module.get_clear_program(optimized),
+    }
+    for name, teal in programs.items():
+        _write(paths[name], teal)
+    _write(directory / "manifest.json", json.dumps({"module": module.__name__, "optimized": optimized}, indent=2))
+    return programs
+
+
+def get_cached_json(filename, build, module=None, optimized=False):
+    """
+    JSON derived from a contract build, from the cache or computed with build()
+
+    Args:
+        filename: File name inside the build's cache directory
+        build: Zero-argument callable returning JSON-serializable data
+        module: Contract module (default: contract.py)
+        optimized: Build profile
+
+    Returns:
+        The cached or freshly built data, as loaded from JSON
+    """
+    module = module or _default_module()
+    path = CACHE_DIR / build_key(module, optimized) / filename
+    if path.exists():
+        return json.loads(path.read_text())
+    data = build()
+    _write(path, json.dumps(data))
+    return json.loads(json.dumps(data))
+
+
+def get_compiled_programs(algod_client, module=None, optimized=False):
+    """
+    TEAL, bytecode and source map of both programs, compiling with algod only on a miss
+
+    Args:
+        algod_client: Algod client used on a cache miss; clients with a
+            compile_target (local_avm.LocalAlgodClient) get their own files
+        module: Contract module (default: contract.py)
+        optimized: Build profile
+
+    Returns:
+        Dict of "approval"/"clear" -> dict with teal, bytecode (bytes),
+        result (base64, as returned by algod compile) and source_map
+    """
+    module = module or _default_module()
+    directory = CACHE_DIR / build_key(module, optimized)
+    target = getattr(algod_client, "compile_target", None)
+    programs = {}
+    for name, teal in get_programs(module, optimized).items():
+        stem = f"{name}.{target}" if target else name
+        bytecode_path = directory / f"{stem}.bin"
+        source_map_path = directory / f"{stem}.map.json"
+        if bytecode_path.exists() and source_map_path.exists():
+            bytecode = bytecode_path.read_bytes()
+            source_map = json.loads(source_map_path.read_text())
+        else:
+            response = algod_client.compile(teal, source_map=True)
+            bytecode = base64.b64decode(response["result"])
+            source_map = response.get("sourcemap", {})
+            _write(bytecode_path, bytecode)
+            _write(source_map_path, json.dumps(source_map))
+        programs[name] = {
+            "teal": teal,
+            "bytecode": bytecode,
+            "result": base64.b64encode(bytecode).decode(),
+            "source_map": source_map,
+        }
+    return programs
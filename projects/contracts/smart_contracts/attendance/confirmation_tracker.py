@@ -0,0 +1,227 @@
+"""
+CampusChain AI - Block-Driven Confirmation Tracker
+
+wait_for_confirmation polls pending_transaction_info once per round for one
+transaction, so confirming a 1,000-transaction batch runs 1,000 polling
+loops. ConfirmationTracker follows the chain instead: one background thread
+waits on status_after_block, reads each new block once and resolves every
+tracked transaction found in it.
+
+- track() returns a concurrent.futures.Future (and takes an optional
+  callback); the result is a dict like pending_transaction_info's, with
+  confirmed-round, application-index, asset-index and logs
+- a transaction still missing after its last valid round fails with
+  TransactionExpiredError
+- the last RECENT_ROUNDS blocks are remembered (and read on a cold start),
+  so a transaction tracked just after it was confirmed still resolves
+
+Usage:
+    from confirmation_tracker import get_confirmation_tracker
+
+    tracker = get_confirmation_tracker(algod_client)
+    futures = [tracker.track(algod_client.send_transaction(stxn), stxn.transaction.last_valid_round) for stxn in signed]
+    results = [future.result(timeout=60) for future in futures]
+"""
+
+import base64
+import threading
+from concurrent.futures import Future
+
+import msgpack
+from algosdk import encoding
+
+# Rounds to wait for a transaction tracked without its last valid round
+DEFAULT_VALIDITY_ROUNDS = 1000
+RECENT_ROUNDS = 16
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+class TransactionExpiredError(Exception):
+    """A tracked transaction passed its last valid round without being confirmed"""
+
+
+def transaction_id(txn, block):
+    """
+    ID of a transaction taken from a block
+
+    Blocks drop the genesis hash (and the genesis ID when "hgi" is set) from each
+    transaction; they are put back before hashing.
+    """
+    fields = dict(txn["txn"])
+    fields["gh"] = block["gh"]
+    if txn.get("hgi"):
+        fields["gen"] = block["gen"]
+    encoded = base64.b64decode(encoding.msgpack_encode(fields))
+    return base64.b32encode(encoding.checksum(b"TX" + encoded)).decode().strip("=")
+
+
+def _confirmation(txn, round_number):
+    """pending_transaction_info-style result of a transaction taken from a block"""
+    result = {"confirmed-round": round_number, "pool-error": ""}
+    if txn.get("apid"):
+        result["application-index"] = txn["apid"]
+    if txn.get("caid"):
+        result["asset-index"] = txn["caid"]
+    logs = txn.get("dt", {}).get("lg")
+    if logs:
+        result["logs"] = [base64.b64encode(log).decode() for log in logs]
+    return result
+
+
+class ConfirmationTracker:
+    """Resolves many pending transactions per block update"""
+
+    def __init__(self, algod_client, recent_rounds=RECENT_ROUNDS):
+        """
+        Args:
+            algod_client: Algod client instance
+            recent_rounds: Blocks whose confirmations are kept for late track() calls
+        """
+        self.algod_client = algod_client
+        self.recent_rounds = recent_rounds
+        self.last_round = None
+        self.block_reads = 0
+        self._pending = {}  # tx_id -> (future, last_valid)
+        self._recent = {}  # round -> {tx_id: result}
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stopping = False
+
+    def track(self, tx_id, last_valid=None, callback=None):
+        """
+        Start tracking a submitted (or about to be submitted) transaction
+
+        Args:
+            tx_id: Transaction ID
+            last_valid: Its last valid round; defaults to DEFAULT_VALIDITY_ROUNDS from now
+            callback: Called with the Future once it resolves
+
+        Returns:
+            Future resolving to the confirmation dict, or failing with TransactionExpiredError
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        with self._lock:
+            for confirmations in self._recent.values():
+                if tx_id in confirmations:
+                    future.set_result(confirmations[tx_id])
+                    return future
+            if tx_id in self._pending:
+                return self._pending[tx_id][0]
+            if last_valid is None and self.last_round is not None:
+                last_valid = self.last_round + DEFAULT_VALIDITY_ROUNDS
+            self._pending[tx_id] = (future, last_valid)
+            self._ensure_running()
+        return future
+
+    def wait(self, tx_ids, timeout=None):
+        """
+        Track transactions and block until all are resolved
+
+        Returns:
+            Dict of tx_id -> confirmation dict
+
+        Raises:
+            TransactionExpiredError: If any of them expired
+            TimeoutError: If timeout seconds pass first
+        """
+        futures = {tx_id: self.track(tx_id) for tx_id in tx_ids}
+        return {tx_id: future.result(timeout=timeout) for tx_id, future in futures.items()}
+
+    def wait_one(self, tx_id, timeout=None):
+        """Track one transaction and block until it is confirmed"""
+        return self.wait([tx_id], timeout)[tx_id]
+
+    def stop(self):
+        """Stop following blocks; pending futures stay unresolved"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _ensure_running(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._follow, name="confirmation-tracker", daemon=True)
+            self._thread.start()
+
+    def _follow(self):
+        """Read each new block once while anything is pending"""
+        try:
+            # Tracked transactions may already be in one of the last recent_rounds blocks,
+            # on a cold start as after an idle spell
+            latest = self.algod_client.status()["last-round"]
+            first = max(0, latest - self.recent_rounds + 1)
+            if self.last_round is not None:
+                first = max(first, self.last_round + 1)
+            for round_number in range(first, latest + 1):
+                self._process_block(round_number)
+            while True:
+                with self._lock:
+                    if self._stopping or not self._pending:
+                        self._thread = None
+                        return
+                    round_number = self.last_round
+                latest = self.algod_client.status_after_block(round_number)["last-round"]
+                for next_round in range(round_number + 1, latest + 1):
+                    self._process_block(next_round)
+        except Exception as e:
+            # A broken connection fails the waiting callers instead of hanging them
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._thread = None
+            for future, _ in pending.values():
+                future.set_exception(e)
+
+    def _process_block(self, round_number):
+        raw = self.algod_client.block_info(round_number, response_format="msgpack")
+        block = msgpack.unpackb(raw, raw=False, strict_map_key=False)["block"]
+        self.block_reads += 1
+        confirmations = {
+            transaction_id(txn, block): _confirmation(txn, round_number)
+            for txn in block.get("txns", [])
+        }
+
+        resolved, expired = [], []
+        with self._lock:
+            self.last_round = round_number
+            self._recent[round_number] = confirmations
+            for old_round in [r for r in self._recent if r <= round_number - self.recent_rounds]:
+                del self._recent[old_round]
+            for tx_id, (future, last_valid) in list(self._pending.items()):
+                if tx_id in confirmations:
+                    resolved.append((future, confirmations[tx_id]))
+                elif last_valid is None:
+                    self._pending[tx_id] = (future, round_number + DEFAULT_VALIDITY_ROUNDS)
+                    continue
+                elif last_valid <= round_number:
+                    expired.append((future, tx_id, last_valid))
+                else:
+                    continue
+                del self._pending[tx_id]
+
+        # Callbacks run outside the lock, they may track more transactions
+        for future, result in resolved:
+            future.set_result(result)
+        for future, tx_id, last_valid in expired:
+            future.set_exception(TransactionExpiredError(f"Transaction {tx_id} not confirmed by round {last_valid}"))
+
+
+def get_confirmation_tracker(algod_client):
+    """
+    Shared tracker for an algod client (one per network with algod_pool clients)
+
+    Returns:
+        ConfirmationTracker
+    """
+    with _trackers_lock:
+        tracker = _trackers.get(id(algod_client))
+        if tracker is None or tracker.algod_client is not algod_client:
+            tracker = ConfirmationTracker(algod_client)
+            _trackers[id(algod_client)] = tracker
+        return tracker
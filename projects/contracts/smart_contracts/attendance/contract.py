@@ -8,15 +8,35 @@ Features:
 - Round-based expiry (prevents QR sharing)
 - Session creation and management
 - Duplicate attendance prevention
+- Box-backed attendance records (no per-student local state limit)
+- Concurrent session registry (many classes per app)
+- Merkle-committed bulk attendance (one transaction per session)
+- Read-only session summary and attendance reads (one simulate call per class)
 - On-chain verification
 """
 
 from pyteal import *
 
-def approval_program():
+# Default build profile: TEAL v8, the first version with box storage
+TEAL_VERSION = 8
+
+# Optimized build profile: the newest AVM version PyTeal targets, with the scratch slot
+# and frame pointer optimizer enabled (see benchmark_optimized.py)
+OPTIMIZED_VERSION = 10
+OPTIMIZE_OPTIONS = OptimizeOptions(scratch_slots=True, frame_pointers=True)
+
+
+def approval_program(optimized=False):
     """
     Main approval program for attendance contract
     
+    Args:
+        optimized: Build the cost-optimized variant. Same rules and state, but NoOp
+            calls are routed after a single OnCompletion check with the hot
+            methods first, a session's end_round is computed once and reused as
+            the default attendance window, and start_round is only read by
+            mark_attendance_bitmap.
+    
     Global State Schema (per session):
     - session_id (Bytes): Unique session identifier
     - session_name (Bytes): Human-readable session name
@@ -36,6 +56,31 @@ def approval_program():
     Note: Students can mark attendance for multiple sessions. Each session creates
     separate local state entries with the session_id as part of the key.
     
+    Box Storage (box-backed attendance mode):
+    - "a" + session_id + student_address (8 bytes): Round number when attendance was marked
+      No opt-in or local state is needed, so there is no per-student session limit.
+      All records of a session share the "a" + session_id prefix and can be read with
+      a single box listing of the app (see box_storage.py).
+    
+    Box Storage (bitmap roster mode):
+    - "n" + session_id (24 bytes): capacity | enrolled_count | track_rounds
+    - "e" + session_id + student_address (8 bytes): Student's slot in that session's roster
+    - "b" + session_id (capacity / 8 bytes): 1 bit per slot, set when the student checked in
+    - "r" + session_id (2 bytes per slot, optional): Check-in round minus the session's start_round
+    
+    Box Storage (session registry):
+    - "s" + session_id: start_round | end_round | attendance_end_round | is_active |
+      total_attendance (8 bytes each) | teacher (32 bytes) | session_name
+      Lets one app run any number of concurrent sessions; the global state session
+      created by create_session keeps working alongside registered ones.
+    
+    Box Storage (Merkle-committed bulk attendance):
+    - "m" + session_id (40 bytes): merkle_root (32 bytes) | attendee count (8 bytes)
+      Written once by close_session. Students' signed QR proofs are collected off-chain
+      (merkle_attendance.py) and any student can later prove inclusion with
+      verify_attendance. Leaves are SHA256(0x00 + student_address + qr_round) and nodes
+      SHA256(0x01 + left + right).
+    
     Security Features:
     - QR codes are wallet-bound (cannot be shared)
     - QR codes expire after 20 rounds (~60 seconds)
@@ -57,15 +102,68 @@ def approval_program():
     check_in_round_key = Bytes("check_in_round")
     is_teacher_key = Bytes("is_teacher")
     
+    # Box key prefixes
+    attendance_box_prefix = Bytes("a")
+    enrollment_box_prefix = Bytes("e")
+    roster_box_prefix = Bytes("n")
+    bitmap_box_prefix = Bytes("b")
+    rounds_box_prefix = Bytes("r")
+    session_box_prefix = Bytes("s")
+    commitment_box_prefix = Bytes("m")
+    
     # Constants
     QR_VALIDITY_ROUNDS = Int(20)  # QR valid for 20 rounds (~60 seconds)
+    MAX_BOX_SESSION_ID_LENGTH = Int(31)  # 1 (prefix) + 31 + 32 (address) = 64 byte box name limit
+    
+    # Session registry record offsets ("s" + session_id box)
+    SESSION_START_ROUND = Int(0)
+    SESSION_ATTENDANCE_END_ROUND = Int(16)
+    SESSION_IS_ACTIVE = Int(24)
+    SESSION_TOTAL_ATTENDANCE = Int(32)
+    SESSION_TEACHER = Int(40)
+    SESSION_HEADER_SIZE = Int(72)  # session_name follows the header
+    
+    # Bitmap roster record offsets ("n" + session_id box)
+    ROSTER_CAPACITY = Int(0)
+    ROSTER_ENROLLED_COUNT = Int(8)
+    ROSTER_TRACK_ROUNDS = Int(16)
+    ROSTER_RECORD_SIZE = Int(24)
     
     # Helper function to check if sender is authorized teacher
-    is_authorized_teacher = Or(
+    # The optimized build reads creator once into scratch and skips the local state
+    # read when the creator calls
+    creator = ScratchVar(TealType.bytes)
+    is_authorized_teacher = Seq([
+        creator.store(App.globalGet(creator_key)),
+        If(Txn.sender() == creator.load())
+        .Then(Int(1))
+        .Else(App.localGet(Txn.sender(), is_teacher_key) == Int(1)),
+    ]) if optimized else Or(
         Txn.sender() == App.globalGet(creator_key),  # Creator is always authorized
         App.localGet(Txn.sender(), is_teacher_key) == Int(1)  # Or has teacher flag
     )
     
+    # Session rounds from [..., duration_seconds, attendance_window_seconds (optional)] args
+    # (approx 3 seconds per round)
+    end_round = ScratchVar(TealType.uint64)
+    
+    def rounds_from_seconds(arg_index):
+        return Global.round() + (Btoi(Txn.application_args[arg_index]) / Int(3))
+    
+    def store_end_round(duration_index):
+        return end_round.store(rounds_from_seconds(duration_index)) if optimized else Seq()
+    
+    def session_end_round(duration_index):
+        return end_round.load() if optimized else rounds_from_seconds(duration_index)
+    
+    def attendance_end_round(duration_index):
+        # Window argument if provided, otherwise the whole session
+        return (
+            If(Txn.application_args.length() > Int(duration_index + 1))
+            .Then(rounds_from_seconds(duration_index + 1))
+            .Else(session_end_round(duration_index))
+        )
+    
     # Application call handlers
     on_creation = Seq([
         # Initialize global state on contract creation
@@ -74,62 +172,172 @@ def approval_program():
         App.globalPut(creator_key, Txn.sender()),
         App.globalPut(start_round_key, Global.round()),
         # Duration in rounds: duration_seconds / 3 (approx 3 sec per round)
-        App.globalPut(end_round_key, Global.round() + (Btoi(Txn.application_args[2]) / Int(3))),
+        store_end_round(2),
+        App.globalPut(end_round_key, session_end_round(2)),
         # Attendance window: If 4th arg provided, use it; otherwise same as end_round
-        App.globalPut(
-            attendance_end_round_key,
-            If(Txn.application_args.length() > Int(3))
-            .Then(Global.round() + (Btoi(Txn.application_args[3]) / Int(3)))
-            .Else(Global.round() + (Btoi(Txn.application_args[2]) / Int(3)))
-        ),
+        App.globalPut(attendance_end_round_key, attendance_end_round(2)),
         App.globalPut(is_active_key, Int(1)),
         App.globalPut(total_attendance_key, Int(0)),
         # Note: Creator must opt-in separately to get teacher privileges
         Approve()
     ])
     
+    # Registered sessions live in their own "s" + session_id box (see open_session)
+    session_box_name = Concat(session_box_prefix, Txn.application_args[1])
+    registered_session = App.box_length(session_box_name)
+    
     # Method: Create new attendance session
     # Args: ["create_session", session_id, session_name, duration_seconds, attendance_window_seconds (optional)]
+    # Boxes: ["s" + session_id] (session_id of at most 31 bytes)
     create_session = Seq([
         # Verify caller is an authorized teacher
         Assert(is_authorized_teacher),
         
+        # Don't shadow a registered session (only session_ids that fit in a box name can be registered)
+        If(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH).Then(Seq([
+            registered_session,
+            Assert(Not(registered_session.hasValue())),
+        ])),
+        
         # Update session details
         App.globalPut(session_id_key, Txn.application_args[1]),
         App.globalPut(session_name_key, Txn.application_args[2]),
         App.globalPut(start_round_key, Global.round()),
         # Convert duration from seconds to rounds (approx 3 seconds per round)
-        App.globalPut(end_round_key, Global.round() + (Btoi(Txn.application_args[3]) / Int(3))),
+        store_end_round(3),
+        App.globalPut(end_round_key, session_end_round(3)),
         # Attendance window: If 5th arg provided, use it; otherwise same as end_round
-        App.globalPut(
-            attendance_end_round_key,
-            If(Txn.application_args.length() > Int(4))
-            .Then(Global.round() + (Btoi(Txn.application_args[4]) / Int(3)))
-            .Else(Global.round() + (Btoi(Txn.application_args[3]) / Int(3)))
-        ),
+        App.globalPut(attendance_end_round_key, attendance_end_round(3)),
         App.globalPut(is_active_key, Int(1)),
         App.globalPut(total_attendance_key, Int(0)),
         Approve()
     ])
     
+    # Targeted session lookup shared by every attendance mode
+    # The session in global state (create_session) is checked directly; any other
+    # session_id must be registered with open_session and is read from its own
+    # "s" + session_id box, so concurrent sessions never touch each other's state.
+    is_global_session = ScratchVar(TealType.uint64)
+    session_start_round = ScratchVar(TealType.uint64)
+    
+    def session_field(offset):
+        return Btoi(App.box_extract(session_box_name, offset, Int(8)))
+    
+    # Only mark_attendance_bitmap needs start_round; the optimized build reads it
+    # there instead of on every attendance call
+    def store_session_start_round(value):
+        return Seq() if optimized else session_start_round.store(value)
+    
+    load_session_start_round = If(is_global_session.load()).Then(
+        session_start_round.store(App.globalGet(start_round_key))
+    ).Else(
+        session_start_round.store(session_field(SESSION_START_ROUND))
+    ) if optimized else Seq()
+    
+    check_session_open = Seq([
+        is_global_session.store(Txn.application_args[1] == App.globalGet(session_id_key)),
+        If(is_global_session.load())
+        .Then(Seq([
+            Assert(App.globalGet(is_active_key) == Int(1)),
+            Assert(Global.round() <= App.globalGet(attendance_end_round_key)),
+            store_session_start_round(App.globalGet(start_round_key)),
+        ]))
+        .Else(Seq([
+            # box_extract fails if the session was never registered
+            Assert(session_field(SESSION_IS_ACTIVE) == Int(1)),
+            Assert(Global.round() <= session_field(SESSION_ATTENDANCE_END_ROUND)),
+            store_session_start_round(session_field(SESSION_START_ROUND)),
+        ])),
+    ])
+    
+    count_attendance = If(is_global_session.load()).Then(
+        App.globalPut(total_attendance_key, App.globalGet(total_attendance_key) + Int(1))
+    ).Else(
+        App.box_replace(
+            session_box_name,
+            SESSION_TOTAL_ATTENDANCE,
+            Itob(session_field(SESSION_TOTAL_ATTENDANCE) + Int(1))
+        )
+    )
+    
+    # Method: Register a concurrent attendance session (teacher only)
+    # Args: ["open_session", session_id, session_name, duration_seconds, attendance_window_seconds (optional)]
+    # Boxes: ["s" + session_id]
+    #
+    # Record: start_round | end_round | attendance_end_round | is_active | total_attendance | teacher | session_name
+    # The teacher pays the box minimum balance by funding the app account.
+    open_session = Seq([
+        Assert(is_authorized_teacher),
+        Assert(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH),
+        # Don't shadow the session held in global state
+        Assert(Txn.application_args[1] != App.globalGet(session_id_key)),
+        
+        # Create the record (fails if the session_id is already registered)
+        Assert(App.box_create(session_box_name, SESSION_HEADER_SIZE + Len(Txn.application_args[2]))),
+        store_end_round(3),
+        App.box_replace(
+            session_box_name,
+            SESSION_START_ROUND,
+            Concat(
+                Itob(Global.round()),
+                Itob(session_end_round(3)),
+                Itob(attendance_end_round(3)),
+                Itob(Int(1)),
+                Itob(Int(0)),
+                Txn.sender(),
+                Txn.application_args[2]
+            )
+        ),
+        Approve()
+    ])
+    
+    # A student counts once per session whichever mode recorded the check-in:
+    # local state, an "a" + session_id + student box, or the bitmap of a roster the
+    # student is enrolled in ("e" + session_id + student box). Enrolled students
+    # check in through the roster only.
+    attendance_box_name = Concat(attendance_box_prefix, Txn.application_args[1], Txn.sender())
+    sender_enrollment_box_name = Concat(enrollment_box_prefix, Txn.application_args[1], Txn.sender())
+    # localGetEx reads 0 for students who never opted in
+    local_check_in = App.localGetEx(
+        Txn.sender(), Global.current_application_id(), Concat(checked_in_key, Txn.application_args[1])
+    )
+    attendance_box = App.box_length(attendance_box_name)
+    sender_enrollment = App.box_length(sender_enrollment_box_name)
+    
+    # mark_attendance reads and writes "checked_in_<session_id>"; the optimized build
+    # builds the key once into scratch
+    checked_in_name = ScratchVar(TealType.bytes)
+    
+    def store_checked_in_name():
+        return checked_in_name.store(Concat(checked_in_key, Txn.application_args[1])) if optimized else Seq()
+    
+    def checked_in_session_key():
+        return checked_in_name.load() if optimized else Concat(checked_in_key, Txn.application_args[1])
+    
     # Method: Mark student attendance with wallet-bound QR validation
     # Args: ["mark_attendance", session_id, qr_round, qr_hash]
+    # Boxes (session_id of at most 31 bytes): ["s" + session_id, "a" + session_id + student_address,
+    #        "e" + session_id + student_address]
     # 
     # Security: QR hash must equal SHA256(session_id + qr_round + Txn.sender())
     # This binds the QR to a specific wallet, preventing sharing
     mark_attendance = Seq([
-        # 1. Verify session is active
-        Assert(App.globalGet(is_active_key) == Int(1)),
-        
-        # 2. Verify attendance window hasn't closed (use attendance_end_round, not end_round)
-        Assert(Global.round() <= App.globalGet(attendance_end_round_key)),
-        
-        # 3. Verify session_id matches
-        Assert(Txn.application_args[1] == App.globalGet(session_id_key)),
+        # 1-3. Verify the targeted session exists, is active and its attendance window
+        # (attendance_end_round, not end_round) hasn't closed
+        check_session_open,
         
         # 4. Verify student hasn't already checked in for THIS session (duplicate prevention)
         # Use session-specific key: "checked_in_<session_id>"
-        Assert(App.localGet(Txn.sender(), Concat(checked_in_key, Txn.application_args[1])) == Int(0)),
+        store_checked_in_name(),
+        Assert(App.localGet(Txn.sender(), checked_in_session_key()) == Int(0)),
+        # Nor in box mode, and isn't on the session's roster (box modes need a session_id
+        # that fits in a box name)
+        If(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH).Then(Seq([
+            attendance_box,
+            Assert(Not(attendance_box.hasValue())),
+            sender_enrollment,
+            Assert(Not(sender_enrollment.hasValue())),
+        ])),
         
         # 5. Verify qr_round is 8 bytes (uint64)
         Assert(Len(Txn.application_args[2]) == Int(8)),
@@ -152,25 +360,371 @@ def approval_program():
         
         # 8. Mark attendance in local state with session-specific keys
         # Key format: "checked_in_<session_id>" and "check_in_round_<session_id>"
-        App.localPut(Txn.sender(), Concat(checked_in_key, Txn.application_args[1]), Int(1)),
+        App.localPut(Txn.sender(), checked_in_session_key(), Int(1)),
         App.localPut(Txn.sender(), Concat(check_in_round_key, Txn.application_args[1]), Global.round()),
         
-        # 9. Increment total attendance count
-        App.globalPut(total_attendance_key, App.globalGet(total_attendance_key) + Int(1)),
+        # 9. Increment the session's attendance count
+        count_attendance,
         
         Approve()
     ])
     
-    # Method: Close attendance session
-    close_session = Seq([
+    # Shared QR validation for the box-backed attendance modes
+    # Args: [method, session_id, qr_round, qr_hash]
+    verify_qr_proof = Seq([
+        # 1-3. Verify the targeted session is open and its session_id fits in a box name
+        check_session_open,
+        Assert(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH),
+        
+        # 4. Verify qr_round is 8 bytes (uint64)
+        Assert(Len(Txn.application_args[2]) == Int(8)),
+        
+        # 5. Verify QR is not older than 20 rounds (anti-replay, ~60 seconds)
+        Assert(Global.round() - Btoi(Txn.application_args[2]) <= QR_VALIDITY_ROUNDS),
+        
+        # 6. Verify wallet-bound hash: SHA256(session_id + qr_round + sender_address)
+        Assert(
+            Txn.application_args[3] == Sha256(
+                Concat(
+                    Txn.application_args[1],
+                    Txn.application_args[2],
+                    Txn.sender()
+                )
+            )
+        ),
+    ])
+    
+    # Method: Mark student attendance in box storage (no opt-in required)
+    # Args: ["mark_attendance_box", session_id, qr_round, qr_hash]
+    # Boxes: ["a" + session_id + student_address, "s" + session_id, "e" + session_id + student_address]
+    #
+    # Same QR validation as mark_attendance, but the record lives in a box keyed by
+    # session and student instead of the student's local state.
+    # The app account must hold enough ALGO to cover the box minimum balance.
+    mark_attendance_box = Seq([
+        # 1-6. Session and wallet-bound QR checks
+        verify_qr_proof,
+        
+        # 7. Not checked in with local state, and not on the session's roster
+        local_check_in,
+        Assert(local_check_in.value() == Int(0)),
+        sender_enrollment,
+        Assert(Not(sender_enrollment.hasValue())),
+        
+        # 8. Create the attendance box (fails if it already exists -> duplicate prevention)
+        Assert(App.box_create(attendance_box_name, Int(8))),
+        App.box_put(attendance_box_name, Itob(Global.round())),
+        
+        # 9. Increment the session's attendance count
+        count_attendance,
+        
+        Approve()
+    ])
+    
+    # Method: Create bitmap roster for a session (teacher only)
+    # Args: ["create_roster", session_id, capacity, track_rounds (optional, 8 bytes)]
+    # Boxes: ["n" + session_id, "b" + session_id, "r" + session_id (if track_rounds)]
+    #
+    # The roster record keeps the capacity, the number of slots handed out and whether
+    # round deltas are tracked. The bitmap holds 1 bit per enrollment slot (capacity / 8
+    # bytes, ~100 bytes for 800 students). With track_rounds != 0 a second box stores a
+    # 2-byte check-in round delta per slot, counted from the session's start_round.
+    roster_box_name = Concat(roster_box_prefix, Txn.application_args[1])
+    bitmap_box_name = Concat(bitmap_box_prefix, Txn.application_args[1])
+    rounds_box_name = Concat(rounds_box_prefix, Txn.application_args[1])
+    roster_tracks_rounds = ScratchVar(TealType.uint64)
+    
+    def roster_field(offset):
+        return Btoi(App.box_extract(roster_box_name, offset, Int(8)))
+    
+    create_roster = Seq([
+        Assert(is_authorized_teacher),
+        Assert(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH),
+        Assert(Btoi(Txn.application_args[2]) > Int(0)),
+        roster_tracks_rounds.store(
+            If(Txn.application_args.length() > Int(3))
+            .Then(Btoi(Txn.application_args[3]) != Int(0))
+            .Else(Int(0))
+        ),
+        
+        # Create the roster record (fails if the session already has a roster)
+        Assert(App.box_create(roster_box_name, ROSTER_RECORD_SIZE)),
+        App.box_put(
+            roster_box_name,
+            Concat(Itob(Btoi(Txn.application_args[2])), Itob(Int(0)), Itob(roster_tracks_rounds.load()))
+        ),
+        Assert(App.box_create(bitmap_box_name, (Btoi(Txn.application_args[2]) + Int(7)) / Int(8))),
+        If(roster_tracks_rounds.load())
+        .Then(Assert(App.box_create(rounds_box_name, Btoi(Txn.application_args[2]) * Int(2)))),
+        Approve()
+    ])
+    
+    # Method: Enroll a student in a session's bitmap roster (teacher only)
+    # Args: ["enroll", session_id, student_address]
+    # Boxes: ["n" + session_id, "e" + session_id + student_address]
+    #
+    # Slots are numbered per roster and stay below its capacity. The teacher pays the
+    # enrollment box minimum balance by funding the app account.
+    enrollment_box_name = Concat(enrollment_box_prefix, Txn.application_args[1], Txn.application_args[2])
+    enrolled_count = ScratchVar(TealType.uint64)
+    
+    enroll = Seq([
+        Assert(is_authorized_teacher),
+        Assert(Len(Txn.application_args[2]) == Int(32)),
+        
+        # box_extract fails if the session has no roster
+        enrolled_count.store(roster_field(ROSTER_ENROLLED_COUNT)),
+        Assert(enrolled_count.load() < roster_field(ROSTER_CAPACITY)),
+        
+        # Create the enrollment box (fails if the student is already enrolled)
+        Assert(App.box_create(enrollment_box_name, Int(8))),
+        App.box_put(enrollment_box_name, Itob(enrolled_count.load())),
+        App.box_replace(roster_box_name, ROSTER_ENROLLED_COUNT, Itob(enrolled_count.load() + Int(1))),
+        Approve()
+    ])
+    
+    # Method: Mark attendance as one bit in the session bitmap
+    # Args: ["mark_attendance_bitmap", session_id, qr_round, qr_hash]
+    # Boxes: ["e" + session_id + student_address, "n" + session_id, "b" + session_id, "s" + session_id,
+    #         "a" + session_id + student_address, "r" + session_id (if the roster tracks rounds)]
+    #
+    # Duplicate prevention is a getbit on the student's slot instead of a local state read.
+    slot = ScratchVar(TealType.uint64)
+    slot_byte = ScratchVar(TealType.bytes)
+    enrollment = App.box_get(sender_enrollment_box_name)
+    
+    mark_attendance_bitmap = Seq([
+        # 1-6. Session and wallet-bound QR checks
+        verify_qr_proof,
+        
+        # Not checked in with local state or in box mode before enrolling
+        local_check_in,
+        Assert(local_check_in.value() == Int(0)),
+        attendance_box,
+        Assert(Not(attendance_box.hasValue())),
+        
+        # 7. Look up the student's slot in this session's roster
+        enrollment,
+        Assert(enrollment.hasValue()),
+        slot.store(Btoi(enrollment.value())),
+        # Never read past the bitmap, whatever the box holds
+        Assert(slot.load() < roster_field(ROSTER_CAPACITY)),
+        
+        # 8. Verify the slot's bit is not set yet (duplicate prevention)
+        slot_byte.store(App.box_extract(bitmap_box_name, slot.load() / Int(8), Int(1))),
+        Assert(GetBit(slot_byte.load(), slot.load() % Int(8)) == Int(0)),
+        
+        # 9. Set the bit
+        App.box_replace(bitmap_box_name, slot.load() / Int(8), SetBit(slot_byte.load(), slot.load() % Int(8), Int(1))),
+        
+        # 10. Record the check-in round as a 2-byte delta from start_round if the roster tracks rounds
+        If(roster_field(ROSTER_TRACK_ROUNDS)).Then(Seq([
+            load_session_start_round,
+            Assert(Global.round() - session_start_round.load() <= Int(65535)),
+            App.box_replace(
+                rounds_box_name,
+                slot.load() * Int(2),
+                Extract(Itob(Global.round() - session_start_round.load()), Int(6), Int(2))
+            ),
+        ])),
+        
+        # 11. Increment the session's attendance count
+        count_attendance,
+        
+        Approve()
+    ])
+    
+    close_registered_session = Seq([
+        # Only the teacher who opened the session or the admin can close it
+        Assert(Or(
+            Txn.sender() == App.box_extract(session_box_name, SESSION_TEACHER, Int(32)),
+            Txn.sender() == App.globalGet(creator_key)
+        )),
+        App.box_replace(session_box_name, SESSION_IS_ACTIVE, Itob(Int(0))),
+    ])
+    
+    close_global_session = Seq([
         # Verify caller is an authorized teacher
         Assert(is_authorized_teacher),
         
         # Mark session as inactive
         App.globalPut(is_active_key, Int(0)),
+    ])
+    
+    # Merkle commitment of a session's off-chain collected attendance
+    commitment_box_name = Concat(commitment_box_prefix, Txn.application_args[1])
+    
+    commit_attendance = Seq([
+        # Close whichever session session_id names (same rules as above)
+        If(Txn.application_args[1] == App.globalGet(session_id_key))
+        .Then(close_global_session)
+        .Else(close_registered_session),
+        
+        # Store merkle_root | count once (box_create fails if already committed)
+        Assert(Len(Txn.application_args[2]) == Int(32)),
+        Assert(Len(Txn.application_args[3]) == Int(8)),
+        Assert(App.box_create(commitment_box_name, Int(40))),
+        App.box_put(commitment_box_name, Concat(Txn.application_args[2], Txn.application_args[3])),
+    ])
+    
+    # Method: Close attendance session
+    # Args: ["close_session"] closes the session in global state
+    # Args: ["close_session", session_id] closes a registered session (Boxes: ["s" + session_id])
+    # Args: ["close_session", session_id, merkle_root, count] closes either session and commits
+    #       the attendance collected off-chain (Boxes: ["s" + session_id, "m" + session_id])
+    close_session = If(Txn.application_args.length() > Int(2)).Then(Seq([
+        commit_attendance,
+        Approve()
+    ])).ElseIf(Txn.application_args.length() > Int(1)).Then(Seq([
+        close_registered_session,
+        Approve()
+    ])).Else(Seq([
+        close_global_session,
+        Approve()
+    ]))
+    
+    # Method: Prove a student attended a Merkle-committed session (anyone can call)
+    # Args: ["verify_attendance", session_id, student_address, qr_round, leaf_index, proof]
+    # Boxes: ["m" + session_id]
+    #
+    # proof is the sibling hashes from the leaf up to the root, 32 bytes each.
+    # Each level costs about 65 opcodes, so trees deeper than 8 levels (over 256
+    # attendees) need pool_budget calls in the same group.
+    merkle_node = ScratchVar(TealType.bytes)
+    merkle_index = ScratchVar(TealType.uint64)
+    proof_offset = ScratchVar(TealType.uint64)
+    
+    verify_attendance = Seq([
+        Assert(Len(Txn.application_args[2]) == Int(32)),
+        Assert(Len(Txn.application_args[3]) == Int(8)),
+        Assert(Len(Txn.application_args[5]) % Int(32) == Int(0)),
+        
+        # The leaf must be one of the committed attendees
+        Assert(Btoi(Txn.application_args[4]) < Btoi(App.box_extract(commitment_box_name, Int(32), Int(8)))),
+        
+        merkle_node.store(Sha256(Concat(Bytes("base16", "0x00"), Txn.application_args[2], Txn.application_args[3]))),
+        merkle_index.store(Btoi(Txn.application_args[4])),
+        For(
+            proof_offset.store(Int(0)),
+            proof_offset.load() < Len(Txn.application_args[5]),
+            proof_offset.store(proof_offset.load() + Int(32))
+        ).Do(Seq([
+            # Even index: the node is the left child
+            merkle_node.store(
+                If(merkle_index.load() % Int(2) == Int(0))
+                .Then(Sha256(Concat(
+                    Bytes("base16", "0x01"),
+                    merkle_node.load(),
+                    Extract(Txn.application_args[5], proof_offset.load(), Int(32))
+                )))
+                .Else(Sha256(Concat(
+                    Bytes("base16", "0x01"),
+                    Extract(Txn.application_args[5], proof_offset.load(), Int(32)),
+                    merkle_node.load()
+                )))
+            ),
+            merkle_index.store(merkle_index.load() / Int(2)),
+        ])),
+        
+        # A proof shorter than the tree would leave index bits unused
+        Assert(merkle_index.load() == Int(0)),
+        Assert(merkle_node.load() == App.box_extract(commitment_box_name, Int(0), Int(32))),
         Approve()
     ])
     
+    # Method: Read-only session summary (anyone, meant for simulate)
+    # Args: ["get_session_summary", session_id]
+    # Boxes: ["s" + session_id] for registered sessions
+    #
+    # Logs the session in the registered record layout for both kinds of session:
+    # start_round | end_round | attendance_end_round | is_active | total_attendance | teacher | session_name
+    # (teacher is the creator for the session held in global state)
+    session_record = App.box_get(session_box_name)
+    
+    get_session_summary = Seq([
+        If(Txn.application_args[1] == App.globalGet(session_id_key))
+        .Then(Log(Concat(
+            Itob(App.globalGet(start_round_key)),
+            Itob(App.globalGet(end_round_key)),
+            Itob(App.globalGet(attendance_end_round_key)),
+            Itob(App.globalGet(is_active_key)),
+            Itob(App.globalGet(total_attendance_key)),
+            App.globalGet(creator_key),
+            App.globalGet(session_name_key)
+        )))
+        .Else(Seq([
+            session_record,
+            Assert(session_record.hasValue()),
+            Log(session_record.value()),
+        ])),
+        Approve()
+    ])
+    
+    # Method: Read-only attendance of a list of students (anyone, meant for simulate)
+    # Args: ["get_attendance_bitmap", session_id, addresses (32 bytes each)]
+    #
+    # Logs one bit per address (bit 0 is the high bit of byte 0, as getbit), set when the
+    # student checked in with mark_attendance, mark_attendance_box or mark_attendance_bitmap.
+    # Simulate with allow_unnamed_resources so the accounts and boxes need no references.
+    reader_offset = ScratchVar(TealType.uint64)
+    reader_address = ScratchVar(TealType.bytes)
+    reader_present = ScratchVar(TealType.uint64)
+    reader_bits = ScratchVar(TealType.bytes)
+    reader_bitmap_length = ScratchVar(TealType.uint64)
+    
+    checked_in_local = App.localGetEx(
+        reader_address.load(), Global.current_application_id(), Concat(checked_in_key, Txn.application_args[1])
+    )
+    reader_attendance_box = App.box_length(Concat(attendance_box_prefix, Txn.application_args[1], reader_address.load()))
+    reader_enrollment = App.box_get(Concat(enrollment_box_prefix, Txn.application_args[1], reader_address.load()))
+    reader_bitmap = App.box_length(bitmap_box_name)
+    
+    get_attendance_bitmap = Seq([
+        Assert(Len(Txn.application_args[2]) % Int(32) == Int(0)),
+        reader_bits.store(BytesZero((Len(Txn.application_args[2]) / Int(32) + Int(7)) / Int(8))),
+        # Box names only fit session_ids of up to 31 bytes
+        reader_bitmap_length.store(Int(0)),
+        If(Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH).Then(Seq([
+            reader_bitmap,
+            reader_bitmap_length.store(reader_bitmap.value()),
+        ])),
+        For(
+            reader_offset.store(Int(0)),
+            reader_offset.load() < Len(Txn.application_args[2]),
+            reader_offset.store(reader_offset.load() + Int(32))
+        ).Do(Seq([
+            reader_address.store(Extract(Txn.application_args[2], reader_offset.load(), Int(32))),
+            
+            # Local state mode (account does not need to be opted in)
+            checked_in_local,
+            reader_present.store(checked_in_local.value()),
+            
+            # Box mode
+            If(And(reader_present.load() == Int(0), Len(Txn.application_args[1]) <= MAX_BOX_SESSION_ID_LENGTH))
+            .Then(Seq([reader_attendance_box, reader_present.store(reader_attendance_box.hasValue())])),
+            
+            # Bitmap roster mode: the student's slot bit
+            If(And(reader_present.load() == Int(0), reader_bitmap_length.load() > Int(0))).Then(Seq([
+                reader_enrollment,
+                If(And(
+                    reader_enrollment.hasValue(),
+                    Btoi(reader_enrollment.value()) / Int(8) < reader_bitmap_length.load()
+                )).Then(reader_present.store(GetBit(
+                    App.box_extract(bitmap_box_name, Btoi(reader_enrollment.value()) / Int(8), Int(1)),
+                    Btoi(reader_enrollment.value()) % Int(8)
+                ))),
+            ])),
+            
+            reader_bits.store(SetBit(reader_bits.load(), reader_offset.load() / Int(32), reader_present.load())),
+        ])),
+        Log(reader_bits.load()),
+        Approve()
+    ])
+    
+    # Method: Adds 700 opcodes to the group's pooled budget (anyone can call)
+    # Args: ["pool_budget"]
+    pool_budget = Approve()
+    
     # Method: Add teacher (admin only)
     # Args: ["add_teacher"]
     # Accounts: [teacher_address]
@@ -212,6 +766,33 @@ def approval_program():
         Approve()
     ])
     
+    if optimized:
+        # One OnCompletion check for every NoOp call, then the hot methods first:
+        # mark_attendance runs once per student per lecture, create_session once per
+        # lecture, the rest less often.
+        # UpdateApplication/DeleteApplication match no branch and are rejected.
+        return Cond(
+            [Txn.application_id() == Int(0), on_creation],
+            [Txn.on_completion() == OnComplete.NoOp, Cond(
+                [Txn.application_args[0] == Bytes("mark_attendance"), mark_attendance],
+                [Txn.application_args[0] == Bytes("create_session"), create_session],
+                [Txn.application_args[0] == Bytes("mark_attendance_box"), mark_attendance_box],
+                [Txn.application_args[0] == Bytes("mark_attendance_bitmap"), mark_attendance_bitmap],
+                [Txn.application_args[0] == Bytes("enroll"), enroll],
+                [Txn.application_args[0] == Bytes("open_session"), open_session],
+                [Txn.application_args[0] == Bytes("verify_attendance"), verify_attendance],
+                [Txn.application_args[0] == Bytes("close_session"), close_session],
+                [Txn.application_args[0] == Bytes("create_roster"), create_roster],
+                [Txn.application_args[0] == Bytes("add_teacher"), add_teacher],
+                [Txn.application_args[0] == Bytes("remove_teacher"), remove_teacher],
+                [Txn.application_args[0] == Bytes("get_session_summary"), get_session_summary],
+                [Txn.application_args[0] == Bytes("get_attendance_bitmap"), get_attendance_bitmap],
+                [Txn.application_args[0] == Bytes("pool_budget"), pool_budget],
+            )],
+            [Txn.on_completion() == OnComplete.OptIn, on_opt_in],
+            [Txn.on_completion() == OnComplete.CloseOut, Approve()],
+        )
+    
     # Method router based on application args
     program = Cond(
         [Txn.application_id() == Int(0), on_creation],
@@ -221,9 +802,18 @@ def approval_program():
         [Txn.on_completion() == OnComplete.DeleteApplication, Reject()],
         [Txn.application_args[0] == Bytes("create_session"), create_session],
         [Txn.application_args[0] == Bytes("mark_attendance"), mark_attendance],
+        [Txn.application_args[0] == Bytes("mark_attendance_box"), mark_attendance_box],
+        [Txn.application_args[0] == Bytes("enroll"), enroll],
+        [Txn.application_args[0] == Bytes("create_roster"), create_roster],
+        [Txn.application_args[0] == Bytes("mark_attendance_bitmap"), mark_attendance_bitmap],
         [Txn.application_args[0] == Bytes("close_session"), close_session],
+        [Txn.application_args[0] == Bytes("open_session"), open_session],
+        [Txn.application_args[0] == Bytes("verify_attendance"), verify_attendance],
         [Txn.application_args[0] == Bytes("add_teacher"), add_teacher],
         [Txn.application_args[0] == Bytes("remove_teacher"), remove_teacher],
+        [Txn.application_args[0] == Bytes("get_session_summary"), get_session_summary],
+        [Txn.application_args[0] == Bytes("get_attendance_bitmap"), get_attendance_bitmap],
+        [Txn.application_args[0] == Bytes("pool_budget"), pool_budget],
     )
     
     return program
@@ -237,19 +827,36 @@ def clear_state_program():
     return Approve()
 
 
-def get_approval_program():
-    """Compile and return approval program"""
-    return compileTeal(approval_program(), mode=Mode.Application, version=6)
+def get_approval_program(optimized=False):
+    """
+    Compile and return approval program (TEAL v8 is the first version with box storage)
+    
+    Args:
+        optimized: Compile the optimized build profile (OPTIMIZED_VERSION + OPTIMIZE_OPTIONS)
+    """
+    if optimized:
+        return compileTeal(
+            approval_program(optimized=True),
+            mode=Mode.Application,
+            version=OPTIMIZED_VERSION,
+            optimize=OPTIMIZE_OPTIONS
+        )
+    return compileTeal(approval_program(), mode=Mode.Application, version=TEAL_VERSION)
 
 
-def get_clear_program():
-    """Compile and return clear state program"""
-    return compileTeal(clear_state_program(), mode=Mode.Application, version=6)
+def get_clear_program(optimized=False):
+    """Compile and return clear state program (same version as the approval program)"""
+    if optimized:
+        return compileTeal(clear_state_program(), mode=Mode.Application, version=OPTIMIZED_VERSION)
+    return compileTeal(clear_state_program(), mode=Mode.Application, version=TEAL_VERSION)
 
 
 if __name__ == "__main__":
-    # Compile and print TEAL code
+    import sys
+    
+    # Compile and print TEAL code (pass --optimized for the optimized build profile)
+    optimized = "--optimized" in sys.argv
     print("=== APPROVAL PROGRAM (Multi-Teacher + Anti-Proxy) ===")
-    print(get_approval_program())
+    print(get_approval_program(optimized))
     print("\n=== CLEAR STATE PROGRAM ===")
-    print(get_clear_program())
+    print(get_clear_program(optimized))
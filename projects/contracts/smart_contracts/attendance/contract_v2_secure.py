@@ -11,10 +11,23 @@ SECURITY UPGRADE: Wallet-Bound Dynamic QR Codes
 
 from pyteal import *
 
-def approval_program():
+# Default build profile: TEAL v6, without box storage (boxes need v8)
+TEAL_VERSION = 6
+
+# Optimized build profile: the newest AVM version PyTeal targets, with the scratch slot
+# and frame pointer optimizer enabled (see benchmark_optimized.py)
+OPTIMIZED_VERSION = 10
+OPTIMIZE_OPTIONS = OptimizeOptions(scratch_slots=True, frame_pointers=True)
+
+
+def approval_program(optimized=False):
     """
     Main approval program for attendance contract with anti-proxy security
     
+    Args:
+        optimized: Build the cost-optimized variant. Same rules and state, but NoOp
+            calls are routed after a single OnCompletion check with mark_attendance first.
+    
     Global State Schema (per session):
     - session_id (Bytes): Unique session identifier
     - session_name (Bytes): Human-readable session name
@@ -159,6 +172,23 @@ def approval_program():
         Approve()
     ])
     
+    if optimized:
+        # One OnCompletion check for every NoOp call, then mark_attendance first (it
+        # runs once per student). UpdateApplication/DeleteApplication match no branch
+        # and are rejected.
+        return Cond(
+            [Txn.application_id() == Int(0), on_creation],
+            [Txn.on_completion() == OnComplete.NoOp, Cond(
+                [Txn.application_args[0] == Bytes("mark_attendance"), mark_attendance],
+                [Txn.application_args[0] == Bytes("create_session"), create_session],
+                [Txn.application_args[0] == Bytes("close_session"), close_session],
+                [Txn.application_args[0] == Bytes("add_teacher"), add_teacher],
+                [Txn.application_args[0] == Bytes("remove_teacher"), remove_teacher],
+            )],
+            [Txn.on_completion() == OnComplete.OptIn, on_opt_in],
+            [Txn.on_completion() == OnComplete.CloseOut, Approve()],
+        )
+    
     # Method router
     program = Cond(
         [Txn.application_id() == Int(0), on_creation],
@@ -181,18 +211,36 @@ def clear_state_program():
     return Approve()
 
 
-def get_approval_program():
-    """Compile and return approval program"""
-    return compileTeal(approval_program(), mode=Mode.Application, version=6)
+def get_approval_program(optimized=False):
+    """
+    Compile and return approval program
+    
+    Args:
+        optimized: Compile the optimized build profile (OPTIMIZED_VERSION + OPTIMIZE_OPTIONS)
+    """
+    if optimized:
+        return compileTeal(
+            approval_program(optimized=True),
+            mode=Mode.Application,
+            version=OPTIMIZED_VERSION,
+            optimize=OPTIMIZE_OPTIONS
+        )
+    return compileTeal(approval_program(), mode=Mode.Application, version=TEAL_VERSION)
 
 
-def get_clear_program():
-    """Compile and return clear state program"""
-    return compileTeal(clear_state_program(), mode=Mode.Application, version=6)
+def get_clear_program(optimized=False):
+    """Compile and return clear state program (same version as the approval program)"""
+    if optimized:
+        return compileTeal(clear_state_program(), mode=Mode.Application, version=OPTIMIZED_VERSION)
+    return compileTeal(clear_state_program(), mode=Mode.Application, version=TEAL_VERSION)
 
 
 if __name__ == "__main__":
+    import sys
+    
+    # Pass --optimized for the optimized build profile
+    optimized = "--optimized" in sys.argv
     print("=== APPROVAL PROGRAM (V2 - Anti-Proxy) ===")
-    print(get_approval_program())
+    print(get_approval_program(optimized))
     print("\n=== CLEAR STATE PROGRAM ===")
-    print(get_clear_program())
+    print(get_clear_program(optimized))
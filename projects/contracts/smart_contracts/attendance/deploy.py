@@ -13,25 +13,10 @@ import base64
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from contract import get_approval_program, get_clear_program
+from compile_cache import get_compiled_programs, get_programs
 from deploy_config import AttendanceDeployConfig
 
 
-def compile_contract(algod_client, source_code):
-    """
-    Compile TEAL source code using Algod
-    
-    Args:
-        algod_client: Algod client instance
-        source_code: TEAL source code as string
-    
-    Returns:
-        Compiled program as base64 string
-    """
-    compile_response = algod_client.compile(source_code)
-    return compile_response['result']
-
-
 def main():
     """Main deployment script"""
     
@@ -41,8 +26,8 @@ def main():
     
     # Step 1: Compile contract
     print("\n[1/4] Compiling contract...")
-    approval_teal = get_approval_program()
-    clear_teal = get_clear_program()
+    # Served from .cache/attendance unless contract.py changed
+    get_programs()
     print("✅ Contract compiled successfully")
     
     # Step 2: Connect to network
@@ -101,10 +86,11 @@ def main():
     duration = input("Enter duration in seconds (default 3600): ").strip() or "3600"
     
     try:
-        # Compile programs with Algod
+        # Compile programs with Algod (cached by contract source)
         print("   Compiling TEAL programs...")
-        approval_compiled = compile_contract(algod_client, approval_teal)
-        clear_compiled = compile_contract(algod_client, clear_teal)
+        programs = get_compiled_programs(algod_client)
+        approval_compiled = programs["approval"]["result"]
+        clear_compiled = programs["clear"]["result"]
         
         print("   Submitting deployment transaction...")
         app_id = AttendanceDeployConfig.deploy_contract(
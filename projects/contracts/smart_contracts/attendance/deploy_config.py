@@ -2,11 +2,17 @@
 CampusChain AI - Attendance Contract Deployment Configuration
 """
 
-from algosdk.v2client import algod
 from algosdk import account, mnemonic
 from algosdk.transaction import ApplicationCreateTxn, OnComplete, StateSchema
 import base64
 
+from algod_pool import get_algod_client as get_pooled_algod_client
+from confirmation_tracker import get_confirmation_tracker
+from params_cache import get_params_provider
+
+PROGRAM_PAGE_SIZE = 2048
+MAX_EXTRA_PROGRAM_PAGES = 3
+
 
 class AttendanceDeployConfig:
     """Configuration for deploying attendance contract"""
@@ -18,28 +24,53 @@ class AttendanceDeployConfig:
     )
     
     LOCAL_SCHEMA = StateSchema(
-        num_uints=17,  # is_teacher (1) + up to 16 sessions (checked_in + check_in_round for 8 sessions)
+        num_uints=16,  # the protocol maximum: is_teacher (1) + checked_in and check_in_round for up to 7 sessions
         num_byte_slices=0
     )
     
     @staticmethod
-    def get_algod_client(network="localnet"):
+    def extra_program_pages(approval_program, clear_program):
         """
-        Get Algod client for specified network
+        Extra 2048-byte pages a create needs beyond the first one
+        
+        The approval program alone is over one page once assembled, so every
+        create has to request them. Programs local_avm keeps as TEAL source
+        are not bytecode and need none.
         
         Args:
-            network: "localnet", "testnet", or "mainnet"
+            approval_program: Compiled approval program (bytes)
+            clear_program: Compiled clear program (bytes)
+        
+        Raises:
+            ValueError: If the programs do not fit in the maximum extra pages
         """
-        if network == "localnet":
-            algod_address = "http://localhost:4001"
-            algod_token = "a" * 64
-        elif network == "testnet":
-            algod_address = "https://testnet-api.algonode.cloud"
-            algod_token = ""
-        else:
-            raise ValueError(f"Unsupported network: {network}")
-        
-        return algod.AlgodClient(algod_token, algod_address)
+        if approval_program.startswith(b"#pragma"):
+            return 0
+        pages = max(0, (len(approval_program) + len(clear_program) - 1) // PROGRAM_PAGE_SIZE)
+        if pages > MAX_EXTRA_PROGRAM_PAGES:
+            raise ValueError(f"Programs of {len(approval_program) + len(clear_program)} bytes need more than {MAX_EXTRA_PROGRAM_PAGES} extra pages")
+        return pages
+    
+    @staticmethod
+    def get_algod_client(network="localnet", **options):
+        """
+        Get the shared, connection-pooled Algod client for specified network
+        
+        Args:
+            network: "localnet" or "testnet"
+            **options: pool_size, max_retries, backoff_seconds, timeouts (see algod_pool)
+        """
+        return get_pooled_algod_client(network, **options)
+    
+    @staticmethod
+    def get_params_provider(network="localnet"):
+        """
+        Get the shared suggested params cache for specified network
+        
+        Args:
+            network: "localnet" or "testnet"
+        """
+        return get_params_provider(get_pooled_algod_client(network))
     
     @staticmethod
     def deploy_contract(
@@ -49,7 +80,8 @@ class AttendanceDeployConfig:
         clear_program_compiled,
         session_id,
         session_name,
-        duration_seconds=3600
+        duration_seconds=3600,
+        params_provider=None
     ):
         """
         Deploy attendance contract to Algorand
@@ -62,6 +94,8 @@ class AttendanceDeployConfig:
             session_id: Unique session identifier
             session_name: Human-readable session name
             duration_seconds: Session duration (default 1 hour)
+            params_provider: SuggestedParamsProvider to take params from
+                (default: the shared one for algod_client)
         
         Returns:
             app_id: Application ID of deployed contract
@@ -70,7 +104,7 @@ class AttendanceDeployConfig:
         creator_address = account.address_from_private_key(creator_private_key)
         
         # Get suggested params
-        params = algod_client.suggested_params()
+        params = (params_provider or get_params_provider(algod_client)).get()
         
         # Application arguments for creation
         app_args = [
@@ -79,16 +113,20 @@ class AttendanceDeployConfig:
             duration_seconds.to_bytes(8, 'big')
         ]
         
+        approval_program = base64.b64decode(approval_program_compiled)
+        clear_program = base64.b64decode(clear_program_compiled)
+        
         # Create application transaction
         txn = ApplicationCreateTxn(
             sender=creator_address,
             sp=params,
             on_complete=OnComplete.NoOpOC,
-            approval_program=base64.b64decode(approval_program_compiled),
-            clear_program=base64.b64decode(clear_program_compiled),
+            approval_program=approval_program,
+            clear_program=clear_program,
             global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
             local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
-            app_args=app_args
+            app_args=app_args,
+            extra_pages=AttendanceDeployConfig.extra_program_pages(approval_program, clear_program)
         )
         
         # Sign transaction
@@ -97,9 +135,9 @@ class AttendanceDeployConfig:
         # Submit transaction
         tx_id = algod_client.send_transaction(signed_txn)
         
-        # Wait for confirmation
-        confirmed_txn = algod_client.pending_transaction_info(tx_id)
-        app_id = confirmed_txn.get("application-index")
+        # Wait for confirmation (pending_transaction_info alone has no application-index yet)
+        confirmed_txn = get_confirmation_tracker(algod_client).track(tx_id, txn.last_valid_round).result()
+        app_id = confirmed_txn["application-index"]
         
         print(f"✅ Contract deployed successfully!")
         print(f"📝 Application ID: {app_id}")
@@ -4,17 +4,16 @@ No AlgoKit required - uses pure py-algorand-sdk
 """
 
 from algosdk import account, mnemonic
-from algosdk.v2client import algod
 from algosdk.transaction import ApplicationCreateTxn, OnComplete, StateSchema, wait_for_confirmation
-import base64
 import sys
 import os
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from contract import get_approval_program, get_clear_program
+from compile_cache import get_compiled_programs
 from deploy_config import AttendanceDeployConfig
+from params_cache import get_params_provider
 
 
 def main():
@@ -24,9 +23,8 @@ def main():
     
     # Connect to TestNet
     print("\n[1/6] Connecting to TestNet...")
-    algod_address = "https://testnet-api.algonode.cloud"
-    algod_token = ""
-    algod_client = algod.AlgodClient(algod_token, algod_address)
+    algod_client = AttendanceDeployConfig.get_algod_client("testnet")
+    params_provider = get_params_provider(algod_client)
     
     try:
         status = algod_client.status()
@@ -94,14 +92,10 @@ def main():
     # Compile contract
     print("\n[3/6] Compiling contract...")
     try:
-        approval_teal = get_approval_program()
-        clear_teal = get_clear_program()
-        
-        approval_result = algod_client.compile(approval_teal)
-        clear_result = algod_client.compile(clear_teal)
-        
-        approval_binary = base64.b64decode(approval_result['result'])
-        clear_binary = base64.b64decode(clear_result['result'])
+        # PyTeal output and algod bytecode are cached by contract source
+        programs = get_compiled_programs(algod_client)
+        approval_binary = programs["approval"]["bytecode"]
+        clear_binary = programs["clear"]["bytecode"]
         
         print("✅ Contract compiled successfully")
     except Exception as e:
@@ -118,7 +112,7 @@ def main():
     # Deploy
     print("\n[5/6] Deploying to TestNet...")
     try:
-        params = algod_client.suggested_params()
+        params = params_provider.get()
         
         app_args = [
             session_id.encode(),
@@ -134,7 +128,8 @@ def main():
             clear_program=clear_binary,
             global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
             local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
-            app_args=app_args
+            app_args=app_args,
+            extra_pages=AttendanceDeployConfig.extra_program_pages(approval_binary, clear_binary)
         )
         
         # Sign and send
@@ -161,7 +156,7 @@ def main():
         # Opt-in creator to get teacher privileges
         print("\n[6/6] Opting in creator as teacher...")
         try:
-            params = algod_client.suggested_params()
+            params = params_provider.get()
             
             from algosdk.transaction import ApplicationOptInTxn
             opt_in_txn = ApplicationOptInTxn(
@@ -0,0 +1,1894 @@
+"""
+CampusChain AI - In-Process AVM Harness
+
+Runs the attendance contracts' real PyTeal output against an in-memory
+ledger, so the test suite and the profiling scripts work without LocalNet:
+
+- Ledger evaluates TEAL with the AVM rules the contracts rely on: the
+  opcode subset PyTeal emits, the 700-per-app-call pooled budget, schema
+  limits (including the 16-key local and 64-key global maximums at
+  creation), account/box references with the 8-per-transaction limit,
+  the 1024-bytes-per-box-reference I/O budget, the reference limits
+  simulate's allow-unnamed-resources is held to (per transaction below
+  TEAL v9, pooled over the group from v9, as resource sharing), minimum
+  balances, validity windows, group IDs, duplicate transactions and
+  ed25519 signatures. Each committed group is one block, as in LocalNet
+  dev mode, or with block_seconds every group sent during an interval
+  shares one block, as on a real network.
+- LocalAlgodClient is an algosdk AlgodClient whose algod_request is served
+  by that ledger (like PooledAlgodClient in algod_pool.py), so everything
+  written against algod - wait_for_confirmation, simulate, box reads, the
+  confirmation tracker, the indexer's msgpack blocks - runs unchanged.
+
+"Compiling" keeps the TEAL source as the program bytes (there is no TEAL
+assembler outside algod); the pc of simulate traces and source maps is the
+opcode index. Programs compiled by a real algod cannot be run here, and
+program sizes are not checked against the 2048-byte pages (TEAL source is
+far longer than its bytecode): only the extra pages requested are, and
+they count towards the creator's minimum balance.
+
+Usage:
+    from local_avm import LocalAlgodClient
+
+    algod_client = LocalAlgodClient()  # LocalNet dispenser is pre-funded
+    programs = get_compiled_programs(algod_client)
+"""
+
+import base64
+import copy
+import hashlib
+import re
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import msgpack
+from algosdk import account, encoding, error, logic, mnemonic
+from algosdk.transaction import (
+    LogicSigTransaction,
+    MultisigTransaction,
+    SignedTransaction,
+    calculate_group_id,
+)
+from algosdk.v2client.algod import AlgodClient
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+APP_CALL_BUDGET = 700
+MIN_BALANCE = 100_000
+MIN_TXN_FEE = 1_000
+MAX_TXN_LIFE = 1000
+MAX_GROUP_SIZE = 16
+MAX_TXN_REFERENCES = 8  # accounts + foreign apps + foreign assets + boxes
+MAX_TXN_ACCOUNTS = 4
+BOX_IO_BUDGET = 1024  # bytes of box I/O each box reference adds to the group
+MAX_LOCAL_SCHEMA_ENTRIES = 16
+MAX_GLOBAL_SCHEMA_ENTRIES = 64
+MAX_EXTRA_PROGRAM_PAGES = 3
+START_ROUND = 1000
+START_TIMESTAMP = 1_700_000_000
+ROUND_SECONDS = 3
+GENESIS_ID = "local-avm-v1"
+GENESIS_HASH = base64.b64encode(hashlib.sha256(GENESIS_ID.encode()).digest()).decode()
+
+# Same account LocalNet funds, so scripts written for LocalNet work unchanged
+LOCALNET_DISPENSER_MNEMONIC = "auction inquiry lava second expand liberty glass involve ginger illness length room item discover ahead table doctor term tackle cement bonus profit right above catch"
+DISPENSER_BALANCE = 10**15
+
+# status_after_block returns after this long even if no block was added
+STATUS_WAIT_SECONDS = 2
+
+ON_COMPLETE = {
+    "NoOp": 0,
+    "OptIn": 1,
+    "CloseOut": 2,
+    "ClearState": 3,
+    "UpdateApplication": 4,
+    "DeleteApplication": 5,
+}
+
+TXN_TYPES = {"unknown": 0, "pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6}
+
+NAMED_INTS = dict(ON_COMPLETE, **TXN_TYPES)
+
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+}
+
+
+class LogicError(Exception):
+    """Raised when a program fails (assert, err, invalid access, budget...)"""
+
+    def __init__(self, message, line=None, source=None):
+        location = f" (line {line}: {source})" if line is not None else ""
+        super().__init__(f"logic eval error: {message}{location}")
+        self.reason = message
+        self.line = line
+        self.source = source
+
+
+class TransactionRejected(Exception):
+    """Raised when a transaction group is rejected by the ledger"""
+
+
+def _reference_count(txn):
+    """References an app call names: accounts, foreign apps, foreign assets and boxes"""
+    return sum(len(refs or []) for refs in (txn.accounts, txn.foreign_apps, txn.foreign_assets, txn.boxes))
+
+
+def _parse_bytes(tokens):
+    """Parse a TEAL byte literal from its tokens"""
+    literal = " ".join(tokens)
+    if literal.startswith('"'):
+        return _parse_string(literal)
+    if literal.startswith("0x"):
+        return bytes.fromhex(literal[2:])
+    for prefix in ("base64 ", "b64 "):
+        if literal.startswith(prefix):
+            return base64.b64decode(literal[len(prefix):])
+    for prefix in ("base64(", "b64("):
+        if literal.startswith(prefix):
+            return base64.b64decode(literal[len(prefix):-1])
+    for prefix in ("base32 ", "b32 "):
+        if literal.startswith(prefix):
+            value = literal[len(prefix):]
+            return base64.b32decode(value + "=" * (-len(value) % 8))
+    raise ValueError(f"Unsupported byte literal: {literal}")
+
+
+def _parse_string(literal):
+    """Decode a double-quoted TEAL string literal"""
+    body = literal[1:literal.rindex('"')]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\":
+            nxt = body[i + 1]
+            if nxt == "x":
+                out.append(int(body[i + 2:i + 4], 16))
+                i += 4
+                continue
+            out += {"n": b"\n", "r": b"\r", "t": b"\t", "\\": b"\\", '"': b'"'}[nxt]
+            i += 2
+            continue
+        out += char.encode()
+        i += 1
+    return bytes(out)
+
+
+def _tokenize(line):
+    """Split a TEAL line into tokens, keeping quoted strings intact and dropping comments"""
+    tokens = []
+    current = ""
+    in_string = False
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_string:
+            current += char
+            if char == "\\":
+                current += line[i + 1]
+                i += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            current += char
+        elif line.startswith("//", i):
+            break
+        elif char.isspace():
+            if current:
+                tokens.append(current)
+                current = ""
+        else:
+            current += char
+        i += 1
+    if current:
+        tokens.append(current)
+    return tokens
+
+
+class Program:
+    """Parsed TEAL program: list of (opcode, immediates, source line number)"""
+
+    def __init__(self, teal):
+        if isinstance(teal, bytes):
+            if not teal.startswith(b"#pragma"):
+                raise ValueError("program is not TEAL source; compile it with LocalAlgodClient.compile")
+            teal = teal.decode()
+        self.source = teal
+        self.lines = teal.splitlines()
+        self.version = 1
+        self.ops = []
+        self.labels = {}
+        for number, raw in enumerate(self.lines, start=1):
+            tokens = _tokenize(raw)
+            if not tokens:
+                continue
+            if tokens[0] == "#pragma":
+                if tokens[1] == "version":
+                    self.version = int(tokens[2])
+                continue
+            if tokens[0].endswith(":") and len(tokens) == 1:
+                self.labels[tokens[0][:-1]] = len(self.ops)
+                continue
+            self.ops.append((tokens[0], tokens[1:], number))
+
+    def source_line(self, number):
+        return self.lines[number - 1].strip()
+
+
+class AppState:
+    """On-ledger state of one application"""
+
+    def __init__(self, app_id, creator, approval, clear, global_schema, local_schema, extra_pages=0):
+        self.app_id = app_id
+        self.creator = creator
+        self.approval = approval
+        self.clear = clear
+        self.global_schema = global_schema
+        self.local_schema = local_schema
+        self.extra_pages = extra_pages
+        self.global_state = {}
+        self.local_state = {}
+        self.boxes = {}
+
+    @property
+    def address(self):
+        return logic.get_application_address(self.app_id)
+
+    def fork(self):
+        """Copy to evaluate a group on; an account's local state is copied on its first write"""
+        fork = copy.copy(self)
+        fork.global_state = dict(self.global_state)
+        fork.local_state = dict(self.local_state)
+        fork.boxes = dict(self.boxes)
+        fork._copied = set()
+        return fork
+
+    def writable_local_state(self, address):
+        copied = getattr(self, "_copied", None)
+        if copied is None:
+            return self.local_state[address]
+        if address not in copied:
+            self.local_state[address] = dict(self.local_state[address])
+            copied.add(address)
+        return self.local_state[address]
+
+
+
+
+class Ledger:
+    """
+    In-memory ledger: balances, applications, boxes, blocks and the current round
+
+    send() commits every group as its own block, as in LocalNet dev mode;
+    next_block()/apply()/commit() build blocks holding many groups, and
+    advance_rounds adds empty blocks.
+    """
+
+    def __init__(self, start_round=START_ROUND, genesis_id=GENESIS_ID, genesis_hash=GENESIS_HASH):
+        self.round = start_round
+        self.timestamp = START_TIMESTAMP
+        self.genesis_id = genesis_id
+        self.genesis_hash = genesis_hash
+        self.balances = {}
+        self.apps = {}
+        self.next_app_id = 1001
+        self.blocks = {}  # round -> block transaction entries
+        self.confirmed = {}  # tx_id -> (signed transaction, result)
+        self.unnamed_resources = False
+
+    # ---------------------------- accounts ---------------------------- #
+
+    def fund(self, address, amount):
+        self.balances[address] = self.balances.get(address, 0) + amount
+
+    def balance(self, address):
+        return self.balances.get(address, 0)
+
+    def min_balance(self, address):
+        total = MIN_BALANCE
+        for app in self.apps.values():
+            if address in app.local_state:
+                uints, byte_slices = app.local_schema
+                total += MIN_BALANCE + 28_500 * uints + 50_000 * byte_slices
+            if app.creator == address:
+                uints, byte_slices = app.global_schema
+                total += MIN_BALANCE * (1 + app.extra_pages) + 28_500 * uints + 50_000 * byte_slices
+            if app.address == address:
+                total += sum(2_500 + 400 * (len(name) + len(value)) for name, value in app.boxes.items())
+        return total
+
+    def advance_rounds(self, count=1):
+        """Add empty blocks"""
+        self.round += count
+        self.timestamp += ROUND_SECONDS * count
+
+    # ---------------------------- snapshots --------------------------- #
+
+    def snapshot(self):
+        """
+        Return an opaque copy of the balances and applications
+
+        Committed state is never changed in place (groups are evaluated on forks),
+        so this is as cheap as evaluating a group.
+        """
+        return {
+            "balances": dict(self.balances),
+            "apps": {app_id: app.fork() for app_id, app in self.apps.items()},
+        }
+
+    def restore(self, snapshot):
+        """
+        Restore the balances and applications of a snapshot() (it can be restored again)
+
+        The round, timestamp, blocks, confirmed transactions and the next app ID
+        keep moving forward, so clients following this ledger (confirmation
+        trackers, cached suggested params) stay valid.
+        """
+        self.balances = dict(snapshot["balances"])
+        self.apps = {app_id: app.fork() for app_id, app in snapshot["apps"].items()}
+
+    # ------------------------- global/local --------------------------- #
+
+    def global_state(self, app_id):
+        return dict(self.apps[app_id].global_state)
+
+    def local_state(self, app_id, address):
+        return dict(self.apps[app_id].local_state[address])
+
+    def boxes(self, app_id):
+        return dict(self.apps[app_id].boxes)
+
+    # ---------------------------- execution --------------------------- #
+
+    def send(self, txns, simulate=False, trace=False, unnamed_resources=False, extra_budget=0, require_signatures=False):
+        """
+        Execute a transaction or atomic group in the next round
+
+        Args:
+            txns: A transaction or a list forming an atomic group; signed
+                  transactions have their signatures verified
+            simulate: Evaluate and return results without committing state
+            trace: Record (pc, line, opcode, cost) for every executed opcode
+            unnamed_resources: Allow accounts and boxes missing from the references
+            extra_budget: Opcode budget added to the group (simulate's extra-opcode-budget)
+            require_signatures: Reject transactions that are not signed
+
+        Returns:
+            List of per-transaction result dicts (tx-id, application-index, logs, cost, trace)
+
+        Raises:
+            TransactionRejected: If the group is invalid or any program fails
+        """
+        block = self.next_block()
+        results = block.apply(txns, trace, unnamed_resources, extra_budget, require_signatures)
+        if not simulate:
+            self.commit(block)
+        return results
+
+    def next_block(self):
+        """
+        Start building the block of the next round
+
+        Groups added to it with apply() only become part of this ledger with commit().
+        """
+        block = self._fork()
+        block.round += 1
+        block.pending = []
+        block.pending_txns = {}  # tx_id -> signed transaction
+        return block
+
+    def apply(self, txns, trace=False, unnamed_resources=False, extra_budget=0, require_signatures=False):
+        """
+        Evaluate a group into a block from next_block(); a failing group changes nothing
+
+        Same arguments, result and errors as send()
+        """
+        signed = list(txns) if isinstance(txns, (list, tuple)) else [txns]
+        txns = [getattr(stxn, "transaction", stxn) for stxn in signed]
+        self._check_group(signed, txns, require_signatures)
+
+        working = self._fork()
+        working.unnamed_resources = unnamed_resources
+
+        app_calls = [txn for txn in txns if txn.type == "appl"]
+        budget = {
+            "remaining": APP_CALL_BUDGET * len(app_calls) + extra_budget,
+            # Box I/O, pooled across the group
+            "box_refs": sum(len(txn.boxes or []) for txn in app_calls),
+            "box_io": {},  # (app ID, box name) -> bytes charged
+            # Reference slots each transaction leaves free for unnamed resources
+            "free_refs": [MAX_TXN_REFERENCES - _reference_count(txn) if txn.type == "appl" else 0 for txn in txns],
+            "free_accounts": [MAX_TXN_ACCOUNTS - len(txn.accounts or []) if txn.type == "appl" else 0 for txn in txns],
+            "unnamed": set(),
+        }
+        if sum(txn.fee for txn in txns) < MIN_TXN_FEE * len(txns):
+            raise TransactionRejected(f"txgroup had {sum(txn.fee for txn in txns)} in fees, which is less than the minimum {MIN_TXN_FEE * len(txns)}")
+
+        results = []
+        for index, txn in enumerate(txns):
+            if working.balance(txn.sender) < txn.fee:
+                raise TransactionRejected(f"transaction {index}: overspend (fee) for {txn.sender}")
+            working.balances[txn.sender] -= txn.fee
+            if txn.type == "pay":
+                result = working._apply_payment(txn, index)
+            elif txn.type == "appl":
+                result = working._apply_app_call(txns, index, budget, trace)
+            else:
+                raise TransactionRejected(f"transaction {index}: unsupported type {txn.type}")
+            result["tx-id"] = txn.get_txid()
+            results.append(result)
+
+        for txn in txns:
+            if working.balance(txn.sender) < working.min_balance(txn.sender):
+                raise TransactionRejected(f"account {txn.sender} balance below min {working.min_balance(txn.sender)}")
+        for app in working.apps.values():
+            if app.boxes and working.balance(app.address) < working.min_balance(app.address):
+                raise TransactionRejected(
+                    f"app {app.app_id} balance {working.balance(app.address)} below min {working.min_balance(app.address)}"
+                )
+
+        working.unnamed_resources = False
+        self.__dict__.update(working.__dict__)
+        self.pending.append((signed, results))
+        self.pending_txns.update((result["tx-id"], stxn) for stxn, result in zip(signed, results))
+        return results
+
+    def commit(self, block):
+        """Make a block from next_block() (and its groups) the latest round"""
+        for signed, results in block.pending:
+            block._record_block(signed, results)
+        del block.pending, block.pending_txns
+        block.blocks.setdefault(block.round, [])
+        block.timestamp += ROUND_SECONDS
+        self.__dict__.update(block.__dict__)
+
+    def _fork(self):
+        """Copy of the mutable state to evaluate a group on; parsed programs and history are shared"""
+        fork = copy.copy(self)
+        fork.balances = dict(self.balances)
+        fork.apps = {app_id: app.fork() for app_id, app in self.apps.items()}
+        return fork
+
+    def _check_group(self, signed, txns, require_signatures):
+        if not 1 <= len(txns) <= MAX_GROUP_SIZE:
+            raise TransactionRejected(f"group size {len(txns)} is not between 1 and {MAX_GROUP_SIZE}")
+        if len(txns) > 1 or txns[0].group:
+            ungrouped = []
+            for txn in txns:
+                txn = copy.copy(txn)
+                txn.group = None
+                ungrouped.append(txn)
+            group_id = calculate_group_id(ungrouped)
+            if any(txn.group != group_id for txn in txns):
+                raise TransactionRejected("transaction group ID does not match its members")
+
+        for index, txn in enumerate(txns):
+            if txn.type == "appl":
+                self._check_app_call(txn, index)
+
+        for index, (stxn, txn) in enumerate(zip(signed, txns)):
+            tx_id = txn.get_txid()
+            if txn.genesis_hash and txn.genesis_hash != self.genesis_hash:
+                raise TransactionRejected(f"transaction {index}: genesis hash mismatch")
+            if not txn.first_valid_round <= self.round <= txn.last_valid_round:
+                raise TransactionRejected(
+                    f"transaction {index}: txn dead: round {self.round} outside of {txn.first_valid_round}--{txn.last_valid_round}"
+                )
+            if tx_id in self.confirmed or tx_id in self.pending_txns:
+                raise TransactionRejected(f"transaction {index}: transaction already in ledger: {tx_id}")
+            if isinstance(stxn, (LogicSigTransaction, MultisigTransaction)):
+                raise TransactionRejected(f"transaction {index}: only single-signature transactions are supported")
+            signature = getattr(stxn, "signature", None)
+            if signature is None:
+                if require_signatures:
+                    raise TransactionRejected(f"transaction {index}: signedtxn has no sig")
+                continue
+            signer = stxn.authorizing_address or txn.sender
+            message = b"TX" + base64.b64decode(encoding.msgpack_encode(txn))
+            try:
+                VerifyKey(encoding.decode_address(signer)).verify(message, base64.b64decode(signature))
+            except BadSignatureError:
+                raise TransactionRejected(f"transaction {index}: invalid signature for {signer}") from None
+
+    def _check_app_call(self, txn, index):
+        """Reject app calls whose references, schemas or program pages are over the protocol limits"""
+        if len(txn.accounts or []) > MAX_TXN_ACCOUNTS:
+            raise TransactionRejected(f"transaction {index}: tx.Accounts too long, max number of accounts is {MAX_TXN_ACCOUNTS}")
+        if _reference_count(txn) > MAX_TXN_REFERENCES:
+            raise TransactionRejected(
+                f"transaction {index}: tx references exceed MaxAppTotalTxnReferences = {MAX_TXN_REFERENCES}"
+            )
+        for box in txn.boxes or []:
+            if box.app_index > len(txn.foreign_apps or []):
+                raise TransactionRejected(f"transaction {index}: tx.Boxes[{box.app_index}] has invalid app index")
+        if txn.index != 0:
+            return
+        for schema, maximum, kind in (
+            (txn.local_schema, MAX_LOCAL_SCHEMA_ENTRIES, "LocalStateSchema"),
+            (txn.global_schema, MAX_GLOBAL_SCHEMA_ENTRIES, "GlobalStateSchema"),
+        ):
+            if schema and schema.num_uints + schema.num_byte_slices > maximum:
+                raise TransactionRejected(f"transaction {index}: tx.{kind} too large, max number of keys is {maximum}")
+        if not 0 <= (txn.extra_pages or 0) <= MAX_EXTRA_PROGRAM_PAGES:
+            raise TransactionRejected(
+                f"transaction {index}: tx.ExtraProgramPages exceeds MaxExtraAppProgramPages = {MAX_EXTRA_PROGRAM_PAGES}"
+            )
+
+    def _record_block(self, signed, results):
+        """Append the committed group to the block of the current round"""
+        entries = self.blocks.setdefault(self.round, [])
+        for stxn, result in zip(signed, results):
+            fields = stxn.dictify() if isinstance(stxn, SignedTransaction) else {"txn": stxn.dictify()}
+            entry = dict(fields)
+            txn_fields = dict(fields["txn"])
+            # Blocks drop the genesis hash and flag the genesis ID, see confirmation_tracker.transaction_id
+            txn_fields.pop("gh", None)
+            if txn_fields.pop("gen", None) is not None:
+                entry["hgi"] = True
+            entry["txn"] = txn_fields
+            if result.get("created"):
+                entry["apid"] = result["application-index"]
+            if result.get("logs"):
+                entry["dt"] = {"lg": result["logs"]}
+            entries.append(entry)
+            result["confirmed-round"] = self.round
+            self.confirmed[result["tx-id"]] = (stxn, result)
+
+    def _apply_payment(self, txn, index):
+        if self.balance(txn.sender) < txn.amt:
+            raise TransactionRejected(f"transaction {index}: overspend for {txn.sender}")
+        self.balances[txn.sender] -= txn.amt
+        self.fund(txn.receiver, txn.amt)
+        if txn.close_remainder_to:
+            self.fund(txn.close_remainder_to, self.balances.pop(txn.sender))
+        return {"txn-index": index}
+
+    def _program(self, program, index):
+        try:
+            return Program(program)
+        except ValueError as e:
+            raise TransactionRejected(f"transaction {index}: {e}") from None
+
+    def _apply_app_call(self, group, index, budget, trace):
+        txn = group[index]
+        on_complete = int(txn.on_complete)
+
+        created = txn.index == 0
+        if created:
+            app_id = self.next_app_id
+            self.next_app_id += 1
+            app = AppState(
+                app_id,
+                txn.sender,
+                self._program(txn.approval_program, index),
+                self._program(txn.clear_program, index),
+                (txn.global_schema.num_uints, txn.global_schema.num_byte_slices) if txn.global_schema else (0, 0),
+                (txn.local_schema.num_uints, txn.local_schema.num_byte_slices) if txn.local_schema else (0, 0),
+                txn.extra_pages or 0,
+            )
+            self.apps[app_id] = app
+        else:
+            app_id = txn.index
+            if app_id not in self.apps:
+                raise TransactionRejected(f"transaction {index}: application {app_id} does not exist")
+            app = self.apps[app_id]
+
+        if on_complete == ON_COMPLETE["OptIn"]:
+            if txn.sender in app.local_state:
+                raise TransactionRejected(f"transaction {index}: account {txn.sender} has already opted in to app {app_id}")
+            app.local_state[txn.sender] = {}
+        elif on_complete in (ON_COMPLETE["CloseOut"], ON_COMPLETE["ClearState"]) and txn.sender not in app.local_state:
+            raise TransactionRejected(f"transaction {index}: account {txn.sender} is not opted in to app {app_id}")
+
+        program = app.clear if on_complete == ON_COMPLETE["ClearState"] else app.approval
+        evaluator = Evaluator(self, app, group, index, budget, trace)
+        try:
+            approved = evaluator.run(program)
+        except LogicError as e:
+            if on_complete != ON_COMPLETE["ClearState"]:
+                raise TransactionRejected(f"transaction {index}: {e}") from e
+            approved = True
+        if not approved and on_complete != ON_COMPLETE["ClearState"]:
+            raise TransactionRejected(f"transaction {index}: rejected by ApprovalProgram")
+
+        if on_complete in (ON_COMPLETE["CloseOut"], ON_COMPLETE["ClearState"]):
+            app.local_state.pop(txn.sender, None)
+        elif on_complete == ON_COMPLETE["UpdateApplication"]:
+            app.approval = self._program(txn.approval_program, index)
+            app.clear = self._program(txn.clear_program, index)
+        elif on_complete == ON_COMPLETE["DeleteApplication"]:
+            del self.apps[app_id]
+
+        return {
+            "txn-index": index,
+            "application-index": app_id,
+            "created": created,
+            "logs": evaluator.logs,
+            "cost": evaluator.cost,
+            "trace": evaluator.trace,
+        }
+
+
+class Evaluator:
+    """Executes one program for one application call"""
+
+    def __init__(self, ledger, app, group, index, budget, trace=False):
+        self.ledger = ledger
+        self.app = app
+        self.group = group
+        self.index = index
+        self.txn = group[index]
+        self.budget = budget
+        self.stack = []
+        self.scratch = [0] * 256
+        self.frames = []
+        self.logs = []
+        self.cost = 0
+        self.trace = [] if trace else None
+        self.intc = []
+        self.bytec = []
+
+    # ------------------------------ helpers --------------------------- #
+
+    def fail(self, message):
+        raise LogicError(message, self.line, self.program.source_line(self.line))
+
+    def pop(self):
+        if not self.stack:
+            self.fail("stack underflow")
+        return self.stack.pop()
+
+    def pop_int(self):
+        value = self.pop()
+        if not isinstance(value, int):
+            self.fail("expected uint64, got bytes")
+        return value
+
+    def pop_bytes(self):
+        value = self.pop()
+        if not isinstance(value, bytes):
+            self.fail("expected bytes, got uint64")
+        return value
+
+    def push(self, value):
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, int) and not 0 <= value < 2**64:
+            self.fail("uint64 overflow/underflow")
+        if isinstance(value, bytes) and len(value) > 4096:
+            self.fail("byte array longer than 4096")
+        if len(self.stack) >= 1000:
+            self.fail("stack overflow")
+        self.stack.append(value)
+
+    def account(self, ref):
+        """Resolve an account reference (index into Txn.accounts or 32-byte address)"""
+        if isinstance(ref, int):
+            if ref == 0:
+                return self.txn.sender
+            accounts = self.txn.accounts or []
+            if ref > len(accounts):
+                self.fail(f"invalid Account reference {ref}")
+            return accounts[ref - 1]
+        if len(ref) != 32:
+            self.fail("invalid address length")
+        address = encoding.encode_address(ref)
+        available = {self.txn.sender, *(self.txn.accounts or []), self.app.address}
+        if self.program.version >= 9:
+            # Resource sharing: the accounts of every transaction in the group
+            for txn in self.group:
+                available |= {txn.sender, *(getattr(txn, "accounts", None) or [])}
+        if address not in available and self.program.version >= 4:
+            if not self.ledger.unnamed_resources:
+                self.fail(f"invalid Account reference {address}")
+            # Below v9 the account needs a reference in this transaction itself
+            owner = self.index if self.program.version < 9 else None
+            self.use_unnamed(("account", owner, address))
+        return address
+
+    def local_state(self, ref, writable=False):
+        address = self.account(ref)
+        if address not in self.app.local_state:
+            self.fail(f"account {address} is not opted in to app {self.app.app_id}")
+        return self.app.writable_local_state(address) if writable else self.app.local_state[address]
+
+    def check_box_ref(self, name, size=0):
+        """
+        Check the group references this app's box and charge it to the box I/O budget
+
+        Every box the group touches counts once, at the largest size it was
+        read or written at (size: the size an operation is about to give it),
+        against BOX_IO_BUDGET bytes per box reference in the group.
+        """
+        if not 1 <= len(name) <= 64:
+            self.fail("box names must be 1-64 bytes")
+        refs = set()
+        for txn in self.group:
+            for box in getattr(txn, "boxes", None) or []:
+                # app_index is 0 for the called app, otherwise 1 + an index into foreign_apps
+                box_app = txn.index if box.app_index == 0 else txn.foreign_apps[box.app_index - 1]
+                if box_app in (0, self.app.app_id):
+                    refs.add(bytes(box.name))
+        if name not in refs:
+            if not self.ledger.unnamed_resources:
+                self.fail(f"invalid Box reference {name!r}")
+            self.use_unnamed(("box", self.app.app_id, name))
+        key = (self.app.app_id, name)
+        size = max(size, len(self.app.boxes.get(name, b"")))
+        if size > self.budget["box_io"].get(key, 0):
+            self.budget["box_io"][key] = size
+            self.check_references()
+
+    def use_unnamed(self, resource):
+        """Record an account or box the group did not reference (simulate's allow-unnamed-resources)"""
+        if resource not in self.budget["unnamed"]:
+            self.budget["unnamed"].add(resource)
+            self.check_references()
+
+    def check_references(self):
+        """
+        Hold the group to its box I/O budget and, with unnamed resources, to the reference limits
+
+        Simulate only allows unnamed resources that could have been named: each
+        takes one of the reference slots the group's app calls left free (an
+        account also one of their free account slots), and box I/O beyond the
+        budget of the referenced boxes takes one more slot per BOX_IO_BUDGET bytes.
+        Boxes are shared by the group in every version, accounts only from v9:
+        below that an account must fit in the slots of the transaction using it.
+        """
+        budget = self.budget
+        unnamed = budget["unnamed"]
+        unnamed_boxes = sum(1 for resource in unnamed if resource[0] == "box")
+        unnamed_accounts = len(unnamed) - unnamed_boxes
+        quota = BOX_IO_BUDGET * (budget["box_refs"] + unnamed_boxes)
+        shortfall = max(0, sum(budget["box_io"].values()) - quota)
+        if not self.ledger.unnamed_resources:
+            if shortfall:
+                self.fail(f"box I/O budget ({quota} bytes) exceeded")
+            return
+        own_accounts = Counter(resource[1] for resource in unnamed if resource[0] == "account" and resource[1] is not None)
+        for index, count in own_accounts.items():
+            if count > min(budget["free_accounts"][index], budget["free_refs"][index]):
+                self.fail(f"unnamed resources exceed the reference limits of transaction {index}")
+        extra_box_refs = -(-shortfall // BOX_IO_BUDGET)
+        if unnamed_accounts > sum(budget["free_accounts"]) or len(unnamed) + extra_box_refs > sum(budget["free_refs"]):
+            self.fail("unnamed resources exceed the group's pooled reference limits")
+
+    def check_schema(self, state, schema, kind):
+        uints = sum(1 for value in state.values() if isinstance(value, int))
+        byte_slices = len(state) - uints
+        if uints > schema[0] or byte_slices > schema[1]:
+            self.fail(f"store {kind} count exceeds schema ({uints} uints/{byte_slices} bytes)")
+
+    def txn_field(self, txn, field, index=None):
+        if field == "Sender":
+            return encoding.decode_address(txn.sender)
+        if field == "Fee":
+            return txn.fee
+        if field == "FirstValid":
+            return txn.first_valid_round
+        if field == "LastValid":
+            return txn.last_valid_round
+        if field == "Note":
+            return txn.note or b""
+        if field == "Lease":
+            return txn.lease or bytes(32)
+        if field == "RekeyTo":
+            return encoding.decode_address(txn.rekey_to) if txn.rekey_to else bytes(32)
+        if field == "Type":
+            return txn.type.encode()
+        if field == "TypeEnum":
+            return TXN_TYPES[txn.type]
+        if field == "GroupIndex":
+            return self.group.index(txn)
+        if field == "TxID":
+            return encoding.base64.b32decode(txn.get_txid() + "====")
+        if field == "Receiver":
+            return encoding.decode_address(txn.receiver)
+        if field == "Amount":
+            return txn.amt
+        if field == "CloseRemainderTo":
+            return encoding.decode_address(txn.close_remainder_to) if txn.close_remainder_to else bytes(32)
+        if field == "ApplicationID":
+            return txn.index
+        if field == "OnCompletion":
+            return int(txn.on_complete)
+        if field == "ApplicationArgs":
+            args = txn.app_args or []
+            if index >= len(args):
+                self.fail(f"invalid ApplicationArgs index {index}")
+            return bytes(args[index])
+        if field == "NumAppArgs":
+            return len(txn.app_args or [])
+        if field == "Accounts":
+            accounts = [txn.sender] + list(txn.accounts or [])
+            if index >= len(accounts):
+                self.fail(f"invalid Accounts index {index}")
+            return encoding.decode_address(accounts[index])
+        if field == "NumAccounts":
+            return len(txn.accounts or [])
+        if field == "Applications":
+            apps = [txn.index] + list(txn.foreign_apps or [])
+            if index >= len(apps):
+                self.fail(f"invalid Applications index {index}")
+            return apps[index]
+        if field == "NumApplications":
+            return len(txn.foreign_apps or [])
+        if field == "NumAssets":
+            return len(txn.foreign_assets or [])
+        if field == "NumBoxes":
+            return len(txn.boxes or [])
+        self.fail(f"unsupported txn field {field}")
+
+    def global_field(self, field):
+        if field == "MinTxnFee":
+            return MIN_TXN_FEE
+        if field == "MinBalance":
+            return MIN_BALANCE
+        if field == "MaxTxnLife":
+            return 1000
+        if field == "ZeroAddress":
+            return bytes(32)
+        if field == "GroupSize":
+            return len(self.group)
+        if field == "Round":
+            return self.ledger.round
+        if field == "LatestTimestamp":
+            return self.ledger.timestamp
+        if field == "CurrentApplicationID":
+            return self.app.app_id
+        if field == "CreatorAddress":
+            return encoding.decode_address(self.app.creator)
+        if field == "CurrentApplicationAddress":
+            return encoding.decode_address(self.app.address)
+        if field == "OpcodeBudget":
+            return self.budget["remaining"]
+        if field == "CallerApplicationID":
+            return 0
+        self.fail(f"unsupported global field {field}")
+
+    # ------------------------------ execution ------------------------- #
+
+    def run(self, program):
+        """Run the program, returning True if it approved"""
+        self.program = program
+        self.line = None
+        pc = 0
+        ops = program.ops
+        while pc < len(ops):
+            opcode, args, self.line = ops[pc]
+            self.pc = pc
+            cost = OPCODE_COSTS.get(opcode, 1)
+            self.budget["remaining"] -= cost
+            self.cost += cost
+            if self.budget["remaining"] < 0:
+                self.fail("dynamic cost budget exceeded")
+            if self.trace is not None:
+                self.trace.append((pc, self.line, opcode, cost))
+            handler = getattr(self, "op_" + _OP_NAMES.get(opcode, opcode), None)
+            if handler is None:
+                self.fail(f"unsupported opcode {opcode}")
+            jump = handler(args)
+            if jump is _RETURN:
+                break
+            pc = jump if jump is not None else pc + 1
+        if len(self.stack) != 1:
+            self.fail(f"stack len is {len(self.stack)} instead of 1")
+        result = self.stack[0]
+        if not isinstance(result, int):
+            self.fail("stack finished with bytes not int")
+        return result != 0
+
+    def jump(self, label):
+        if label not in self.program.labels:
+            self.fail(f"unknown label {label}")
+        return self.program.labels[label]
+
+    # constants
+    def op_int(self, args):
+        value = args[0]
+        self.push(NAMED_INTS[value] if value in NAMED_INTS else int(value, 0))
+
+    op_pushint = op_int
+
+    def op_pushints(self, args):
+        for value in args:
+            self.push(int(value, 0))
+
+    def op_byte(self, args):
+        self.push(_parse_bytes(args))
+
+    op_pushbytes = op_byte
+
+    def op_pushbytess(self, args):
+        for token in args:
+            self.push(_parse_bytes([token]))
+
+    def op_addr(self, args):
+        self.push(encoding.decode_address(args[0]))
+
+    def op_method(self, args):
+        self.push(hashlib.new("sha512_256", _parse_bytes(args)).digest()[:4])
+
+    def op_intcblock(self, args):
+        self.intc = [int(value, 0) for value in args]
+
+    def op_bytecblock(self, args):
+        self.bytec = [_parse_bytes([value]) for value in args]
+
+    def op_intc(self, args):
+        self.push(self.intc[int(args[0])])
+
+    def op_bytec(self, args):
+        self.push(self.bytec[int(args[0])])
+
+    # arithmetic and logic
+    def _binary(self, fn):
+        b = self.pop_int()
+        a = self.pop_int()
+        self.push(fn(a, b))
+
+    def op_add(self, args):
+        self._binary(lambda a, b: a + b)
+
+    def op_sub(self, args):
+        self._binary(lambda a, b: a - b)
+
+    def op_mul(self, args):
+        self._binary(lambda a, b: a * b)
+
+    def op_div(self, args):
+        b = self.pop_int()
+        a = self.pop_int()
+        if b == 0:
+            self.fail("/ 0")
+        self.push(a // b)
+
+    def op_mod(self, args):
+        b = self.pop_int()
+        a = self.pop_int()
+        if b == 0:
+            self.fail("% 0")
+        self.push(a % b)
+
+    def op_lt(self, args):
+        self._binary(lambda a, b: a < b)
+
+    def op_gt(self, args):
+        self._binary(lambda a, b: a > b)
+
+    def op_le(self, args):
+        self._binary(lambda a, b: a <= b)
+
+    def op_ge(self, args):
+        self._binary(lambda a, b: a >= b)
+
+    def op_and(self, args):
+        self._binary(lambda a, b: a != 0 and b != 0)
+
+    def op_or(self, args):
+        self._binary(lambda a, b: a != 0 or b != 0)
+
+    def op_bitand(self, args):
+        self._binary(lambda a, b: a & b)
+
+    def op_bitor(self, args):
+        self._binary(lambda a, b: a | b)
+
+    def op_bitxor(self, args):
+        self._binary(lambda a, b: a ^ b)
+
+    def op_shl(self, args):
+        self._binary(lambda a, b: (a << b) % 2**64)
+
+    def op_shr(self, args):
+        self._binary(lambda a, b: a >> b)
+
+    def op_exp(self, args):
+        self._binary(lambda a, b: a ** b)
+
+    def op_eq(self, args):
+        b = self.pop()
+        a = self.pop()
+        if type(a) is not type(b):
+            self.fail("cannot compare uint64 to bytes")
+        self.push(a == b)
+
+    def op_neq(self, args):
+        b = self.pop()
+        a = self.pop()
+        if type(a) is not type(b):
+            self.fail("cannot compare uint64 to bytes")
+        self.push(a != b)
+
+    def op_not(self, args):
+        self.push(self.pop_int() == 0)
+
+    def op_bitnot(self, args):
+        self.push(self.pop_int() ^ (2**64 - 1))
+
+    # byte operations
+    def op_len(self, args):
+        self.push(len(self.pop_bytes()))
+
+    def op_itob(self, args):
+        self.push(self.pop_int().to_bytes(8, "big"))
+
+    def op_btoi(self, args):
+        value = self.pop_bytes()
+        if len(value) > 8:
+            self.fail("btoi arg too long")
+        self.push(int.from_bytes(value, "big"))
+
+    def op_concat(self, args):
+        b = self.pop_bytes()
+        a = self.pop_bytes()
+        self.push(a + b)
+
+    def _substring(self, value, start, end):
+        if end < start or end > len(value):
+            self.fail("substring range beyond length of string")
+        return value[start:end]
+
+    def op_substring(self, args):
+        value = self.pop_bytes()
+        self.push(self._substring(value, int(args[0]), int(args[1])))
+
+    def op_substring3(self, args):
+        end = self.pop_int()
+        start = self.pop_int()
+        value = self.pop_bytes()
+        self.push(self._substring(value, start, end))
+
+    def op_extract(self, args):
+        value = self.pop_bytes()
+        start, length = int(args[0]), int(args[1])
+        end = len(value) if length == 0 else start + length
+        self.push(self._substring(value, start, end))
+
+    def op_extract3(self, args):
+        length = self.pop_int()
+        start = self.pop_int()
+        value = self.pop_bytes()
+        self.push(self._substring(value, start, start + length))
+
+    def _extract_uint(self, size):
+        start = self.pop_int()
+        value = self.pop_bytes()
+        self.push(int.from_bytes(self._substring(value, start, start + size), "big"))
+
+    def op_extract_uint16(self, args):
+        self._extract_uint(2)
+
+    def op_extract_uint32(self, args):
+        self._extract_uint(4)
+
+    def op_extract_uint64(self, args):
+        self._extract_uint(8)
+
+    def _replace(self, value, start, replacement):
+        if start + len(replacement) > len(value):
+            self.fail("replacement end exceeds array length")
+        return value[:start] + replacement + value[start + len(replacement):]
+
+    def op_replace2(self, args):
+        replacement = self.pop_bytes()
+        value = self.pop_bytes()
+        self.push(self._replace(value, int(args[0]), replacement))
+
+    def op_replace3(self, args):
+        replacement = self.pop_bytes()
+        start = self.pop_int()
+        value = self.pop_bytes()
+        self.push(self._replace(value, start, replacement))
+
+    def op_getbit(self, args):
+        index = self.pop_int()
+        target = self.pop()
+        if isinstance(target, int):
+            if index > 63:
+                self.fail("getbit index > 63")
+            self.push((target >> index) & 1)
+            return
+        if index >= len(target) * 8:
+            self.fail("getbit index beyond byte array")
+        self.push((target[index // 8] >> (7 - index % 8)) & 1)
+
+    def op_setbit(self, args):
+        bit = self.pop_int()
+        index = self.pop_int()
+        target = self.pop()
+        if bit > 1:
+            self.fail("setbit value > 1")
+        if isinstance(target, int):
+            if index > 63:
+                self.fail("setbit index > 63")
+            self.push((target & ~(1 << index)) | (bit << index))
+            return
+        if index >= len(target) * 8:
+            self.fail("setbit index beyond byte array")
+        data = bytearray(target)
+        mask = 1 << (7 - index % 8)
+        data[index // 8] = (data[index // 8] | mask) if bit else (data[index // 8] & ~mask)
+        self.push(bytes(data))
+
+    def op_getbyte(self, args):
+        index = self.pop_int()
+        value = self.pop_bytes()
+        if index >= len(value):
+            self.fail("getbyte index beyond array length")
+        self.push(value[index])
+
+    def op_setbyte(self, args):
+        byte = self.pop_int()
+        index = self.pop_int()
+        value = self.pop_bytes()
+        if index >= len(value) or byte > 255:
+            self.fail("setbyte index/value out of range")
+        data = bytearray(value)
+        data[index] = byte
+        self.push(bytes(data))
+
+    def op_bzero(self, args):
+        size = self.pop_int()
+        if size > 4096:
+            self.fail("bzero attempted to create a too large string")
+        self.push(bytes(size))
+
+    def op_sha256(self, args):
+        self.push(hashlib.sha256(self.pop_bytes()).digest())
+
+    def op_sha512_256(self, args):
+        self.push(hashlib.new("sha512_256", self.pop_bytes()).digest())
+
+    def op_keccak256(self, args):
+        from Cryptodome.Hash import keccak
+
+        self.push(keccak.new(data=self.pop_bytes(), digest_bits=256).digest())
+
+    def op_log(self, args):
+        self.logs.append(self.pop_bytes())
+
+    # transaction and global fields
+    def op_txn(self, args):
+        self.push(self.txn_field(self.txn, args[0], int(args[1]) if len(args) > 1 else None))
+
+    def op_txna(self, args):
+        self.push(self.txn_field(self.txn, args[0], int(args[1])))
+
+    def op_txnas(self, args):
+        self.push(self.txn_field(self.txn, args[0], self.pop_int()))
+
+    def op_gtxn(self, args):
+        self.push(self.txn_field(self.group[int(args[0])], args[1], int(args[2]) if len(args) > 2 else None))
+
+    def op_gtxna(self, args):
+        self.push(self.txn_field(self.group[int(args[0])], args[1], int(args[2])))
+
+    def op_gtxns(self, args):
+        index = self.pop_int()
+        if index >= len(self.group):
+            self.fail("gtxns index beyond group")
+        self.push(self.txn_field(self.group[index], args[0], int(args[1]) if len(args) > 1 else None))
+
+    def op_gtxnsa(self, args):
+        index = self.pop_int()
+        self.push(self.txn_field(self.group[index], args[0], int(args[1])))
+
+    def op_global(self, args):
+        self.push(self.global_field(args[0]))
+
+    # scratch space
+    def op_load(self, args):
+        self.push(self.scratch[int(args[0])])
+
+    def op_store(self, args):
+        self.scratch[int(args[0])] = self.pop()
+
+    def op_loads(self, args):
+        self.push(self.scratch[self.pop_int()])
+
+    def op_stores(self, args):
+        value = self.pop()
+        self.scratch[self.pop_int()] = value
+
+    # stack manipulation
+    def op_pop(self, args):
+        self.pop()
+
+    def op_popn(self, args):
+        for _ in range(int(args[0])):
+            self.pop()
+
+    def op_dup(self, args):
+        value = self.pop()
+        self.push(value)
+        self.push(value)
+
+    def op_dup2(self, args):
+        b = self.pop()
+        a = self.pop()
+        for value in (a, b, a, b):
+            self.push(value)
+
+    def op_dupn(self, args):
+        value = self.pop()
+        for _ in range(int(args[0]) + 1):
+            self.push(value)
+
+    def op_swap(self, args):
+        b = self.pop()
+        a = self.pop()
+        self.push(b)
+        self.push(a)
+
+    def op_select(self, args):
+        condition = self.pop_int()
+        b = self.pop()
+        a = self.pop()
+        self.push(b if condition else a)
+
+    def op_dig(self, args):
+        depth = int(args[0])
+        if depth >= len(self.stack):
+            self.fail("dig beyond stack")
+        self.push(self.stack[-1 - depth])
+
+    def op_bury(self, args):
+        depth = int(args[0])
+        value = self.pop()
+        self.stack[-depth] = value
+
+    def op_cover(self, args):
+        depth = int(args[0])
+        value = self.pop()
+        self.stack.insert(len(self.stack) - depth, value)
+
+    def op_uncover(self, args):
+        depth = int(args[0])
+        value = self.stack.pop(-1 - depth)
+        self.push(value)
+
+    # flow control
+    def op_err(self, args):
+        self.fail("err opcode executed")
+
+    def op_assert(self, args):
+        if self.pop_int() == 0:
+            self.fail("assert failed")
+
+    def op_return(self, args):
+        value = self.pop()
+        self.stack = [value]
+        return _RETURN
+
+    def op_b(self, args):
+        return self.jump(args[0])
+
+    def op_bz(self, args):
+        if self.pop_int() == 0:
+            return self.jump(args[0])
+
+    def op_bnz(self, args):
+        if self.pop_int() != 0:
+            return self.jump(args[0])
+
+    def op_switch(self, args):
+        index = self.pop_int()
+        if index < len(args):
+            return self.jump(args[index])
+
+    def op_match(self, args):
+        count = len(args)
+        value = self.pop()
+        candidates = [self.pop() for _ in range(count)][::-1]
+        for label, candidate in zip(args, candidates):
+            if candidate == value:
+                return self.jump(label)
+
+    def op_callsub(self, args):
+        self.frames.append({"return": self.pc + 1, "height": len(self.stack), "args": 0, "returns": 0})
+        return self.jump(args[0])
+
+    def op_proto(self, args):
+        frame = self.frames[-1]
+        frame["args"], frame["returns"] = int(args[0]), int(args[1])
+        frame["height"] = len(self.stack)
+        frame["proto"] = True
+
+    def op_retsub(self, args):
+        frame = self.frames.pop()
+        if frame.get("proto"):
+            returns = self.stack[len(self.stack) - frame["returns"]:] if frame["returns"] else []
+            self.stack = self.stack[:frame["height"] - frame["args"]] + returns
+        return frame["return"]
+
+    def op_frame_dig(self, args):
+        frame = self.frames[-1]
+        self.push(self.stack[frame["height"] + int(args[0])])
+
+    def op_frame_bury(self, args):
+        frame = self.frames[-1]
+        value = self.pop()
+        self.stack[frame["height"] + int(args[0])] = value
+
+    # application state
+    def op_app_global_get(self, args):
+        self.push(self.app.global_state.get(self.pop_bytes(), 0))
+
+    def op_app_global_get_ex(self, args):
+        key = self.pop_bytes()
+        app_ref = self.pop_int()
+        app = self.app if app_ref in (0, self.app.app_id) else self.ledger.apps.get(app_ref)
+        exists = app is not None and key in app.global_state
+        self.push(app.global_state[key] if exists else 0)
+        self.push(exists)
+
+    def op_app_global_put(self, args):
+        value = self.pop()
+        key = self.pop_bytes()
+        if len(key) > 64:
+            self.fail("key too long")
+        self.app.global_state[key] = value
+        self.check_schema(self.app.global_state, self.app.global_schema, "global")
+
+    def op_app_global_del(self, args):
+        self.app.global_state.pop(self.pop_bytes(), None)
+
+    def op_app_local_get(self, args):
+        key = self.pop_bytes()
+        state = self.local_state(self.pop())
+        self.push(state.get(key, 0))
+
+    def op_app_local_get_ex(self, args):
+        key = self.pop_bytes()
+        app_ref = self.pop_int()
+        address = self.account(self.pop())
+        app = self.app if app_ref in (0, self.app.app_id) else self.ledger.apps.get(app_ref)
+        state = app.local_state.get(address, {}) if app else {}
+        exists = key in state
+        self.push(state[key] if exists else 0)
+        self.push(exists)
+
+    def op_app_local_put(self, args):
+        value = self.pop()
+        key = self.pop_bytes()
+        state = self.local_state(self.pop(), writable=True)
+        if len(key) > 64:
+            self.fail("key too long")
+        state[key] = value
+        self.check_schema(state, self.app.local_schema, "local")
+
+    def op_app_local_del(self, args):
+        key = self.pop_bytes()
+        self.local_state(self.pop(), writable=True).pop(key, None)
+
+    def op_app_opted_in(self, args):
+        self.pop_int()
+        self.push(self.account(self.pop()) in self.app.local_state)
+
+    def op_balance(self, args):
+        self.push(self.ledger.balance(self.account(self.pop())))
+
+    def op_min_balance(self, args):
+        self.push(self.ledger.min_balance(self.account(self.pop())))
+
+    # box storage
+    def op_box_create(self, args):
+        size = self.pop_int()
+        name = self.pop_bytes()
+        if size > 32768:
+            self.fail("box size too large")
+        self.check_box_ref(name, size)
+        if name in self.app.boxes:
+            if len(self.app.boxes[name]) != size:
+                self.fail("box size mismatch")
+            self.push(0)
+            return
+        self.app.boxes[name] = bytes(size)
+        self.push(1)
+
+    def op_box_put(self, args):
+        value = self.pop_bytes()
+        name = self.pop_bytes()
+        self.check_box_ref(name, len(value))
+        if name in self.app.boxes and len(self.app.boxes[name]) != len(value):
+            self.fail("box_put wrong size")
+        self.app.boxes[name] = value
+
+    def op_box_get(self, args):
+        name = self.pop_bytes()
+        self.check_box_ref(name)
+        exists = name in self.app.boxes
+        self.push(self.app.boxes[name] if exists else b"")
+        self.push(exists)
+
+    def op_box_len(self, args):
+        name = self.pop_bytes()
+        self.check_box_ref(name)
+        exists = name in self.app.boxes
+        self.push(len(self.app.boxes[name]) if exists else 0)
+        self.push(exists)
+
+    def op_box_del(self, args):
+        name = self.pop_bytes()
+        self.check_box_ref(name)
+        self.push(self.app.boxes.pop(name, None) is not None)
+
+    def op_box_extract(self, args):
+        length = self.pop_int()
+        start = self.pop_int()
+        name = self.pop_bytes()
+        self.check_box_ref(name)
+        if name not in self.app.boxes:
+            self.fail("no such box")
+        self.push(self._substring(self.app.boxes[name], start, start + length))
+
+    def op_box_replace(self, args):
+        value = self.pop_bytes()
+        start = self.pop_int()
+        name = self.pop_bytes()
+        self.check_box_ref(name)
+        if name not in self.app.boxes:
+            self.fail("no such box")
+        self.app.boxes[name] = self._replace(self.app.boxes[name], start, value)
+
+    def op_box_resize(self, args):
+        size = self.pop_int()
+        name = self.pop_bytes()
+        self.check_box_ref(name, size)
+        if name not in self.app.boxes:
+            self.fail("no such box")
+        self.app.boxes[name] = self.app.boxes[name][:size].ljust(size, b"\x00")
+
+
+_RETURN = object()
+
+_OP_NAMES = {
+    "+": "add",
+    "-": "sub",
+    "*": "mul",
+    "/": "div",
+    "%": "mod",
+    "<": "lt",
+    ">": "gt",
+    "<=": "le",
+    ">=": "ge",
+    "&&": "and",
+    "||": "or",
+    "&": "bitand",
+    "|": "bitor",
+    "^": "bitxor",
+    "~": "bitnot",
+    "==": "eq",
+    "!=": "neq",
+    "!": "not",
+}
+
+for _i in range(4):
+    setattr(Evaluator, f"op_intc_{_i}", lambda self, args, _i=_i: self.push(self.intc[_i]))
+    setattr(Evaluator, f"op_bytec_{_i}", lambda self, args, _i=_i: self.push(self.bytec[_i]))
+
+
+# --------------------------- algod stand-in --------------------------- #
+
+DISPENSER_ADDRESS = account.address_from_private_key(mnemonic.to_private_key(LOCALNET_DISPENSER_MNEMONIC))
+
+_VLQ_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+def _vlq(value):
+    """Base64 VLQ encoding of one source map field"""
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    digits = ""
+    while True:
+        digit, value = value & 31, value >> 5
+        digits += _VLQ_DIGITS[digit | (32 if value else 0)]
+        if not value:
+            return digits
+
+
+def source_map(program):
+    """
+    Version 3 source map of a parsed program, mapping each pc (opcode index) to its TEAL line
+
+    Readable with algosdk.source_map.SourceMap like the one algod returns.
+    """
+    segments = []
+    last_line = 0
+    for _opcode, _args, number in program.ops:
+        segments.append("AA" + _vlq(number - 1 - last_line) + "A")
+        last_line = number - 1
+    return {"version": 3, "sources": [], "names": [], "mappings": ";".join(segments)}
+
+
+def _json(value):
+    """algod JSON encoding: bytes become base64 strings"""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if isinstance(value, dict):
+        return {key: _json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json(item) for item in value]
+    return value
+
+
+def _key_values(state):
+    return [
+        {
+            "key": base64.b64encode(key).decode(),
+            "value": {"type": 2, "uint": value, "bytes": ""} if isinstance(value, int)
+            else {"type": 1, "uint": 0, "bytes": base64.b64encode(value).decode()},
+        }
+        for key, value in state.items()
+    ]
+
+
+def _decode_signed(fields):
+    if "lsig" in fields:
+        return LogicSigTransaction.undictify(fields)
+    if "msig" in fields:
+        return MultisigTransaction.undictify(fields)
+    return SignedTransaction.undictify(fields)
+
+
+def _failed_at(rejection):
+    """Index of the failing transaction in a TransactionRejected message, if it names one"""
+    message = str(rejection)
+    if message.startswith("transaction ") and ":" in message:
+        index = message[len("transaction "):message.index(":")]
+        if index.isdigit():
+            return int(index)
+    return None
+
+
+def _not_found(message):
+    return error.AlgodHTTPError(message, 404)
+
+
+def _box_name_param(value):
+    """Decode a box name query parameter ("b64:..." or "str:...")"""
+    encoding_name, _, name = value.partition(":")
+    return base64.b64decode(name) if encoding_name == "b64" else name.encode()
+
+
+class LocalAlgodClient(AlgodClient):
+    """AlgodClient whose requests are answered by an in-memory Ledger instead of algod"""
+
+    # Its "bytecode" is TEAL source, compile_cache keeps it apart from algod's
+    compile_target = "local_avm"
+
+    # (method, path pattern, handler); handlers get the path groups as arguments
+    ROUTES = [
+        ("GET", r"/status", "_status"),
+        ("GET", r"/status/wait-for-block-after/(\d+)", "_status_after_block"),
+        ("GET", r"/transactions/params", "_params"),
+        ("POST", r"/transactions", "_send"),
+        ("GET", r"/transactions/pending/(\w+)", "_pending"),
+        ("POST", r"/transactions/simulate", "_simulate"),
+        ("POST", r"/teal/compile", "_compile"),
+        ("GET", r"/accounts/(\w+)", "_account"),
+        ("GET", r"/accounts/(\w+)/applications/(\d+)", "_account_application"),
+        ("GET", r"/applications/(\d+)", "_application"),
+        ("GET", r"/applications/(\d+)/boxes", "_boxes"),
+        ("GET", r"/applications/(\d+)/box", "_box"),
+        ("GET", r"/blocks/(\d+)", "_block"),
+    ]
+
+    def __init__(self, ledger=None, fund_dispenser=True, block_seconds=None):
+        """
+        Args:
+            ledger: Ledger to serve (default: a new one)
+            fund_dispenser: Give the LocalNet dispenser account DISPENSER_BALANCE
+            block_seconds: Add a block every block_seconds holding every group sent
+                since the last one, like a real network (MainNet: about 2.8);
+                None commits each group as its own block, like LocalNet dev mode
+        """
+        super().__init__("", "http://local-avm")
+        self.ledger = ledger or Ledger()
+        if fund_dispenser and not self.ledger.balance(DISPENSER_ADDRESS):
+            self.ledger.fund(DISPENSER_ADDRESS, DISPENSER_BALANCE)
+        self.requests = 0
+        self.block_seconds = block_seconds
+        self._open_block = None  # block being filled in block_seconds mode
+        self._closed = threading.Event()
+        self._new_block = threading.Condition(threading.RLock())
+        self._routes = [(method, re.compile(pattern), getattr(self, name)) for method, pattern, name in self.ROUTES]
+        if block_seconds:
+            threading.Thread(target=self._produce_blocks, name="local-avm-blocks", daemon=True).start()
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=None):
+        """Serve one algod API request from the ledger"""
+        path = urlsplit(requrl).path
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                with self._new_block:
+                    self.requests += 1
+                    return handler(*match.groups(), params=params or {}, data=data, response_format=response_format)
+        raise error.AlgodHTTPError(f"local_avm does not serve {method} {requrl}", 404)
+
+    def advance_rounds(self, count=1):
+        """Add empty blocks, e.g. to let a QR code or a session expire"""
+        with self._new_block:
+            if self._open_block is not None:
+                self._commit_block()
+                count -= 1
+            self.ledger.advance_rounds(count)
+            self._new_block.notify_all()
+
+    def close(self):
+        """Stop adding blocks (block_seconds mode)"""
+        self._closed.set()
+
+    def snapshot(self):
+        """Ledger.snapshot() of the state after every group sent so far"""
+        with self._new_block:
+            self._commit_open_block()
+            return self.ledger.snapshot()
+
+    def restore(self, snapshot):
+        """Ledger.restore() a snapshot() of this client, e.g. at the start of every test"""
+        with self._new_block:
+            self._commit_open_block()
+            self.ledger.restore(snapshot)
+
+    def _produce_blocks(self):
+        next_block = time.monotonic() + self.block_seconds
+        while not self._closed.wait(max(next_block - time.monotonic(), 0)):
+            next_block += self.block_seconds
+            with self._new_block:
+                self._commit_block()
+                self._new_block.notify_all()
+
+    def _commit_open_block(self):
+        """Commit the block being filled (block_seconds mode) before reading or replacing state"""
+        if self._open_block is not None:
+            self._commit_block()
+            self._new_block.notify_all()
+
+    def _commit_block(self):
+        block, self._open_block = self._open_block or self.ledger.next_block(), None
+        self.ledger.commit(block)
+
+    # ------------------------------ node ------------------------------ #
+
+    def _status(self, **request):
+        return {
+            "last-round": self.ledger.round,
+            "last-version": "future",
+            "next-version": "future",
+            "next-version-round": self.ledger.round + 1,
+            "next-version-supported": True,
+            "time-since-last-round": 0,
+            "catchup-time": 0,
+            "stopped-at-unsupported-round": False,
+        }
+
+    def _status_after_block(self, round_number, **request):
+        # Like algod, give up after a while and report the current round
+        self._new_block.wait_for(lambda: self.ledger.round > int(round_number), STATUS_WAIT_SECONDS)
+        return self._status()
+
+    def _params(self, **request):
+        return {
+            "consensus-version": "future",
+            "fee": 0,
+            "genesis-hash": self.ledger.genesis_hash,
+            "genesis-id": self.ledger.genesis_id,
+            "last-round": self.ledger.round,
+            "min-fee": MIN_TXN_FEE,
+        }
+
+    def _compile(self, params, data, **request):
+        try:
+            program = Program(data)
+        except ValueError as e:
+            raise error.AlgodHTTPError(str(e), 400) from None
+        response = {
+            "hash": encoding.encode_address(encoding.checksum(b"Program" + data)),
+            "result": base64.b64encode(data).decode(),
+        }
+        if params.get("sourcemap") in (True, "true"):
+            response["sourcemap"] = source_map(program)
+        return response
+
+    def _block(self, round_number, response_format, **request):
+        round_number = int(round_number)
+        if round_number > self.ledger.round:
+            raise _not_found(f"ledger does not have entry {round_number}")
+        if response_format != "msgpack":
+            raise error.AlgodHTTPError("local_avm serves blocks as msgpack only", 400)
+        block = {
+            "rnd": round_number,
+            "ts": self.ledger.timestamp,
+            "gen": self.ledger.genesis_id,
+            "gh": base64.b64decode(self.ledger.genesis_hash),
+        }
+        if self.ledger.blocks.get(round_number):
+            block["txns"] = self.ledger.blocks[round_number]
+        return msgpack.packb({"block": block}, use_bin_type=True)
+
+    # -------------------------- transactions -------------------------- #
+
+    def _send(self, data, **request):
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(data)
+        signed = [_decode_signed(fields) for fields in unpacker]
+        try:
+            if self.block_seconds:
+                if self._open_block is None:
+                    self._open_block = self.ledger.next_block()
+                results = self._open_block.apply(signed, require_signatures=True)
+            else:
+                results = self.ledger.send(signed, require_signatures=True)
+        except TransactionRejected as e:
+            raise error.AlgodHTTPError(f"TransactionPool.Remember: {e}", 400) from None
+        self._new_block.notify_all()
+        return {"txId": results[0]["tx-id"]}
+
+    def _pending(self, tx_id, response_format, **request):
+        if self._open_block is not None and tx_id in self._open_block.pending_txns:
+            stxn = self._open_block.pending_txns[tx_id]
+            return {"pool-error": "", "txn": _json(stxn.dictify())}
+        if tx_id not in self.ledger.confirmed:
+            raise _not_found("txn does not exist")
+        if response_format != "json":
+            raise error.AlgodHTTPError("local_avm serves pending transactions as json only", 400)
+        stxn, result = self.ledger.confirmed[tx_id]
+        response = {
+            "confirmed-round": result["confirmed-round"],
+            "pool-error": "",
+            "txn": _json(stxn.dictify() if isinstance(stxn, SignedTransaction) else {"txn": stxn.dictify()}),
+        }
+        if result.get("created"):
+            response["application-index"] = result["application-index"]
+        if result.get("logs"):
+            response["logs"] = _json(result["logs"])
+        return response
+
+    def _simulate(self, data, **request):
+        body = msgpack.unpackb(data, raw=False, strict_map_key=False)
+        trace = body.get("exec-trace-config", {}).get("enable", False)
+        groups = []
+        for group in body["txn-groups"]:
+            signed = [_decode_signed(fields) for fields in group["txns"]]
+            app_calls = sum(1 for stxn in signed if stxn.transaction.type == "appl")
+            extra_budget = body.get("extra-opcode-budget", 0)
+            response = {"app-budget-added": APP_CALL_BUDGET * app_calls + extra_budget, "txn-results": []}
+            try:
+                results = self.ledger.send(
+                    signed,
+                    simulate=True,
+                    trace=trace,
+                    unnamed_resources=body.get("allow-unnamed-resources", False),
+                    extra_budget=extra_budget,
+                    require_signatures=not body.get("allow-empty-signatures", False),
+                )
+            except TransactionRejected as e:
+                response["failure-message"] = str(e)
+                if _failed_at(e) is not None:
+                    response["failed-at"] = [_failed_at(e)]
+                groups.append(response)
+                continue
+            for stxn, result in zip(signed, results):
+                txn_result = {"txn-result": {"txn": _json(stxn.dictify()), "pool-error": ""}}
+                if result.get("created"):
+                    txn_result["txn-result"]["application-index"] = result["application-index"]
+                if result.get("logs"):
+                    txn_result["txn-result"]["logs"] = _json(result["logs"])
+                if stxn.transaction.type == "appl":
+                    txn_result["app-budget-consumed"] = result["cost"]
+                    if trace:
+                        kind = "clear-state-program-trace" if int(stxn.transaction.on_complete) == ON_COMPLETE["ClearState"] else "approval-program-trace"
+                        txn_result["exec-trace"] = {kind: [{"pc": pc} for pc, _line, _opcode, _cost in result["trace"]]}
+                response["txn-results"].append(txn_result)
+            response["app-budget-consumed"] = sum(result.get("cost", 0) for result in results)
+            groups.append(response)
+
+        response = {"version": 2, "last-round": self.ledger.round, "txn-groups": groups}
+        overrides = {}
+        if body.get("allow-empty-signatures"):
+            overrides["allow-empty-signatures"] = True
+        if body.get("allow-unnamed-resources"):
+            overrides["allow-unnamed-resources"] = True
+        if body.get("extra-opcode-budget"):
+            overrides["extra-opcode-budget"] = body["extra-opcode-budget"]
+        if overrides:
+            response["eval-overrides"] = overrides
+        return response
+
+    # ------------------------ accounts and apps ----------------------- #
+
+    def _app_params(self, app):
+        return {
+            "creator": app.creator,
+            "approval-program": base64.b64encode(app.approval.source.encode()).decode(),
+            "clear-state-program": base64.b64encode(app.clear.source.encode()).decode(),
+            "global-state": _key_values(app.global_state),
+            "global-state-schema": {"num-uint": app.global_schema[0], "num-byte-slice": app.global_schema[1]},
+            "local-state-schema": {"num-uint": app.local_schema[0], "num-byte-slice": app.local_schema[1]},
+        }
+
+    def _local_state(self, app, address):
+        return {
+            "id": app.app_id,
+            "key-value": _key_values(app.local_state[address]),
+            "schema": {"num-uint": app.local_schema[0], "num-byte-slice": app.local_schema[1]},
+        }
+
+    def _account(self, address, **request):
+        if not encoding.is_valid_address(address):
+            raise error.AlgodHTTPError("failed to parse the address", 400)
+        apps = self.ledger.apps.values()
+        local_states = [self._local_state(app, address) for app in apps if address in app.local_state]
+        created = [{"id": app.app_id, "params": self._app_params(app)} for app in apps if app.creator == address]
+        return {
+            "address": address,
+            "amount": self.ledger.balance(address),
+            "min-balance": self.ledger.min_balance(address),
+            "round": self.ledger.round,
+            "status": "Offline",
+            "apps-local-state": local_states,
+            "created-apps": created,
+            "total-apps-opted-in": len(local_states),
+            "total-created-apps": len(created),
+        }
+
+    def _account_application(self, address, app_id, **request):
+        app = self.ledger.apps.get(int(app_id))
+        response = {"round": self.ledger.round}
+        if app is not None and address in app.local_state:
+            response["app-local-state"] = self._local_state(app, address)
+        if app is not None and app.creator == address:
+            response["created-app"] = self._app_params(app)
+        if len(response) == 1:
+            raise _not_found("account application info not found")
+        return response
+
+    def _application(self, app_id, **request):
+        app = self.ledger.apps.get(int(app_id))
+        if app is None:
+            raise _not_found("application does not exist")
+        return {"id": app.app_id, "params": self._app_params(app)}
+
+    def _boxes(self, app_id, params, **request):
+        app = self.ledger.apps.get(int(app_id))
+        if app is None:
+            raise _not_found("application does not exist")
+        # Sorted by name and filtered by prefix, paged with next-token, as algod's box index
+        prefix = _box_name_param(params.get("prefix", ""))
+        start = _box_name_param(params.get("next", ""))
+        names = sorted(name for name in app.boxes if name.startswith(prefix) and name >= start)
+        response = {"round": self.ledger.round}
+        if params.get("max") and len(names) > int(params["max"]):
+            response["next-token"] = "b64:" + base64.b64encode(names[int(params["max"])]).decode()
+            names = names[:int(params["max"])]
+        response["boxes"] = []
+        for name in names:
+            box = {"name": base64.b64encode(name).decode()}
+            if str(params.get("values", "")).lower() == "true":
+                box["value"] = base64.b64encode(app.boxes[name]).decode()
+            response["boxes"].append(box)
+        return response
+
+    def _box(self, app_id, params, **request):
+        app = self.ledger.apps.get(int(app_id))
+        name = _box_name_param(params.get("name", ""))
+        if app is None or name not in app.boxes:
+            raise _not_found("box not found")
+        return {
+            "name": base64.b64encode(name).decode(),
+            "round": self.ledger.round,
+            "value": base64.b64encode(app.boxes[name]).decode(),
+        }
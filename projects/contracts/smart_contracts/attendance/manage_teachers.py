@@ -1,13 +1,21 @@
 """
 CampusChain AI - Teacher Management Script
 Add or remove authorized teachers from the attendance contract
+
+Interactive:  python manage_teachers.py
+Bulk (CSV):   ADMIN_MNEMONIC="..." python manage_teachers.py --csv faculty.csv --app-id 123 --report report.csv
 """
 
 from algosdk import account, mnemonic
-from algosdk.v2client import algod
 from algosdk.transaction import ApplicationCallTxn, OnComplete, wait_for_confirmation
+import argparse
+import os
 import sys
 
+from algod_pool import get_algod_client
+from params_cache import get_params_provider
+from teacher_provisioning import provision_teachers, read_teacher_csv, summarize, write_report
+
 
 def main():
     print("=" * 60)
@@ -16,9 +24,8 @@ def main():
     
     # Connect to TestNet
     print("\n[1/4] Connecting to TestNet...")
-    algod_address = "https://testnet-api.algonode.cloud"
-    algod_token = ""
-    algod_client = algod.AlgodClient(algod_token, algod_address)
+    algod_client = get_algod_client("testnet")
+    params_provider = get_params_provider(algod_client)
     
     try:
         status = algod_client.status()
@@ -81,7 +88,7 @@ def main():
             return
         
         try:
-            params = algod_client.suggested_params()
+            params = params_provider.get()
             
             if choice == "1":
                 # Add teacher
@@ -168,5 +175,36 @@ def main():
         print("❌ Invalid choice")
 
 
+def bulk_main(argv):
+    """Non-interactive mode: apply every change in a CSV file (address, action)"""
+    parser = argparse.ArgumentParser(description="Add or remove the teachers listed in a CSV file")
+    parser.add_argument("--csv", required=True, help="CSV with address and optional action (add/remove) columns")
+    parser.add_argument("--app-id", type=int, required=True, help="Attendance application ID")
+    parser.add_argument("--network", default="testnet", help="localnet or testnet")
+    parser.add_argument("--report", help="Write the reconciliation report to this CSV file")
+    args = parser.parse_args(argv)
+    
+    # The admin mnemonic comes from the environment so the run needs no input
+    admin_mnemonic = os.environ.get("ADMIN_MNEMONIC") or input("Enter admin (creator) mnemonic: ").strip()
+    admin_private_key = mnemonic.to_private_key(admin_mnemonic)
+    
+    algod_client = get_algod_client(args.network)
+    changes = read_teacher_csv(args.csv)
+    print(f"⏳ Provisioning {len(changes)} teacher changes on app {args.app_id}...")
+    report = provision_teachers(algod_client, admin_private_key, args.app_id, changes)
+    
+    for outcome, count in summarize(report).items():
+        print(f"  {outcome}: {count}")
+    for entry in report:
+        if not entry["ok"]:
+            print(f"❌ {entry['address']} ({entry['action']}): {entry['outcome']} {entry['error']}".rstrip())
+    if args.report:
+        write_report(args.report, report)
+        print(f"📄 Report written to {args.report}")
+    return 0 if all(entry["ok"] for entry in report) else 1
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(bulk_main(sys.argv[1:]))
     main()
@@ -0,0 +1,298 @@
+"""
+CampusChain AI - Merkle-Committed Bulk Attendance
+
+Instead of one mark_attendance app call per student, students sign their
+wallet-bound QR proof off-chain and hand it to the teacher's device. The
+teacher aggregates the check-ins and, at close_session, commits a Merkle root
+plus the attendee count in a single transaction. Any student can then prove
+inclusion on-chain (verify_attendance) or off-chain (verify_inclusion).
+
+Tree layout (must match contract.py):
+- leaf = SHA256(0x00 + student_address (32 bytes) + qr_round (8 bytes))
+- node = SHA256(0x01 + left + right)
+- leaves are sorted by student address and padded with 32 zero bytes up to a
+  power of two, so a proof is always log2(padded size) sibling hashes
+"""
+
+import base64
+import hashlib
+import json
+
+from algosdk import account, encoding, util
+from algosdk.transaction import ApplicationNoOpTxn, assign_group_id
+
+from box_storage import COMMITMENT_BOX_SIZE, commitment_box_name, session_box_name
+
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+EMPTY_LEAF = bytes(32)
+
+# Same anti-replay window as mark_attendance in contract.py
+QR_VALIDITY_ROUNDS = 20
+
+# verify_attendance opcode cost: fixed part plus one hash per proof level
+APP_CALL_BUDGET = 700
+VERIFY_BASE_COST = 160
+VERIFY_LEVEL_COST = 66
+
+
+def qr_hash(session_id, qr_round, student_address):
+    """Wallet-bound QR proof: SHA256(session_id + qr_round + student_address)"""
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    return hashlib.sha256(
+        session_id + qr_round.to_bytes(8, "big") + encoding.decode_address(student_address)
+    ).digest()
+
+
+def check_in_message(session_id, qr_round, qr_proof):
+    """Bytes a student signs to check in off-chain"""
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    return b"campuschain-attendance" + session_id + qr_round.to_bytes(8, "big") + qr_proof
+
+
+def sign_check_in(private_key, session_id, qr_round):
+    """
+    Build a student's signed off-chain check-in (runs on the student's device)
+
+    Args:
+        private_key: Student's private key
+        session_id: Session identifier from the QR code
+        qr_round: Round encoded in the QR code
+
+    Returns:
+        Dict with address, qr_round, qr_hash (hex) and signature (base64)
+    """
+    address = account.address_from_private_key(private_key)
+    proof = qr_hash(session_id, qr_round, address)
+    return {
+        "address": address,
+        "qr_round": qr_round,
+        "qr_hash": proof.hex(),
+        "signature": util.sign_bytes(check_in_message(session_id, qr_round, proof), private_key),
+    }
+
+
+def leaf_hash(student_address, qr_round):
+    """Merkle leaf of one attendee"""
+    return hashlib.sha256(LEAF_PREFIX + encoding.decode_address(student_address) + qr_round.to_bytes(8, "big")).digest()
+
+
+def node_hash(left, right):
+    """Merkle node from its two children"""
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """Merkle tree over a session's attendees (address -> qr_round)"""
+
+    def __init__(self, attendees):
+        """
+        Args:
+            attendees: Dict of student address -> qr_round
+        """
+        self.addresses = sorted(attendees)
+        self.rounds = [attendees[address] for address in self.addresses]
+        self.positions = {address: index for index, address in enumerate(self.addresses)}
+
+        level = [leaf_hash(address, qr_round) for address, qr_round in zip(self.addresses, self.rounds)]
+        size = 1
+        while size < len(level):
+            size *= 2
+        level += [EMPTY_LEAF] * (size - len(level))
+
+        self.levels = [level]
+        while len(level) > 1:
+            level = [node_hash(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+            self.levels.append(level)
+
+    @property
+    def root(self):
+        return self.levels[-1][0]
+
+    @property
+    def count(self):
+        return len(self.addresses)
+
+    def proof(self, student_address):
+        """
+        Inclusion proof of one attendee
+
+        Returns:
+            Dict with index, qr_round and proof (list of sibling hashes, leaf first)
+
+        Raises:
+            KeyError: If the student is not in the tree
+        """
+        index = self.positions[student_address]
+        siblings = []
+        position = index
+        for level in self.levels[:-1]:
+            siblings.append(level[position ^ 1])
+            position //= 2
+        return {"index": index, "qr_round": self.rounds[index], "proof": siblings}
+
+    def export_proofs(self):
+        """All proofs as JSON-ready data, published for students after the commit"""
+        proofs = {}
+        for address in self.addresses:
+            proof = self.proof(address)
+            proofs[address] = {
+                "index": proof["index"],
+                "qr_round": proof["qr_round"],
+                "proof": [sibling.hex() for sibling in proof["proof"]],
+            }
+        return {"root": self.root.hex(), "count": self.count, "proofs": proofs}
+
+
+class AttendanceAggregator:
+    """
+    Collects students' signed check-ins for one session on the teacher's device
+
+    Each check-in is accepted only if the signature is the student's, the QR
+    proof is bound to that student's wallet and the QR is at most
+    QR_VALIDITY_ROUNDS old when received, the same rules as mark_attendance.
+    """
+
+    def __init__(self, session_id, validity_rounds=QR_VALIDITY_ROUNDS):
+        self.session_id = session_id.encode() if isinstance(session_id, str) else session_id
+        self.validity_rounds = validity_rounds
+        self.attendees = {}
+
+    def add(self, check_in, current_round):
+        """
+        Validate and record a check-in from sign_check_in()
+
+        Args:
+            check_in: Dict with address, qr_round, qr_hash and signature
+            current_round: Latest round when the check-in was received
+
+        Returns:
+            (accepted, reason) - reason explains a rejection
+        """
+        address = check_in["address"]
+        qr_round = check_in["qr_round"]
+        proof = bytes.fromhex(check_in["qr_hash"])
+
+        if address in self.attendees:
+            return False, "duplicate"
+        if current_round - qr_round > self.validity_rounds or qr_round > current_round:
+            return False, "expired QR"
+        if proof != qr_hash(self.session_id, qr_round, address):
+            return False, "QR not bound to this wallet"
+        message = check_in_message(self.session_id, qr_round, proof)
+        if not util.verify_bytes(message, check_in["signature"], address):
+            return False, "bad signature"
+
+        self.attendees[address] = qr_round
+        return True, "ok"
+
+    def build(self):
+        """Merkle tree over every accepted check-in"""
+        return MerkleTree(self.attendees)
+
+    def save(self, path):
+        """Persist accepted check-ins so proofs can be rebuilt after the commit"""
+        with open(path, "w") as f:
+            json.dump({"session_id": self.session_id.decode(), "attendees": self.attendees}, f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        aggregator = cls(data["session_id"])
+        aggregator.attendees = data["attendees"]
+        return aggregator
+
+
+def verify_inclusion(root, count, student_address, qr_round, index, proof):
+    """
+    Off-chain verifier, same checks as verify_attendance in contract.py
+
+    Args:
+        root: Committed Merkle root (bytes)
+        count: Committed attendee count
+        student_address: Student's Algorand address
+        qr_round: Round of the student's QR code
+        index: Leaf index from the proof
+        proof: Sibling hashes (bytes), leaf first
+
+    Returns:
+        True if the student is part of the commitment
+    """
+    if index >= count:
+        return False
+    node = leaf_hash(student_address, qr_round)
+    for sibling in proof:
+        node = node_hash(node, sibling) if index % 2 == 0 else node_hash(sibling, node)
+        index //= 2
+    return index == 0 and node == root
+
+
+def commit_attendance_txn(sender, sp, app_id, session_id, tree):
+    """
+    Build the close_session call that commits a session's Merkle root and count
+
+    Works for the session in global state and for registered sessions. The app
+    account must cover the commitment box minimum balance.
+    """
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"close_session", session_id, tree.root, tree.count.to_bytes(8, "big")],
+        boxes=[(0, session_box_name(session_id)), (0, commitment_box_name(session_id))]
+    )
+
+
+def verify_attendance_txn(sender, sp, app_id, session_id, student_address, qr_round, index, proof):
+    """Build an on-chain verify_attendance call (any sender, simulate it to check)"""
+    session_id = session_id.encode() if isinstance(session_id, str) else session_id
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[
+            b"verify_attendance",
+            session_id,
+            encoding.decode_address(student_address),
+            qr_round.to_bytes(8, "big"),
+            index.to_bytes(8, "big"),
+            b"".join(proof)
+        ],
+        boxes=[(0, commitment_box_name(session_id))]
+    )
+
+
+def verify_attendance_group(sender, sp, app_id, session_id, student_address, qr_round, index, proof):
+    """
+    verify_attendance plus enough pool_budget calls for the proof depth
+
+    One app call covers proofs of up to 8 levels (256 attendees); every
+    pool_budget call in the group adds another 700 opcodes.
+
+    Returns:
+        List of grouped transactions, sign each with the sender's key
+    """
+    cost = VERIFY_BASE_COST + VERIFY_LEVEL_COST * len(proof)
+    extra_calls = max(0, -(-cost // APP_CALL_BUDGET) - 1)
+    txns = [verify_attendance_txn(sender, sp, app_id, session_id, student_address, qr_round, index, proof)]
+    for i in range(extra_calls):
+        # The note keeps otherwise identical calls from having the same ID
+        txns.append(ApplicationNoOpTxn(sender, sp, app_id, app_args=[b"pool_budget"], note=i.to_bytes(1, "big")))
+    return assign_group_id(txns) if extra_calls else txns
+
+
+def get_commitment(algod_client, app_id, session_id):
+    """
+    Read a session's commitment
+
+    Returns:
+        Dict with root (bytes) and count
+    """
+    response = algod_client.application_box_by_name(app_id, commitment_box_name(session_id))
+    value = base64.b64decode(response["value"])
+    if len(value) != COMMITMENT_BOX_SIZE:
+        raise ValueError(f"Commitment box is {len(value)} bytes, expected {COMMITMENT_BOX_SIZE}")
+    return {"root": value[:32], "count": int.from_bytes(value[32:], "big")}
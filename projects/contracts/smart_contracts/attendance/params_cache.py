@@ -0,0 +1,121 @@
+"""
+CampusChain AI - Cached Suggested Params
+
+Calling algod_client.suggested_params() before every transaction doubles the
+round-trips of bulk flows. Suggested params stay usable for their whole
+validity window (1000 rounds), so SuggestedParamsProvider fetches them once
+and hands out copies until:
+
+- the window gets close to its end, judged from the rounds elapsed since the
+  fetch (estimated from wall time, or reported through observe_round) plus
+  one round per copy handed out, which covers LocalNet dev mode where every
+  transaction makes a block
+- max_age_seconds have passed, so a changed fee is picked up
+- invalidate() is called, e.g. after a "fee too small" or "txn dead" rejection
+
+Transactions built from the same params are more alike: two identical calls
+from one sender get the same ID, so add a note or lease where that can happen.
+
+Usage:
+    from params_cache import get_params_provider
+
+    params = get_params_provider(algod_client).get()
+"""
+
+import copy
+import threading
+import time
+
+# Refresh this many rounds before last_valid
+REFRESH_MARGIN_ROUNDS = 100
+# Faster than real block times, so the elapsed round count is overestimated
+ESTIMATED_ROUND_SECONDS = 2.5
+MAX_AGE_SECONDS = 30
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+class SuggestedParamsProvider:
+    """Thread-safe suggested params cache for one algod client"""
+
+    def __init__(
+        self,
+        algod_client,
+        refresh_margin_rounds=REFRESH_MARGIN_ROUNDS,
+        max_age_seconds=MAX_AGE_SECONDS,
+        round_seconds=ESTIMATED_ROUND_SECONDS
+    ):
+        """
+        Args:
+            algod_client: Algod client instance
+            refresh_margin_rounds: Refresh once fewer rounds than this remain valid
+            max_age_seconds: Refresh after this long regardless, to follow fee changes
+            round_seconds: Assumed block time for estimating elapsed rounds
+        """
+        self.algod_client = algod_client
+        self.refresh_margin_rounds = refresh_margin_rounds
+        self.max_age_seconds = max_age_seconds
+        self.round_seconds = round_seconds
+        self.fetches = 0
+        self._params = None
+        self._fetched_at = 0
+        self._uses = 0
+        self._observed_round = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Suggested params for a new transaction
+
+        Returns:
+            A copy of the cached SuggestedParams (safe to change fee or flat_fee on)
+        """
+        with self._lock:
+            if self._stale():
+                self._params = self.algod_client.suggested_params()
+                self._fetched_at = time.monotonic()
+                self._uses = 0
+                self.fetches += 1
+            self._uses += 1
+            return copy.copy(self._params)
+
+    def observe_round(self, round_num):
+        """Tell the provider the latest known round (e.g. from status_after_block)"""
+        with self._lock:
+            self._observed_round = max(self._observed_round, round_num)
+
+    def invalidate(self):
+        """Drop the cached params, the next get() fetches fresh ones"""
+        with self._lock:
+            self._params = None
+
+    def _stale(self):
+        if self._params is None:
+            return True
+        age = time.monotonic() - self._fetched_at
+        if age >= self.max_age_seconds:
+            return True
+        elapsed_rounds = max(age / self.round_seconds, self._observed_round - self._params.first) + self._uses
+        return self._params.first + elapsed_rounds >= self._params.last - self.refresh_margin_rounds
+
+
+def get_params_provider(algod_client):
+    """
+    Shared provider for an algod client
+
+    Clients from algod_pool.get_algod_client are shared per network, so this
+    is one cache per network.
+
+    Args:
+        algod_client: Algod client instance
+
+    Returns:
+        SuggestedParamsProvider
+    """
+    with _providers_lock:
+        provider = _providers.get(id(algod_client))
+        if provider is None or provider.algod_client is not algod_client:
+            provider = SuggestedParamsProvider(algod_client)
+            _providers[id(algod_client)] = provider
+        return provider
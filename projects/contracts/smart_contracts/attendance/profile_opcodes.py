@@ -0,0 +1,456 @@
+"""
+CampusChain AI - Opcode Budget Profiler
+
+Runs every handler of contract.py and contract_v2_secure.py through algod
+simulate with execution traces on LocalNet and reports, per handler:
+- opcode cost (app budget consumed, out of 700 per app call)
+- program size in bytes
+- hotspots: the PyTeal lines that spent the most budget, mapped
+  pc -> TEAL line (algod source map) -> PyTeal line (PyTeal source map)
+
+Costs are checked against opcode_baseline.json and the script exits with
+status 1 when a handler or program grows past its baseline. Every baseline
+entry records the evaluator that measured it: "algod" (LocalNet, assembled
+sizes under "program_bytes") or "local_avm" (the in-process AVM with its
+OPCODE_COSTS table, which never assembles TEAL: its entries hold the TEAL
+source length under "teal_bytes" instead). Sizes are only compared against a
+baseline measured by the same evaluator.
+
+Usage:
+    python profile_opcodes.py                        # profile + regression check
+    python profile_opcodes.py --update-baseline      # store current costs as the baseline
+    python profile_opcodes.py --network local        # in-process AVM instead of LocalNet
+    python profile_opcodes.py --hotspots 10 --json report.json
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+from feature_gates import FeatureGates
+from algosdk import account, encoding, mnemonic
+from algosdk.logic import get_application_address
+from algosdk.source_map import SourceMap
+from algosdk.transaction import (
+    ApplicationCreateTxn,
+    ApplicationNoOpTxn,
+    ApplicationOptInTxn,
+    OnComplete,
+    PaymentTxn,
+    wait_for_confirmation,
+)
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup, SimulateTraceConfig
+
+# PyTeal only records where each expression was built while this gate is on.
+# That makes every PyTeal build several times slower, so modules importing the
+# profiler (tests, benchmark_optimized.py) leave it off and get TEAL-line hotspots.
+if __name__ == "__main__":
+    FeatureGates.set_sourcemap_enabled(True)
+
+sys.path.insert(0, str(Path(__file__).parent))
+from pyteal import Compilation, Mode
+import contract
+import contract_v2_secure
+from compile_cache import get_cached_json, get_compiled_programs
+from deploy_config import AttendanceDeployConfig
+from box_storage import (
+    close_session_txn,
+    create_roster_txn,
+    enroll_txn,
+    mark_attendance_bitmap_txn,
+    mark_attendance_box_txn,
+    mark_attendance_txn,
+    open_session_txn,
+    session_box_name,
+)
+from merkle_attendance import MerkleTree, commit_attendance_txn, verify_attendance_txn
+
+BASELINE_PATH = Path(__file__).parent / "opcode_baseline.json"
+LOCALNET_DISPENSER_MNEMONIC = "auction inquiry lava second expand liberty glass involve ginger illness length room item discover ahead table doctor term tackle cement bonus profit right above catch"
+
+APP_CALL_BUDGET = 700
+
+# Opcodes costing more than 1 (the simulate trace lists pcs, not costs)
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+}
+
+CONTRACTS = {
+    "contract": contract,
+    "contract_v2_secure": contract_v2_secure,
+}
+
+GLOBAL_SESSION = b"CS101-LECTURE"
+REGISTERED_SESSION = b"CS102-LAB"
+ROSTER_CAPACITY = 64
+MERKLE_SESSION = b"CS103-SEMINAR"
+MERKLE_ATTENDEES = 64
+
+
+def compile_with_sourcemaps(algod_client, module):
+    """
+    Compile a PyTeal contract module and build its pc -> source lookup
+
+    Args:
+        algod_client: Algod client used to assemble the TEAL
+        module: contract module exposing approval_program() and get_clear_program()
+
+    Returns:
+        dict with approval/clear program bytes, TEAL lines and, per pc, the
+        (teal_line, pyteal_location) it came from
+    """
+    programs = get_compiled_programs(algod_client, module)
+    teal = programs["approval"]["teal"]
+    version = int(teal.splitlines()[0].split()[-1])
+
+    def pyteal_source_map():
+        compiled = Compilation(module.approval_program(), mode=Mode.Application, version=version).compile(
+            with_sourcemap=True
+        )
+        # Same TEAL as compileTeal, plus the TEAL line -> PyTeal line mapping. Several
+        # expressions can share a PyTeal line, label it with the widest one.
+        locations = {}
+        extracts = {}
+        for (line, _column), entry in compiled.sourcemap.r3_sourcemap.entries.items():
+            location = f"{entry.source}:{entry.source_line + 1}"
+            locations.setdefault(line, location)
+            extract = entry.source_extract.strip()
+            if len(extract) > len(extracts.get(location, "")):
+                extracts[location] = extract
+        return {line: f"{location}  {extracts[location]}" for line, location in locations.items()}
+
+    # Cached with the TEAL, so only the first profile of a contract change traces PyTeal
+    pyteal_lines = {}
+    if FeatureGates.sourcemap_enabled():
+        pyteal_lines = get_cached_json("pyteal_lines.json", pyteal_source_map, module)
+
+    return {
+        "version": version,
+        "approval": programs["approval"]["bytecode"],
+        "clear": programs["clear"]["bytecode"],
+        "teal_lines": teal.splitlines(),
+        "pc_to_line": SourceMap(programs["approval"]["source_map"]).get_line_for_pc,
+        "pyteal_lines": {int(line): location for line, location in pyteal_lines.items()},
+    }
+
+
+def trace_hotspots(program, trace):
+    """
+    Aggregate an approval program trace into budget spent per PyTeal line
+
+    Returns:
+        Counter of source location -> opcode cost
+    """
+    hotspots = Counter()
+    for step in trace:
+        line = program["pc_to_line"](step["pc"])
+        teal = program["teal_lines"][line].strip()
+        opcode = teal.split()[0] if teal else ""
+        location = program["pyteal_lines"].get(line, f"TEAL:{line + 1}  {teal}")
+        hotspots[location] += OPCODE_COSTS.get(opcode, 1)
+    return hotspots
+
+
+def qr_hash(session_id, qr_round, student_address):
+    """QR proof the teacher's screen encodes for a student"""
+    return hashlib.sha256(
+        session_id + qr_round.to_bytes(8, "big") + encoding.decode_address(student_address)
+    ).digest()
+
+
+def send(algod_client, txn, private_key):
+    """Sign, send and wait for a transaction"""
+    tx_id = algod_client.send_transaction(txn.sign(private_key))
+    return wait_for_confirmation(algod_client, tx_id, 4)
+
+
+def simulate(algod_client, txn, private_key):
+    """Simulate a transaction with an execution trace and return its txn result"""
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=[txn.sign(private_key)])],
+        exec_trace_config=SimulateTraceConfig(enable=True),
+    )
+    group = algod_client.simulate_transactions(request)["txn-groups"][0]
+    if "failure-message" in group:
+        raise RuntimeError(group["failure-message"])
+    return group["txn-results"][0]
+
+
+def new_funded_account(algod_client, amount=10_000_000):
+    """Create a LocalNet account funded by the dispenser"""
+    private_key, address = account.generate_account()
+    dispenser_key = mnemonic.to_private_key(LOCALNET_DISPENSER_MNEMONIC)
+    payment = PaymentTxn(
+        account.address_from_private_key(dispenser_key),
+        algod_client.suggested_params(),
+        address,
+        amount,
+    )
+    send(algod_client, payment, dispenser_key)
+    return private_key, address
+
+
+def profile_contract(algod_client, name):
+    """
+    Deploy one contract on LocalNet and profile each of its handlers
+
+    Every handler is simulated (for its cost and trace) and then sent, so the
+    next handler runs against the state a real session would have.
+
+    Args:
+        algod_client: LocalNet Algod client
+        name: Key of CONTRACTS ("contract" or "contract_v2_secure")
+
+    Returns:
+        dict with the evaluator, program sizes and, per handler, cost and hotspots
+    """
+    module = CONTRACTS[name]
+    program = compile_with_sourcemaps(algod_client, module)
+    has_boxes = program["version"] >= 8
+
+    teacher_key, teacher = new_funded_account(algod_client)
+    assistant_key, assistant = new_funded_account(algod_client)
+    student_key, student = new_funded_account(algod_client)
+    # A student checks in to a session in one mode only
+    box_student_key, box_student = new_funded_account(algod_client)
+    roster_student_key, roster_student = new_funded_account(algod_client)
+    sp = algod_client.suggested_params()
+    handlers = {}
+
+    def profile(handler, txn, private_key):
+        result = simulate(algod_client, txn, private_key)
+        hotspots = trace_hotspots(program, result["exec-trace"]["approval-program-trace"])
+        handlers[handler] = {
+            "cost": result["app-budget-consumed"],
+            "hotspots": hotspots.most_common(),
+        }
+        return send(algod_client, txn, private_key)
+
+    create = ApplicationCreateTxn(
+        sender=teacher,
+        sp=sp,
+        on_complete=OnComplete.NoOpOC,
+        approval_program=program["approval"],
+        clear_program=program["clear"],
+        global_schema=AttendanceDeployConfig.GLOBAL_SCHEMA,
+        local_schema=AttendanceDeployConfig.LOCAL_SCHEMA,
+        app_args=[GLOBAL_SESSION, b"Intro Lecture", (3600).to_bytes(8, "big")],
+        extra_pages=AttendanceDeployConfig.extra_program_pages(program["approval"], program["clear"]),
+    )
+    app_id = profile("create", create, teacher_key)["application-index"]
+    send(algod_client, PaymentTxn(teacher, sp, get_application_address(app_id), 1_000_000), teacher_key)
+
+    profile("opt_in", ApplicationOptInTxn(teacher, sp, app_id), teacher_key)
+    send(algod_client, ApplicationOptInTxn(assistant, sp, app_id), assistant_key)
+    send(algod_client, ApplicationOptInTxn(student, sp, app_id), student_key)
+
+    profile(
+        "add_teacher",
+        ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"add_teacher"], accounts=[assistant]),
+        teacher_key,
+    )
+    profile(
+        "create_session",
+        ApplicationNoOpTxn(
+            assistant,
+            sp,
+            app_id,
+            app_args=[b"create_session", GLOBAL_SESSION, b"Lecture 2", (3600).to_bytes(8, "big")],
+            boxes=[(0, session_box_name(GLOBAL_SESSION))] if has_boxes else None,
+        ),
+        assistant_key,
+    )
+
+    qr_round = algod_client.status()["last-round"]
+    proof = qr_hash(GLOBAL_SESSION, qr_round, student)
+    if has_boxes:
+        txn = mark_attendance_txn(student, sp, app_id, GLOBAL_SESSION, qr_round, proof)
+    else:
+        txn = ApplicationNoOpTxn(
+            student, sp, app_id, app_args=[b"mark_attendance", GLOBAL_SESSION, qr_round.to_bytes(8, "big"), proof]
+        )
+    profile("mark_attendance", txn, student_key)
+
+    if has_boxes:
+        profile("open_session", open_session_txn(assistant, sp, app_id, REGISTERED_SESSION, "Lab", 3600), assistant_key)
+        profile(
+            "create_roster",
+            create_roster_txn(assistant, sp, app_id, REGISTERED_SESSION, ROSTER_CAPACITY, track_rounds=True),
+            assistant_key,
+        )
+        profile("enroll", enroll_txn(assistant, sp, app_id, REGISTERED_SESSION, roster_student), assistant_key)
+
+        qr_round = algod_client.status()["last-round"]
+        proof = qr_hash(REGISTERED_SESSION, qr_round, student)
+        profile(
+            "mark_attendance[registered]",
+            mark_attendance_txn(student, sp, app_id, REGISTERED_SESSION, qr_round, proof),
+            student_key,
+        )
+        proof = qr_hash(REGISTERED_SESSION, qr_round, box_student)
+        profile(
+            "mark_attendance_box",
+            mark_attendance_box_txn(box_student, sp, app_id, REGISTERED_SESSION, qr_round, proof),
+            box_student_key,
+        )
+        proof = qr_hash(REGISTERED_SESSION, qr_round, roster_student)
+        profile(
+            "mark_attendance_bitmap",
+            mark_attendance_bitmap_txn(
+                roster_student, sp, app_id, REGISTERED_SESSION, qr_round, proof, ROSTER_CAPACITY, track_rounds=True
+            ),
+            roster_student_key,
+        )
+        profile(
+            "close_session[registered]",
+            close_session_txn(assistant, sp, app_id, REGISTERED_SESSION),
+            assistant_key,
+        )
+
+        send(algod_client, open_session_txn(assistant, sp, app_id, MERKLE_SESSION, "Seminar", 3600), assistant_key)
+        attendees = {account.generate_account()[1]: qr_round for _ in range(MERKLE_ATTENDEES - 1)}
+        attendees[student] = qr_round
+        tree = MerkleTree(attendees)
+        profile("close_session[commit]", commit_attendance_txn(assistant, sp, app_id, MERKLE_SESSION, tree), assistant_key)
+        # Cost depends on the leaf index bits, always prove leaf 0 so runs compare
+        merkle_proof = tree.proof(tree.addresses[0])
+        profile(
+            "verify_attendance",
+            verify_attendance_txn(
+                student, sp, app_id, MERKLE_SESSION, tree.addresses[0], qr_round, merkle_proof["index"], merkle_proof["proof"]
+            ),
+            student_key,
+        )
+
+    profile(
+        "remove_teacher",
+        ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"remove_teacher"], accounts=[assistant]),
+        teacher_key,
+    )
+    profile("close_session", ApplicationNoOpTxn(teacher, sp, app_id, app_args=[b"close_session"]), teacher_key)
+
+    evaluator = getattr(algod_client, "compile_target", "algod")
+    return {
+        "version": program["version"],
+        "evaluator": evaluator,
+        size_key(evaluator): {"approval": len(program["approval"]), "clear": len(program["clear"])},
+        "handlers": handlers,
+    }
+
+
+def size_key(evaluator):
+    """Report key of program sizes: assembled bytes from algod, TEAL source length from the in-process AVM"""
+    return "program_bytes" if evaluator == "algod" else "teal_bytes"
+
+
+def find_regressions(report, baseline, tolerance=0):
+    """
+    Compare a profile report against the stored baseline
+
+    Args:
+        report: dict of contract name -> profile_contract() result
+        baseline: dict loaded from opcode_baseline.json
+        tolerance: Extra opcodes/bytes allowed before a change counts as a regression
+
+    Returns:
+        List of human-readable regression messages (empty when within budget)
+    """
+    regressions = []
+    for name, profile in report.items():
+        expected = baseline.get(name, {})
+        key = size_key(profile["evaluator"])
+        # TEAL source length and assembled bytes don't compare
+        sizes = expected.get(key, {}) if expected.get("evaluator") == profile["evaluator"] else {}
+        for program, size in profile[key].items():
+            limit = sizes.get(program)
+            if limit is not None and size > limit + tolerance:
+                regressions.append(f"{name}.py {program} program: {size} bytes (baseline {limit})")
+        for handler, result in profile["handlers"].items():
+            limit = expected.get("handlers", {}).get(handler)
+            if limit is not None and result["cost"] > limit + tolerance:
+                regressions.append(f"{name}.py {handler}: {result['cost']} opcodes (baseline {limit})")
+            if result["cost"] > APP_CALL_BUDGET:
+                regressions.append(f"{name}.py {handler}: {result['cost']} opcodes exceeds the {APP_CALL_BUDGET} budget")
+    return regressions
+
+
+def baseline_from_report(report):
+    """Baseline entries (evaluator, program sizes and handler costs) for a profile report"""
+    return {
+        name: {
+            "evaluator": profile["evaluator"],
+            size_key(profile["evaluator"]): profile[size_key(profile["evaluator"])],
+            "handlers": {handler: result["cost"] for handler, result in profile["handlers"].items()},
+        }
+        for name, profile in report.items()
+    }
+
+
+def print_report(report, baseline, hotspots=3):
+    """Print per-handler costs and their top hotspots"""
+    for name, profile in report.items():
+        key = size_key(profile["evaluator"])
+        sizes = profile[key]
+        unit = "bytes" if key == "program_bytes" else "bytes of TEAL source"
+        print(f"\n📄 {name}.py (TEAL v{profile['version']}, approval {sizes['approval']} {unit}, clear {sizes['clear']} {unit})")
+        print(f"   {'handler':<30} {'cost':>6} {'budget':>7} {'baseline':>9}")
+        expected = baseline.get(name, {}).get("handlers", {})
+        for handler, result in profile["handlers"].items():
+            share = result["cost"] * 100 // APP_CALL_BUDGET
+            print(f"   {handler:<30} {result['cost']:>6} {share:>6}% {expected.get(handler, '-'):>9}")
+            for location, cost in result["hotspots"][:hotspots]:
+                print(f"      {cost:>5}  {location[:100]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile attendance contract opcode budget per handler")
+    parser.add_argument("--contract", choices=sorted(CONTRACTS), action="append", help="Contract(s) to profile")
+    parser.add_argument("--hotspots", type=int, default=3, help="Hotspot lines shown per handler")
+    parser.add_argument("--tolerance", type=int, default=0, help="Opcodes/bytes allowed above the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the current costs as the baseline")
+    parser.add_argument("--json", help="Write the full report to this file")
+    parser.add_argument("--network", choices=("local", "localnet"), default="localnet",
+                        help="localnet: AlgoKit LocalNet (default), local: in-process AVM")
+    args = parser.parse_args()
+
+    if args.network == "localnet":
+        algod_client = AttendanceDeployConfig.get_algod_client("localnet")
+    else:
+        from local_avm import LocalAlgodClient
+        algod_client = LocalAlgodClient()
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    report = {name: profile_contract(algod_client, name) for name in args.contract or CONTRACTS}
+    print_report(report, baseline, args.hotspots)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+    if args.update_baseline:
+        baseline.update(baseline_from_report(report))
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\n✅ Baseline written to {BASELINE_PATH.name}")
+        return
+
+    regressions = find_regressions(report, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Opcode budget regressions:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        sys.exit(1)
+    print("\n✅ All handlers within baseline")
+
+
+if __name__ == "__main__":
+    main()
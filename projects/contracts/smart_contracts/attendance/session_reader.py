@@ -0,0 +1,203 @@
+"""
+CampusChain AI - Single-Simulate Session Reads
+
+Rebuilding a session from application_info global state plus one
+account_application_info call per student costs N+1 requests. The contract's
+read-only get_session_summary and get_attendance_bitmap methods return the
+same data as logs, so a whole class is read with one simulate request:
+
+- nothing is signed or sent; simulate runs with empty signatures
+- accounts and boxes need no references (allow_unnamed_resources), but they
+  still count against the reference limits: 8 per app call, at most 4 of
+  them accounts. contract.py is TEAL v8, and below v9 an app call cannot use
+  the references of the other calls in its group, so each call is sized by
+  its own limits
+- each address costs up to 3 references (its account for local state, its
+  "a" and "e" boxes) next to the session's "s" and "b" boxes, so a call reads
+  2 students and a group of 16 calls about 30; larger classes take one
+  simulate request per ~30 students
+
+Usage:
+    from session_reader import read_session
+
+    status = read_session(algod_client, app_id, "CS101_L12", student_addresses, sender=teacher_address)
+    status["summary"]["total_attendance"], status["present"]
+"""
+
+import base64
+
+from algosdk import encoding
+from algosdk.transaction import ApplicationNoOpTxn, SignedTransaction, assign_group_id
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from box_storage import MAX_SESSION_ID_LENGTH, decode_bitmap, decode_session_record, session_box_name
+
+MAX_GROUP_SIZE = 16
+MAX_APP_ARGS_BYTES = 2048
+
+# Reference limits of each app call (not pooled over the group below TEAL v9)
+REFS_PER_APP_CALL = 8
+ACCOUNT_REFS_PER_APP_CALL = 4
+
+# Simulate may add up to 320000 opcodes; an address costs at most ~100
+READ_COST_PER_ADDRESS = 100
+APP_CALL_BUDGET = 700
+MAX_EXTRA_OPCODE_BUDGET = 320_000
+
+
+def _session_id(session_id):
+    return session_id.encode() if isinstance(session_id, str) else session_id
+
+
+def addresses_per_call(session_id):
+    """How many addresses fit in one get_attendance_bitmap call's app args"""
+    return (MAX_APP_ARGS_BYTES - len(b"get_attendance_bitmap") - len(_session_id(session_id))) // 32
+
+
+def references_per_address(session_id):
+    """References get_attendance_bitmap uses per address: the account, plus its "a" and "e" boxes"""
+    return 3 if len(_session_id(session_id)) <= MAX_SESSION_ID_LENGTH else 1
+
+
+def addresses_per_bitmap_call(session_id):
+    """
+    How many addresses one get_attendance_bitmap call can read
+
+    Its own references hold the session's "s" and "b" boxes (session_ids of at
+    most 31 bytes) and references_per_address() per address, out of
+    REFS_PER_APP_CALL, with at most ACCOUNT_REFS_PER_APP_CALL accounts; the
+    addresses must also fit in its app args.
+    """
+    box_refs = 2 if len(_session_id(session_id)) <= MAX_SESSION_ID_LENGTH else 0
+    return min(
+        (REFS_PER_APP_CALL - box_refs) // references_per_address(session_id),
+        ACCOUNT_REFS_PER_APP_CALL,
+        addresses_per_call(session_id),
+    )
+
+
+def plan_groups(session_id, count):
+    """
+    Split count addresses into simulate groups within each app call's reference limits
+
+    contract.py is TEAL v8, where an app call only has its own references, so
+    every attendance call carries at most addresses_per_bitmap_call()
+    addresses. The first group also carries the summary call.
+
+    Returns:
+        List of groups, each a list of address counts, one per attendance call
+    """
+    per_call = addresses_per_bitmap_call(session_id)
+    groups = []
+    remaining = count
+    while remaining or not groups:
+        summary_calls = 0 if groups else 1
+        addresses = min(remaining, per_call * (MAX_GROUP_SIZE - summary_calls))
+        calls = -(-addresses // per_call)
+        groups.append([addresses // calls + (index < addresses % calls) for index in range(calls)])
+        remaining -= addresses
+    return groups
+
+
+def session_summary_txn(sender, sp, app_id, session_id):
+    """Build a get_session_summary call"""
+    session_id = _session_id(session_id)
+    boxes = [(0, session_box_name(session_id))] if len(session_id) <= MAX_SESSION_ID_LENGTH else []
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[b"get_session_summary", session_id],
+        boxes=boxes
+    )
+
+
+def attendance_bitmap_txn(sender, sp, app_id, session_id, addresses):
+    """Build a get_attendance_bitmap call for up to addresses_per_call(session_id) students"""
+    return ApplicationNoOpTxn(
+        sender=sender,
+        sp=sp,
+        index=app_id,
+        app_args=[
+            b"get_attendance_bitmap",
+            _session_id(session_id),
+            b"".join(encoding.decode_address(address) for address in addresses)
+        ]
+    )
+
+
+def simulate_reads(algod_client, txns, addresses=0):
+    """
+    Simulate read-only calls as one group
+
+    Args:
+        algod_client: Algod client instance
+        txns: Read-only calls (at most 16)
+        addresses: Addresses read in total, to size the extra opcode budget
+
+    Returns:
+        The last log of each call (bytes), in order
+
+    Raises:
+        RuntimeError: If the simulated group fails
+    """
+    if len(txns) > 1:
+        txns = assign_group_id(txns)
+    extra_budget = min(MAX_EXTRA_OPCODE_BUDGET, max(0, READ_COST_PER_ADDRESS * addresses - APP_CALL_BUDGET * len(txns)))
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=[SignedTransaction(txn, None) for txn in txns])],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+        extra_opcode_budget=extra_budget,
+    )
+    group = algod_client.simulate_transactions(request)["txn-groups"][0]
+    if "failure-message" in group:
+        raise RuntimeError(group["failure-message"])
+    return [
+        base64.b64decode(result["txn-result"]["logs"][-1])
+        for result in group["txn-results"]
+    ]
+
+
+def read_session(algod_client, app_id, session_id, addresses=(), sender=None):
+    """
+    Read a session's summary and which of the given students attended it
+
+    Args:
+        algod_client: Algod client instance
+        app_id: Attendance application ID
+        session_id: Session in global state or registered with open_session
+        addresses: Student addresses to check
+        sender: Any funded account (fees are simulated, not paid), e.g. the teacher
+
+    Returns:
+        Dict with summary (decoded like box_storage.decode_session_record) and
+        present (the attending subset of addresses, in order)
+    """
+    addresses = list(addresses)
+    sp = algod_client.suggested_params()
+
+    summary = None
+    present = []
+    start = 0
+    # The first group also carries the summary call, later groups (classes over ~30) only attendance
+    for call_sizes in plan_groups(session_id, len(addresses)):
+        group_chunks = []
+        for size in call_sizes:
+            group_chunks.append(addresses[start:start + size])
+            start += size
+        txns = [] if summary is not None else [session_summary_txn(sender, sp, app_id, session_id)]
+        txns += [attendance_bitmap_txn(sender, sp, app_id, session_id, students) for students in group_chunks]
+        logs = simulate_reads(algod_client, txns, sum(call_sizes))
+
+        if summary is None:
+            summary = decode_session_record(logs.pop(0))
+        for students, bitmap in zip(group_chunks, logs):
+            present += [students[index] for index in decode_bitmap(bitmap) if index < len(students)]
+
+    return {"summary": summary, "present": present}
+
+
+def get_session_summary(algod_client, app_id, session_id, sender):
+    """Read a session's summary (global state or registered) with one simulate request"""
+    return read_session(algod_client, app_id, session_id, sender=sender)["summary"]
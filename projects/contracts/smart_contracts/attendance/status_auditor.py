@@ -0,0 +1,148 @@
+"""
+CampusChain AI - Teacher/Student Status Auditor
+
+Reports the state of many accounts in many attendance apps. Instead of one
+account_application_info call per account/app pair, every account is read
+once with account_info (which carries its local state in every app) and
+every app once with application_info (for the creator), all concurrently
+through async_algod. Ten thousand accounts in five apps take ten thousand
+requests rather than fifty thousand, spread over the worker pool.
+
+Each row is one account/app pair with opted_in, is_teacher, is_creator,
+creator and, for every session found in local state, checked_in:<session_id>
+and check_in_round:<session_id> columns.
+
+Usage:
+    from status_auditor import audit_status, write_report
+
+    rows = audit_status(algod_client, [755366519], addresses)
+    write_report("audit.csv", rows)  # or audit.json
+"""
+
+import asyncio
+import base64
+import csv
+import json
+
+from algosdk import error
+
+from async_algod import AsyncAlgodClient, decode_state, map_bounded
+
+DEFAULT_CONCURRENCY = 32
+BASE_COLUMNS = ["address", "app_id", "opted_in", "is_teacher", "is_creator", "creator", "error"]
+
+# Local state keys are these prefixes followed by the session ID (see contract.py)
+CHECKED_IN_PREFIX = "checked_in"
+CHECK_IN_ROUND_PREFIX = "check_in_round"
+
+
+def session_columns(state):
+    """
+    Per-session columns of one decoded local state
+
+    Returns:
+        Dict of "checked_in:<session_id>" / "check_in_round:<session_id>" -> value
+    """
+    columns = {}
+    for key, value in state.items():
+        if key.startswith(CHECK_IN_ROUND_PREFIX):
+            columns[f"check_in_round:{key[len(CHECK_IN_ROUND_PREFIX):]}"] = value
+        elif key.startswith(CHECKED_IN_PREFIX):
+            columns[f"checked_in:{key[len(CHECKED_IN_PREFIX):]}"] = value
+    return columns
+
+
+async def _fetch(algod_client, app_ids, addresses, concurrency):
+    async with AsyncAlgodClient(algod_client, concurrency=concurrency) as client:
+        apps = await map_bounded(client.application_info, app_ids, concurrency, return_exceptions=True)
+        accounts = await map_bounded(client.account_info, addresses, concurrency, return_exceptions=True)
+    return apps, accounts
+
+
+def _error_text(result):
+    if isinstance(result, error.AlgodHTTPError):
+        return f"HTTP {result.code}: {result}"
+    return str(result) or type(result).__name__
+
+
+def audit_status(algod_client, app_ids, addresses, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Fetch and decode the state of every account in every app
+
+    Args:
+        algod_client: Algod client instance
+        app_ids: Attendance application IDs
+        addresses: Account addresses
+        concurrency: Requests in flight
+
+    Returns:
+        List of row dicts (BASE_COLUMNS plus per-session columns), grouped by address
+    """
+    app_ids = list(dict.fromkeys(app_ids))
+    addresses = list(dict.fromkeys(addresses))
+    apps, accounts = asyncio.run(_fetch(algod_client, app_ids, addresses, concurrency))
+
+    creators = {}
+    app_errors = {}
+    for app_id, app in zip(app_ids, apps):
+        if isinstance(app, Exception):
+            app_errors[app_id] = _error_text(app)
+        else:
+            creators[app_id] = app["params"]["creator"]
+
+    rows = []
+    for address, account_info in zip(addresses, accounts):
+        # Decode each account's local state once, then split it per app
+        local_states = {}
+        if not isinstance(account_info, Exception):
+            for app_state in account_info.get("apps-local-state", []):
+                local_states[app_state["id"]] = decode_state(app_state.get("key-value", []))
+
+        for app_id in app_ids:
+            creator = creators.get(app_id, "")
+            row = {
+                "address": address,
+                "app_id": app_id,
+                "opted_in": app_id in local_states,
+                "is_teacher": False,
+                "is_creator": address == creator,
+                "creator": creator,
+                "error": _error_text(account_info) if isinstance(account_info, Exception) else app_errors.get(app_id, ""),
+            }
+            state = local_states.get(app_id)
+            if state is not None:
+                # On-chain flag only; a creator that opted in before it existed shows up as False
+                row["is_teacher"] = state.get("is_teacher", 0) == 1
+                row.update(session_columns(state))
+            rows.append(row)
+    return rows
+
+
+def report_columns(rows):
+    """BASE_COLUMNS followed by every session column present, sorted"""
+    extra = sorted({key for row in rows for key in row} - set(BASE_COLUMNS))
+    return BASE_COLUMNS + extra
+
+
+def write_report(path_or_file, rows, fmt=None):
+    """
+    Write audit rows as CSV or JSON
+
+    Args:
+        path_or_file: Output path, or an open text file
+        rows: Rows from audit_status
+        fmt: "csv" or "json"; by default taken from the path's extension (csv otherwise)
+    """
+    if fmt is None:
+        fmt = "json" if isinstance(path_or_file, str) and path_or_file.endswith(".json") else "csv"
+    if isinstance(path_or_file, str):
+        with open(path_or_file, "w", newline="") as f:
+            return write_report(f, rows, fmt)
+
+    if fmt == "json":
+        json.dump(rows, path_or_file, indent=2, default=lambda value: base64.b64encode(value).decode())
+        path_or_file.write("\n")
+    else:
+        writer = csv.DictWriter(path_or_file, fieldnames=report_columns(rows), restval="")
+        writer.writeheader()
+        writer.writerows(rows)
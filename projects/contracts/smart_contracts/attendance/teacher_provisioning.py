@@ -0,0 +1,199 @@
+"""
+CampusChain AI - Bulk Teacher Provisioning
+
+Adds and removes many teachers in one non-interactive run instead of one
+manage_teachers.py session per teacher:
+
+1. read a CSV with an `address` column and an optional `action` column
+   (add or remove, default add)
+2. check every teacher's opt-in and current is_teacher flag concurrently
+   and skip no-ops and accounts that have not opted in
+3. pack the remaining add_teacher / remove_teacher calls into atomic groups
+   of 16 and send them all before waiting (pipelined)
+4. wait for the groups through the confirmation tracker, re-read every
+   teacher's flag and report whether it now matches the request
+
+Usage:
+    from teacher_provisioning import provision_teachers, read_teacher_csv, write_report
+
+    report = provision_teachers(algod_client, admin_private_key, app_id, read_teacher_csv("faculty.csv"))
+    write_report("faculty_report.csv", report)
+"""
+
+import asyncio
+import csv
+
+from algosdk import account, encoding, error
+from algosdk.transaction import ApplicationNoOpTxn, assign_group_id
+
+from async_algod import AsyncAlgodClient, account_app_states, batched
+from confirmation_tracker import get_confirmation_tracker
+from params_cache import get_params_provider
+
+MAX_GROUP_SIZE = 16
+DEFAULT_CONCURRENCY = 16
+ACTIONS = ("add", "remove")
+
+# Outcomes per teacher
+APPLIED = "applied"
+NO_OP = "no-op"
+NOT_OPTED_IN = "not opted in"
+INVALID = "invalid"
+FAILED = "failed"
+
+REPORT_COLUMNS = ["address", "action", "outcome", "is_teacher", "ok", "tx_id", "error"]
+
+
+def read_teacher_csv(path):
+    """
+    Read teacher changes from a CSV file
+
+    Args:
+        path: CSV with an address column and an optional action column (add/remove)
+
+    Returns:
+        List of (address, action) in file order
+
+    Raises:
+        ValueError: If there is no address column
+    """
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or "address" not in [name.strip().lower() for name in reader.fieldnames]:
+            raise ValueError(f"{path} needs an 'address' column")
+        changes = []
+        for row in reader:
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            if row.get("address"):
+                changes.append((row["address"], (row.get("action") or "add").lower()))
+        return changes
+
+
+def teacher_call_txn(admin_address, sp, app_id, teacher_address, action):
+    """Build one add_teacher or remove_teacher call"""
+    return ApplicationNoOpTxn(
+        sender=admin_address,
+        sp=sp,
+        index=app_id,
+        app_args=[f"{action}_teacher".encode()],
+        accounts=[teacher_address]
+    )
+
+
+def _read_flags(algod_client, app_id, addresses, concurrency):
+    """address -> is_teacher (0/1), or None if not opted in"""
+    async def fetch():
+        async with AsyncAlgodClient(algod_client, concurrency=concurrency) as client:
+            return await account_app_states(client, app_id, addresses)
+
+    states = asyncio.run(fetch())
+    return {
+        address: None if state is None else state.get("is_teacher", 0)
+        for address, state in states.items()
+    }
+
+
+def provision_teachers(
+    algod_client,
+    admin_private_key,
+    app_id,
+    changes,
+    group_size=MAX_GROUP_SIZE,
+    concurrency=DEFAULT_CONCURRENCY,
+    timeout=120
+):
+    """
+    Apply teacher additions and removals in grouped, pipelined calls
+
+    Args:
+        algod_client: Algod client instance
+        admin_private_key: Private key of the app creator
+        app_id: Attendance application ID
+        changes: (address, action) pairs; a later entry for an address wins
+        group_size: Calls per atomic group (at most 16)
+        concurrency: Parallel state reads
+        timeout: Seconds to wait for confirmations
+
+    Returns:
+        One report dict per address (see REPORT_COLUMNS), in first-seen order
+    """
+    admin_address = account.address_from_private_key(admin_private_key)
+    group_size = min(group_size, MAX_GROUP_SIZE)
+
+    report = {}
+    for address, action in changes:
+        entry = report.setdefault(address, {"address": address, "tx_id": "", "error": ""})
+        entry["action"] = action
+        entry["outcome"] = None
+        if action not in ACTIONS:
+            entry["outcome"], entry["error"] = INVALID, f"unknown action {action!r}"
+        elif not encoding.is_valid_address(address):
+            entry["outcome"], entry["error"] = INVALID, "not an Algorand address"
+
+    # Pre-check opt-in and the current flag of every valid address at once
+    candidates = [address for address, entry in report.items() if entry["outcome"] is None]
+    current = _read_flags(algod_client, app_id, candidates, concurrency)
+    pending = []
+    for address in candidates:
+        entry = report[address]
+        if current[address] is None:
+            entry["outcome"] = NOT_OPTED_IN
+        elif current[address] == (1 if entry["action"] == "add" else 0):
+            entry["outcome"] = NO_OP
+        else:
+            pending.append(address)
+
+    # Send every group before waiting for any of them
+    params_provider = get_params_provider(algod_client)
+    tracker = get_confirmation_tracker(algod_client)
+    in_flight = []
+    for members in batched(pending, group_size):
+        sp = params_provider.get()
+        txns = [teacher_call_txn(admin_address, sp, app_id, address, report[address]["action"]) for address in members]
+        if len(txns) > 1:
+            txns = assign_group_id(txns)
+        signed = [txn.sign(admin_private_key) for txn in txns]
+        try:
+            algod_client.send_transactions(signed)
+        except error.AlgodHTTPError as e:
+            for address in members:
+                report[address]["outcome"], report[address]["error"] = FAILED, str(e)
+            continue
+        for address, stxn in zip(members, signed):
+            report[address]["tx_id"] = stxn.get_txid()
+        in_flight.append((members, tracker.track(signed[0].get_txid(), txns[0].last_valid_round)))
+
+    for members, future in in_flight:
+        try:
+            future.result(timeout=timeout)
+            outcome, message = APPLIED, ""
+        except Exception as e:
+            outcome, message = FAILED, str(e) or type(e).__name__
+        for address in members:
+            report[address]["outcome"], report[address]["error"] = outcome, message
+
+    # Reconcile against the chain, whatever the outcome was
+    final = _read_flags(algod_client, app_id, candidates, concurrency)
+    for address, entry in report.items():
+        flag = final.get(address)
+        entry["is_teacher"] = "" if flag is None else flag
+        wanted = 1 if entry["action"] == "add" else 0
+        entry["ok"] = entry["outcome"] != INVALID and flag == wanted
+    return list(report.values())
+
+
+def write_report(path, report):
+    """Write a provision_teachers report as CSV"""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(report)
+
+
+def summarize(report):
+    """Count teachers per outcome, plus how many ended up as requested"""
+    counts = {}
+    for entry in report:
+        counts[entry["outcome"]] = counts.get(entry["outcome"], 0) + 1
+    counts["ok"] = sum(1 for entry in report if entry["ok"])
+    return counts
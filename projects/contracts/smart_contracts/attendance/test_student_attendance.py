@@ -9,11 +9,16 @@ This script simulates a student marking attendance:
 5. Verify on-chain
 """
 
-from algosdk import account, mnemonic
-from algosdk.v2client import algod
-from algosdk.transaction import ApplicationOptInTxn, ApplicationNoOpTxn, wait_for_confirmation
+from algosdk import account, encoding, mnemonic
+from algosdk.transaction import ApplicationOptInTxn, wait_for_confirmation
+import hashlib
 import time
 
+from algod_pool import get_algod_client
+from box_storage import mark_attendance_txn
+from params_cache import get_params_provider
+from session_reader import read_session
+
 
 def main():
     print("=" * 60)
@@ -22,7 +27,8 @@ def main():
     
     # Connect to TestNet
     print("\n[1/6] Connecting to TestNet...")
-    algod_client = algod.AlgodClient("", "https://testnet-api.algonode.cloud")
+    algod_client = get_algod_client("testnet")
+    params_provider = get_params_provider(algod_client)
     
     try:
         status = algod_client.status()
@@ -94,7 +100,7 @@ def main():
     # Opt-in to app
     print("\n[4/6] Opting in to attendance app...")
     try:
-        params = algod_client.suggested_params()
+        params = params_provider.get()
         
         opt_in_txn = ApplicationOptInTxn(
             sender=student_address,
@@ -124,14 +130,15 @@ def main():
     # Mark attendance
     print("\n[5/6] Marking attendance...")
     try:
-        params = algod_client.suggested_params()
+        params = params_provider.get()
         
-        mark_txn = ApplicationNoOpTxn(
-            sender=student_address,
-            sp=params,
-            index=app_id,
-            app_args=[b"mark_attendance", session_id.encode()]
-        )
+        # The QR on screen: the current round, bound to this student's wallet
+        qr_round = algod_client.status()["last-round"]
+        qr_hash = hashlib.sha256(
+            session_id.encode() + qr_round.to_bytes(8, "big") + encoding.decode_address(student_address)
+        ).digest()
+        # References the boxes the contract checks (box_storage.check_in_box_refs)
+        mark_txn = mark_attendance_txn(student_address, params, app_id, session_id, qr_round, qr_hash)
         
         signed_txn = mark_txn.sign(student_private_key)
         tx_id = algod_client.send_transaction(signed_txn)
@@ -162,52 +169,18 @@ def main():
             print(f"❌ Error: {e}")
         return
     
-    # Verify local state
+    # Verify on-chain state (summary + this student's attendance in one simulate request)
     print("\n[6/6] Verifying on-chain state...")
     try:
-        account_info = algod_client.account_application_info(student_address, app_id)
-        
-        if 'app-local-state' in account_info:
-            local_state = account_info['app-local-state'].get('key-value', [])
-            
-            print("\n📊 Student's Local State:")
-            for item in local_state:
-                key = item['key']
-                value = item['value']
-                
-                # Decode key
-                import base64
-                key_decoded = base64.b64decode(key).decode('utf-8')
-                
-                # Get value
-                if value['type'] == 1:  # bytes
-                    val = base64.b64decode(value['bytes']).decode('utf-8')
-                else:  # uint
-                    val = value['uint']
-                
-                print(f"  {key_decoded}: {val}")
-        
-        # Get global state
-        app_info = algod_client.application_info(app_id)
-        global_state = app_info['params'].get('global-state', [])
-        
-        print("\n📊 Global State (Session Info):")
-        for item in global_state:
-            key = item['key']
-            value = item['value']
-            
-            import base64
-            key_decoded = base64.b64decode(key).decode('utf-8')
-            
-            if value['type'] == 1:  # bytes
-                try:
-                    val = base64.b64decode(value['bytes']).decode('utf-8')
-                except:
-                    val = value['bytes']
-            else:  # uint
-                val = value['uint']
-            
-            print(f"  {key_decoded}: {val}")
+        status = read_session(algod_client, app_id, session_id, [student_address], sender=student_address)
+        summary = status["summary"]
+        
+        print("\n📊 Session:")
+        print(f"  session_name: {summary['session_name']}")
+        print(f"  is_active: {summary['is_active']}")
+        print(f"  total_attendance: {summary['total_attendance']}")
+        print(f"  end_round: {summary['end_round']}")
+        print(f"\n📊 Student checked in: {student_address in status['present']}")
         
         print("\n✅ Verification complete!")
         
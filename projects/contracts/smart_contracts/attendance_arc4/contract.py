@@ -0,0 +1,391 @@
+from algopy import *
+from algopy.arc4 import abimethod, baremethod
+
+# Same rules and storage layout as the PyTeal contract in smart_contracts/attendance,
+# so box_storage.py and the frontend read both deployments the same way.
+QR_VALIDITY_ROUNDS = 20  # QR valid for 20 rounds (~60 seconds)
+SECONDS_PER_ROUND = 3
+MAX_BOX_SESSION_ID_LENGTH = 31  # 1 (prefix) + 31 + 32 (address) = 64 byte box name limit
+MAX_ROUND_DELTA = 65535  # round deltas are stored in 2 bytes
+
+# Session registry record offsets ("s" + session_id box)
+SESSION_START_ROUND = 0
+SESSION_ATTENDANCE_END_ROUND = 16
+SESSION_IS_ACTIVE = 24
+SESSION_TOTAL_ATTENDANCE = 32
+SESSION_TEACHER = 40
+SESSION_HEADER_SIZE = 72
+
+# Bitmap roster record offsets ("n" + session_id box)
+ROSTER_CAPACITY = 0
+ROSTER_ENROLLED_COUNT = 8
+ROSTER_TRACK_ROUNDS = 16
+ROSTER_RECORD_SIZE = 24
+
+
+class Attendance(
+    ARC4Contract,
+    # checked_in<session_id>/check_in_round<session_id> local keys are dynamic, reserve them explicitly
+    # (16 is the AVM's local schema limit: is_teacher + 7 sessions + 1 spare)
+    state_totals=StateTotals(global_uints=5, global_bytes=3, local_uints=16, local_bytes=0),
+):
+    session_id: Bytes
+    session_name: Bytes
+    creator: Account
+    start_round: UInt64
+    end_round: UInt64
+    attendance_end_round: UInt64
+    is_active: UInt64
+    total_attendance: UInt64
+
+    def __init__(self) -> None:
+        """Initializes contract storages on deployment"""
+        self.is_teacher = LocalState(UInt64, key="is_teacher")
+
+    # ------------------------------ lifecycle ------------------------------ #
+
+    @abimethod(create="require")
+    def create(
+        self, session_id: Bytes, session_name: Bytes, duration_seconds: UInt64, attendance_window_seconds: UInt64
+    ) -> None:
+        """Creates the app with its first session (attendance_window_seconds=0 means the whole session)"""
+        self.creator = Txn.sender
+        self._start_global_session(session_id, session_name, duration_seconds, attendance_window_seconds)
+
+    @abimethod(allow_actions=["OptIn"])
+    def opt_in(self) -> None:
+        """Opts in the sender; the creator is granted teacher privileges"""
+        self.is_teacher[Txn.sender] = UInt64(1) if Txn.sender == self.creator else UInt64(0)
+
+    @baremethod(allow_actions=["CloseOut"])
+    def close_out(self) -> None:
+        """Allows students and teachers to leave the app"""
+
+    # ------------------------------ teachers ------------------------------- #
+
+    @abimethod()
+    def add_teacher(self, teacher: Account) -> None:
+        """Grants teacher privileges (admin only, teacher must be opted in)"""
+        assert Txn.sender == self.creator, "Only the creator can manage teachers"
+        self.is_teacher[teacher] = UInt64(1)
+
+    @abimethod()
+    def remove_teacher(self, teacher: Account) -> None:
+        """Revokes teacher privileges (admin only)"""
+        assert Txn.sender == self.creator, "Only the creator can manage teachers"
+        self.is_teacher[teacher] = UInt64(0)
+
+    # ------------------------------ sessions ------------------------------- #
+
+    @abimethod()
+    def create_session(
+        self, session_id: Bytes, session_name: Bytes, duration_seconds: UInt64, attendance_window_seconds: UInt64
+    ) -> None:
+        """Replaces the session held in global state"""
+        assert self._is_authorized_teacher(), "Caller is not an authorized teacher"
+        if session_id.length <= MAX_BOX_SESSION_ID_LENGTH:
+            _length, registered = op.Box.length(Bytes(b"s") + session_id)
+            assert not registered, "Session ID is registered"
+        self._start_global_session(session_id, session_name, duration_seconds, attendance_window_seconds)
+
+    @abimethod()
+    def close_session(self) -> None:
+        """Closes the session held in global state"""
+        self._close_global_session()
+
+    @abimethod()
+    def open_session(
+        self, session_id: Bytes, session_name: Bytes, duration_seconds: UInt64, attendance_window_seconds: UInt64
+    ) -> None:
+        """Registers a concurrent session in its own "s" + session_id box"""
+        assert self._is_authorized_teacher(), "Caller is not an authorized teacher"
+        assert session_id.length <= MAX_BOX_SESSION_ID_LENGTH, "Session ID too long"
+        assert session_id != self.session_id, "Session ID is held in global state"
+
+        end_round = Global.round + duration_seconds // SECONDS_PER_ROUND
+        attendance_end_round = self._attendance_end_round(duration_seconds, attendance_window_seconds)
+
+        name = Bytes(b"s") + session_id
+        assert op.Box.create(name, SESSION_HEADER_SIZE + session_name.length), "Session already registered"
+        op.Box.replace(
+            name,
+            SESSION_START_ROUND,
+            op.itob(Global.round)
+            + op.itob(end_round)
+            + op.itob(attendance_end_round)
+            + op.itob(1)
+            + op.itob(0)
+            + Txn.sender.bytes
+            + session_name,
+        )
+
+    @abimethod()
+    def close_registered_session(self, session_id: Bytes) -> None:
+        """Closes a registered session (opening teacher or admin)"""
+        self._close_registered_session(session_id)
+
+    @abimethod()
+    def commit_attendance(self, session_id: Bytes, merkle_root: Bytes, count: UInt64) -> None:
+        """Closes either kind of session and stores the Merkle root of its off-chain attendance"""
+        if session_id == self.session_id:
+            self._close_global_session()
+        else:
+            self._close_registered_session(session_id)
+
+        assert merkle_root.length == 32, "Merkle root must be 32 bytes"
+        name = Bytes(b"m") + session_id
+        assert op.Box.create(name, 40), "Attendance already committed"
+        op.Box.put(name, merkle_root + op.itob(count))
+
+    @abimethod()
+    def verify_attendance(
+        self, session_id: Bytes, student: arc4.Address, qr_round: UInt64, leaf_index: UInt64, proof: Bytes
+    ) -> None:
+        """Proves a student is in a committed session's Merkle tree (proof: sibling hashes, leaf to root)"""
+        assert proof.length % 32 == 0, "Proof must be 32-byte hashes"
+        commitment = Bytes(b"m") + session_id
+        assert leaf_index < op.btoi(op.Box.extract(commitment, 32, 8)), "Leaf outside the commitment"
+
+        node = op.sha256(Bytes(b"\x00") + student.bytes + op.itob(qr_round))
+        index = leaf_index
+        for offset in urange(0, proof.length, 32):
+            sibling = op.extract(proof, offset, 32)
+            # Even index: the node is the left child
+            if index % 2 == 0:
+                node = op.sha256(Bytes(b"\x01") + node + sibling)
+            else:
+                node = op.sha256(Bytes(b"\x01") + sibling + node)
+            index //= 2
+
+        # A proof shorter than the tree would leave index bits unused
+        assert index == 0, "Proof does not reach the root"
+        assert node == op.Box.extract(commitment, 0, 32), "Student not in the committed attendance"
+
+    @abimethod()
+    def pool_budget(self) -> None:
+        """Adds 700 opcodes to the group's pooled budget (anyone can call)"""
+
+    # ----------------------------- attendance ------------------------------ #
+
+    @abimethod()
+    def mark_attendance(self, session_id: Bytes, qr_round: UInt64, qr_hash: Bytes) -> None:
+        """Records attendance in the student's local state (requires opt-in)"""
+        is_global, _start_round = self._check_session_open(session_id)
+
+        checked_in_key = Bytes(b"checked_in") + session_id
+        assert op.AppLocal.get_uint64(Txn.sender, checked_in_key) == 0, "Attendance already marked"
+        # Nor in box mode, and isn't on the session's roster (box modes need a session_id
+        # that fits in a box name)
+        if session_id.length <= MAX_BOX_SESSION_ID_LENGTH:
+            assert not self._has_box(Bytes(b"a") + session_id + Txn.sender.bytes), "Attendance already marked"
+            assert not self._has_box(Bytes(b"e") + session_id + Txn.sender.bytes), "Student is enrolled"
+        self._verify_qr_proof(session_id, qr_round, qr_hash)
+
+        op.AppLocal.put(Txn.sender, checked_in_key, UInt64(1))
+        op.AppLocal.put(Txn.sender, Bytes(b"check_in_round") + session_id, Global.round)
+        self._count_attendance(session_id, is_global)
+
+    @abimethod()
+    def mark_attendance_box(self, session_id: Bytes, qr_round: UInt64, qr_hash: Bytes) -> None:
+        """Records attendance in an "a" + session_id + student box (no opt-in required)"""
+        is_global, _start_round = self._check_session_open(session_id)
+        assert session_id.length <= MAX_BOX_SESSION_ID_LENGTH, "Session ID too long"
+        self._verify_qr_proof(session_id, qr_round, qr_hash)
+        assert not self._checked_in_local(session_id), "Attendance already marked"
+        assert not self._has_box(Bytes(b"e") + session_id + Txn.sender.bytes), "Student is enrolled"
+
+        name = Bytes(b"a") + session_id + Txn.sender.bytes
+        assert op.Box.create(name, 8), "Attendance already marked"
+        op.Box.put(name, op.itob(Global.round))
+        self._count_attendance(session_id, is_global)
+
+    @abimethod()
+    def create_roster(self, session_id: Bytes, capacity: UInt64, track_rounds: bool) -> None:  # noqa: FBT001
+        """Creates a session roster record, its bitmap (1 bit per slot) and optionally a 2-byte round delta per slot"""
+        assert self._is_authorized_teacher(), "Caller is not an authorized teacher"
+        assert session_id.length <= MAX_BOX_SESSION_ID_LENGTH, "Session ID too long"
+        assert capacity > 0, "Capacity must be greater than zero"
+
+        roster = Bytes(b"n") + session_id
+        assert op.Box.create(roster, ROSTER_RECORD_SIZE), "Roster already exists"
+        op.Box.put(roster, op.itob(capacity) + op.itob(0) + op.itob(UInt64(1) if track_rounds else UInt64(0)))
+        assert op.Box.create(Bytes(b"b") + session_id, (capacity + 7) // 8), "Roster already exists"
+        if track_rounds:
+            assert op.Box.create(Bytes(b"r") + session_id, capacity * 2), "Roster already exists"
+
+    @abimethod()
+    def enroll(self, session_id: Bytes, student: arc4.Address) -> UInt64:
+        """Assigns a student the roster's next slot and returns it (teacher only)"""
+        assert self._is_authorized_teacher(), "Caller is not an authorized teacher"
+
+        roster = Bytes(b"n") + session_id
+        slot = op.btoi(op.Box.extract(roster, ROSTER_ENROLLED_COUNT, 8))
+        assert slot < op.btoi(op.Box.extract(roster, ROSTER_CAPACITY, 8)), "Roster is full"
+
+        name = Bytes(b"e") + session_id + student.bytes
+        assert op.Box.create(name, 8), "Already enrolled"
+        op.Box.put(name, op.itob(slot))
+        op.Box.replace(roster, ROSTER_ENROLLED_COUNT, op.itob(slot + 1))
+        return slot
+
+    @abimethod()
+    def mark_attendance_bitmap(self, session_id: Bytes, qr_round: UInt64, qr_hash: Bytes) -> None:
+        """Records attendance as one bit in the session bitmap at the student's enrollment slot"""
+        is_global, start_round = self._check_session_open(session_id)
+        assert session_id.length <= MAX_BOX_SESSION_ID_LENGTH, "Session ID too long"
+        self._verify_qr_proof(session_id, qr_round, qr_hash)
+        # Not checked in with local state or in box mode before enrolling
+        assert not self._checked_in_local(session_id), "Attendance already marked"
+        assert not self._has_box(Bytes(b"a") + session_id + Txn.sender.bytes), "Attendance already marked"
+
+        enrollment, enrolled = op.Box.get(Bytes(b"e") + session_id + Txn.sender.bytes)
+        assert enrolled, "Student is not enrolled"
+        slot = op.btoi(enrollment)
+        roster = Bytes(b"n") + session_id
+        assert slot < op.btoi(op.Box.extract(roster, ROSTER_CAPACITY, 8)), "Slot outside the roster"
+
+        bitmap = Bytes(b"b") + session_id
+        slot_byte = op.Box.extract(bitmap, slot // 8, 1)
+        assert op.getbit(slot_byte, slot % 8) == 0, "Attendance already marked"
+        op.Box.replace(bitmap, slot // 8, op.setbit_bytes(slot_byte, slot % 8, True))
+
+        if op.btoi(op.Box.extract(roster, ROSTER_TRACK_ROUNDS, 8)):
+            delta = Global.round - start_round
+            assert delta <= MAX_ROUND_DELTA, "Round delta does not fit in 2 bytes"
+            op.Box.replace(Bytes(b"r") + session_id, slot * 2, op.extract(op.itob(delta), 6, 2))
+
+        self._count_attendance(session_id, is_global)
+
+    # ------------------------------- readers ------------------------------- #
+
+    @abimethod(readonly=True)
+    def get_session_summary(self, session_id: Bytes) -> Bytes:
+        """
+        Returns the session in the registered record layout for both kinds of session:
+        start_round | end_round | attendance_end_round | is_active | total_attendance | teacher | session_name
+        (teacher is the creator for the session held in global state)
+        """
+        if session_id == self.session_id:
+            return (
+                op.itob(self.start_round)
+                + op.itob(self.end_round)
+                + op.itob(self.attendance_end_round)
+                + op.itob(self.is_active)
+                + op.itob(self.total_attendance)
+                + self.creator.bytes
+                + self.session_name
+            )
+        record, registered = op.Box.get(Bytes(b"s") + session_id)
+        assert registered, "Session not found"
+        return record
+
+    @abimethod(readonly=True)
+    def get_attendance_bitmap(self, session_id: Bytes, addresses: Bytes) -> Bytes:
+        """
+        Returns one bit per address (32 bytes each; bit 0 is the high bit of byte 0, as getbit),
+        set when the student checked in with any attendance mode. Simulate with
+        allow_unnamed_resources so the accounts and boxes need no references.
+        """
+        assert addresses.length % 32 == 0, "Addresses must be 32 bytes each"
+        bits = op.bzero((addresses.length // 32 + 7) // 8)
+        # Box names only fit session_ids of up to 31 bytes
+        fits_box_name = session_id.length <= MAX_BOX_SESSION_ID_LENGTH
+        bitmap = Bytes(b"b") + session_id
+        bitmap_length = UInt64(0)
+        if fits_box_name:
+            bitmap_length, _exists = op.Box.length(bitmap)
+
+        for offset in urange(0, addresses.length, 32):
+            address = op.extract(addresses, offset, 32)
+            # Local state mode (account does not need to be opted in)
+            present, _exists = op.AppLocal.get_ex_uint64(
+                Account(address), Global.current_application_id, Bytes(b"checked_in") + session_id
+            )
+            # Box mode
+            if not present and fits_box_name and self._has_box(Bytes(b"a") + session_id + address):
+                present = UInt64(1)
+            # Bitmap roster mode: the student's slot bit
+            if not present and bitmap_length:
+                enrollment, enrolled = op.Box.get(Bytes(b"e") + session_id + address)
+                if enrolled and op.btoi(enrollment) // 8 < bitmap_length:
+                    slot = op.btoi(enrollment)
+                    if op.getbit(op.Box.extract(bitmap, slot // 8, 1), slot % 8):
+                        present = UInt64(1)
+            bits = op.setbit_bytes(bits, offset // 32, bool(present))
+        return bits
+
+    # ----------------------------- subroutines ----------------------------- #
+
+    @subroutine
+    def _is_authorized_teacher(self) -> bool:
+        return Txn.sender == self.creator or self.is_teacher.get(Txn.sender, default=UInt64(0)) == 1
+
+    @subroutine
+    def _has_box(self, name: Bytes) -> bool:
+        _length, exists = op.Box.length(name)
+        return exists
+
+    @subroutine
+    def _checked_in_local(self, session_id: Bytes) -> bool:
+        # app_local_get_ex reads 0 for students who never opted in
+        checked_in, _exists = op.AppLocal.get_ex_uint64(
+            Txn.sender, Global.current_application_id, Bytes(b"checked_in") + session_id
+        )
+        return checked_in != 0
+
+    @subroutine
+    def _close_global_session(self) -> None:
+        assert self._is_authorized_teacher(), "Caller is not an authorized teacher"
+        self.is_active = UInt64(0)
+
+    @subroutine
+    def _close_registered_session(self, session_id: Bytes) -> None:
+        name = Bytes(b"s") + session_id
+        teacher = op.Box.extract(name, SESSION_TEACHER, 32)
+        assert Txn.sender.bytes == teacher or Txn.sender == self.creator, "Only the session teacher can close it"
+        op.Box.replace(name, SESSION_IS_ACTIVE, op.itob(0))
+
+    @subroutine
+    def _attendance_end_round(self, duration_seconds: UInt64, attendance_window_seconds: UInt64) -> UInt64:
+        window = attendance_window_seconds if attendance_window_seconds else duration_seconds
+        return Global.round + window // SECONDS_PER_ROUND
+
+    @subroutine
+    def _start_global_session(
+        self, session_id: Bytes, session_name: Bytes, duration_seconds: UInt64, attendance_window_seconds: UInt64
+    ) -> None:
+        self.session_id = session_id
+        self.session_name = session_name
+        self.start_round = Global.round
+        self.end_round = Global.round + duration_seconds // SECONDS_PER_ROUND
+        self.attendance_end_round = self._attendance_end_round(duration_seconds, attendance_window_seconds)
+        self.is_active = UInt64(1)
+        self.total_attendance = UInt64(0)
+
+    @subroutine
+    def _check_session_open(self, session_id: Bytes) -> tuple[bool, UInt64]:
+        """Checks the targeted session only: global state session or its registry box"""
+        if session_id == self.session_id:
+            assert self.is_active == 1, "Session is not active"
+            assert Global.round <= self.attendance_end_round, "Attendance window closed"
+            return True, self.start_round
+
+        name = Bytes(b"s") + session_id
+        assert op.btoi(op.Box.extract(name, SESSION_IS_ACTIVE, 8)) == 1, "Session is not active"
+        assert Global.round <= op.btoi(op.Box.extract(name, SESSION_ATTENDANCE_END_ROUND, 8)), "Attendance window closed"
+        return False, op.btoi(op.Box.extract(name, SESSION_START_ROUND, 8))
+
+    @subroutine
+    def _verify_qr_proof(self, session_id: Bytes, qr_round: UInt64, qr_hash: Bytes) -> None:
+        """QR must be at most QR_VALIDITY_ROUNDS old and equal SHA256(session_id + qr_round + sender)"""
+        assert Global.round - qr_round <= QR_VALIDITY_ROUNDS, "QR code expired"
+        assert qr_hash == op.sha256(session_id + op.itob(qr_round) + Txn.sender.bytes), "Invalid QR code"
+
+    @subroutine
+    def _count_attendance(self, session_id: Bytes, is_global: bool) -> None:  # noqa: FBT001
+        if is_global:
+            self.total_attendance += 1
+        else:
+            name = Bytes(b"s") + session_id
+            total = op.btoi(op.Box.extract(name, SESSION_TOTAL_ATTENDANCE, 8))
+            op.Box.replace(name, SESSION_TOTAL_ATTENDANCE, op.itob(total + 1))
@@ -0,0 +1,50 @@
+import logging
+
+import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+
+# define deployment behaviour based on supplied app spec
+def deploy() -> None:
+    from smart_contracts.artifacts.attendance_arc4.attendance_client import (
+        AttendanceFactory,
+        AttendanceMethodCallCreateParams,
+        CreateArgs,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+
+    factory = algorand.client.get_typed_app_factory(
+        AttendanceFactory, default_sender=deployer_.address
+    )
+
+    app_client, result = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        create_params=AttendanceMethodCallCreateParams(
+            args=CreateArgs(
+                session_id=b"GENESIS",
+                session_name=b"Initial session",
+                duration_seconds=3600,
+                attendance_window_seconds=0,
+            )
+        ),
+    )
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # Box-backed modes (registry, box records, bitmap roster) need the app account funded
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=1),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        logger.info(
+            f"Deployed Attendance app {app_client.app_id} to address {app_client.app_address}"
+        )
@@ -0,0 +1,62 @@
+"""Import-time benchmark of the `python -m smart_contracts` entry point.
+
+Building one contract must not pay for algokit_utils, python-dotenv or any
+contract's deploy_config module; those are only imported to deploy.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RUNS = 5
+
+# What `build counter` does before it starts the compiler
+BUILD_STARTUP = (
+    "import smart_contracts.__main__ as m; "
+    "assert [c.name for c in m.discover_contracts('counter')] == ['counter']"
+)
+# What every invocation used to do at import time
+EAGER_STARTUP = (
+    "import algokit_utils, dotenv; "
+    "import smart_contracts.counter.deploy_config, smart_contracts.bank.deploy_config"
+)
+DEPLOY_ONLY_MODULES = ("algokit_utils", "dotenv", "deploy_config")
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _best_of(code: str) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        _python(code)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_build_startup_skips_deploy_imports() -> None:
+    # -X importtime lists every imported module on stderr
+    imported = _python(BUILD_STARTUP, "-X", "importtime").stderr
+    for module in DEPLOY_ONLY_MODULES:
+        assert module not in imported
+
+
+def test_build_startup_benchmark() -> None:
+    pytest.importorskip("algokit_utils")
+    pytest.importorskip("dotenv")
+    lazy = _best_of(BUILD_STARTUP)
+    eager = _best_of(EAGER_STARTUP)
+    print(f"build counter startup: {lazy * 1000:.0f}ms (eager imports: {eager * 1000:.0f}ms)")
+    assert lazy < eager / 2
@@ -3,6 +3,27 @@ import algosdk from 'algosdk';
 // Your deployed contract details
 export const ATTENDANCE_APP_ID = 755432657;
 
+// Box names only fit session IDs of up to 31 bytes (must match box_storage.py)
+const MAX_BOX_SESSION_ID_LENGTH = 31;
+
+/**
+ * Boxes mark_attendance reads for a student's check-in: the registered session
+ * record, plus the student's box record and roster slot so a student counts once
+ * whatever the mode (box_storage.check_in_box_refs). Empty for session IDs too
+ * long for box names, which only use local state.
+ */
+export function checkInBoxNames(sessionId: string, studentAddress: string): Uint8Array[] {
+    const session = new TextEncoder().encode(sessionId);
+    if (session.length > MAX_BOX_SESSION_ID_LENGTH) {
+        return [];
+    }
+    const student = algosdk.decodeAddress(studentAddress).publicKey;
+    const boxName = (prefix: string, ...parts: Uint8Array[]) =>
+        new Uint8Array([...new TextEncoder().encode(prefix), ...parts.flatMap((part) => [...part])]);
+
+    return [boxName('s', session), boxName('a', session, student), boxName('e', session, student)];
+}
+
 // Algorand SDK helper functions
 export class AlgorandService {
     private algodClient: algosdk.Algodv2;
@@ -45,7 +66,8 @@ export class AlgorandService {
             sender: userAddress,
             suggestedParams: suggestedParams,
             appIndex: appId,
-            appArgs: appArgs
+            appArgs: appArgs,
+            boxes: checkInBoxNames(sessionId, userAddress).map((name) => ({ appIndex: appId, name }))
         });
 
         return markAttendanceTxn;
@@ -2,6 +2,7 @@ import { useWallet } from '@txnlab/use-wallet-react';
 import { AlgorandClient } from '@algorandfoundation/algokit-utils';
 import algosdk from 'algosdk';
 import { getAlgodConfigFromViteEnvironment } from './network/getAlgoClientConfigs';
+import { checkInBoxNames } from './algorand';
 
 /**
  * Custom hook for attendance contract interactions
@@ -57,6 +58,7 @@ export const useAttendance = () => {
             sender: activeAddress,
             appId: BigInt(appId),
             args: appArgs,
+            boxReferences: checkInBoxNames(sessionId, activeAddress),
         });
 
         return result.txIds[0];
@@ -288,16 +290,24 @@ export const useAttendance = () => {
         try {
             // Use Algorand Indexer to get all accounts opted into this app
             const indexerUrl = 'https://testnet-idx.algonode.cloud';
-            const response = await fetch(
-                `${indexerUrl}/v2/accounts?application-id=${appId}&limit=100`
-            );
-            
-            if (!response.ok) {
-                throw new Error('Failed to fetch opted-in accounts');
-            }
+            const accounts: any[] = [];
+            let nextToken: string | undefined;
+
+            // Follow next-token, a single page stops at 100 accounts
+            do {
+                const page = nextToken ? `&next=${encodeURIComponent(nextToken)}` : '';
+                const response = await fetch(
+                    `${indexerUrl}/v2/accounts?application-id=${appId}&limit=100${page}`
+                );
+
+                if (!response.ok) {
+                    throw new Error('Failed to fetch opted-in accounts');
+                }
 
-            const data = await response.json();
-            const accounts = data.accounts || [];
+                const data = await response.json();
+                accounts.push(...(data.accounts || []));
+                nextToken = data['next-token'];
+            } while (nextToken);
 
             // Process each account to get their local state
             const processedAccounts = await Promise.all(
@@ -2,6 +2,7 @@ import { useWallet } from '@txnlab/use-wallet-react';
 import { AlgorandClient } from '@algorandfoundation/algokit-utils';
 import algosdk from 'algosdk';
 import { getAlgodConfigFromViteEnvironment } from './network/getAlgoClientConfigs';
+import { checkInBoxNames } from './algorand';
 
 /**
  * Custom hook for secure attendance contract interactions
@@ -48,6 +49,7 @@ export const useSecureAttendance = () => {
             sender: activeAddress,
             appId: BigInt(appId),
             args: appArgs,
+            boxReferences: checkInBoxNames(sessionId, activeAddress),
         });
 
         return result.txIds[0];